@@ -1,4 +1,4 @@
-from rock.sdk.envs import make
+from rock.sdk.envs import make, make_vec
 
 from ._codes import codes
 from .sdk.common.exceptions import (
@@ -11,6 +11,7 @@ from .sdk.common.exceptions import (
 
 __all__ = [
     "make",
+    "make_vec",
     "codes",
     "RockException",
     "BadRequestRockError",
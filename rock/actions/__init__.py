@@ -1,6 +1,23 @@
 from .envs.base import Env
-from .envs.request import EnvCloseRequest, EnvMakeRequest, EnvResetRequest, EnvStepRequest
-from .envs.response import EnvCloseResponse, EnvListResponse, EnvMakeResponse, EnvResetResponse, EnvStepResponse
+from .envs.request import (
+    EnvBatchResetRequest,
+    EnvBatchStepRequest,
+    EnvCloseRequest,
+    EnvMakeRequest,
+    EnvResetRequest,
+    EnvStepRequest,
+)
+from .envs.response import (
+    EnvBatchResetResponse,
+    EnvBatchStepResponse,
+    EnvCloseResponse,
+    EnvListResponse,
+    EnvMakeResponse,
+    EnvResetResponse,
+    EnvResetResult,
+    EnvStepResponse,
+    EnvStepResult,
+)
 from .response import BaseResponse, ResponseStatus, RockResponse
 from .sandbox.base import AbstractSandbox, _ExceptionTransfer
 from .sandbox.config import RemoteSandboxRuntimeConfig, RockletConfig, SandboxRuntimeConfig
@@ -12,13 +29,19 @@ from .sandbox.request import (
     Command,
     CreateBashSessionRequest,
     CreateSessionRequest,
+    DownloadChunkRequest,
     ReadFileRequest,
+    UploadChunkRequest,
     UploadMode,
     UploadRequest,
+    UploadStatusRequest,
+    WaitProcessRequest,
     WriteFileRequest,
 )
 from .sandbox.response import (
     BashObservation,
+    BatchCommandResult,
+    BatchStopResult,
     CloseBashSessionResponse,
     CloseResponse,
     CloseSessionResponse,
@@ -33,7 +56,9 @@ from .sandbox.response import (
     ReadFileResponse,
     SandboxResponse,
     SandboxStatusResponse,
+    UploadChunkResponse,
     UploadResponse,
+    WaitProcessResponse,
     WriteFileResponse,
 )
 
@@ -51,6 +76,12 @@ __all__ = [
     "EnvResetResponse",
     "EnvStepResponse",
     "EnvListResponse",
+    "EnvBatchStepRequest",
+    "EnvBatchResetRequest",
+    "EnvStepResult",
+    "EnvResetResult",
+    "EnvBatchStepResponse",
+    "EnvBatchResetResponse",
     "_ExceptionTransfer",
     "AbstractSandbox",
     "Command",
@@ -66,9 +97,15 @@ __all__ = [
     "ReadFileRequest",
     "UploadMode",
     "UploadRequest",
+    "UploadChunkRequest",
+    "UploadStatusRequest",
+    "DownloadChunkRequest",
+    "WaitProcessRequest",
     "IsAliveResponse",
     "SandboxStatusResponse",
     "CommandResponse",
+    "BatchCommandResult",
+    "BatchStopResult",
     "WriteFileResponse",
     "OssSetupResponse",
     "ExecuteBashSessionResponse",
@@ -78,6 +115,8 @@ __all__ = [
     "Observation",
     "ReadFileResponse",
     "UploadResponse",
+    "UploadChunkResponse",
+    "WaitProcessResponse",
     "FileUploadResponse",
     "CloseResponse",
     "RockletConfig",
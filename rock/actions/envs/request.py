@@ -20,3 +20,11 @@ class EnvStepRequest(BaseModel):
 
 class EnvCloseRequest(BaseModel):
     sandbox_id: NonBlankStr
+
+
+class EnvBatchStepRequest(BaseModel):
+    steps: list[EnvStepRequest]
+
+
+class EnvBatchResetRequest(BaseModel):
+    resets: list[EnvResetRequest]
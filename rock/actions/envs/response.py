@@ -28,3 +28,29 @@ class EnvCloseResponse(BaseModel):
 
 class EnvListResponse(BaseModel):
     env_id: list[str]
+
+
+class EnvStepResult(BaseModel):
+    """Outcome for one environment of a batch step: ``response`` on success, ``error`` otherwise."""
+
+    sandbox_id: str
+    response: EnvStepResponse | None = None
+    error: str | None = None
+
+
+class EnvBatchStepResponse(BaseModel):
+    results: list[EnvStepResult]
+    """One result per requested step, in request order."""
+
+
+class EnvResetResult(BaseModel):
+    """Outcome for one environment of a batch reset: ``response`` on success, ``error`` otherwise."""
+
+    sandbox_id: str
+    response: EnvResetResponse | None = None
+    error: str | None = None
+
+
+class EnvBatchResetResponse(BaseModel):
+    results: list[EnvResetResult]
+    """One result per requested reset, in request order."""
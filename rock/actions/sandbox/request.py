@@ -69,6 +69,14 @@ class ReadFileRequest(BaseModel):
     This corresponds to the `errors` parameter of `Path.read_text()`."""
 
 
+class WaitProcessRequest(BaseModel):
+    pid: int
+    """Pid of the process to wait for."""
+
+    timeout: float = 60
+    """Maximum seconds to block before returning with `exited=False`."""
+
+
 class UploadMode(str, Enum):
     AUTO = "auto"
     """Automatically decide the upload method based on file size and OSS configuration."""
@@ -92,6 +100,39 @@ class UploadRequest(BaseModel):
     'oss' forces OSS upload, 'direct' forces direct HTTP upload bypassing OSS."""
 
 
+class UploadChunkRequest(BaseModel):
+    target_path: str
+    """Remote file path the chunk belongs to."""
+
+    offset: int = Field(default=0, ge=0)
+    """Byte offset of the chunk in the file. Must equal the bytes stored so far; 0 restarts the transfer."""
+
+    sha256: str
+    """Hex sha256 of the chunk; a chunk that does not match is discarded."""
+
+    final: bool = False
+    """Whether this is the last chunk. The file is then moved (or extracted) to `target_path`."""
+
+    extract: bool = False
+    """Extract the uploaded tar or zip archive into the `target_path` directory instead of storing it."""
+
+
+class UploadStatusRequest(BaseModel):
+    target_path: str
+    """Remote file path of the transfer to look up."""
+
+
+class DownloadChunkRequest(BaseModel):
+    path: str
+    """Remote file path to read from."""
+
+    offset: int = Field(default=0, ge=0)
+    """Byte offset to start reading at."""
+
+    length: int = Field(default=8 * 1024 * 1024, gt=0)
+    """Maximum number of bytes to return."""
+
+
 class ChownRequest(BaseModel):
     remote_user: str
     paths: list[str] = []
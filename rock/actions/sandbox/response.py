@@ -62,6 +62,21 @@ class CommandResponse(BaseModel):
     exit_code: int | None = None
 
 
+class BatchCommandResult(BaseModel):
+    """The outcome of a batched command in one sandbox; exactly one of ``result`` and ``error`` is set."""
+
+    sandbox_id: str
+    result: CommandResponse | None = None
+    error: str | None = None
+
+
+class BatchStopResult(BaseModel):
+    """The outcome of stopping one sandbox of a batch; ``error`` is set when the stop failed."""
+
+    sandbox_id: str
+    error: str | None = None
+
+
 class WriteFileResponse(BaseModel):
     success: bool = False
     message: str = ""
@@ -111,6 +126,15 @@ class ReadFileResponse(BaseModel):
     """Content of the file as a string."""
 
 
+class WaitProcessResponse(BaseModel):
+    pid: int
+    exited: bool = False
+    """Whether the process exited before the wait timed out."""
+
+    elapsed: float = 0.0
+    """Seconds spent waiting on the sandbox side."""
+
+
 class UploadResponse(BaseModel):
     success: bool = False
     message: str = ""
@@ -120,6 +144,13 @@ class UploadResponse(BaseModel):
 FileUploadResponse = UploadResponse
 
 
+class UploadChunkResponse(BaseModel):
+    success: bool = False
+    message: str = ""
+    offset: int = 0
+    """Bytes of the file stored so far, i.e. where the next chunk starts."""
+
+
 class CloseResponse(BaseModel):
     """Response for close operations."""
 
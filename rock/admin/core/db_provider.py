@@ -23,6 +23,7 @@ class DatabaseProvider:
 
     def __init__(self, db_config: DatabaseConfig) -> None:
         self._url = self._convert_url(db_config.url)
+        self._statement_cache_size = db_config.statement_cache_size
         self._engine: AsyncEngine | None = None
 
     @property
@@ -34,12 +35,13 @@ class DatabaseProvider:
     async def init(self) -> None:
         """Create the async engine.
 
-        For asyncpg, ``statement_cache_size=0`` prevents
+        For asyncpg, ``statement_cache_size=0`` (the default of
+        ``DatabaseConfig.statement_cache_size``) prevents
         ``InvalidCachedStatementError`` after external DDL changes
         """
         engine_kwargs: dict[str, object] = {"echo": False}
         if "asyncpg" in self._url:
-            engine_kwargs["connect_args"] = {"statement_cache_size": 0}
+            engine_kwargs["connect_args"] = {"statement_cache_size": self._statement_cache_size}
             engine_kwargs["pool_size"] = 100
             engine_kwargs["max_overflow"] = 0
             engine_kwargs["pool_timeout"] = 120
@@ -20,6 +20,7 @@ from rock import InternalServerRockError
 from rock._codes import codes
 from rock.config import RayConfig
 from rock.logger import init_logger
+from rock.utils.concurrent_helper import RayUtil
 from rock.utils.rwlock import AsyncRWLock
 
 logger = init_logger(__name__)
@@ -31,7 +32,10 @@ class RayService:
         self._ray_rwlock = AsyncRWLock()
         self._ray_request_count = 0
         self._ray_establish_time = time.time()
+        # Only used for the Ray APIs that have no awaitable form (get_actor, batched ray.wait);
+        # ObjectRefs themselves are awaited on the event loop.
         self._executor = executor or ThreadPoolExecutor(max_workers=10)
+        self._in_flight = asyncio.Semaphore(max(1, config.max_in_flight_calls))
 
     def init(self):
         ray.init(
@@ -46,8 +50,8 @@ class RayService:
             self._setup_ray_reconnect_scheduler()
         logger.info("end to init ray")
 
-    def increment_ray_request_count(self):
-        self._ray_request_count += 1
+    def increment_ray_request_count(self, count: int = 1):
+        self._ray_request_count += count
 
     def get_ray_rwlock(self):
         return self._ray_rwlock
@@ -141,6 +145,10 @@ class RayService:
         """
         Asynchronously get the result of a Ray ObjectRef.
 
+        The ref is awaited on the event loop through Ray's completion callback, so no
+        thread is held while the actor call runs. At most ``max_in_flight_calls`` refs
+        are awaited at once; time spent queueing counts towards ``timeout``.
+
         Args:
             ray_future: Ray ObjectRef to get result from
             timeout: Timeout in seconds for the ray.get operation
@@ -149,19 +157,80 @@ class RayService:
             The result from the Ray ObjectRef
 
         Raises:
-            Exception: If ray.get fails
+            Exception: If ray.get fails or times out
         """
         self._ensure_ray_initialized()
         self.increment_ray_request_count()
-        loop = asyncio.get_running_loop()
         try:
-            result = await loop.run_in_executor(self._executor, lambda r: ray.get(r, timeout=timeout), ray_future)
+            result = await asyncio.wait_for(self._await_ref(ray_future), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"ray get timed out after {timeout}s")
+            raise Exception(f"ray get timed out after {timeout}s")
         except Exception as e:
             logger.error("ray get failed", exc_info=e)
             error_msg = str(e.args[0]) if len(e.args) > 0 else f"ray get failed, {str(e)}"
             raise Exception(error_msg)
         return result
 
+    async def async_ray_get_many(
+        self, ray_futures: list[ray.ObjectRef], timeout: int = 60, return_exceptions: bool = False
+    ) -> list:
+        """
+        Asynchronously get the results of several Ray ObjectRefs issued together.
+
+        The refs are awaited together on the event loop, like ``async_ray_get``, so no
+        executor thread is held however large the batch; the batch takes one in-flight slot.
+
+        Args:
+            ray_futures: Ray ObjectRefs to get results from
+            timeout: Timeout in seconds for the whole batch
+            return_exceptions: Return per-ref errors in place of results instead of raising
+
+        Returns:
+            Results in the same order as ``ray_futures``
+
+        Raises:
+            Exception: If any ref fails or times out and ``return_exceptions`` is False
+        """
+        self._ensure_ray_initialized()
+        self.increment_ray_request_count(len(ray_futures))
+        if not ray_futures:
+            return []
+        async with self._in_flight:
+            results = await asyncio.gather(
+                *[self._await_ref_within(ref, timeout) for ref in ray_futures], return_exceptions=True
+            )
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.error("ray get many failed", exc_info=result)
+                    error_msg = str(result.args[0]) if len(result.args) > 0 else f"ray get failed, {str(result)}"
+                    raise Exception(error_msg)
+        return results
+
+    async def async_ray_wait(self, ray_future: ray.ObjectRef, timeout: float):
+        """
+        Wait for a long-running Ray ObjectRef, such as a sandbox start, and return its result.
+
+        Unlike ``async_ray_get`` this does not take one of the ``max_in_flight_calls`` slots, so
+        waits lasting minutes cannot starve short actor calls.
+
+        Raises:
+            asyncio.TimeoutError: If the ref is not done within ``timeout`` seconds
+        """
+        self._ensure_ray_initialized()
+        return await asyncio.wait_for(RayUtil.as_asyncio_future(ray_future), timeout=timeout)
+
+    async def _await_ref(self, ray_future: ray.ObjectRef):
+        async with self._in_flight:
+            return await RayUtil.as_asyncio_future(ray_future)
+
+    async def _await_ref_within(self, ray_future: ray.ObjectRef, timeout: int):
+        try:
+            return await asyncio.wait_for(RayUtil.as_asyncio_future(ray_future), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise ray.exceptions.GetTimeoutError(f"ray get timed out after {timeout}s")
+
     async def async_ray_get_actor(self, actor_name: str, namespace: str = None):
         """
         Asynchronously get a Ray actor by name.
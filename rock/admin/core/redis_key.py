@@ -1,5 +1,12 @@
 ALIVE_PREFIX = "alive:"
 TIMEOUT_PREFIX = "timeout:"
+EXPIRY_LEASE_PREFIX = "expiry_lease:"
+SANDBOX_CHANGES_CHANNEL = "sandbox:changes"
+# Sorted set of sandbox IDs scored by their expire_time (epoch seconds).
+SANDBOX_EXPIRY_KEY = "sandbox:expiry"
+# Hash of active (pending/running) sandbox ID -> image, and hash of image -> number of active sandboxes.
+SANDBOX_ACTIVE_KEY = "sandbox:active"
+SANDBOX_ACTIVE_COUNT_KEY = "sandbox:active_count"
 
 
 def alive_sandbox_key(sandbox_id: str) -> str:
@@ -8,3 +15,7 @@ def alive_sandbox_key(sandbox_id: str) -> str:
 
 def timeout_sandbox_key(sandbox_id: str) -> str:
     return f"{TIMEOUT_PREFIX}{sandbox_id}"
+
+
+def expiry_lease_key(sandbox_id: str) -> str:
+    return f"{EXPIRY_LEASE_PREFIX}{sandbox_id}"
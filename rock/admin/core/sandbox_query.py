@@ -0,0 +1,114 @@
+"""SandboxQuery: filtered, keyset-paginated sandbox listings pushed down to SQL.
+
+Filters compare indexed ``SandboxRecord`` columns (``LIST_BY_ALLOWLIST``) or a top-level key of
+the JSON ``spec`` / ``status`` columns (``spec.<key>`` / ``status.<key>``) for equality. Pages are
+ordered by ``sandbox_id`` and continue after the last ID of the previous page, so reading any page
+costs the same however many rows come before it.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import Boolean, Float, Select, func, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from rock.admin.core.schema import SandboxRecord
+
+_JSON_FILTER_COLUMNS = ("spec", "status")
+
+
+@dataclass
+class SandboxQuery:
+    filters: dict[str, str] = field(default_factory=dict)
+    """Equality filters: an allowlisted column name, or ``spec.<key>`` / ``status.<key>``."""
+    states: list[str] | None = None
+    """Only rows whose ``state`` is one of these."""
+    fields: list[str] | None = None
+    """Columns to load; ``sandbox_id`` is always included. None loads every column."""
+    limit: int | None = None
+    after: str | None = None
+    """Keyset cursor: only rows with a ``sandbox_id`` greater than this."""
+    offset: int | None = None
+
+    def where(self) -> list[ColumnElement[bool]]:
+        """Filter and state clauses; the page (cursor, offset and limit) is applied by :meth:`select`."""
+        clauses = [_filter_clause(key, value) for key, value in self.filters.items()]
+        if self.states is not None:
+            clauses.append(SandboxRecord.state.in_(self.states))
+        return clauses
+
+    def select(self) -> Select:
+        if self.fields is None:
+            stmt = select(SandboxRecord.__table__)
+        else:
+            columns = dict.fromkeys(["sandbox_id", *self.fields])
+            unknown = [name for name in columns if name not in SandboxRecord.column_names()]
+            if unknown:
+                raise ValueError(f"Unknown sandbox fields: {', '.join(unknown)}")
+            stmt = select(*(getattr(SandboxRecord, name) for name in columns))
+        stmt = stmt.where(*self.where()).order_by(SandboxRecord.sandbox_id)
+        if self.after is not None:
+            stmt = stmt.where(SandboxRecord.sandbox_id > self.after)
+        if self.offset:
+            stmt = stmt.offset(self.offset)
+        if self.limit is not None:
+            stmt = stmt.limit(self.limit)
+        return stmt
+
+    def count(self) -> Select:
+        """``COUNT(*)`` of the rows matching the filters, ignoring the page."""
+        return select(func.count()).select_from(SandboxRecord).where(*self.where())
+
+
+def encode_cursor(sandbox_id: str) -> str:
+    return base64.urlsafe_b64encode(sandbox_id.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> str:
+    try:
+        sandbox_id = base64.b64decode(cursor.encode(), altchars=b"-_", validate=True).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not sandbox_id:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return sandbox_id
+
+
+def is_filterable(key: str) -> bool:
+    """Whether *key* can be used in :attr:`SandboxQuery.filters`."""
+    return key in SandboxRecord.LIST_BY_ALLOWLIST or _split_json_key(key) is not None
+
+
+def _split_json_key(key: str) -> tuple[str, str] | None:
+    json_column, _, json_key = key.partition(".")
+    if json_key and json_column in _JSON_FILTER_COLUMNS:
+        return json_column, json_key
+    return None
+
+
+def _filter_clause(key: str, value: str) -> ColumnElement[bool]:
+    if json_path := _split_json_key(key):
+        json_column, json_key = json_path
+        return getattr(SandboxRecord, json_column)[json_key].as_string() == value
+    if key not in SandboxRecord.LIST_BY_ALLOWLIST:
+        raise ValueError(f"Filtering by '{key}' is not allowed")
+    column = getattr(SandboxRecord, key)
+    return column == _coerce(column.type, key, value)
+
+
+def _coerce(column_type: Any, key: str, value: str) -> Any:
+    """Query parameters arrive as strings; compare non-string columns with a value of their own type."""
+    if isinstance(column_type, Boolean):
+        if value.lower() not in ("true", "false"):
+            raise ValueError(f"'{key}' must be true or false, got '{value}'")
+        return value.lower() == "true"
+    if isinstance(column_type, Float):
+        try:
+            return float(value)
+        except ValueError as e:
+            raise ValueError(f"'{key}' must be a number, got '{value}'") from e
+    return value
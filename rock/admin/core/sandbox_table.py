@@ -6,11 +6,13 @@ import asyncio
 import functools
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select
+from sqlalchemy import RowMapping, Select, bindparam, delete, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import DisconnectionError, InterfaceError, OperationalError
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from rock.admin.core.db_provider import DatabaseProvider
+from rock.admin.core.sandbox_query import SandboxQuery
 from rock.admin.core.schema import SandboxRecord
 from rock.admin.metrics.decorator import monitor_metastore_operation
 from rock.admin.metrics.monitor import MetricsMonitor
@@ -78,15 +80,19 @@ class SandboxTable:
 
     All methods use plain ``dict`` for both input and output.
 
-    Write path (create / update):
+    Every method runs one statement (or one executemany per column set) on a pooled
+    connection, without an ORM session.
+
+    Write path (create / create_many / update / update_many / upsert_many):
     - Fields from ``SandboxInfo`` / ``DockerDeploymentConfig`` that match a
       ``SandboxRecord`` column are written to the corresponding scalar column.
     - ``status`` column stores the full ``SandboxInfo`` dict.
     - ``spec`` column stores the full ``DockerDeploymentConfig.model_dump()`` dict.
 
     Read path (get / list_by / list_by_in):
-    - Returns ``record.to_dict()`` — a plain dict with all non-None column values,
+    - Returns the same dict as ``record.to_dict()`` — all non-None column values,
       including ``spec`` and ``status``.
+    - ``query`` loads only ``SandboxQuery.fields`` when they are given.
     """
 
     def __init__(self, db_provider: DatabaseProvider, rock_config: RockConfig | None = None) -> None:
@@ -112,58 +118,93 @@ class SandboxTable:
         (``info`` takes priority on conflicts).
         Raises ``IntegrityError`` if ``sandbox_id`` already exists.
         """
-        config_dict = config.model_dump() if config is not None else {}
-        merged = {**config_dict, **info}
-        filtered = _pick_columns(merged)
-
-        for col, default in SandboxRecord._NOT_NULL_DEFAULTS.items():
-            if col not in filtered:
-                filtered[col] = default
-
-        filtered["status"] = dict(info)
-        if config_dict:
-            filtered["spec"] = config_dict
+        async with self._db.engine.begin() as conn:
+            await conn.execute(insert(_TABLE), _insert_values(sandbox_id, info, config))
 
-        record = SandboxRecord(sandbox_id=sandbox_id, **filtered)
-        async with AsyncSession(self._db.engine) as session:
-            session.add(record)
-            await session.commit()
+    @_retry_on_disconnect
+    @monitor_metastore_operation
+    async def create_many(self, infos: dict[str, SandboxInfo]) -> None:
+        """``create`` for many sandboxes in one transaction; nothing is inserted if any ID already exists."""
+        if not infos:
+            return
+        rows = [_insert_values(sandbox_id, info) for sandbox_id, info in infos.items()]
+        async with self._db.engine.begin() as conn:
+            for group in _group_by_keys(rows):
+                await conn.execute(insert(_TABLE), group)
 
     @_retry_on_disconnect
     @monitor_metastore_operation
     async def get(self, sandbox_id: str) -> dict | None:
         """Return a sandbox row as a plain dict, or ``None`` if not found."""
-        async with AsyncSession(self._db.engine) as session:
-            record = await session.get(SandboxRecord, sandbox_id)
-            if record is None:
-                return None
-            return record.to_dict()
+        async with self._db.engine.connect() as conn:
+            result = await conn.execute(select(_TABLE).where(_TABLE.c.sandbox_id == sandbox_id))
+            row = result.mappings().one_or_none()
+            return _row_to_dict(row) if row is not None else None
 
     @_retry_on_disconnect
     @monitor_metastore_operation
-    async def update(self, sandbox_id: str, info: SandboxInfo) -> None:
-        """Partial update of scalar columns; always overwrites ``status`` with *info*."""
-        filtered = _pick_columns(info)
-        filtered["status"] = dict(info)
-
-        async with AsyncSession(self._db.engine) as session:
-            record = await session.get(SandboxRecord, sandbox_id)
-            if record is None:
-                logger.warning("update: sandbox_id=%s not found", sandbox_id)
-                return
-            for key, value in filtered.items():
-                setattr(record, key, value)
-            await session.commit()
+    async def update(self, sandbox_id: str, info: SandboxInfo) -> bool:
+        """Partial update of scalar columns; always overwrites ``status`` with *info*.
+
+        A single ``UPDATE ... RETURNING`` statement; returns ``False`` if the row does not exist.
+        """
+        stmt = (
+            update(_TABLE)
+            .where(_TABLE.c.sandbox_id == sandbox_id)
+            .values(_update_values(info))
+            .returning(_TABLE.c.sandbox_id)
+        )
+        async with self._db.engine.begin() as conn:
+            result = await conn.execute(stmt)
+            found = result.first() is not None
+        if not found:
+            logger.warning("update: sandbox_id=%s not found", sandbox_id)
+        return found
+
+    @_retry_on_disconnect
+    @monitor_metastore_operation
+    async def update_many(self, infos: dict[str, SandboxInfo]) -> None:
+        """``update`` for many sandboxes in one transaction.
+
+        Updates that set the same columns share one executemany statement. Missing rows are skipped.
+        """
+        if not infos:
+            return
+        rows = [{_ID_PARAM: sandbox_id, **_update_values(info)} for sandbox_id, info in infos.items()]
+        stmt = update(_TABLE).where(_TABLE.c.sandbox_id == bindparam(_ID_PARAM))
+        async with self._db.engine.begin() as conn:
+            for group in _group_by_keys(rows):
+                await conn.execute(stmt, group)
+
+    @_retry_on_disconnect
+    @monitor_metastore_operation
+    async def upsert_many(self, infos: dict[str, SandboxInfo]) -> None:
+        """Update each row like ``update``, inserting it like ``create`` if it does not exist.
+
+        One ``INSERT ... ON CONFLICT (sandbox_id) DO UPDATE`` per set of columns, all in one transaction;
+        on conflict only the columns present in the info are overwritten.
+        """
+        if not infos:
+            return
+        dialect_insert = _DIALECT_INSERTS[self._db.engine.dialect.name]
+        groups: dict[frozenset[str], list[dict[str, Any]]] = {}
+        for sandbox_id, info in infos.items():
+            groups.setdefault(frozenset(_update_values(info)), []).append(_insert_values(sandbox_id, info))
+        async with self._db.engine.begin() as conn:
+            for set_columns, rows in groups.items():
+                stmt = dialect_insert(_TABLE)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[_TABLE.c.sandbox_id],
+                    set_={column: stmt.excluded[column] for column in set_columns},
+                )
+                await conn.execute(stmt, rows)
 
     @_retry_on_disconnect
     @monitor_metastore_operation
     async def delete(self, sandbox_id: str) -> None:
         """Hard-delete a sandbox record."""
-        async with AsyncSession(self._db.engine) as session:
-            record = await session.get(SandboxRecord, sandbox_id)
-            if record is not None:
-                await session.delete(record)
-                await session.commit()
+        async with self._db.engine.begin() as conn:
+            await conn.execute(delete(_TABLE).where(_TABLE.c.sandbox_id == sandbox_id))
 
     @_retry_on_disconnect
     @monitor_metastore_operation
@@ -171,28 +212,92 @@ class SandboxTable:
         """Equality query on a single column. Only columns in ``SandboxRecord.LIST_BY_ALLOWLIST`` are permitted."""
         if column not in SandboxRecord.LIST_BY_ALLOWLIST:
             raise ValueError(f"Querying by column '{column}' is not allowed")
-        col_attr = getattr(SandboxRecord, column)
-        stmt = select(SandboxRecord).where(col_attr == value)
-        async with AsyncSession(self._db.engine) as session:
-            result = await session.execute(stmt)
-            return [r.to_dict() for r in result.scalars().all()]
+        stmt = select(_TABLE).where(_TABLE.c[column] == value)
+        return await self._fetch_all(stmt)
 
     @_retry_on_disconnect
     @monitor_metastore_operation
-    async def list_by_in(self, column: str, values: list[str | int | float | bool]) -> list[dict]:
-        """IN query on a single column. Only columns in ``SandboxRecord.LIST_BY_ALLOWLIST`` are permitted."""
+    async def list_by_in(
+        self,
+        column: str,
+        values: list[str | int | float | bool],
+        after: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """IN query on a single column. Only columns in ``SandboxRecord.LIST_BY_ALLOWLIST`` are permitted.
+
+        With *limit*, returns one page ordered by ``sandbox_id``; pass the last ``sandbox_id`` of a
+        page as *after* to get the next one.
+        """
         if column not in SandboxRecord.LIST_BY_ALLOWLIST:
             raise ValueError(f"Querying by column '{column}' is not allowed")
         if not values:
             return []
-        col_attr = getattr(SandboxRecord, column)
-        stmt = select(SandboxRecord).where(col_attr.in_(values))
-        async with AsyncSession(self._db.engine) as session:
-            result = await session.execute(stmt)
-            return [r.to_dict() for r in result.scalars().all()]
+        stmt = select(_TABLE).where(_TABLE.c[column].in_(values))
+        if after is not None:
+            stmt = stmt.where(_TABLE.c.sandbox_id > after)
+        if limit is not None:
+            stmt = stmt.order_by(_TABLE.c.sandbox_id).limit(limit)
+        return await self._fetch_all(stmt)
+
+    @_retry_on_disconnect
+    @monitor_metastore_operation
+    async def query(self, query: SandboxQuery) -> list[dict]:
+        """Rows matching *query*, ordered by ``sandbox_id``; ``None`` columns are left out as in ``get``."""
+        return await self._fetch_all(query.select())
+
+    @_retry_on_disconnect
+    @monitor_metastore_operation
+    async def count(self, query: SandboxQuery) -> int:
+        """Number of rows matching the filters of *query*, ignoring its page."""
+        async with self._db.engine.connect() as conn:
+            result = await conn.execute(query.count())
+            return result.scalar_one()
+
+    async def _fetch_all(self, stmt: Select) -> list[dict]:
+        async with self._db.engine.connect() as conn:
+            result = await conn.execute(stmt)
+            return [_row_to_dict(row) for row in result.mappings().all()]
+
+
+_TABLE = SandboxRecord.__table__
+# Bind name for the WHERE of executemany updates; must not clash with a column name.
+_ID_PARAM = "b_sandbox_id"
+_DIALECT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
 
 
 def _pick_columns(data: dict[str, Any]) -> dict[str, Any]:
     """Return only keys matching a scalar SandboxRecord column, excluding sandbox_id/spec/status."""
     columns = SandboxRecord.column_names() - {"sandbox_id", "spec", "status"}
     return {k: v for k, v in data.items() if k in columns}
+
+
+def _insert_values(sandbox_id: str, info: SandboxInfo, config: DockerDeploymentConfig | None = None) -> dict[str, Any]:
+    config_dict = config.model_dump() if config is not None else {}
+    values = _pick_columns({**config_dict, **info})
+    for col, default in SandboxRecord._NOT_NULL_DEFAULTS.items():
+        values.setdefault(col, default)
+    values["sandbox_id"] = sandbox_id
+    values["status"] = dict(info)
+    if config_dict:
+        values["spec"] = config_dict
+    return values
+
+
+def _update_values(info: SandboxInfo) -> dict[str, Any]:
+    values = _pick_columns(info)
+    values["status"] = dict(info)
+    return values
+
+
+def _group_by_keys(rows: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """Split *rows* into groups with the same keys, since one executemany statement binds one column set."""
+    groups: dict[frozenset[str], list[dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(frozenset(row), []).append(row)
+    return list(groups.values())
+
+
+def _row_to_dict(row: RowMapping) -> dict[str, Any]:
+    """Same shape as ``SandboxRecord.to_dict``: every non-``None`` column that was selected."""
+    return {key: value for key, value in row.items() if value is not None}
@@ -54,6 +54,8 @@ class SandboxRecord(Base):
     __table_args__ = (
         Index("ix_sandbox_record_user_id", "user_id"),
         Index("ix_sandbox_record_state", "state"),
+        # Serves the state-filtered, sandbox_id-ordered pages of list_sandboxes.
+        Index("ix_sandbox_record_state_sandbox_id", "state", "sandbox_id"),
         Index("ix_sandbox_record_namespace", "namespace"),
         Index("ix_sandbox_record_experiment_id", "experiment_id"),
         Index("ix_sandbox_record_cluster_name", "cluster_name"),
@@ -4,7 +4,8 @@ import time
 from typing import Annotated, Any
 
 import httpx
-from fastapi import APIRouter, Body, Depends, File, Form, UploadFile
+from fastapi import APIRouter, Body, Depends, File, Form, Query, Request, UploadFile
+from fastapi.responses import StreamingResponse
 
 from rock.actions import (
     BashObservation,
@@ -14,21 +15,29 @@ from rock.actions import (
     IsAliveResponse,
     ReadFileResponse,
     RockResponse,
+    UploadChunkResponse,
     UploadResponse,
+    WaitProcessResponse,
     WriteFileResponse,
 )
 from rock.actions.response import ResponseStatus
 from rock.admin.proto.request import (
     SandboxBashAction,
+    SandboxBatchCommand,
+    SandboxBatchStopRequest,
     SandboxCloseBashSessionRequest,
     SandboxCommand,
     SandboxCreateBashSessionRequest,
+    SandboxDownloadChunkRequest,
     SandboxReadFileRequest,
     SandboxStartRequest,
+    SandboxUploadChunkRequest,
+    SandboxUploadStatusRequest,
+    SandboxWaitProcessRequest,
     SandboxWriteFileRequest,
     StartHeaders,
 )
-from rock.admin.proto.response import SandboxStartResponse
+from rock.admin.proto.response import SandboxStartResponse, SandboxStatusResponse
 from rock.common.constants import (
     CPU_OVERCOMMIT_ALLOWED_KEYS_KEY,
     CPU_OVERCOMMIT_HEADROOM_KEY,
@@ -52,6 +61,8 @@ logger = init_logger(__name__)
 
 _MIRROR_PROBE_CACHE: dict[str, tuple[bool, float]] = {}
 _MIRROR_PROBE_TTL_SECONDS = 60.0
+# Upper bound of one /wait_ready long-poll; clients waiting longer poll again.
+WAIT_READY_MAX_SECONDS = 120.0
 
 sandbox_router = APIRouter()
 sandbox_manager: SandboxManager
@@ -378,12 +389,30 @@ async def get_status(sandbox_id: NonBlankStr, include_all_states: bool = False):
     return RockResponse(result=await sandbox_manager.get_status(sandbox_id, include_all_states=include_all_states))
 
 
+@sandbox_router.get("/wait_ready")
+@handle_exceptions(error_message="wait sandbox ready failed")
+async def wait_ready(
+    sandbox_id: NonBlankStr, timeout: Annotated[float, Query(gt=0, le=WAIT_READY_MAX_SECONDS)] = 30.0
+) -> RockResponse[SandboxStatusResponse]:
+    """Long-poll: returns as soon as the sandbox is alive or failed to start, or after ``timeout`` seconds."""
+    return RockResponse(result=await sandbox_manager.wait_ready(sandbox_id, timeout))
+
+
 @sandbox_router.post("/execute")
 @handle_exceptions(error_message="execute command failed")
 async def execute(command: SandboxCommand) -> RockResponse[CommandResponse]:
     return RockResponse(result=await sandbox_manager.execute(command))
 
 
+@sandbox_router.post("/batch_execute")
+@handle_exceptions(error_message="batch execute command failed")
+async def batch_execute(request: SandboxBatchCommand) -> StreamingResponse:
+    results = await sandbox_manager.batch_execute(request)
+    return StreamingResponse(
+        (result.model_dump_json() + "\n" async for result in results), media_type="application/x-ndjson"
+    )
+
+
 @sandbox_router.post("/create_session")
 @handle_exceptions(error_message="create session failed")
 async def create_session(request: SandboxCreateBashSessionRequest) -> RockResponse[CreateBashSessionResponse]:
@@ -411,6 +440,12 @@ async def read_file(request: SandboxReadFileRequest) -> RockResponse[ReadFileRes
     return RockResponse(result=await sandbox_manager.read_file(request))
 
 
+@sandbox_router.post("/wait_process")
+@handle_exceptions(error_message="wait process failed")
+async def wait_process(request: SandboxWaitProcessRequest) -> RockResponse[WaitProcessResponse]:
+    return RockResponse(result=await sandbox_manager.wait_process(request))
+
+
 @sandbox_router.post("/write_file")
 @handle_exceptions(error_message="write file failed")
 async def write_file(request: SandboxWriteFileRequest) -> RockResponse[WriteFileResponse]:
@@ -427,6 +462,26 @@ async def upload(
     return RockResponse(result=await sandbox_manager.upload(file, target_path, sandbox_id))
 
 
+@sandbox_router.get("/upload_status")
+@handle_exceptions(error_message="get upload status failed")
+async def upload_status(params: Annotated[SandboxUploadStatusRequest, Query()]) -> RockResponse[UploadChunkResponse]:
+    return RockResponse(result=await sandbox_manager.upload_status(params))
+
+
+@sandbox_router.post("/upload_chunk")
+@handle_exceptions(error_message="upload chunk failed")
+async def upload_chunk(
+    request: Request, params: Annotated[SandboxUploadChunkRequest, Query()]
+) -> RockResponse[UploadChunkResponse]:
+    return RockResponse(result=await sandbox_manager.upload_chunk(params, request.stream()))
+
+
+@sandbox_router.get("/download")
+@handle_exceptions(error_message="download file failed")
+async def download(params: Annotated[SandboxDownloadChunkRequest, Query()]) -> StreamingResponse:
+    return await sandbox_manager.download(params)
+
+
 @sandbox_router.post("/stop")
 @handle_exceptions(error_message="stop sandbox failed")
 async def close(sandbox_id: Annotated[NonBlankStr, Body(embed=True)]) -> RockResponse[str]:
@@ -434,6 +489,15 @@ async def close(sandbox_id: Annotated[NonBlankStr, Body(embed=True)]) -> RockRes
     return RockResponse(result=f"{sandbox_id} stopped")
 
 
+@sandbox_router.post("/batch_stop")
+@handle_exceptions(error_message="batch stop sandboxes failed")
+async def batch_stop(request: SandboxBatchStopRequest) -> StreamingResponse:
+    results = await sandbox_manager.batch_stop(request.sandbox_ids)
+    return StreamingResponse(
+        (result.model_dump_json() + "\n" async for result in results), media_type="application/x-ndjson"
+    )
+
+
 @sandbox_router.post("/delete")
 @handle_exceptions(error_message="delete sandbox failed")
 async def delete(sandbox_id: str = Body(..., embed=True)) -> RockResponse:
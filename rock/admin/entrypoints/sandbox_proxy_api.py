@@ -3,6 +3,7 @@ from typing import Annotated, Any
 
 from fastapi import APIRouter, Body, File, Form, Query, Request, UploadFile, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse as _JSONResponse
+from fastapi.responses import StreamingResponse
 
 from rock.actions import (
     BashObservation,
@@ -12,17 +13,24 @@ from rock.actions import (
     ReadFileResponse,
     ResponseStatus,
     RockResponse,
+    UploadChunkResponse,
     UploadResponse,
+    WaitProcessResponse,
     WriteFileResponse,
 )
 from rock.admin.proto.request import (
     BatchSandboxStatusRequest,
     SandboxBashAction,
+    SandboxBatchCommand,
     SandboxCloseBashSessionRequest,
     SandboxCommand,
     SandboxCreateBashSessionRequest,
+    SandboxDownloadChunkRequest,
     SandboxQueryParams,
     SandboxReadFileRequest,
+    SandboxUploadChunkRequest,
+    SandboxUploadStatusRequest,
+    SandboxWaitProcessRequest,
     SandboxWriteFileRequest,
 )
 from rock.admin.proto.response import BatchSandboxStatusResponse, SandboxListResponse
@@ -115,6 +123,15 @@ async def execute(command: SandboxCommand) -> RockResponse[CommandResponse]:
     return RockResponse(result=await sandbox_proxy_service.execute(command))
 
 
+@sandbox_proxy_router.post("/batch_execute")
+@handle_exceptions(error_message="batch execute command failed")
+async def batch_execute(request: SandboxBatchCommand) -> StreamingResponse:
+    results = await sandbox_proxy_service.batch_execute(request)
+    return StreamingResponse(
+        (result.model_dump_json() + "\n" async for result in results), media_type="application/x-ndjson"
+    )
+
+
 @sandbox_proxy_router.post("/create_session")
 @handle_exceptions(error_message="create session failed")
 async def create_session(request: SandboxCreateBashSessionRequest) -> RockResponse[CreateBashSessionResponse]:
@@ -158,6 +175,12 @@ async def read_file(request: SandboxReadFileRequest) -> RockResponse[ReadFileRes
     return RockResponse(result=await sandbox_proxy_service.read_file(request))
 
 
+@sandbox_proxy_router.post("/wait_process")
+@handle_exceptions(error_message="wait process failed")
+async def wait_process(request: SandboxWaitProcessRequest) -> RockResponse[WaitProcessResponse]:
+    return RockResponse(result=await sandbox_proxy_service.wait_process(request))
+
+
 @sandbox_proxy_router.post("/write_file")
 @handle_exceptions(error_message="write file failed")
 async def write_file(request: SandboxWriteFileRequest) -> RockResponse[WriteFileResponse]:
@@ -174,6 +197,26 @@ async def upload(
     return RockResponse(result=await sandbox_proxy_service.upload(file, target_path, sandbox_id))
 
 
+@sandbox_proxy_router.get("/upload_status")
+@handle_exceptions(error_message="get upload status failed")
+async def upload_status(params: Annotated[SandboxUploadStatusRequest, Query()]) -> RockResponse[UploadChunkResponse]:
+    return RockResponse(result=await sandbox_proxy_service.upload_status(params))
+
+
+@sandbox_proxy_router.post("/upload_chunk")
+@handle_exceptions(error_message="upload chunk failed")
+async def upload_chunk(
+    request: Request, params: Annotated[SandboxUploadChunkRequest, Query()]
+) -> RockResponse[UploadChunkResponse]:
+    return RockResponse(result=await sandbox_proxy_service.upload_chunk(params, request.stream()))
+
+
+@sandbox_proxy_router.get("/download")
+@handle_exceptions(error_message="download file failed")
+async def download(params: Annotated[SandboxDownloadChunkRequest, Query()]) -> StreamingResponse:
+    return await sandbox_proxy_service.download(params)
+
+
 @sandbox_proxy_router.get("/sandboxes")
 @handle_exceptions(error_message="list sandboxes failed")
 async def list_sandboxes(request: Request) -> RockResponse[SandboxListResponse]:
@@ -3,6 +3,10 @@ from typing import Any
 from fastapi import APIRouter, Body
 
 from rock.actions import (
+    EnvBatchResetRequest,
+    EnvBatchResetResponse,
+    EnvBatchStepRequest,
+    EnvBatchStepResponse,
     EnvCloseRequest,
     EnvCloseResponse,
     EnvListResponse,
@@ -41,6 +45,16 @@ async def env_reset(request: EnvResetRequest) -> EnvResetResponse:
     return await sandbox_manager.env_reset(request)
 
 
+@gem_router.post("/step_batch")
+async def env_step_batch(request: EnvBatchStepRequest) -> EnvBatchStepResponse:
+    return await sandbox_manager.env_step_batch(request)
+
+
+@gem_router.post("/reset_batch")
+async def env_reset_batch(request: EnvBatchResetRequest) -> EnvBatchResetResponse:
+    return await sandbox_manager.env_reset_batch(request)
+
+
 @gem_router.post("/close")
 async def env_close(request: EnvCloseRequest) -> EnvCloseResponse:
     return await sandbox_manager.env_close(request)
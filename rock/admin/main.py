@@ -1,5 +1,6 @@
 import argparse
 import asyncio
+import dataclasses
 import json
 import logging
 import time
@@ -38,14 +39,15 @@ from rock.admin.scheduler.tasks.sandbox_log_archive_task import (
 )
 from rock.admin.service.ops_service import OpsService
 from rock.common.exception import request_validation_exception_handler
-from rock.config import DatabaseConfig, RockConfig, SchedulerConfig
+from rock.config import RockConfig, SchedulerConfig
 from rock.logger import init_logger
 from rock.sandbox.gem_manager import GemManager
 from rock.sandbox.operator.factory import OperatorContext, OperatorFactory
 from rock.sandbox.sandbox_meta_store import SandboxMetaStore
 from rock.sandbox.service.sandbox_proxy_service import SandboxProxyService
+from rock.sandbox.service.warm_pool_service import WarmPoolService
 from rock.sandbox.service.warmup_service import WarmupService
-from rock.utils import EAGLE_EYE_TRACE_ID, sandbox_id_ctx_var, trace_id_ctx_var
+from rock.utils import EAGLE_EYE_TRACE_ID, HttpUtils, sandbox_id_ctx_var, trace_id_ctx_var
 from rock.utils.providers import RedisProvider
 from rock.utils.system import is_primary_pod
 
@@ -123,7 +125,7 @@ async def lifespan(app: FastAPI):
     db_url = rock_config.database.url or "sqlite+aiosqlite:///:memory:"
     if not rock_config.database.url:
         logger.info("database.url is not configured, falling back to SQLite in-memory")
-    db_provider = DatabaseProvider(db_config=DatabaseConfig(url=db_url))
+    db_provider = DatabaseProvider(db_config=dataclasses.replace(rock_config.database, url=db_url))
     await db_provider.init()
     if not rock_config.database.url:
         await db_provider.create_tables()
@@ -182,6 +184,8 @@ async def lifespan(app: FastAPI):
         warmup_service = WarmupService(rock_config.warmup)
         await warmup_service.init()
         set_warmup_service(warmup_service)
+        warm_pool_service = WarmPoolService(rock_config.runtime.warm_pool, sandbox_manager.metrics_monitor)
+        await warm_pool_service.init()
         set_env_service(sandbox_manager)
 
         if rock_config.scheduler.enabled and is_primary_pod():
@@ -209,12 +213,18 @@ async def lifespan(app: FastAPI):
         scheduler_thread.stop()
         logger.info("Scheduler thread stopped")
 
+    # flush write-behind expire-time refreshes (redis) and sandbox updates (db) before closing them
+    await sandbox_manager.aclose()
+    await meta_store.aclose()
+
     if db_provider:
         await db_provider.close()
 
     if redis_provider:
         await redis_provider.close_pool()
 
+    await HttpUtils.aclose()
+
     logger.info("rock-admin exit")
 
 
@@ -24,6 +24,10 @@ class MetricsConstants:
 
     SANDBOX_PHASE_FAILURE = "sandbox.phase.failure"
 
+    WARM_POOL_HIT = "warm_pool.hit"
+    WARM_POOL_MISS = "warm_pool.miss"
+    WARM_POOL_IDLE = "warm_pool.idle"
+
     METASTORE_TOTAL = "meta_store.total"
     METASTORE_SUCCESS = "meta_store.success"
     METASTORE_FAILURE = "meta_store.failure"
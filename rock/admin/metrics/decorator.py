@@ -12,6 +12,7 @@ from rock.admin.metrics.monitor import MetricsMonitor
 
 if TYPE_CHECKING:
     from rock.sandbox.sandbox_meta_store import SandboxMetaStore
+    from rock.sandbox.service.route_cache import SandboxRouteCache
 
 
 def _extract_sandbox_id(
@@ -44,19 +45,25 @@ def _extract_sandbox_id(
     return sandbox_id
 
 
-async def _get_user_info(meta_store: SandboxMetaStore | None, sandbox_id: str):
-    """Get user info via meta_store (SandboxMetaStore.get)."""
-    if meta_store and sandbox_id != "unknown":
+async def _get_user_info(
+    meta_store: SandboxMetaStore | None, sandbox_id: str, route_cache: SandboxRouteCache | None = None
+):
+    """Get user info via the route cache when enabled, else meta_store (SandboxMetaStore.get)."""
+    if route_cache is not None and route_cache.enabled and sandbox_id != "unknown":
+        sandbox_info = await route_cache.get(sandbox_id)
+    elif meta_store and sandbox_id != "unknown":
         sandbox_info = await meta_store.get(sandbox_id)
-        if sandbox_info is not None:
-            user_id = sandbox_info.get("user_id")
-            experiment_id = sandbox_info.get("experiment_id")
-            namespace = sandbox_info.get("namespace")
-            return (
-                user_id if user_id is not None else "default",
-                experiment_id if experiment_id is not None else "default",
-                namespace if namespace is not None else "default",
-            )
+    else:
+        sandbox_info = None
+    if sandbox_info is not None:
+        user_id = sandbox_info.get("user_id")
+        experiment_id = sandbox_info.get("experiment_id")
+        namespace = sandbox_info.get("namespace")
+        return (
+            user_id if user_id is not None else "default",
+            experiment_id if experiment_id is not None else "default",
+            namespace if namespace is not None else "default",
+        )
     return "default", "default", "default"
 
 
@@ -180,7 +187,8 @@ def monitor_sandbox_operation(
                 )
 
                 meta_store = getattr(self, "_meta_store", None)
-                user_id, experiment_id, namespace = await _get_user_info(meta_store, sandbox_id)
+                route_cache = getattr(self, "route_cache", None)
+                user_id, experiment_id, namespace = await _get_user_info(meta_store, sandbox_id, route_cache)
 
                 # Build attributes
                 attributes = _build_attributes(op_name, sandbox_id, f, user_id, experiment_id, namespace)
@@ -99,6 +99,11 @@ class MetricsMonitor:
         # Phase failure metrics
         self._register_counter(MetricsConstants.SANDBOX_PHASE_FAILURE, "Number of sandbox phase failures")
 
+        # Warm pool metrics, summed over all nodes per image
+        self._register_gauge(MetricsConstants.WARM_POOL_HIT, "Sandbox starts served by a warm container")
+        self._register_gauge(MetricsConstants.WARM_POOL_MISS, "Sandbox starts that found no warm container")
+        self._register_gauge(MetricsConstants.WARM_POOL_IDLE, "Warm containers waiting to be claimed")
+
         # Ray cluster resource metrics (total and available resources)
         self._register_gauge(MetricsConstants.TOTAL_CPU_RESOURCE, "Total CPU resource in Ray cluster")
         self._register_gauge(MetricsConstants.TOTAL_MEM_RESOURCE, "Total memory resource in Ray cluster")
@@ -9,7 +9,11 @@ from rock.actions import (
     CloseBashSessionRequest,
     Command,
     CreateBashSessionRequest,
+    DownloadChunkRequest,
     ReadFileRequest,
+    UploadChunkRequest,
+    UploadStatusRequest,
+    WaitProcessRequest,
     WriteFileRequest,
 )
 from rock.common.validation import NonBlankStr
@@ -46,7 +50,9 @@ class SandboxStartRequest(BaseModel):
     """GPU accelerator type (e.g. 'A100', 'V100'). If not specified, any available GPU will be used."""
 
 
-class SandboxCommand(Command):
+class _SandboxCommandOptions(Command):
+    """How a command runs in a sandbox; shared by single and batch commands so the two cannot drift apart."""
+
     timeout: float | None = 1200
     """The timeout for the command. None means no timeout."""
     shell: bool = False
@@ -63,10 +69,27 @@ class SandboxCommand(Command):
     """Environment variables to pass to the command."""
     cwd: str | None = None
     """The current working directory to run the command in."""
+
+
+class SandboxCommand(_SandboxCommandOptions):
     sandbox_id: NonBlankStr
     """The id of the sandbox."""
 
 
+class SandboxBatchCommand(_SandboxCommandOptions):
+    """One command run in many sandboxes, see ``SandboxProxyService.batch_execute``."""
+
+    sandbox_ids: list[NonBlankStr] = Field(min_length=1)
+    """The ids of the sandboxes to run the command in."""
+
+
+class SandboxBatchStopRequest(BaseModel):
+    """Many sandboxes to stop at once, see ``SandboxManager.batch_stop``."""
+
+    sandbox_ids: list[NonBlankStr] = Field(min_length=1)
+    """The ids of the sandboxes to stop."""
+
+
 class SandboxCreateBashSessionRequest(CreateBashSessionRequest):
     startup_timeout: float = 1.0
     max_read_size: int = 2000
@@ -114,6 +137,30 @@ class SandboxWriteFileRequest(WriteFileRequest):
     sandbox_id: NonBlankStr
 
 
+class SandboxStatusProbeRequest(BaseModel):
+    """Asks a worker rocklet for a sandbox's persisted service status and liveness in one call."""
+
+    sandbox_id: NonBlankStr
+    host_ip: str | None = None
+    """Address the sandbox's proxy port is published on; without it liveness is not probed."""
+
+
+class SandboxWaitProcessRequest(WaitProcessRequest):
+    sandbox_id: NonBlankStr
+
+
+class SandboxUploadChunkRequest(UploadChunkRequest):
+    sandbox_id: NonBlankStr
+
+
+class SandboxUploadStatusRequest(UploadStatusRequest):
+    sandbox_id: NonBlankStr
+
+
+class SandboxDownloadChunkRequest(DownloadChunkRequest):
+    sandbox_id: NonBlankStr
+
+
 class WarmupRequest(BaseModel):
     image: str = "python:3.11"
 
@@ -127,6 +174,9 @@ class SandboxQueryParams(TypedDict, total=False):
 
     page: str
     page_size: str
+    cursor: str
+    fields: str
+    count: str
     user_id: str
     experiment_id: str
     namespace: str
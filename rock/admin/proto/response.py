@@ -71,10 +71,18 @@ class BatchSandboxStatusResponse(SandboxResponse):
     statuses: list[SandboxStatusResponse] | None = None
 
 
+class SandboxStatusProbeResponse(BaseModel):
+    status: dict | None = None
+    """``ServiceStatus.to_dict()`` of the persisted status file; None if the file is missing or empty."""
+    is_alive: bool = False
+
+
 class SandboxListResponse(SandboxResponse):
     items: list[SandboxListStatusResponse] = []
-    total: int = 0
+    total: int | None = 0
+    """None when the request passed ``count=false``."""
     has_more: bool = False
+    next_cursor: str | None = None
 
 
 class TaskSetMetadata(BaseModel):
@@ -4,7 +4,6 @@ import json
 import os
 import traceback
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -77,18 +76,16 @@ class BaseTask(ABC):
         self.idempotency = idempotency
         self.process_name = process_name
         self.status_file_path = f"{env_vars.ROCK_SCHEDULER_STATUS_DIR}/{type}_status.json"
-        self._executor = ThreadPoolExecutor(max_workers=100)
 
     def _get_runtime(self, ip: str) -> RemoteSandboxRuntime:
         """Create a new RemoteSandboxRuntime instance for the given worker IP.
 
-        Each call creates a new instance to ensure thread-safety in concurrent scenarios.
-        The shared thread pool executor is reused across all instances.
+        Instances are cheap: the connections to each worker are pooled by ``HttpClientPool``
+        and shared across all of them.
         """
         return RemoteSandboxRuntime(
             host=ip,
             port=Port.PROXY.value,
-            executor=self._executor,
         )
 
     @classmethod
@@ -6,11 +6,10 @@ import random
 import re
 import shlex
 import subprocess
-import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from typing_extensions import Self
 
@@ -34,15 +33,17 @@ from rock.utils import (
     DockerUtil,
     ImageUtil,
     StageTimer,
-    find_free_port,
+    find_free_ports,
     get_executor,
     refresh_docker_used_ports,
     release_port,
     sandbox_id_ctx_var,
-    timeout,
     wait_until_alive,
 )
 
+if TYPE_CHECKING:
+    from rock.deployments.warm_pool import WarmContainer
+
 __all__ = ["DockerDeployment", "DockerDeploymentConfig"]
 CHECK_CLEAR_INTERVAL_SECONDS = 300
 
@@ -72,6 +73,7 @@ class DockerDeployment(AbstractDeployment):
         self._stop_time = datetime.datetime.now() + datetime.timedelta(minutes=self._config.auto_clear_time)
         self._check_stop_task = None
         self._container_name = None
+        self._log_dir: str | None = None
         self._service_status = PersistedServiceStatus()
 
         if self._config.container_name:
@@ -457,7 +459,7 @@ class DockerDeployment(AbstractDeployment):
             )
             if findmnt_result.returncode != 0 or not findmnt_result.stdout.strip():
                 logger.warning(
-                    f"findmnt failed for upper_dir {upper_dir!r}: " f"{findmnt_result.stderr.strip() or 'empty output'}"
+                    f"findmnt failed for upper_dir {upper_dir!r}: {findmnt_result.stderr.strip() or 'empty output'}"
                 )
                 return
             xfs_mountpoint = findmnt_result.stdout.strip()
@@ -484,12 +486,26 @@ class DockerDeployment(AbstractDeployment):
             logger.warning(f"Failed to share rootfs prjid with log dir {log_file_path!r}: {e}")
 
     async def start(self):
-        """Starts the runtime."""
+        """Starts the runtime.
+
+        Every blocking docker/filesystem call runs off the event loop, so one actor can start several
+        sandboxes at once. Stages that do not depend on each other (image pull and check, port
+        allocation, log dir and kata disk preparation, and the start jitter) run concurrently.
+        """
+        if self._container_name is None:
+            self.set_container_name(self._get_container_name())
+        self._service_status.set_sandbox_id(self._container_name)
+        executor = get_executor()
+        loop = asyncio.get_running_loop()
+
         with StageTimer("startup_timing", f"[{self._container_name}] Check availability", logger):
-            if not self.sandbox_validator.check_availability():
+            available, storage_opt_supported = await asyncio.gather(
+                loop.run_in_executor(executor, self.sandbox_validator.check_availability),
+                loop.run_in_executor(executor, DockerUtil.detect_storage_opt_support),
+            )
+            if not available:
                 raise Exception("Docker is not available")
 
-        storage_opt_supported = DockerUtil.detect_storage_opt_support()
         # Resolve effective rootfs quota: downgrade to None if storage-opt is not supported.
         if self._config.disk_limit_rootfs is not None and not storage_opt_supported:
             logger.warning(
@@ -500,22 +516,53 @@ class DockerDeployment(AbstractDeployment):
         else:
             self._effective_disk_limit_rootfs = self._config.disk_limit_rootfs
 
-        if self._container_name is None:
-            self.set_container_name(self._get_container_name())
-        self._service_status.set_sandbox_id(self._container_name)
-        executor = get_executor()
-        loop = asyncio.get_running_loop()
-
-        await loop.run_in_executor(executor, self._pull_image)
-        if self._config.python_standalone_dir is not None:
-            image_id = self._build_image()
-        else:
-            image_id = self._config.image
-
-        if not self.sandbox_validator.check_resource(image_id):
-            raise Exception(f"Image {image_id} is not valid")
+        async def prepare_image() -> str:
+            await loop.run_in_executor(executor, self._pull_image)
+            if self._config.python_standalone_dir is not None:
+                image_id = await loop.run_in_executor(executor, self._build_image)
+            else:
+                image_id = self._config.image
+            if not await loop.run_in_executor(executor, self.sandbox_validator.check_resource, image_id):
+                raise Exception(f"Image {image_id} is not valid")
+            return image_id
+
+        async def prepare_log_dir() -> str | None:
+            # Conditionally set up logging path mount based on ROCK_LOGGING_PATH.
+            if not env_vars.ROCK_LOGGING_PATH:  # Only mount if ROCK_LOGGING_PATH is set (not None or empty)
+                return None
+            log_file_path = f"{env_vars.ROCK_LOGGING_PATH}/{self.container_name}"
+            await loop.run_in_executor(executor, self._make_log_dir, log_file_path)
+            return log_file_path
+
+        async def prepare_kata_disk() -> None:
+            # Kata DinD: prepare disk image, mounted below
+            if self._config.use_kata_runtime:
+                with StageTimer("startup_timing", f"[{self._container_name}] Kata disk prepare", logger):
+                    await loop.run_in_executor(executor, self._prepare_kata_disk)
+
+        async def jitter() -> None:
+            # Spreads out `docker create` calls of sandboxes started together; overlaps with the stages above.
+            with StageTimer("startup_timing", f"[{self._container_name}] Random sleep", logger):
+                await asyncio.sleep(random.uniform(0, 5))
+
+        results = await asyncio.gather(
+            prepare_image(),
+            self.do_port_mapping(),
+            prepare_log_dir(),
+            prepare_kata_disk(),
+            jitter(),
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            # Undo what the stages that did succeed left behind.
+            await loop.run_in_executor(executor, self._cleanup_kata_disk)
+            for port in self._service_status.get_port_mapping().values():
+                release_port(port)
+            raise errors[0]
+        image_id, _, log_file_path, _, _ = results
+        self._log_dir = log_file_path
 
-        await self.do_port_mapping()
         platform_arg = []
         if self._config.platform is not None:
             platform_arg = ["--platform", self._config.platform]
@@ -523,28 +570,14 @@ class DockerDeployment(AbstractDeployment):
         if self._config.remove_container:
             rm_arg = ["--rm"]
 
-        # Conditionally set up logging path mount based on ROCK_LOGGING_PATH.
-        log_file_path: str | None = None
         volume_args = self._prepare_volume_mounts()
-        if env_vars.ROCK_LOGGING_PATH:  # Only mount if ROCK_LOGGING_PATH is set (not None or empty)
-            log_file_path = f"{env_vars.ROCK_LOGGING_PATH}/{self.container_name}"
-            os.makedirs(log_file_path, exist_ok=True)
-            os.chmod(log_file_path, 0o777)
+        if log_file_path is not None:
             volume_args.extend(["-v", f"{log_file_path}:{env_vars.ROCK_LOGGING_PATH}"])
-
         volume_args.extend(self._prepare_timezone_mount())
-
-        # Kata DinD: prepare disk image and add volume mount
         if self._config.use_kata_runtime:
-            with StageTimer("startup_timing", f"[{self._container_name}] Kata disk prepare", logger):
-                self._prepare_kata_disk()
-            disk_path = self._get_kata_disk_image_path()
-            volume_args.extend(["-v", f"{disk_path}:/docker-disk.img"])
+            volume_args.extend(["-v", f"{self._get_kata_disk_image_path()}:/docker-disk.img"])
 
         env_arg = self._build_env_args()
-
-        with StageTimer("startup_timing", f"[{self._container_name}] Random sleep", logger):
-            time.sleep(random.randint(0, 5))
         runtime_args = self._build_runtime_args()
         cmds = [
             "docker",
@@ -578,7 +611,7 @@ class DockerDeployment(AbstractDeployment):
         logger.info(f"Command: {cmd_str!r}")
         # shell=True required for && etc.
         with StageTimer("startup_timing", f"[{self._container_name}] Docker start", logger):
-            await loop.run_in_executor(executor, self._docker_create, cmds)
+            await self._docker_create(cmds)
             # After docker create succeeds, the container exists in `created` state. If anything below
             # fails before _wait_until_alive sets _container_process up for _stop to manage, we own the
             # orphan and must remove it. _wait_until_alive's own failure path already calls self.stop().
@@ -587,10 +620,10 @@ class DockerDeployment(AbstractDeployment):
                 # before any container process can write. The bhard is set by `--storage-opt
                 # size=` on the rootfs prjid, so log and rootfs share one quota.
                 if log_file_path is not None:
-                    self._setup_log_dir_quota_shared(log_file_path)
+                    await loop.run_in_executor(executor, self._setup_log_dir_quota_shared, log_file_path)
                 self._container_process = await loop.run_in_executor(executor, self._docker_start)
             except Exception:
-                DockerUtil.remove_container_force(self._container_name)
+                await loop.run_in_executor(executor, DockerUtil.remove_container_force, self._container_name)
                 raise
         await loop.run_in_executor(executor, self._hooks.on_custom_step, DeploymentHookStep.STARTING_RUNTIME)
         logger.info(f"Starting runtime at {self._config.port}")
@@ -603,6 +636,84 @@ class DockerDeployment(AbstractDeployment):
         if self._config.enable_auto_clear:
             self._check_stop_task = asyncio.create_task(self._check_stop())
 
+    @staticmethod
+    def _make_log_dir(log_file_path: str) -> None:
+        os.makedirs(log_file_path, exist_ok=True)
+        os.chmod(log_file_path, 0o777)
+
+    async def adopt(self, container: "WarmContainer") -> None:
+        """Take over a started container from the warm pool instead of starting a new one.
+
+        The container is renamed to this deployment's container name. If its rocklet does not answer
+        or the rename fails, the container is left untouched and the error is raised, so the caller can
+        hand it back to the pool. Failures after the rename remove the container.
+        """
+        if self._container_name is None:
+            self.set_container_name(self._get_container_name())
+        executor = get_executor()
+        loop = asyncio.get_running_loop()
+        runtime = RemoteSandboxRuntime.from_config(
+            RemoteSandboxRuntimeConfig(port=container.port_mapping[Port.PROXY], timeout=self._runtime_timeout)
+        )
+        runtime.set_executor(executor)
+        if not (await runtime.is_alive(timeout=5)).is_alive:
+            raise RuntimeError(f"Warm container {container.container_name} is not alive")
+        await loop.run_in_executor(executor, self._docker_rename, container.container_name, self._container_name)
+
+        try:
+            self._service_status.set_sandbox_id(self._container_name)
+            self._service_status.update_status(
+                phase_name="image_pull", status=Status.SUCCESS, message="use warm container, skip image pull"
+            )
+            for port, host_port in container.port_mapping.items():
+                self._service_status.add_port_mapping(port, host_port)
+            self._config.port = container.port_mapping[Port.PROXY]
+            self._effective_disk_limit_rootfs = container.effective_disk_limit_rootfs
+            if container.log_dir is not None:
+                # The container keeps writing to the log dir it was started with; expose it under the sandbox id too.
+                self._log_dir = f"{env_vars.ROCK_LOGGING_PATH}/{self._container_name}"
+                await loop.run_in_executor(executor, os.symlink, container.log_dir, self._log_dir)
+            # Tracks the container's lifetime the way `docker start -a` does for containers started here.
+            self._container_process = await loop.run_in_executor(executor, self._docker_wait)
+            self._service_status.update_status(
+                phase_name="docker_run", status=Status.RUNNING, message="docker run running"
+            )
+        except Exception:
+            await loop.run_in_executor(executor, DockerUtil.remove_container_force, self._container_name)
+            raise
+        self._runtime = runtime
+        await self._wait_until_alive(timeout=self._config.startup_timeout)
+        if self._config.enable_auto_clear:
+            self._check_stop_task = asyncio.create_task(self._check_stop())
+
+    def detach(self) -> None:
+        """Forget the started container without stopping it, after it was handed to another deployment.
+
+        `docker start -a` is killed with SIGKILL, which it cannot proxy to the container. The container
+        keeps its host ports, so they stay registered in this process until released explicitly.
+        """
+        if self._container_process is not None:
+            self._container_process.kill()
+            self._container_process.wait()
+            self._container_process = None
+        if self._check_stop_task is not None:
+            self._check_stop_task.cancel()
+            self._check_stop_task = None
+        self._runtime = None
+
+    @staticmethod
+    def _docker_rename(old_name: str, new_name: str) -> None:
+        subprocess.run(["docker", "rename", old_name, new_name], capture_output=True, check=True, timeout=30)
+
+    def _docker_wait(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            ["docker", "wait", self._container_name], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+
+    @property
+    def log_dir(self) -> str | None:
+        return self._log_dir
+
     def _build_env_args(self) -> list[str]:
         """Construct `-e KEY=VALUE` argv pairs for `docker run`.
 
@@ -651,16 +762,22 @@ class DockerDeployment(AbstractDeployment):
         logger.info(f"volume_args: {volume_args}")
         return volume_args
 
-    def _docker_create(self, cmd: list[str]) -> None:
+    async def _docker_create(self, cmd: list[str]) -> None:
         """Create the container without starting it."""
+        process = await asyncio.create_subprocess_exec(*cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
         try:
-            subprocess.check_call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=60)
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-            logger.error(f"Failed to create container {self._container_name}")
-            self._service_status.update_status(
-                phase_name="docker_run", status=Status.FAILED, message="docker run failed"
-            )
-            raise
+            _, stderr = await asyncio.wait_for(process.communicate(), timeout=60)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            error = subprocess.TimeoutExpired(cmd, 60)
+        else:
+            if process.returncode == 0:
+                return
+            error = subprocess.CalledProcessError(process.returncode, cmd, stderr=stderr)
+        logger.error(f"Failed to create container {self._container_name}: {error}")
+        self._service_status.update_status(phase_name="docker_run", status=Status.FAILED, message="docker run failed")
+        raise error
 
     def _docker_start(self) -> subprocess.Popen:
         """Start a previously-created container with stdout/stderr attached."""
@@ -685,6 +802,12 @@ class DockerDeployment(AbstractDeployment):
         stop_executor = ThreadPoolExecutor(max_workers=3)
         loop = asyncio.get_running_loop()
         if self._runtime:
+            try:
+                await asyncio.wait_for(self._runtime.close(), timeout=5)
+            except asyncio.TimeoutError as e:
+                logger.error("close timeout", exc_info=e)
+            except Exception as e:
+                logger.error("close failed", exc_info=e)
             await loop.run_in_executor(stop_executor, self._stop)
 
     async def restart(self):
@@ -790,15 +913,7 @@ class DockerDeployment(AbstractDeployment):
         """Stops the runtime."""
         if self._container_name in ENV_POOL:
             del ENV_POOL[self._container_name]
-        if self._runtime is not None:
-            try:
-                with timeout(5):
-                    self._runtime.close()
-            except TimeoutError as e:
-                logger.error("close timeout", exc_info=e)
-            except Exception as e:
-                logger.error("close failed", exc_info=e)
-            self._runtime = None
+        self._runtime = None
 
         if self._container_process is not None:
             try:
@@ -891,12 +1006,11 @@ class DockerDeployment(AbstractDeployment):
         return self._service_status
 
     async def do_port_mapping(self):
-        refresh_docker_used_ports()
-        proxy_port = await find_free_port()
+        # One docker scan and one allocation for all three ports.
+        await asyncio.get_running_loop().run_in_executor(get_executor(), refresh_docker_used_ports)
+        proxy_port, ssh_port, server_port = find_free_ports(3)
         self._service_status.add_port_mapping(Port.PROXY, proxy_port)
-        ssh_port = await find_free_port()
         self._service_status.add_port_mapping(Port.SSH, ssh_port)
-        server_port = await find_free_port()
         self._service_status.add_port_mapping(Port.SERVER, server_port)
         if self._config.port is None:
             self._config.port = proxy_port
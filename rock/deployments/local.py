@@ -56,7 +56,7 @@ class LocalDeployment(AbstractDeployment):
     async def stop(self):
         """Stops the runtime."""
         if self._runtime is not None:
-            self._runtime.close()
+            await self._runtime.close()
             self._runtime = None
 
     @property
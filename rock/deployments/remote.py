@@ -67,5 +67,5 @@ class RemoteDeployment(AbstractDeployment):
 
     async def stop(self):
         """Stops the runtime."""
-        self.runtime.close()
+        await self.runtime.close()
         self._runtime = None
@@ -0,0 +1,313 @@
+"""Per-node pool of pre-started sandbox containers.
+
+Starting a sandbox from scratch pulls/checks the image, creates and starts the container and waits for
+the rocklet inside to come up, which takes seconds to tens of seconds. A :class:`WarmContainerPool`
+keeps containers of recently requested specs started ahead of time, so a sandbox start on the same node
+can claim one and only has to take it over (see ``DockerDeployment.adopt``).
+
+The pool learns which specs to keep from the claims it sees: for each spec it keeps enough containers
+to cover the claims expected while a replacement starts (``refill_lead_seconds``) at the rate seen
+over ``demand_window_seconds``, capped by ``max_per_spec`` and ``max_per_node``. Specs without recent
+claims are drained. Creating and destroying containers is delegated to a :class:`WarmPoolBackend`, so
+the pool itself can be exercised without docker.
+"""
+
+import asyncio
+import contextlib
+import math
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from rock.actions import RemoteSandboxRuntimeConfig
+from rock.config import WarmPoolConfig
+from rock.deployments.config import DockerDeploymentConfig
+from rock.deployments.constants import Port
+from rock.deployments.docker import DockerDeployment
+from rock.logger import init_logger
+from rock.sandbox.remote_sandbox import RemoteSandboxRuntime
+from rock.utils import DockerUtil, get_executor, release_port
+
+logger = init_logger(__name__)
+
+WARM_CONTAINER_PREFIX = "rock-warm-"
+
+# Fields that shape the container itself; sandboxes that agree on all of them can share warm containers.
+_SPEC_FIELDS = (
+    "image",
+    "image_os",
+    "pull",
+    "python_standalone_dir",
+    "platform",
+    "docker_args",
+    "memory",
+    "cpus",
+    "limit_cpus",
+    "disk_limit_rootfs",
+    "use_kata_runtime",
+    "kata_disk_size",
+    "remove_container",
+)
+
+
+def spec_key(config: DockerDeploymentConfig) -> str:
+    return "|".join(f"{name}={getattr(config, name)}" for name in _SPEC_FIELDS)
+
+
+def is_poolable(config: DockerDeploymentConfig) -> bool:
+    """Whether a sandbox with *config* may be served from the pool.
+
+    Sandboxes with registry credentials or GPUs always start from scratch: credentials must not be kept
+    around for refills, and GPUs are assigned per sandbox.
+    """
+    return not config.registry_username and not config.num_gpus
+
+
+@dataclass
+class WarmContainer:
+    """A started container waiting in the pool. Plain data, so it can be handed to another process."""
+
+    container_name: str
+    spec: str
+    image: str
+    port_mapping: dict[int, int]
+    effective_disk_limit_rootfs: str | None = None
+    log_dir: str | None = None
+    created_at: float = 0.0
+
+
+def release_ports(container: WarmContainer) -> None:
+    """Drop this process's reservation of *container*'s host ports, once the container is gone.
+
+    A claimed container keeps its ports reserved in the pool's process, so refills cannot be given the
+    same ports while the sandbox that adopted it is still running.
+    """
+    for port in container.port_mapping.values():
+        release_port(port)
+
+
+class WarmPoolBackend(ABC):
+    @abstractmethod
+    async def create(self, config: DockerDeploymentConfig) -> WarmContainer:
+        """Create and start a container for *config*, returning once its rocklet is ready."""
+        ...
+
+    @abstractmethod
+    async def destroy(self, container: WarmContainer) -> None: ...
+
+    @abstractmethod
+    async def is_alive(self, container: WarmContainer) -> bool: ...
+
+    def detach(self, container: WarmContainer) -> None:
+        """Drop local handles on *container* without stopping it; it now belongs to whoever claimed it."""
+        pass
+
+
+class DockerWarmPoolBackend(WarmPoolBackend):
+    def __init__(self):
+        self._deployments: dict[str, DockerDeployment] = {}
+
+    async def create(self, config: DockerDeploymentConfig) -> WarmContainer:
+        container_name = f"{WARM_CONTAINER_PREFIX}{uuid.uuid4().hex}"
+        warm_config = DockerDeploymentConfig(
+            **config.model_dump(exclude={"container_name", "port", "enable_auto_clear", "type"}),
+            container_name=container_name,
+        )
+        deployment = DockerDeployment.from_config(warm_config)
+        try:
+            await deployment.start()
+        except Exception:
+            await deployment.stop()
+            raise
+        self._deployments[container_name] = deployment
+        return WarmContainer(
+            container_name=container_name,
+            spec=spec_key(config),
+            image=config.image,
+            port_mapping=deployment.get_status().get_port_mapping(),
+            effective_disk_limit_rootfs=deployment.effective_disk_limit_rootfs,
+            log_dir=deployment.log_dir,
+            created_at=time.time(),
+        )
+
+    async def destroy(self, container: WarmContainer) -> None:
+        deployment = self._deployments.pop(container.container_name, None)
+        if deployment is not None:
+            await deployment.stop()
+            return
+        # Claimed and handed back: this process no longer holds a deployment for it.
+        await asyncio.get_running_loop().run_in_executor(
+            get_executor(), DockerUtil.remove_container_force, container.container_name
+        )
+        release_ports(container)
+
+    async def is_alive(self, container: WarmContainer) -> bool:
+        runtime = RemoteSandboxRuntime.from_config(
+            RemoteSandboxRuntimeConfig(port=container.port_mapping[Port.PROXY], timeout=5)
+        )
+        try:
+            return (await runtime.is_alive()).is_alive
+        except Exception:
+            return False
+
+    def detach(self, container: WarmContainer) -> None:
+        deployment = self._deployments.pop(container.container_name, None)
+        if deployment is not None:
+            deployment.detach()
+
+
+@dataclass
+class _SpecState:
+    template: DockerDeploymentConfig
+    idle: deque[WarmContainer] = field(default_factory=deque)
+    claims: deque[float] = field(default_factory=deque)
+    filling: int = 0
+    hits: int = 0
+    misses: int = 0
+    retry_at: float = 0.0
+
+
+class WarmContainerPool:
+    def __init__(
+        self,
+        config: WarmPoolConfig,
+        backend: WarmPoolBackend,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._config = config
+        self._backend = backend
+        self._clock = clock
+        self._specs: dict[str, _SpecState] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._wakeup = asyncio.Event()
+        self._refill_task: asyncio.Task | None = None
+
+    def claim(self, config: DockerDeploymentConfig) -> WarmContainer | None:
+        """Take an idle container matching *config*, or return None on a miss.
+
+        Either way the claim counts as demand for the spec. Claims are served from a single event loop
+        without awaiting in between, so two claims never get the same container.
+        """
+        if not is_poolable(config):
+            return None
+        key = spec_key(config)
+        state = self._specs.get(key)
+        if state is None:
+            state = self._specs[key] = _SpecState(template=config.model_copy(deep=True))
+        state.claims.append(self._clock())
+        self._wakeup.set()
+        if not state.idle:
+            state.misses += 1
+            return None
+        state.hits += 1
+        container = state.idle.popleft()
+        self._backend.detach(container)
+        return container
+
+    async def release(self, container: WarmContainer, reusable: bool = False) -> None:
+        """Give back a claimed container, recycling it if it is *reusable* (never handed to a user) and still alive."""
+        state = self._specs.get(container.spec)
+        if (
+            self._config.recycle
+            and reusable
+            and state is not None
+            and len(state.idle) < self.target_size(container.spec)
+            and await self._backend.is_alive(container)
+        ):
+            state.idle.append(container)
+            return
+        await self._backend.destroy(container)
+
+    def target_size(self, key: str) -> int:
+        state = self._specs[key]
+        window = self._config.demand_window_seconds
+        cutoff = self._clock() - window
+        while state.claims and state.claims[0] < cutoff:
+            state.claims.popleft()
+        if not state.claims:
+            return 0
+        expected = math.ceil(len(state.claims) * self._config.refill_lead_seconds / window)
+        return min(self._config.max_per_spec, max(expected, 1))
+
+    def refill(self) -> list[asyncio.Task]:
+        """Start or destroy containers to move every spec towards its target size; returns the started tasks."""
+        now = self._clock()
+        tasks = []
+        deficits = []
+        for key, state in list(self._specs.items()):
+            target = self.target_size(key)
+            while len(state.idle) > target:
+                tasks.append(self._spawn(self._backend.destroy(state.idle.pop())))
+            if now >= state.retry_at and target > len(state.idle) + state.filling:
+                deficits.append((target - len(state.idle) - state.filling, key))
+        room = self._config.max_per_node - sum(len(s.idle) + s.filling for s in self._specs.values())
+        # Largest shortfall first, one container at a time, so a full node is shared between specs.
+        while room > 0 and deficits:
+            deficits.sort(reverse=True)
+            missing, key = deficits[0]
+            self._specs[key].filling += 1
+            tasks.append(self._spawn(self._fill(key)))
+            room -= 1
+            if missing > 1:
+                deficits[0] = (missing - 1, key)
+            else:
+                deficits.pop(0)
+        return tasks
+
+    async def _fill(self, key: str) -> None:
+        state = self._specs[key]
+        try:
+            container = await self._backend.create(state.template)
+        except Exception as e:
+            logger.warning(f"Failed to start warm container for {state.template.image}: {e}")
+            state.retry_at = self._clock() + self._config.refill_interval_seconds
+            return
+        finally:
+            state.filling -= 1
+        state.idle.append(container)
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def start(self) -> None:
+        if self._refill_task is None:
+            self._refill_task = asyncio.create_task(self._refill_loop())
+
+    async def _refill_loop(self) -> None:
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self._config.refill_interval_seconds)
+            self._wakeup.clear()
+            try:
+                self.refill()
+            except Exception as e:
+                logger.error(f"Warm pool refill failed: {e}", exc_info=True)
+
+    async def close(self) -> None:
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            self._refill_task = None
+        # Let containers that are still starting finish, so they are destroyed below rather than left behind.
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        idle = [container for state in self._specs.values() for container in state.idle]
+        self._specs.clear()
+        await asyncio.gather(*(self._backend.destroy(container) for container in idle), return_exceptions=True)
+
+    def metrics(self) -> list[dict]:
+        return [
+            {
+                "image": state.template.image,
+                "hits": state.hits,
+                "misses": state.misses,
+                "idle": len(state.idle),
+                "filling": state.filling,
+                "target": self.target_size(key),
+            }
+            for key, state in self._specs.items()
+        ]
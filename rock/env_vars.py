@@ -29,6 +29,15 @@ if TYPE_CHECKING:
     # Docker temp auth directory
     ROCK_DOCKER_TEMP_AUTH_DIR: str | None = None
 
+    # Shared HTTP transport (rock.utils.http.HttpClientPool)
+    ROCK_HTTP_MAX_CONNECTIONS_PER_HOST: int = 64
+    ROCK_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    ROCK_HTTP2_ENABLE: bool = True
+
+    # GEM envs
+    ROCK_GEM_ENV_ACTOR_CACHE_SIZE: int = 4096
+    ROCK_GEM_VECTOR_ENV_CONCURRENCY: int = 16
+
     # Scheduler
     ROCK_DOCUUM_INSTALL_URL: str | None = None
 
@@ -147,6 +156,13 @@ environment_variables: dict[str, Callable[[], Any]] = {
     ),
     # Docker temp auth directory
     "ROCK_DOCKER_TEMP_AUTH_DIR": lambda: os.getenv("ROCK_DOCKER_TEMP_AUTH_DIR"),
+    # Shared HTTP transport
+    "ROCK_HTTP_MAX_CONNECTIONS_PER_HOST": lambda: int(os.getenv("ROCK_HTTP_MAX_CONNECTIONS_PER_HOST", "64")),
+    "ROCK_HTTP_KEEPALIVE_EXPIRY_SECONDS": lambda: float(os.getenv("ROCK_HTTP_KEEPALIVE_EXPIRY_SECONDS", "30")),
+    "ROCK_HTTP2_ENABLE": lambda: os.getenv("ROCK_HTTP2_ENABLE", "true").lower() == "true",
+    # GEM envs: sandbox actor handles cached by the admin server, make/close requests a VectorRockEnv sends at once
+    "ROCK_GEM_ENV_ACTOR_CACHE_SIZE": lambda: int(os.getenv("ROCK_GEM_ENV_ACTOR_CACHE_SIZE", "4096")),
+    "ROCK_GEM_VECTOR_ENV_CONCURRENCY": lambda: int(os.getenv("ROCK_GEM_VECTOR_ENV_CONCURRENCY", "16")),
 }
 
 
@@ -6,11 +6,11 @@ LinuxRocklet that the central dispatcher returns for sys.platform in
 """
 
 import asyncio
+import functools
 import os
 import re
 import subprocess
 import time
-from copy import deepcopy
 
 import bashlex
 import bashlex.ast
@@ -41,9 +41,11 @@ from .rocklet import Rocklet, Session
 logger = init_logger(__name__)
 
 
+_ANSI_ESCAPE_RE = re.compile(r"\x1B[@-_][0-?]*[ -/]*[@-~]")
+
+
 def _strip_control_chars(s: str) -> str:
-    ansi_escape = re.compile(r"\x1B[@-_][0-?]*[ -/]*[@-~]")
-    return ansi_escape.sub("", s)
+    return _ANSI_ESCAPE_RE.sub("", s)
 
 
 def _split_bash_command(inpt: str) -> list[str]:
@@ -61,10 +63,16 @@ def _split_bash_command(inpt: str) -> list[str]:
     "cmd1\\\n asdf" is one command (because the linebreak is escaped)
     "cmd1<<EOF\na\nb\nEOF" is one command (because of the heredoc)
     """
+    return list(_split_bash_command_cached(inpt))
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_bash_command_cached(inpt: str) -> tuple[str, ...]:
+    # Agents repeat the same commands a lot; parsing errors are not cached and re-raise every time.
     inpt = inpt.strip()
     if not inpt or all(l.strip().startswith("#") for l in inpt.splitlines()):
         # bashlex can't deal with empty strings or the like :/
-        return []
+        return ()
     parsed = bashlex.parse(inpt)
     cmd_strings = []
 
@@ -80,11 +88,15 @@ def _split_bash_command(inpt: str) -> list[str]:
     for cmd in parsed:
         start, end = find_range(cmd)
         cmd_strings.append(inpt[start:end])
-    return cmd_strings
+    return tuple(cmd_strings)
 
 
 def _check_bash_command(command: str) -> None:
-    """Check if a bash command is valid. Raises BashIncorrectSyntaxError if it's not."""
+    """Check if a bash command is valid. Raises BashIncorrectSyntaxError if it's not.
+
+    This spawns ``bash -n``; BashSession only calls it for commands bashlex could not parse, since
+    bashlex rejects everything bash does (and some valid commands too).
+    """
     _unique_string = "SOUNIQUEEOF"
     cmd = f"/bin/bash -n << '{_unique_string}'\n{command}\n{_unique_string}"
     result = subprocess.run(cmd, shell=True, capture_output=True)
@@ -102,6 +114,10 @@ def _check_bash_command(command: str) -> None:
 
 class BashSession(Session):
     _UNIQUE_STRING = "UNIQUESTRING29234"
+    _EXIT_CODE_PREFIX = "SHELLPS1EXIT"
+    # The prompt carries the exit status of the previous command, so reading up to the next prompt
+    # yields both the output and the exit code.
+    _PROMPT_RE = re.compile(r"SHELLPS1EXIT(\d+)SHELLPS1PREFIX")
 
     def __init__(self, request: CreateBashSessionRequest):
         """This basically represents one REPL that we control.
@@ -110,6 +126,7 @@ class BashSession(Session):
         """
         self.request = request
         self._ps1 = "SHELLPS1PREFIX"
+        self._prompt = f"{self._EXIT_CODE_PREFIX}$?{self._ps1}"
         self._shell: pexpect.spawn | None = None
         self._executor = get_executor()
         self._system_user = "root"
@@ -125,7 +142,7 @@ class BashSession(Session):
         """Commands to reset the PS1, PS2, and PS0 variables to their default values."""
         return [
             "unset PROMPT_COMMAND",
-            f"export PS1='{self._ps1}'",
+            f"export PS1='{self._prompt}'",
             "export PS2=''",
             "export PS0=''",
         ]
@@ -136,7 +153,7 @@ class BashSession(Session):
             env = os.environ.copy()
         else:
             env = {}
-        env.update({"PS1": self._ps1, "PS2": "", "PS0": ""})
+        env.update({"PS1": self._prompt, "PS2": "", "PS0": ""})
         if self.request.env is not None:
             env.update(self.request.env)
         logger.info(f"env:{env}")
@@ -151,6 +168,9 @@ class BashSession(Session):
             env=env,  # type: ignore
             maxread=self.request.max_read_size,
         )
+        # pexpect sleeps 50ms before every write by default (for children that disable echo after a
+        # password prompt); echo is already off here and it would be most of a short command's latency.
+        self._shell.delaybeforesend = None
         time.sleep(0.3)
         cmds = []
         if self.request.startup_source:
@@ -158,7 +178,7 @@ class BashSession(Session):
         cmds += self._get_reset_commands()
         cmd = " ; ".join(cmds)
         self.shell.sendline(cmd)
-        self.shell.expect(self._ps1, timeout=self.request.startup_timeout)
+        self.shell.expect(self._PROMPT_RE, timeout=self.request.startup_timeout)
         output = _strip_control_chars(self.shell.before)  # type: ignore
         self.refresh_shell()
         return CreateBashSessionResponse(output=output)
@@ -207,7 +227,7 @@ class BashSession(Session):
         """
         assert self.shell is not None
         self.shell.sendline(action.command)
-        expect_strings = action.expect + [self._ps1]
+        expect_strings = action.expect + [self._PROMPT_RE]
         try:
             self.shell.expect(expect_strings, timeout=action.timeout)  # type: ignore
             # matched_expect_string = expect_strings[expect_index]
@@ -224,7 +244,7 @@ class BashSession(Session):
             self.shell.sendline(f"stty -echo; echo '{self._UNIQUE_STRING}'")
             # Might need two expects for some reason
             self.shell.expect(self._UNIQUE_STRING, timeout=1)
-            self.shell.expect(self._ps1, timeout=1)
+            self.shell.expect(self._PROMPT_RE, timeout=1)
         else:
             # Interactive command.
             # For some reason, this often times enables echo mode within the shell.
@@ -248,18 +268,11 @@ class BashSession(Session):
     def _run_normal(self, action: BashAction) -> BashObservation:
         """Run a normal action. This is the default mode.
 
-        There are three steps to this:
-
-        1. Check if the command is valid
-        2. Execute the command
-        3. Get the exit code
+        The command is checked in process (bashlex), sent with one write, and one read up to the
+        next prompt returns its output together with its exit code (see ``_PROMPT_RE``).
         """
-        action = deepcopy(action)
-
         assert self.shell is not None
-        _check_bash_command(action.command)
-
-        # Part 2: Execute the command
+        command = action.command
 
         fallback_terminator = False
         # Running multiple interactive commands by sending them with linebreaks would break things
@@ -268,57 +281,55 @@ class BashSession(Session):
         # we add a unique string to the end of the command and then seek to that
         # (which is also somewhat brittle, so we don't do this by default).
         try:
-            individual_commands = _split_bash_command(action.command)
+            individual_commands = _split_bash_command(command)
         except Exception as e:
             # Bashlex is very buggy and can throw a variety of errors, including
             # ParsingErrors, NotImplementedErrors, TypeErrors, possibly more. So we catch them all
+            # and let bash itself decide whether the command is valid.
+            _check_bash_command(command)
             logger.error("Bashlex fail: %s", e)
-            action.command += f"\n TMPEXITCODE=$? ; sleep 0.1; echo '{self._UNIQUE_STRING}' ; (exit $TMPEXITCODE)"
+            command += f"\n TMPEXITCODE=$? ; sleep 0.1; echo '{self._UNIQUE_STRING}' ; (exit $TMPEXITCODE)"
             fallback_terminator = True
         else:
-            action.command = " ; ".join(individual_commands)
-        self.shell.sendline(action.command)
+            command = " ; ".join(individual_commands)
+        self.shell.sendline(command)
         if not fallback_terminator:
-            expect_strings = action.expect + [self._ps1]
+            expect_strings = action.expect + [self._PROMPT_RE]
         else:
             expect_strings = [self._UNIQUE_STRING]
         try:
             expect_index = self.shell.expect(expect_strings, timeout=action.timeout)  # type: ignore
             matched_expect_string = expect_strings[expect_index]
+            output: str = self.shell.before  # type: ignore
+            prompt_match = self.shell.match if expect_strings[expect_index] is self._PROMPT_RE else None
+            if fallback_terminator:
+                # The prompt right after the terminator reports $TMPEXITCODE.
+                try:
+                    self.shell.expect(self._PROMPT_RE, timeout=1)
+                    prompt_match = self.shell.match
+                except pexpect.TIMEOUT:
+                    prompt_match = None
         except pexpect.TIMEOUT as e:
-            msg = f"timeout after {action.timeout} seconds while running command {action.command!r}"
+            msg = f"timeout after {action.timeout} seconds while running command {command!r}"
             raise CommandTimeoutError(msg) from e
         finally:
             self.refresh_shell()
-        output: str = _strip_control_chars(self.shell.before).strip()  # type: ignore
+        # Multi-line fallback commands print a prompt per line.
+        output = self._PROMPT_RE.sub("", _strip_control_chars(output)).strip()
+        if matched_expect_string is self._PROMPT_RE:
+            matched_expect_string = self._ps1
 
-        # Part 3: Get the exit code
         if action.check == "ignore":
             return BashObservation(output=output, exit_code=None, expect_string=matched_expect_string)
+        if prompt_match is not None:
+            return BashObservation(
+                output=output, exit_code=int(prompt_match.group(1)), expect_string=matched_expect_string
+            )
 
+        # One of action.expect matched before the prompt: ask the shell for $? explicitly.
         try:
-            _exit_code_prefix = "EXITCODESTART"
-            _exit_code_suffix = "EXITCODEEND"
-            self.shell.sendline(f"\necho {_exit_code_prefix}$?{_exit_code_suffix}")
-            try:
-                self.shell.expect(_exit_code_suffix, timeout=1)
-            except pexpect.TIMEOUT:
-                msg = "timeout while getting exit code"
-                raise NoExitCodeError(msg)
-            exit_code_raw: str = _strip_control_chars(self.shell.before).strip()  # type: ignore
-            exit_code = re.findall(f"{_exit_code_prefix}([0-9]+)", exit_code_raw)
-            if len(exit_code) != 1:
-                msg = f"failed to parse exit code from output {exit_code_raw!r} (command: {action.command!r}, matches: {exit_code})"
-                raise NoExitCodeError(msg)
-            output += exit_code_raw.split(_exit_code_prefix)[0]
-            exit_code = int(exit_code[0])
-            # We get at least one more PS1 here.
-            try:
-                self.shell.expect(self._ps1, timeout=0.1)
-            except pexpect.TIMEOUT:
-                msg = "Timeout while getting PS1 after exit code extraction"
-                raise CommandTimeoutError(msg)
-            output = output.replace(self._UNIQUE_STRING, "").replace(self._ps1, "")
+            exit_output, exit_code = self._read_exit_code(command)
+            output += exit_output
         except Exception:
             # Ignore all exceptions if check == 'silent'
             if action.check == "raise":
@@ -328,6 +339,32 @@ class BashSession(Session):
             self.refresh_shell()
         return BashObservation(output=output, exit_code=exit_code, expect_string=matched_expect_string)
 
+    def _read_exit_code(self, command: str) -> tuple[str, int]:
+        """Echo ``$?`` and return (output printed before it, exit code)."""
+        _exit_code_prefix = "EXITCODESTART"
+        _exit_code_suffix = "EXITCODEEND"
+        self.shell.sendline(f"\necho {_exit_code_prefix}$?{_exit_code_suffix}")
+        try:
+            self.shell.expect(_exit_code_suffix, timeout=1)
+        except pexpect.TIMEOUT:
+            msg = "timeout while getting exit code"
+            raise NoExitCodeError(msg)
+        exit_code_raw: str = _strip_control_chars(self.shell.before).strip()  # type: ignore
+        exit_code = re.findall(f"{_exit_code_prefix}([0-9]+)", exit_code_raw)
+        if len(exit_code) != 1:
+            msg = (
+                f"failed to parse exit code from output {exit_code_raw!r} (command: {command!r}, matches: {exit_code})"
+            )
+            raise NoExitCodeError(msg)
+        output = self._PROMPT_RE.sub("", exit_code_raw.split(_exit_code_prefix)[0])
+        # We get at least one more PS1 here.
+        try:
+            self.shell.expect(self._PROMPT_RE, timeout=0.1)
+        except pexpect.TIMEOUT:
+            msg = "Timeout while getting PS1 after exit code extraction"
+            raise CommandTimeoutError(msg)
+        return output.replace(self._UNIQUE_STRING, ""), int(exit_code[0])
+
     async def close(self) -> CloseSessionResponse:
         if self._shell is None:
             return CloseBashSessionResponse()
@@ -3,11 +3,14 @@ import shutil
 import tempfile
 import zipfile
 from pathlib import Path
+from typing import Annotated, BinaryIO
 
-from fastapi import APIRouter, File, Form, UploadFile, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, File, Form, Query, Request, UploadFile, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 
 from rock.actions import (
     CloseResponse,
+    DownloadChunkRequest,
     EnvCloseRequest,
     EnvCloseResponse,
     EnvListResponse,
@@ -17,18 +20,33 @@ from rock.actions import (
     EnvResetResponse,
     EnvStepRequest,
     EnvStepResponse,
+    UploadChunkRequest,
+    UploadChunkResponse,
     UploadResponse,
+    UploadStatusRequest,
 )
 from rock.admin.proto.request import SandboxAction as Action
 from rock.admin.proto.request import SandboxCloseSessionRequest as CloseSessionRequest
 from rock.admin.proto.request import SandboxCommand as Command
 from rock.admin.proto.request import SandboxCreateSessionRequest as CreateSessionRequest
 from rock.admin.proto.request import SandboxReadFileRequest as ReadFileRequest
+from rock.admin.proto.request import SandboxStatusProbeRequest
+from rock.admin.proto.request import SandboxWaitProcessRequest as WaitProcessRequest
 from rock.admin.proto.request import SandboxWriteFileRequest as WriteFileRequest
 from rock.common.port_validation import validate_port_forward_port
 from rock.logger import init_logger
 from rock.rocklet.rocklet import Rocklet
 from rock.utils import get_executor
+from rock.utils.file_transfer import (
+    CHUNK_SHA256_HEADER,
+    FILE_SIZE_HEADER,
+    STREAM_BUFFER_SIZE,
+    ChunkWriter,
+    file_range_sha256,
+    finish_transfer,
+    iter_file_range,
+    partial_size,
+)
 
 logger = init_logger(__name__)
 
@@ -80,11 +98,21 @@ async def read_file(request: ReadFileRequest):
     return serialize_model(await rocklet.read_file(request))
 
 
+@local_router.post("/sandbox_status")
+async def sandbox_status(request: SandboxStatusProbeRequest):
+    return serialize_model(await rocklet.probe_sandbox_status(request))
+
+
 @local_router.post("/write_file")
 async def write_file(request: WriteFileRequest):
     return serialize_model(await rocklet.write_file(request))
 
 
+@local_router.post("/wait_process")
+async def wait_process(request: WaitProcessRequest):
+    return serialize_model(await rocklet.wait_process(request))
+
+
 @local_router.post("/upload")
 async def upload(
     file: UploadFile = File(...),
@@ -92,22 +120,72 @@ async def upload(
     unzip: bool = Form(False),
 ):
     target_path: Path = Path(target_path)
+    try:
+        await asyncio.to_thread(_save_upload, file.file, target_path, unzip)
+    finally:
+        await file.close()
+    return UploadResponse(success=True, file_name=target_path.name)
+
+
+def _save_upload(source: BinaryIO, target_path: Path, unzip: bool) -> None:
     target_path.parent.mkdir(parents=True, exist_ok=True)
     # First save the file to a temporary directory and potentially unzip it.
     with tempfile.TemporaryDirectory() as temp_dir:
         file_path = Path(temp_dir) / "temp_file_transfer"
-        try:
-            with open(file_path, "wb") as f:
-                f.write(await file.read())
-        finally:
-            await file.close()
+        with open(file_path, "wb") as f:
+            shutil.copyfileobj(source, f, STREAM_BUFFER_SIZE)
         if unzip:
             with zipfile.ZipFile(file_path, "r") as zip_ref:
                 zip_ref.extractall(target_path)
             file_path.unlink()
         else:
             shutil.move(file_path, target_path)
-    return UploadResponse(success=True, file_name=target_path.name)
+
+
+@local_router.get("/upload_status")
+async def upload_status(params: Annotated[UploadStatusRequest, Query()]):
+    return serialize_model(UploadChunkResponse(success=True, offset=partial_size(params.target_path)))
+
+
+@local_router.post("/upload_chunk")
+async def upload_chunk(request: Request, params: Annotated[UploadChunkRequest, Query()]):
+    """Append the raw request body to a resumable upload; see rock.utils.file_transfer."""
+    stored = partial_size(params.target_path)
+    if params.offset not in (0, stored):
+        return serialize_model(
+            UploadChunkResponse(offset=stored, message=f"chunk starts at {params.offset}, expected {stored}")
+        )
+    writer = await asyncio.to_thread(ChunkWriter, params.target_path, params.offset)
+    try:
+        async for data in request.stream():
+            await asyncio.to_thread(writer.write, data)
+    except BaseException:
+        await asyncio.to_thread(writer.discard)
+        raise
+    if writer.hexdigest() != params.sha256:
+        await asyncio.to_thread(writer.discard)
+        return serialize_model(
+            UploadChunkResponse(offset=params.offset, message=f"sha256 mismatch for chunk at {params.offset}")
+        )
+    await asyncio.to_thread(writer.close)
+    offset = params.offset + writer.written
+    if params.final:
+        await asyncio.to_thread(finish_transfer, params.target_path, params.extract)
+    return serialize_model(UploadChunkResponse(success=True, offset=offset))
+
+
+@local_router.get("/download")
+async def download(params: Annotated[DownloadChunkRequest, Query()]):
+    """Stream a byte range of a file; the range's sha256 and the file size are sent as headers."""
+    size = Path(params.path).stat().st_size
+    offset = min(params.offset, size)
+    length = min(params.length, size - offset)
+    sha256 = await asyncio.to_thread(file_range_sha256, params.path, offset, length)
+    return StreamingResponse(
+        iter_file_range(params.path, offset, length),
+        media_type="application/octet-stream",
+        headers={FILE_SIZE_HEADER: str(size), CHUNK_SHA256_HEADER: sha256},
+    )
 
 
 @local_router.post("/close")
@@ -0,0 +1,115 @@
+"""Event-driven process exit notification for the rocklet.
+
+On Linux a pidfd is registered with the event loop, so waiters wake up as soon as
+the kernel reports the exit. Elsewhere (or when pidfd_open is unavailable) the pid
+is polled with psutil at a short interval. Either way a single watch is shared by
+every concurrent waiter on the same pid.
+"""
+
+import asyncio
+import contextlib
+import os
+
+import psutil
+
+from rock.logger import init_logger
+
+logger = init_logger(__name__)
+
+DEFAULT_POLL_INTERVAL = 0.1
+
+
+def _pid_running(pid: int) -> bool:
+    try:
+        return psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+    except (psutil.NoSuchProcess, psutil.ZombieProcess):
+        return False
+    except psutil.AccessDenied:
+        return True
+
+
+class _Watch:
+    def __init__(self, pid: int, exited: asyncio.Future):
+        self.pid = pid
+        self.exited = exited
+        self.waiters = 0
+        self.pidfd: int | None = None
+        self.poll_task: asyncio.Task | None = None
+
+
+class ProcessWatcher:
+    """Wait for arbitrary pids (not necessarily children) to exit."""
+
+    def __init__(self, poll_interval: float = DEFAULT_POLL_INTERVAL):
+        self._poll_interval = poll_interval
+        self._watches: dict[int, _Watch] = {}
+
+    async def wait(self, pid: int, timeout: float | None) -> bool:
+        """Block until `pid` exits or `timeout` elapses.
+
+        Returns:
+            bool: True if the process is gone, False if it is still running at timeout.
+        """
+        if not _pid_running(pid):
+            return True
+        watch = self._watches.get(pid)
+        if watch is None:
+            watch = self._start_watch(pid)
+        watch.waiters += 1
+        try:
+            await asyncio.wait_for(asyncio.shield(watch.exited), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            watch.waiters -= 1
+            if watch.waiters == 0 or watch.exited.done():
+                self._stop_watch(watch)
+
+    @property
+    def watched_pids(self) -> list[int]:
+        return list(self._watches)
+
+    def _start_watch(self, pid: int) -> _Watch:
+        loop = asyncio.get_running_loop()
+        watch = _Watch(pid, loop.create_future())
+        self._watches[pid] = watch
+        if hasattr(os, "pidfd_open"):
+            try:
+                watch.pidfd = os.pidfd_open(pid)
+                loop.add_reader(watch.pidfd, self._mark_exited, watch)
+                return watch
+            except ProcessLookupError:
+                self._mark_exited(watch)
+                return watch
+            except (OSError, NotImplementedError) as e:
+                logger.debug(f"pidfd unavailable for pid {pid}, falling back to polling: {e}")
+                self._close_pidfd(watch)
+        watch.poll_task = loop.create_task(self._poll(watch))
+        return watch
+
+    async def _poll(self, watch: _Watch):
+        while _pid_running(watch.pid):
+            await asyncio.sleep(self._poll_interval)
+        self._mark_exited(watch)
+
+    def _mark_exited(self, watch: _Watch):
+        if not watch.exited.done():
+            watch.exited.set_result(None)
+        self._close_pidfd(watch)
+
+    def _close_pidfd(self, watch: _Watch):
+        if watch.pidfd is None:
+            return
+        with contextlib.suppress(Exception):
+            asyncio.get_running_loop().remove_reader(watch.pidfd)
+        with contextlib.suppress(OSError):
+            os.close(watch.pidfd)
+        watch.pidfd = None
+
+    def _stop_watch(self, watch: _Watch):
+        if self._watches.get(watch.pid) is watch:
+            del self._watches[watch.pid]
+        self._close_pidfd(watch)
+        if watch.poll_task is not None and not watch.poll_task.done():
+            watch.poll_task.cancel()
@@ -11,6 +11,7 @@ import asyncio
 import shutil
 import subprocess
 import sys
+import time
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
@@ -34,6 +35,8 @@ from rock.actions import (
     RockletConfig,
     UploadRequest,
     UploadResponse,
+    WaitProcessRequest,
+    WaitProcessResponse,
     WriteFileRequest,
     WriteFileResponse,
 )
@@ -43,7 +46,11 @@ from rock.admin.proto.request import SandboxCommand as Command
 from rock.admin.proto.request import SandboxCreateBashSessionRequest as CreateBashSessionRequest
 from rock.admin.proto.request import SandboxCreateSessionRequest as CreateSessionRequest
 from rock.admin.proto.request import SandboxReadFileRequest as ReadFileRequest
+from rock.admin.proto.request import SandboxStatusProbeRequest
 from rock.admin.proto.request import SandboxWriteFileRequest as WriteFileRequest
+from rock.admin.proto.response import SandboxStatusProbeResponse
+from rock.deployments.constants import Port
+from rock.deployments.status import PersistedServiceStatus, ServiceStatus
 from rock.logger import init_logger
 from rock.rocklet.exceptions import (
     CommandTimeoutError,
@@ -52,6 +59,8 @@ from rock.rocklet.exceptions import (
     SessionExistsError,
     UnsupportedPlatformError,
 )
+from rock.rocklet.process_watcher import ProcessWatcher
+from rock.utils.http import HttpUtils
 
 logger = init_logger(__name__)
 
@@ -96,6 +105,7 @@ class Rocklet(AbstractSandbox, ABC):
         self.command_logger = init_logger("command", "command.log")
         self._executor = executor
         self._gem_envs: dict[str, Any] = {}
+        self._process_watcher = ProcessWatcher()
 
     @classmethod
     def create(cls, **kwargs: Any) -> "Rocklet":
@@ -233,6 +243,32 @@ class Rocklet(AbstractSandbox, ABC):
         self.command_logger.info(f"[read_file output]: {content[:1000]}")
         return ReadFileResponse(content=content)
 
+    async def probe_sandbox_status(self, request: SandboxStatusProbeRequest) -> SandboxStatusProbeResponse:
+        """Read a sandbox's persisted service status and probe its proxy port, for the admin's get_status.
+
+        Replaces the ``execute ls`` + ``read_file`` + ``is_alive`` round trips from the admin with one.
+        """
+        path = Path(PersistedServiceStatus.gen_service_status_path(request.sandbox_id))
+        try:
+            content = await asyncio.get_running_loop().run_in_executor(self._executor, path.read_text)
+        except FileNotFoundError:
+            return SandboxStatusProbeResponse()
+        if not content:
+            logger.warning(f"{path} exists, but content is empty")
+            return SandboxStatusProbeResponse()
+        status = ServiceStatus.from_content(content)
+        is_alive = False
+        proxy_port = status.port_mapping.get(Port.PROXY)
+        if request.host_ip and proxy_port:
+            try:
+                alive_resp = await HttpUtils.get(
+                    url=f"http://{request.host_ip}:{proxy_port}/is_alive", headers={"sandbox_id": request.sandbox_id}
+                )
+                is_alive = IsAliveResponse(**alive_resp).is_alive
+            except Exception:
+                is_alive = False
+        return SandboxStatusProbeResponse(status=status.to_dict(), is_alive=is_alive)
+
     async def write_file(self, request: WriteFileRequest) -> WriteFileResponse:
         """Writes a file"""
         self.command_logger.info(f"[write_file input]: {request.path}")
@@ -252,6 +288,15 @@ class Rocklet(AbstractSandbox, ABC):
         self.command_logger.info("[upload output]: upload success!")
         return UploadResponse(success=True, file_name=Path(request.target_path).name)
 
+    async def wait_process(self, request: WaitProcessRequest) -> WaitProcessResponse:
+        """Blocks until the process exits or `request.timeout` elapses."""
+        start = time.perf_counter()
+        exited = await self._process_watcher.wait(request.pid, timeout=request.timeout)
+        elapsed = time.perf_counter() - start
+        if exited:
+            self.command_logger.info(f"[wait_process]: pid {request.pid} exited after {elapsed:.3f}s")
+        return WaitProcessResponse(pid=request.pid, exited=exited, elapsed=elapsed)
+
     async def close(self) -> CloseResponse:
         """Closes the runtime."""
         for session in self.sessions.values():
@@ -6,7 +6,7 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from rock.admin.metrics.constants import MetricsConstants
-from rock.admin.metrics.monitor import MetricsMonitor, aggregate_metrics
+from rock.admin.metrics.monitor import MetricsMonitor
 from rock.config import RockConfig
 from rock.deployments.manager import DeploymentManager
 from rock.logger import init_logger
@@ -19,6 +19,16 @@ logger = init_logger(__name__)
 class BaseManager:
     _check_job_bg_task: object = None
     rock_config: RockConfig = None
+    # Active sandbox counts are maintained on every state write; a full, paginated DB scan only corrects drift.
+    _reconcile_interval = 600
+    _reconcile_page_size = 1000
+    _last_reconcile_time: float | None = None
+    # Images reported with a non-zero count in the previous round.
+    _reported_images: frozenset[str] = frozenset()
+    # Ray cluster resources change slowly and reading them is a GCS round trip.
+    _cluster_resources_ttl = 60
+    _cluster_resources: tuple[float, float, float, float] | None = None
+    _cluster_resources_time: float = 0.0
 
     def __init__(
         self,
@@ -35,7 +45,7 @@ class BaseManager:
             user_defined_tags=rock_config.runtime.user_defined_tags,
         )
         self._report_interval = 10
-        self._check_job_interval = 180
+        self._check_job_interval = rock_config.runtime.expiry.check_interval_seconds
         self._setup_scheduler()
         self.deployment_manager = DeploymentManager(rock_config, enable_runtime_auto_clear)
 
@@ -89,15 +99,22 @@ class BaseManager:
         """Collect and report metrics for all sandboxes"""
         overall_start = time.perf_counter()
         await self._report_system_resource_metrics()
+        await self._reconcile_sandbox_counts()
+
+        image_counts = await self._meta_store.count_active_by_image()
+        # A reconcile drops images without active sandboxes from the counts; report them as 0 once more
+        # so their gauge does not keep its last non-zero value.
+        for image in self._reported_images.difference(image_counts):
+            image_counts[image] = 0
+        for image, count in image_counts.items():
+            self.metrics_monitor.record_gauge_by_name(MetricsConstants.SANDBOX_COUNT_IMAGE, count, {"image": image})
+        self._reported_images = frozenset(image for image, count in image_counts.items() if count > 0)
 
-        sandbox_cnt, sandbox_meta = await self._collect_sandbox_meta()
+        sandbox_cnt = sum(image_counts.values())
         if sandbox_cnt == 0:
             logger.debug("No sandboxes to monitor")
             self.metrics_monitor.record_gauge_by_name(MetricsConstants.SANDBOX_TOTAL_COUNT, 0)
             return
-        aggregated_metrics = aggregate_metrics(sandbox_meta, "image")
-        for image, count in aggregated_metrics.items():
-            self.metrics_monitor.record_gauge_by_name(MetricsConstants.SANDBOX_COUNT_IMAGE, count, {"image": image})
 
         logger.debug(f"Collecting metrics for {sandbox_cnt} sandboxes")
 
@@ -115,21 +132,32 @@ class BaseManager:
         self.metrics_monitor.record_gauge_by_name(MetricsConstants.AVAILABLE_MEM_RESOURCE, available_mem)
 
     async def _collect_system_resource_metrics(self):
-        """Collect system resource metrics."""
-        cluster_resources = ray.cluster_resources()
-        available_resources = ray.available_resources()
-        total_cpu = cluster_resources.get("CPU", 0)
-        total_mem = cluster_resources.get("memory", 0) / 1024**3
-        available_cpu = available_resources.get("CPU", 0)
-        available_mem = available_resources.get("memory", 0) / 1024**3
-        return total_cpu, total_mem, available_cpu, available_mem
+        """Collect system resource metrics, reading them from Ray at most once per ``_cluster_resources_ttl``."""
+        now = time.monotonic()
+        if self._cluster_resources is None or now - self._cluster_resources_time >= self._cluster_resources_ttl:
+            loop = asyncio.get_running_loop()
+            self._cluster_resources = await loop.run_in_executor(self._executor, _read_cluster_resources)
+            self._cluster_resources_time = now
+        return self._cluster_resources
+
+    async def _reconcile_sandbox_counts(self):
+        """Rebuild the active sandbox counts from the DB every ``_reconcile_interval`` seconds."""
+        now = time.monotonic()
+        if self._last_reconcile_time is not None and now - self._last_reconcile_time < self._reconcile_interval:
+            return
+        self._last_reconcile_time = now
+        sandbox_cnt, sandbox_meta = await self._collect_sandbox_meta()
+        await self._meta_store.reset_active_sandboxes(
+            {sandbox_id: meta["image"] for sandbox_id, meta in sandbox_meta.items()}
+        )
+        logger.info(f"Reconciled active sandbox counts: {sandbox_cnt} sandboxes")
 
     async def _collect_sandbox_meta(self) -> tuple[int, dict[str, dict[str, str]]]:
         meta: dict = {}
         cnt = 0
-        async for sandbox_info in self._meta_store.iter_alive_sandbox_info():
+        async for sandbox_info in self._meta_store.iter_alive_sandbox_info(page_size=self._reconcile_page_size):
             cnt += 1
-            image = sandbox_info.get("image", "default")
+            image = sandbox_info.get("image") or "default"
             meta[sandbox_info.get("sandbox_id")] = {"image": image}
         return cnt, meta
 
@@ -146,3 +174,13 @@ class BaseManager:
         except Exception as e:
             logger.error(f"Error stopping monitoring: {e}")
             pass
+
+
+def _read_cluster_resources() -> tuple[float, float, float, float]:
+    cluster_resources = ray.cluster_resources()
+    available_resources = ray.available_resources()
+    total_cpu = cluster_resources.get("CPU", 0)
+    total_mem = cluster_resources.get("memory", 0) / 1024**3
+    available_cpu = available_resources.get("CPU", 0)
+    available_mem = available_resources.get("memory", 0) / 1024**3
+    return total_cpu, total_mem, available_cpu, available_mem
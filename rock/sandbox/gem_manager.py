@@ -1,7 +1,12 @@
 import asyncio
+from collections import OrderedDict
 
 from rock import env_vars
 from rock.actions import (
+    EnvBatchResetRequest,
+    EnvBatchResetResponse,
+    EnvBatchStepRequest,
+    EnvBatchStepResponse,
     EnvCloseRequest,
     EnvCloseResponse,
     EnvListResponse,
@@ -9,17 +14,23 @@ from rock.actions import (
     EnvMakeResponse,
     EnvResetRequest,
     EnvResetResponse,
+    EnvResetResult,
     EnvStepRequest,
     EnvStepResponse,
+    EnvStepResult,
 )
 from rock.admin.core.ray_service import RayService
-from rock.admin.proto.response import SandboxStartResponse, SandboxStatusResponse
+from rock.admin.proto.response import SandboxStartResponse
+from rock.common.constants import StopReason
 from rock.config import RockConfig
 from rock.deployments.config import DockerDeploymentConfig
+from rock.logger import init_logger
 from rock.sandbox.sandbox_actor import SandboxActor
 from rock.sandbox.sandbox_manager import SandboxManager
 from rock.sandbox.sandbox_meta_store import SandboxMetaStore
 
+logger = init_logger(__name__)
+
 
 class GemManager(SandboxManager):
     def __init__(
@@ -39,31 +50,21 @@ class GemManager(SandboxManager):
             enable_runtime_auto_clear=enable_runtime_auto_clear,
             operator=operator,
         )
+        # Actor handles by sandbox id, so steps don't pay a named-actor lookup each. Least recently used
+        # first; bounded, since sandboxes stopped elsewhere (their own auto clear, another admin) leave
+        # their handle behind.
+        self._env_actors: OrderedDict[str, SandboxActor] = OrderedDict()
+        self._env_actor_cache_size = env_vars.ROCK_GEM_ENV_ACTOR_CACHE_SIZE
 
     async def env_make(self, env_id: str) -> EnvMakeResponse:
         config = DockerDeploymentConfig(image=env_vars.ROCK_ENVHUB_DEFAULT_DOCKER_IMAGE)
         sandbox_start_response: SandboxStartResponse = await self.start_async(config=config)
 
-        async def wait_until_alive(sandbox_id: str, interval: float = 1.0):
-            """Internal polling method"""
-            while True:
-                await asyncio.sleep(interval)
-                status: SandboxStatusResponse = await self.get_status(sandbox_id)
-                if status.is_alive:
-                    return status
-
-        try:
-            await asyncio.wait_for(
-                wait_until_alive(sandbox_start_response.sandbox_id),
-                timeout=300.0,  # 5 minute timeout
-            )
-        except asyncio.TimeoutError:
+        status = await self.wait_ready(sandbox_start_response.sandbox_id, timeout=300.0)  # 5 minute timeout
+        if not status.is_alive:
             raise Exception("Sandbox startup timeout after 300s")
 
-        actor_name = self.deployment_manager.get_actor_name(sandbox_start_response.sandbox_id)
-        sandbox_actor: SandboxActor = await self._ray_service.async_ray_get_actor(actor_name, self._ray_namespace)
-        if sandbox_actor is None:
-            raise Exception(f"sandbox {sandbox_start_response.sandbox_id} not found to stop")
+        sandbox_actor = await self._get_env_actor(sandbox_start_response.sandbox_id)
         response = await self._ray_service.async_ray_get(
             sandbox_actor.env_make.remote(
                 EnvMakeRequest(
@@ -75,34 +76,71 @@ class GemManager(SandboxManager):
         return response
 
     async def env_step(self, request: EnvStepRequest) -> EnvStepResponse:
-        sandbox_id = request.sandbox_id
-        actor_name = self.deployment_manager.get_actor_name(sandbox_id)
-        sandbox_actor: SandboxActor = await self._ray_service.async_ray_get_actor(actor_name, self._ray_namespace)
-        if sandbox_actor is None:
-            raise Exception(f"sandbox {sandbox_id} not found to stop")
-        return await self._ray_service.async_ray_get(sandbox_actor.env_step.remote(request))
+        return await self._call_env_actor(request.sandbox_id, lambda actor: actor.env_step.remote(request))
 
     async def env_reset(self, request: EnvResetRequest) -> EnvResetResponse:
-        sandbox_id = request.sandbox_id
-        actor_name = self.deployment_manager.get_actor_name(sandbox_id)
-        sandbox_actor: SandboxActor = await self._ray_service.async_ray_get_actor(actor_name, self._ray_namespace)
-        if sandbox_actor is None:
-            raise Exception(f"sandbox {sandbox_id} not found to stop")
-        return await self._ray_service.async_ray_get(sandbox_actor.env_reset.remote(request))
+        return await self._call_env_actor(request.sandbox_id, lambda actor: actor.env_reset.remote(request))
+
+    async def env_step_batch(self, request: EnvBatchStepRequest) -> EnvBatchStepResponse:
+        """Step many environments concurrently. A failing environment only fails its own result."""
+
+        async def step(step_request: EnvStepRequest) -> EnvStepResult:
+            try:
+                response = await self.env_step(step_request)
+            except Exception as e:
+                logger.warning(f"batch step failed for sandbox {step_request.sandbox_id}: {e}")
+                return EnvStepResult(sandbox_id=step_request.sandbox_id, error=str(e))
+            return EnvStepResult(sandbox_id=step_request.sandbox_id, response=response)
+
+        results = await asyncio.gather(*(step(step_request) for step_request in request.steps))
+        return EnvBatchStepResponse(results=results)
+
+    async def env_reset_batch(self, request: EnvBatchResetRequest) -> EnvBatchResetResponse:
+        """Reset many environments concurrently. A failing environment only fails its own result."""
+
+        async def reset(reset_request: EnvResetRequest) -> EnvResetResult:
+            try:
+                response = await self.env_reset(reset_request)
+            except Exception as e:
+                logger.warning(f"batch reset failed for sandbox {reset_request.sandbox_id}: {e}")
+                return EnvResetResult(sandbox_id=reset_request.sandbox_id, error=str(e))
+            return EnvResetResult(sandbox_id=reset_request.sandbox_id, response=response)
+
+        results = await asyncio.gather(*(reset(reset_request) for reset_request in request.resets))
+        return EnvBatchResetResponse(results=results)
 
     async def env_close(self, request: EnvCloseRequest) -> EnvCloseResponse:
         sandbox_id = request.sandbox_id
-        actor_name = self.deployment_manager.get_actor_name(sandbox_id)
-        sandbox_actor: SandboxActor = await self._ray_service.async_ray_get_actor(actor_name, self._ray_namespace)
-        if sandbox_actor is None:
-            raise Exception(f"sandbox {sandbox_id} not found to stop")
-        response = await self._ray_service.async_ray_get(sandbox_actor.env_close.remote(request))
+        response = await self._call_env_actor(sandbox_id, lambda actor: actor.env_close.remote(request))
         await self.stop(sandbox_id=sandbox_id)
         return response
 
     async def env_list(self, sandbox_id: str) -> EnvListResponse:
+        return await self._call_env_actor(sandbox_id, lambda actor: actor.env_list.remote())
+
+    async def stop(self, sandbox_id: str, reason: StopReason = StopReason.MANUAL):
+        self._env_actors.pop(sandbox_id, None)
+        return await super().stop(sandbox_id, reason=reason)
+
+    async def _get_env_actor(self, sandbox_id: str) -> SandboxActor:
+        sandbox_actor = self._env_actors.get(sandbox_id)
+        if sandbox_actor is not None:
+            self._env_actors.move_to_end(sandbox_id)
+            return sandbox_actor
         actor_name = self.deployment_manager.get_actor_name(sandbox_id)
         sandbox_actor = await self._ray_service.async_ray_get_actor(actor_name, self._ray_namespace)
         if sandbox_actor is None:
-            raise Exception(f"sandbox {sandbox_id} not found to stop")
-        return await self._ray_service.async_ray_get(sandbox_actor.env_list.remote())
+            raise Exception(f"sandbox {sandbox_id} not found")
+        self._env_actors[sandbox_id] = sandbox_actor
+        while len(self._env_actors) > self._env_actor_cache_size:
+            self._env_actors.popitem(last=False)
+        return sandbox_actor
+
+    async def _call_env_actor(self, sandbox_id: str, call):
+        sandbox_actor = await self._get_env_actor(sandbox_id)
+        try:
+            return await self._ray_service.async_ray_get(call(sandbox_actor))
+        except Exception:
+            # The actor may have died or been replaced; resolve it by name again on the next call.
+            self._env_actors.pop(sandbox_id, None)
+            raise
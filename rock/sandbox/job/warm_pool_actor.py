@@ -0,0 +1,80 @@
+import asyncio
+
+import ray
+
+from rock.config import WarmPoolConfig
+from rock.deployments.config import DockerDeploymentConfig
+from rock.deployments.warm_pool import (
+    WARM_CONTAINER_PREFIX,
+    DockerWarmPoolBackend,
+    WarmContainer,
+    WarmContainerPool,
+    release_ports,
+)
+from rock.logger import init_logger
+
+logger = init_logger(__name__)
+
+
+def warm_pool_actor_name(node_id: str) -> str:
+    return f"warm-pool-{node_id}"
+
+
+@ray.remote(num_cpus=0)
+class WarmPoolActor:
+    """Owns the warm container pool of the node it is pinned to; sandbox actors on that node claim from it."""
+
+    def __init__(self, config: WarmPoolConfig):
+        self._config = config
+        self._pool: WarmContainerPool | None = None
+
+    async def start(self) -> None:
+        if self._pool is not None:
+            return
+        await self._remove_orphans()
+        self._pool = WarmContainerPool(self._config, DockerWarmPoolBackend())
+        self._pool.start()
+        logger.info(f"Warm pool started with {self._config}")
+
+    async def _remove_orphans(self) -> None:
+        """Remove warm containers left behind by a previous pool actor on this node."""
+        process = await asyncio.create_subprocess_exec(
+            "docker",
+            "ps",
+            "-aq",
+            "--filter",
+            f"name=^{WARM_CONTAINER_PREFIX}",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await process.communicate()
+        ids = stdout.decode().split()
+        if ids:
+            logger.info(f"Removing {len(ids)} orphaned warm containers")
+            process = await asyncio.create_subprocess_exec(
+                "docker", "rm", "-f", *ids, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+            )
+            await process.wait()
+
+    async def claim(self, config: DockerDeploymentConfig) -> WarmContainer | None:
+        if self._pool is None:
+            return None
+        return self._pool.claim(config)
+
+    async def release(self, container: WarmContainer, reusable: bool = False) -> None:
+        if self._pool is not None:
+            await self._pool.release(container, reusable)
+
+    async def release_ports(self, container: WarmContainer) -> None:
+        """Called by the sandbox that adopted *container* once it has stopped it."""
+        release_ports(container)
+
+    async def metrics(self) -> list[dict]:
+        if self._pool is None:
+            return []
+        return self._pool.metrics()
+
+    async def shutdown(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
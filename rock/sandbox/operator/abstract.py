@@ -40,6 +40,14 @@ class AbstractOperator(ABC):
     async def delete(self, config: DeploymentConfig, host_ip: str | None = None) -> bool:
         ...
 
+    async def wait_started(self, sandbox_id: str, timeout: float) -> bool:
+        """Block until a sandbox submitted by this process has finished starting, successfully or not.
+
+        Returns False if this operator cannot tell, e.g. the sandbox was submitted elsewhere;
+        readiness is then only learned by probing get_status.
+        """
+        return False
+
     def set_redis_provider(self, redis_provider: RedisProvider):
         self._redis_provider = redis_provider
 
@@ -1,11 +1,15 @@
+import asyncio
 import json
 
+import httpx
 import ray
+from starlette.status import HTTP_404_NOT_FOUND
 
 from rock import env_vars
 from rock.actions.sandbox.response import IsAliveResponse, State
 from rock.actions.sandbox.sandbox_info import SandboxInfo
 from rock.admin.core.ray_service import RayService
+from rock.admin.proto.response import SandboxStatusProbeResponse
 from rock.common.constants import GET_STATUS_SWITCH, StopReason
 from rock.config import RuntimeConfig
 from rock.deployments.config import DockerDeploymentConfig
@@ -14,6 +18,7 @@ from rock.deployments.docker import DockerDeployment
 from rock.deployments.status import PersistedServiceStatus, ServiceStatus
 from rock.logger import init_logger
 from rock.sandbox.operator.abstract import AbstractOperator
+from rock.sandbox.operator.status_cache import SandboxStatusCache
 from rock.sandbox.sandbox_actor import SandboxActor
 from rock.sdk.common.exceptions import BadRequestRockError
 from rock.utils import EAGLE_EYE_TRACE_ID, trace_id_ctx_var
@@ -28,6 +33,9 @@ class RayOperator(AbstractOperator):
     def __init__(self, ray_service: RayService, runtime_config: RuntimeConfig):
         self._ray_service = ray_service
         self._runtime_config = runtime_config
+        self._status_cache = SandboxStatusCache(runtime_config.status_cache_ttl_seconds)
+        # Result of SandboxActor.start per submitted sandbox; it resolves once the sandbox is alive or failed.
+        self._start_refs: dict[str, ray.ObjectRef] = {}
 
     def _get_actor_name(self, sandbox_id: str) -> str:
         return f"sandbox-{sandbox_id}"
@@ -59,11 +67,12 @@ class RayOperator(AbstractOperator):
     async def submit(self, config: DockerDeploymentConfig, user_info: dict = {}) -> SandboxInfo:
         async with self._ray_service.get_ray_rwlock().read_lock():
             sandbox_id = config.container_name
+            self._status_cache.invalidate(sandbox_id)
             logger.info(f"[{sandbox_id}] start_async params:{json.dumps(config.model_dump(), indent=2)}")
             sandbox_actor: SandboxActor = await self.create_actor(config)
             sandbox_actor.set_metrics_endpoint.remote(self._runtime_config.metrics_endpoint)
             sandbox_actor.set_user_defined_tags.remote(self._runtime_config.user_defined_tags)
-            sandbox_actor.start.remote()
+            self._start_refs[sandbox_id] = sandbox_actor.start.remote()
             user_id = user_info.get("user_id", "default")
             experiment_id = user_info.get("experiment_id", "default")
             namespace = user_info.get("namespace", "default")
@@ -81,13 +90,15 @@ class RayOperator(AbstractOperator):
             return sandbox_info
 
     async def get_status(self, sandbox_id: str) -> SandboxInfo | None:
+        return await self._status_cache.get(sandbox_id, self._probe_status)
+
+    async def _probe_status(self, sandbox_id: str) -> SandboxInfo | None:
         if self.use_rocklet():
             sandbox_info: SandboxInfo = await build_sandbox_from_redis(self._redis_provider, sandbox_id)
             if sandbox_info is None:
                 return None
             host_ip = sandbox_info.get("host_ip")
-            remote_status = await self.get_remote_status(sandbox_id, host_ip)
-            is_alive = await self._check_alive_status(sandbox_id, host_ip, remote_status)
+            remote_status, is_alive = await self._probe_rocklet_status(sandbox_id, host_ip)
             # TODO: sink update state according to is_alive logic into SandboxInfo
             if is_alive:
                 sandbox_info["state"] = State.RUNNING
@@ -99,24 +110,51 @@ class RayOperator(AbstractOperator):
             except (ValueError, Exception):
                 logger.debug(f"Actor for sandbox {sandbox_id} not found, returning None")
                 return None
-            sandbox_info: SandboxInfo = await self._ray_service.async_ray_get(actor.sandbox_info.remote())
-            remote_status: ServiceStatus = await self._ray_service.async_ray_get(actor.get_status.remote())
-            sandbox_info["phases"] = {name: phase.to_dict() for name, phase in remote_status.phases.items()}
-            sandbox_info["port_mapping"] = remote_status.get_port_mapping()
-            alive = await self._ray_service.async_ray_get(actor.is_alive.remote())
+            if self._redis_provider:
+                (sandbox_info, alive), redis_info = await asyncio.gather(
+                    self._actor_status(actor), self.get_sandbox_info_from_redis(sandbox_id)
+                )
+            else:
+                (sandbox_info, alive), redis_info = await self._actor_status(actor), None
             # TODO: sink update state according to is_alive logic into SandboxInfo
-            if alive.is_alive:
+            if alive:
                 sandbox_info["state"] = State.RUNNING
-            if not self._redis_provider:
-                return sandbox_info
-            redis_info = await self.get_sandbox_info_from_redis(sandbox_id)
             if redis_info:
                 redis_info.update(sandbox_info)
                 return redis_info
-            else:
-                return sandbox_info
+            return sandbox_info
+
+    async def _actor_status(self, actor: SandboxActor) -> tuple[SandboxInfo, bool]:
+        try:
+            status_snapshot = actor.status_snapshot
+        except AttributeError:
+            # Actor started before status_snapshot existed.
+            sandbox_info, remote_status, alive = await self._ray_service.async_ray_get_many(
+                [actor.sandbox_info.remote(), actor.get_status.remote(), actor.is_alive.remote()]
+            )
+            sandbox_info["phases"] = {name: phase.to_dict() for name, phase in remote_status.phases.items()}
+            sandbox_info["port_mapping"] = remote_status.get_port_mapping()
+            return sandbox_info, alive.is_alive
+        return await self._ray_service.async_ray_get(status_snapshot.remote())
+
+    async def wait_started(self, sandbox_id: str, timeout: float) -> bool:
+        start_ref = self._start_refs.get(sandbox_id)
+        if start_ref is None:
+            return False
+        try:
+            await self._ray_service.async_ray_wait(start_ref, timeout)
+        except asyncio.TimeoutError:
+            return False
+        except Exception as e:
+            logger.info(f"[{sandbox_id}] start finished with error: {e}")
+        finally:
+            self._start_refs.pop(sandbox_id, None)
+        self._status_cache.invalidate(sandbox_id)
+        return True
 
     async def stop(self, sandbox_id: str, reason: StopReason = StopReason.MANUAL) -> bool:
+        self._status_cache.invalidate(sandbox_id)
+        self._start_refs.pop(sandbox_id, None)
         async with self._ray_service.get_ray_rwlock().read_lock():
             actor: SandboxActor = await self._ray_service.async_ray_get_actor(self._get_actor_name(sandbox_id))
             await self._ray_service.async_ray_get(actor.stop.remote(reason))
@@ -127,6 +165,7 @@ class RayOperator(AbstractOperator):
     async def delete(self, config: DockerDeploymentConfig, host_ip: str | None = None) -> bool:
         async with self._ray_service.get_ray_rwlock().read_lock():
             sandbox_id = config.container_name
+            self._status_cache.invalidate(sandbox_id)
             actor_name = self._get_actor_name(sandbox_id)
 
             try:
@@ -163,6 +202,7 @@ class RayOperator(AbstractOperator):
         """
         async with self._ray_service.get_ray_rwlock().read_lock():
             sandbox_id = config.container_name
+            self._status_cache.invalidate(sandbox_id)
 
             if not host_ip:
                 logger.warning(
@@ -219,6 +259,28 @@ class RayOperator(AbstractOperator):
         logger.warning(f"{service_status_path} exists, but content is empty")
         return ServiceStatus()
 
+    async def _probe_rocklet_status(self, sandbox_id: str, host_ip: str) -> tuple[ServiceStatus, bool]:
+        """Status file and liveness from the worker rocklet's /sandbox_status in one request.
+
+        Falls back to /execute + /read_file + /is_alive for rocklets that predate /sandbox_status.
+        """
+        worker_rocklet_port = env_vars.ROCK_WORKER_ROCKLET_PORT if env_vars.ROCK_WORKER_ROCKLET_PORT else Port.PROXY
+        try:
+            response = await HttpUtils.post(
+                url=f"http://{host_ip}:{worker_rocklet_port}/sandbox_status",
+                headers={"sandbox_id": sandbox_id, EAGLE_EYE_TRACE_ID: trace_id_ctx_var.get()},
+                data={"sandbox_id": sandbox_id, "host_ip": host_ip},
+                read_timeout=60,
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != HTTP_404_NOT_FOUND:
+                raise
+            remote_status = await self.get_remote_status(sandbox_id, host_ip)
+            return remote_status, await self._check_alive_status(sandbox_id, host_ip, remote_status)
+        probe = SandboxStatusProbeResponse(**response)
+        remote_status = ServiceStatus.from_dict(probe.status) if probe.status else ServiceStatus()
+        return remote_status, probe.is_alive
+
     def use_rocklet(self) -> bool:
         if not self._nacos_provider:
             return False
@@ -0,0 +1,61 @@
+"""SandboxStatusCache - short-lived cache of operator status probes.
+
+``get_status`` is polled by every client waiting for a sandbox and by the admin's own
+loops, often for the same sandbox at the same moment. Concurrent lookups of one sandbox
+share a single probe, and its result is served for ``ttl_seconds`` afterwards.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import time
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+from rock.actions.sandbox.sandbox_info import SandboxInfo
+
+# Expired entries are dropped once the cache holds this many.
+_PRUNE_THRESHOLD = 4096
+
+
+class SandboxStatusCache:
+    def __init__(self, ttl_seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: dict[str, tuple[float, SandboxInfo | None]] = {}
+        self._in_flight: dict[str, asyncio.Task] = {}
+
+    async def get(self, sandbox_id: str, load: Callable[[str], Awaitable[SandboxInfo | None]]) -> SandboxInfo | None:
+        """Cached status of *sandbox_id*, calling *load* only if no fresh entry or probe in flight exists.
+
+        Each caller gets its own copy, so callers may modify the result.
+        """
+        entry = self._entries.get(sandbox_id)
+        if entry is not None and entry[0] > self._clock():
+            return copy.deepcopy(entry[1])
+        task = self._in_flight.get(sandbox_id)
+        if task is None:
+            task = asyncio.create_task(load(sandbox_id))
+            self._in_flight[sandbox_id] = task
+            task.add_done_callback(partial(self._on_loaded, sandbox_id))
+        # Shielded: a caller giving up does not cancel the probe the others are waiting for.
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def invalidate(self, sandbox_id: str) -> None:
+        """Forget *sandbox_id*, e.g. after it was stopped; a probe already in flight is not cached."""
+        self._entries.pop(sandbox_id, None)
+        self._in_flight.pop(sandbox_id, None)
+
+    def _on_loaded(self, sandbox_id: str, task: asyncio.Task) -> None:
+        # Checked first so a failure nobody awaited is still marked as retrieved.
+        failed = task.cancelled() or task.exception() is not None
+        if self._in_flight.get(sandbox_id) is not task:
+            return
+        del self._in_flight[sandbox_id]
+        if failed or self._ttl_seconds <= 0:
+            return
+        now = self._clock()
+        if len(self._entries) >= _PRUNE_THRESHOLD:
+            self._entries = {key: entry for key, entry in self._entries.items() if entry[0] > now}
+        self._entries[sandbox_id] = (now + self._ttl_seconds, task.result())
@@ -3,11 +3,12 @@ import shutil
 import sys
 import tempfile
 import traceback
+from collections.abc import AsyncIterator
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-import requests
+import httpx
 from fastapi import UploadFile
 from pydantic import BaseModel
 from typing_extensions import Self
@@ -18,6 +19,7 @@ from rock.actions import (
     CloseSessionResponse,
     CommandResponse,
     CreateSessionResponse,
+    DownloadChunkRequest,
     EnvCloseRequest,
     EnvCloseResponse,
     EnvListResponse,
@@ -44,7 +46,7 @@ from rock.admin.proto.request import SandboxReadFileRequest as ReadFileRequest
 from rock.admin.proto.request import SandboxWriteFileRequest as WriteFileRequest
 from rock.logger import init_logger
 from rock.rocklet.exceptions import RockletException
-from rock.utils import SANDBOX_ID, sandbox_id_ctx_var, wait_until_alive
+from rock.utils import SANDBOX_ID, HttpClientPool, sandbox_id_ctx_var, wait_until_alive
 
 __all__ = ["RemoteSandboxRuntime", "RemoteSandboxRuntimeConfig"]
 
@@ -60,7 +62,12 @@ class RemoteSandboxRuntime(AbstractSandbox):
     ):
         """A runtime that connects to a remote server.
 
+        Requests go through the keep-alive connections that ``HttpClientPool`` holds per rocklet on the
+        running event loop, so runtimes for the same rocklet share connections, and concurrency per
+        rocklet is capped at ``ROCK_HTTP_MAX_CONNECTIONS_PER_HOST`` with further requests queued.
+
         Args:
+            executor: Executor for blocking local work, such as zipping a directory before upload.
             **kwargs: Keyword arguments to pass to the `RemoteRuntimeConfig` constructor.
         """
         self._config = RemoteSandboxRuntimeConfig(**kwargs)
@@ -98,7 +105,6 @@ class RemoteSandboxRuntime(AbstractSandbox):
         if exc_transfer.traceback:
             logger.critical("Traceback: \n%s", exc_transfer.traceback)
         module, _, exc_name = exc_transfer.class_path.rpartition(".")
-        print(module, exc_name)
         if module == "builtins":
             module_obj = __builtins__
         else:
@@ -126,7 +132,7 @@ class RemoteSandboxRuntime(AbstractSandbox):
         exception.extra_info = exc_transfer.extra_info
         raise exception from None
 
-    def _handle_response_errors(self, response: requests.Response) -> None:
+    def _handle_response_errors(self, response: httpx.Response) -> None:
         """Raise exceptions found in the request response."""
         if response.status_code == 511:
             exc_transfer = _ExceptionTransfer(**response.json()["rockletexception"])
@@ -134,13 +140,18 @@ class RemoteSandboxRuntime(AbstractSandbox):
         try:
             response.raise_for_status()
         except Exception:
-            logger.critical("Received error response: %s", response.json())
+            logger.critical("Received error response: %s", response.text)
             raise
 
-    def _is_alive(self, timeout: float | None = None) -> IsAliveResponse:
+    async def is_alive(self, *, timeout: float | None = None) -> IsAliveResponse:
+        """Checks if the runtime is alive.
+
+        Internal server errors are thrown, everything else just has us return False
+        together with the message.
+        """
         try:
-            response = requests.get(
-                f"{self._api_url}/is_alive", headers=self._headers, timeout=self._get_timeout(timeout)
+            response = await HttpClientPool.request(
+                "GET", f"{self._api_url}/is_alive", headers=self._headers, timeout=self._get_timeout(timeout)
             )
             if response.status_code == 200:
                 return IsAliveResponse(**response.json())
@@ -152,102 +163,74 @@ class RemoteSandboxRuntime(AbstractSandbox):
                 f"Message: {response.json().get('detail')}"
             )
             return IsAliveResponse(is_alive=False, message=msg)
-        except requests.RequestException:
-            msg = f"Failed to connect to {self._config.host}\n"
-            msg += traceback.format_exc()
-            return IsAliveResponse(is_alive=False, message=msg)
         except Exception:
             msg = f"Failed to connect to {self._config.host}\n"
             msg += traceback.format_exc()
             return IsAliveResponse(is_alive=False, message=msg)
 
-    async def is_alive(self, *, timeout: float | None = None) -> IsAliveResponse:
-        """Checks if the runtime is alive.
-
-        Internal server errors are thrown, everything else just has us return False
-        together with the message.
-        """
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, self._is_alive, timeout)
-
     async def wait_until_alive(self, *, timeout: float = 60.0):
         return await wait_until_alive(self.is_alive, timeout=timeout)
 
-    def _request(self, endpoint: str, request: BaseModel | None, output_class: Any):
+    async def _request(self, endpoint: str, request: BaseModel | dict | None, output_class: Any):
         """Small helper to make requests to the server and handle errors and output."""
-        response = requests.post(
-            f"{self._api_url}/{endpoint}", json=request.model_dump() if request else None, headers=self._headers
+        if isinstance(request, BaseModel):
+            request = request.model_dump()
+        # No timeout: commands bound their own runtime, and the pool queues requests past its connection cap.
+        response = await HttpClientPool.request(
+            "POST", f"{self._api_url}/{endpoint}", json=request, headers=self._headers, timeout=None
         )
         self._handle_response_errors(response)
         return output_class(**response.json())
 
     async def create_session(self, request: CreateSessionRequest) -> CreateSessionResponse:
         """Creates a new session."""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            self._executor, self._request, "create_session", request, CreateSessionResponse
-        )
+        return await self._request("create_session", request, CreateSessionResponse)
 
     async def run_in_session(self, action: Action) -> Observation:
         """Runs a command in a session."""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, self._request, "run_in_session", action, Observation)
+        return await self._request("run_in_session", action, Observation)
 
     async def close_session(self, request: CloseSessionRequest) -> CloseSessionResponse:
         """Closes a shell session."""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, self._request, "close_session", request, CloseSessionResponse)
+        return await self._request("close_session", request, CloseSessionResponse)
 
     async def execute(self, command: Command) -> CommandResponse:
         """Executes a command (independent of any shell session)."""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, self._request, "execute", command, CommandResponse)
+        return await self._request("execute", command, CommandResponse)
 
     async def read_file(self, request: ReadFileRequest) -> ReadFileResponse:
         """Reads a file"""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, self._request, "read_file", request, ReadFileResponse)
+        return await self._request("read_file", request, ReadFileResponse)
 
     async def write_file(self, request: WriteFileRequest) -> WriteFileResponse:
         """Writes a file"""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, self._request, "write_file", request, WriteFileResponse)
+        return await self._request("write_file", request, WriteFileResponse)
 
     async def get_statistics(self) -> dict:
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, self._get_statistics)
+        try:
+            response = await HttpClientPool.request("GET", f"{self._api_url}/get_statistics", headers=self._headers)
+            return response.json()
+        except Exception:
+            logger.warning(f"Failed to connect to {self._config.host}\n{traceback.format_exc()}")
+            return {}
 
     async def env_make(self, request: EnvMakeRequest) -> EnvMakeResponse:
         """Creates a new environment"""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, self._request, "env/make", request, EnvMakeResponse)
+        return await self._request("env/make", request, EnvMakeResponse)
 
     async def env_step(self, request: EnvStepRequest) -> EnvStepResponse:
         """Steps an environment"""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, self._request, "env/step", request, EnvStepResponse)
+        return await self._request("env/step", request, EnvStepResponse)
 
     async def env_reset(self, request: EnvResetRequest) -> EnvResetResponse:
         """Resets an environment"""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, self._request, "env/reset", request, EnvResetResponse)
+        return await self._request("env/reset", request, EnvResetResponse)
 
     async def env_close(self, request: EnvCloseRequest) -> EnvCloseResponse:
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, self._request, "env/close", request, EnvCloseResponse)
+        return await self._request("env/close", request, EnvCloseResponse)
 
     async def env_list(self) -> EnvListResponse:
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(self._executor, self._request, "env/list", {}, EnvListResponse)
-
-    def _get_statistics(self):
-        try:
-            response = requests.get(f"{self._api_url}/get_statistics", headers=self._headers)
-            return response.json()
-        except Exception:
-            msg = f"Failed to connect to {self._config.host}\n"
-            msg += traceback.format_exc()
-            return {}
+        return await self._request("env/list", {}, EnvListResponse)
 
     async def check_pid_exists(self, pid: int, sandbox_id: str, process_name: str | None = None) -> bool:
         """Check if a process exists on the remote host.
@@ -286,36 +269,45 @@ class RemoteSandboxRuntime(AbstractSandbox):
         if source.is_dir():
             with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
                 zip_path = Path(temp_dir) / "zipped_transfer.zip"
-                shutil.make_archive(str(zip_path.with_suffix("")), "zip", source)
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(
+                    self._executor, shutil.make_archive, str(zip_path.with_suffix("")), "zip", source
+                )
                 logger.debug("Created zip file at %s", zip_path)
-                files = {"file": zip_path.open("rb")}
-                data = {"target_path": request.target_path, "unzip": "true"}
-                response = requests.post(f"{self._api_url}/upload", files=files, data=data, headers=self._headers)
-                self._handle_response_errors(response)
-                return UploadResponse(**response.json())
+                with zip_path.open("rb") as f:
+                    return await self._upload_file(f, request.target_path, unzip=True)
         elif source.is_file():
             logger.debug("Uploading file from %s to %s", source, request.target_path)
-            files = {"file": source.open("rb")}
-            data = {"target_path": request.target_path, "unzip": "false"}
-            response = requests.post(f"{self._api_url}/upload", files=files, data=data, headers=self._headers)
-            self._handle_response_errors(response)
-            return UploadResponse(**response.json())
+            with source.open("rb") as f:
+                return await self._upload_file(f, request.target_path, unzip=False)
         else:
             msg = f"Source path {source} is not a file or directory"
             raise ValueError(msg)
 
-    def client_upload(self, files: dict[str, Any], target_path: str) -> UploadResponse:
-        data = {"target_path": target_path, "unzip": "false"}
-        response = requests.post(f"{self._api_url}/upload", files=files, data=data, headers=self._headers)
+    async def async_upload(self, file: UploadFile, target_path: str) -> UploadResponse:
+        return await self._upload_file((file.filename, file.file, file.content_type), target_path, unzip=False)
+
+    async def _upload_file(self, file: Any, target_path: str, unzip: bool) -> UploadResponse:
+        # httpx reads file objects in chunks while sending, so the upload is never held in memory.
+        data = {"target_path": target_path, "unzip": "true" if unzip else "false"}
+        response = await HttpClientPool.request(
+            "POST", f"{self._api_url}/upload", files={"file": file}, data=data, headers=self._headers, timeout=None
+        )
         self._handle_response_errors(response)
-        logger.info(f"Uploaded file from {files} to {target_path}: {response.json()}")
+        logger.info(f"Uploaded file to {target_path}: {response.json()}")
         return UploadResponse(**response.json())
 
-    async def async_upload(self, file: UploadFile, target_path: str) -> UploadResponse:
-        loop = asyncio.get_running_loop()
-        files = {"file": (file.filename, file.file, file.content_type)}
-        return await loop.run_in_executor(self._executor, self.client_upload, files, target_path)
+    async def download(self, request: DownloadChunkRequest) -> AsyncIterator[bytes]:
+        """Streams a byte range of a remote file as it arrives, without buffering the range."""
+        async with HttpClientPool.stream(
+            "GET", f"{self._api_url}/download", params=request.model_dump(), headers=self._headers, timeout=None
+        ) as response:
+            if response.is_error:
+                await response.aread()
+                self._handle_response_errors(response)
+            async for data in response.aiter_bytes():
+                yield data
 
-    def close(self) -> CloseResponse:
+    async def close(self) -> CloseResponse:
         """Closes the runtime."""
-        return self._request("close", None, CloseResponse)
+        return await self._request("close", None, CloseResponse)
@@ -33,6 +33,8 @@ from rock.deployments.docker import DockerDeployment
 from rock.deployments.status import ServiceStatus
 from rock.logger import init_logger
 from rock.sandbox.gem_actor import GemActor
+from rock.sandbox.job.warm_pool_actor import warm_pool_actor_name
+from rock.utils import StageTimer
 
 logger = init_logger(__name__)
 
@@ -49,6 +51,9 @@ class SandboxActor(GemActor):
     _user_id = "default"
     _experiment_id = "default"
     _namespace = "default"
+    # The warm pool actor and container this sandbox was started from; the pool holds its ports until stop.
+    _warm_pool = None
+    _warm_container = None
 
     def __init__(
         self,
@@ -129,7 +134,8 @@ class SandboxActor(GemActor):
 
     async def start(self):
         try:
-            await self._deployment.start()
+            if not await self._start_from_warm_pool():
+                await self._deployment.start()
         except Exception as ex:
             logger.error(f"[{self._config.container_name}] start deployment failed: {ex}", exc_info=True)
             raise ex
@@ -138,6 +144,33 @@ class SandboxActor(GemActor):
             self._clean_container_background()
         await self._setup_monitor()
 
+    async def _start_from_warm_pool(self) -> bool:
+        """Take over a container from this node's warm pool, if enabled and one matches; False means start from scratch."""
+        if not isinstance(self._deployment, DockerDeployment) or not self._config.runtime_config.warm_pool.enabled:
+            return False
+        try:
+            pool_name = warm_pool_actor_name(ray.get_runtime_context().get_node_id())
+            pool = await asyncio.to_thread(ray.get_actor, pool_name)
+            container = await pool.claim.remote(self._config)
+        except Exception as e:
+            logger.warning(f"[{self._config.container_name}] warm pool unavailable: {e}")
+            return False
+        if container is None:
+            logger.info(f"[{self._config.container_name}] warm pool miss")
+            return False
+        try:
+            with StageTimer("startup_timing", f"[{self._config.container_name}] Adopt warm container", logger):
+                await self._deployment.adopt(container)
+        except Exception as e:
+            logger.warning(
+                f"[{self._config.container_name}] failed to adopt warm container {container.container_name}: {e}"
+            )
+            pool.release.remote(container, reusable=True)
+            return False
+        logger.info(f"[{self._config.container_name}] warm pool hit: {container.container_name}")
+        self._warm_pool, self._warm_container = pool, container
+        return True
+
     async def stop(self, reason: StopReason = StopReason.MANUAL):
         logger.info(f"[{self._config.container_name}] start to stop (reason={reason.value})")
         try:
@@ -148,8 +181,18 @@ class SandboxActor(GemActor):
         except Exception as e:
             logger.error(f"[{self._config.container_name}] Error occurred while stopping container: {e}", exc_info=True)
         finally:
+            await self._release_warm_ports()
             self.log_lifecycle_summary(reason)
 
+    async def _release_warm_ports(self) -> None:
+        if self._warm_container is None:
+            return
+        container, self._warm_container = self._warm_container, None
+        try:
+            await self._warm_pool.release_ports.remote(container)
+        except Exception as e:
+            logger.warning(f"[{container.container_name}] failed to release warm container ports: {e}")
+
     async def restart(self):
         """Restart an existing stopped container using docker start."""
         logger.info(f"[{self._config.container_name}] start to restart")
@@ -268,6 +311,14 @@ class SandboxActor(GemActor):
             status.update_status("docker_run", Status.FAILED, "not supported on current deployment")
             return status
 
+    async def status_snapshot(self) -> tuple[SandboxInfo, bool]:
+        """``sandbox_info`` with phases and port mapping, plus liveness, in one actor call."""
+        status, alive = await asyncio.gather(self.get_status(), self.is_alive())
+        sandbox_info = await self.sandbox_info()
+        sandbox_info["phases"] = {name: phase.to_dict() for name, phase in status.phases.items()}
+        sandbox_info["port_mapping"] = status.get_port_mapping()
+        return sandbox_info, alive.is_alive
+
     async def host_ip(self) -> str | None:
         try:
             hostname = socket.gethostname()
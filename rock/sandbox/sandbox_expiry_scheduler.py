@@ -0,0 +1,86 @@
+"""SandboxExpiryScheduler - stops sandboxes whose ``expire_time`` has passed.
+
+Every timeout write also scores the sandbox by its expire time in a Redis sorted set
+(see ``SandboxMetaStore.update_timeout``). Each round pops only the entries that are due,
+so its cost follows the number of expired sandboxes rather than the size of the fleet.
+Popped entries are leased, which lets every admin replica run the scheduler without two
+of them stopping the same sandbox.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+from rock.config import ExpiryConfig
+from rock.logger import init_logger
+from rock.sandbox.sandbox_meta_store import SandboxMetaStore
+from rock.sandbox.utils.timeout import SandboxTimeoutHelper
+
+logger = init_logger(__name__)
+
+
+class SandboxExpiryScheduler:
+    """Pops due sandboxes from the expiry index and hands them to *on_expired* with bounded parallelism.
+
+    The index only decides what to look at: the timeout key stays the source of truth, so an
+    entry whose timeout was refreshed after it was read is put back at its new expire time
+    instead of being stopped. A sandbox whose *on_expired* fails keeps its lease and is
+    retried by any replica once the lease runs out.
+    """
+
+    def __init__(
+        self,
+        meta_store: SandboxMetaStore,
+        on_expired: Callable[[str], Awaitable[object]],
+        config: ExpiryConfig,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._meta_store = meta_store
+        self._on_expired = on_expired
+        self._config = config
+        self._clock = clock
+        self._owner = uuid.uuid4().hex
+        self._indexed = False
+
+    async def run_once(self) -> list[str]:
+        """Handle every sandbox that is due now; returns the IDs passed to *on_expired* successfully."""
+        if not self._indexed:
+            added = await self._meta_store.index_missing_expiries()
+            self._indexed = True
+            if added:
+                logger.info(f"Added {added} alive sandboxes to the expiry index")
+
+        semaphore = asyncio.Semaphore(self._config.concurrency)
+        expired: list[str] = []
+        while True:
+            now = int(self._clock())
+            claimed = await self._meta_store.claim_expired(
+                now, self._config.batch_size, self._config.lease_seconds, self._owner
+            )
+            # Claimed entries move ahead in the index, so this ends once nothing unleased is due.
+            if not claimed:
+                return expired
+            results = await asyncio.gather(*(self._expire(sandbox_id, now, semaphore) for sandbox_id in claimed))
+            expired.extend(sandbox_id for sandbox_id, done in zip(claimed, results) if done)
+
+    async def _expire(self, sandbox_id: str, now: int, semaphore: asyncio.Semaphore) -> bool:
+        async with semaphore:
+            try:
+                timeout_info = await self._meta_store.get_timeout(sandbox_id)
+                if timeout_info is None:
+                    await self._meta_store.unschedule_expiry(sandbox_id)
+                    return False
+                if not SandboxTimeoutHelper.is_expired(timeout_info, now):
+                    await self._meta_store.schedule_expiry(sandbox_id, SandboxTimeoutHelper.expire_time(timeout_info))
+                    return False
+                logger.info(f"sandbox_id:[{sandbox_id}] is expired, start to stop")
+                await self._on_expired(sandbox_id)
+                # Stopping archives the sandbox, which drops it from the index; a dangling one has no alive key.
+                await self._meta_store.unschedule_expiry(sandbox_id)
+                return True
+            except Exception as e:
+                logger.error(f"Failed to expire sandbox {sandbox_id}, retrying after the lease", exc_info=e)
+                return False
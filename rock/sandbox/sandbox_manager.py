@@ -1,16 +1,22 @@
 import asyncio
-import time
+from collections.abc import AsyncIterable, AsyncIterator
+from functools import partial
 
 from fastapi import UploadFile
+from fastapi.responses import StreamingResponse
 
 from rock import env_vars
 from rock.actions import (
     BashObservation,
+    BatchCommandResult,
+    BatchStopResult,
     CloseBashSessionResponse,
     CommandResponse,
     CreateBashSessionResponse,
     ReadFileResponse,
+    UploadChunkResponse,
     UploadResponse,
+    WaitProcessResponse,
     WriteFileResponse,
 )
 from rock.actions.sandbox.response import State
@@ -19,23 +25,32 @@ from rock.admin.core.ray_service import RayService
 from rock.admin.metrics.decorator import monitor_sandbox_operation
 from rock.admin.proto.request import ClusterInfo, UserInfo
 from rock.admin.proto.request import SandboxAction as Action
+from rock.admin.proto.request import SandboxBatchCommand as BatchCommand
 from rock.admin.proto.request import SandboxCloseBashSessionRequest as CloseBashSessionRequest
 from rock.admin.proto.request import SandboxCommand as Command
 from rock.admin.proto.request import SandboxCreateSessionRequest as CreateSessionRequest
+from rock.admin.proto.request import SandboxDownloadChunkRequest as DownloadChunkRequest
 from rock.admin.proto.request import SandboxReadFileRequest as ReadFileRequest
+from rock.admin.proto.request import SandboxUploadChunkRequest as UploadChunkRequest
+from rock.admin.proto.request import SandboxUploadStatusRequest as UploadStatusRequest
+from rock.admin.proto.request import SandboxWaitProcessRequest as WaitProcessRequest
 from rock.admin.proto.request import SandboxWriteFileRequest as WriteFileRequest
 from rock.admin.proto.response import SandboxStartResponse, SandboxStatusResponse
 from rock.common.constants import DeleteReason, StopReason
 from rock.config import RockConfig, RuntimeConfig
 from rock.deployments.config import DeploymentConfig, DockerDeploymentConfig
+from rock.deployments.constants import Status
 from rock.logger import init_logger
 from rock.rocklet import __version__ as swe_version
 from rock.sandbox import __version__ as gateway_version
 from rock.sandbox.base_manager import BaseManager
 from rock.sandbox.operator.abstract import AbstractOperator
 from rock.sandbox.sandbox_actor import SandboxActor
+from rock.sandbox.sandbox_expiry_scheduler import SandboxExpiryScheduler
 from rock.sandbox.sandbox_meta_store import SandboxMetaStore
+from rock.sandbox.sandbox_readiness import SandboxReadinessRegistry
 from rock.sandbox.sandbox_statemachine import SandboxStateMachine
+from rock.sandbox.service.route_cache import SandboxRouteCache
 from rock.sandbox.service.sandbox_proxy_service import SandboxProxyService
 from rock.sandbox.utils.timeout import SandboxTimeoutHelper
 from rock.sdk.common.exceptions import BadRequestRockError, InternalServerRockError
@@ -69,6 +84,12 @@ class SandboxManager(BaseManager):
         self._operator = operator
         self._aes_encrypter = AESEncryption()
         self._proxy_service = SandboxProxyService(rock_config=rock_config, meta_store=meta_store)
+        self._expiry_scheduler = SandboxExpiryScheduler(
+            meta_store, partial(self.stop, reason=StopReason.EXPIRED), rock_config.runtime.expiry
+        )
+        self._readiness = SandboxReadinessRegistry(meta_store, rock_config.runtime.readiness_poll_seconds)
+        self._start_watchers: set[asyncio.Task] = set()
+        self._stop_tasks: set[asyncio.Task] = set()
         logger.info("sandbox service init success")
 
     async def _get_current_statemachine(self, sandbox_id: str) -> SandboxStateMachine | None:
@@ -145,12 +166,30 @@ class SandboxManager(BaseManager):
                 timeout_info=timeout_info,
                 deployment_config=docker_deployment_config,
             )
+        self._watch_start(sandbox_id, docker_deployment_config.startup_timeout)
         return SandboxStartResponse(
             sandbox_id=sandbox_id,
             host_name=sandbox_info.get("host_name"),
             host_ip=sandbox_info.get("host_ip"),
         )
 
+    def _watch_start(self, sandbox_id: str, timeout: float) -> None:
+        task = asyncio.create_task(self._on_started(sandbox_id, timeout))
+        self._start_watchers.add(task)
+        task.add_done_callback(self._start_watchers.discard)
+
+    async def _on_started(self, sandbox_id: str, timeout: float) -> None:
+        """Once the operator reports the start finished, record the new state and wake wait_ready callers."""
+        try:
+            if not await self._operator.wait_started(sandbox_id, timeout):
+                return
+            try:
+                await self.get_status(sandbox_id)
+            finally:
+                await self._meta_store.notify_change(sandbox_id)
+        except Exception as e:
+            logger.warning(f"[{sandbox_id}] failed to report start completion: {e}")
+
     @monitor_sandbox_operation()
     async def restart_async(self, sandbox_id: str) -> SandboxStartResponse:
         sm = await self._get_current_statemachine(sandbox_id)
@@ -179,17 +218,30 @@ class SandboxManager(BaseManager):
     async def start(self, config: DeploymentConfig) -> SandboxStartResponse:
         response = await self.start_async(config)
         sandbox_id = response.sandbox_id
-        deadline = time.time() + REQUEST_TIMEOUT_SECONDS
         with StageTimer("startup_timing", f"[{sandbox_id}] Wait sandbox running", logger):
-            while True:
-                status = await self.get_status(sandbox_id)
-                if status.is_alive:
-                    break
-                if time.time() >= deadline:
-                    raise TimeoutError(f"sandbox {sandbox_id} not running after {REQUEST_TIMEOUT_SECONDS}s")
-                await asyncio.sleep(1)
+            status = await self.wait_ready(sandbox_id, REQUEST_TIMEOUT_SECONDS)
+        if not status.is_alive:
+            if error := _start_error(status):
+                raise InternalServerRockError(f"sandbox {sandbox_id} failed to start, {error}")
+            raise TimeoutError(f"sandbox {sandbox_id} not running after {REQUEST_TIMEOUT_SECONDS}s")
         return response
 
+    async def wait_ready(self, sandbox_id: str, timeout: float) -> SandboxStatusResponse:
+        """Status of *sandbox_id* once it is alive or its start failed, or after *timeout* seconds otherwise.
+
+        Blocks on readiness notifications rather than polling; get_status runs again only when the
+        sandbox changed, or every ``runtime.readiness_poll_seconds`` as a fallback.
+        """
+        status: SandboxStatusResponse | None = None
+
+        async def ready() -> SandboxStatusResponse | None:
+            nonlocal status
+            status = await self.get_status(sandbox_id)
+            return status if status.is_alive or _start_error(status) else None
+
+        await self._readiness.wait(sandbox_id, ready, timeout)
+        return status
+
     @monitor_sandbox_operation()
     async def stop(self, sandbox_id: str, reason: StopReason = StopReason.MANUAL):
         sm = await self._get_current_statemachine(sandbox_id)
@@ -223,6 +275,32 @@ class SandboxManager(BaseManager):
                     reason=DeleteReason.IMMEDIATE,
                 )
 
+    async def batch_stop(
+        self, sandbox_ids: list[str], reason: StopReason = StopReason.MANUAL
+    ) -> AsyncIterator[BatchStopResult]:
+        """Stop many sandboxes in parallel and return their outcomes in completion order.
+
+        Each sandbox goes through ``stop``, at most ``runtime.batch_stop_concurrency`` at a time.
+        The stops are not tied to the caller: they run to completion even if it stops reading.
+        """
+        semaphore = asyncio.Semaphore(self.rock_config.runtime.batch_stop_concurrency)
+
+        async def stop_one(sandbox_id: str) -> BatchStopResult:
+            async with semaphore:
+                try:
+                    await self.stop(sandbox_id, reason=reason)
+                    return BatchStopResult(sandbox_id=sandbox_id)
+                except Exception as e:
+                    logger.warning(f"batch stop: failed to stop sandbox {sandbox_id}: {e}")
+                    return BatchStopResult(sandbox_id=sandbox_id, error=str(e))
+
+        tasks = [asyncio.create_task(stop_one(sandbox_id)) for sandbox_id in dict.fromkeys(sandbox_ids)]
+        for task in tasks:
+            self._stop_tasks.add(task)
+            task.add_done_callback(self._stop_tasks.discard)
+        logger.info(f"batch stop: stopping {len(tasks)} sandboxes")
+        return _completed(tasks)
+
     @monitor_sandbox_operation()
     async def delete(self, sandbox_id: str, reason: DeleteReason = DeleteReason.MANUAL) -> None:
         sm = await self._get_current_statemachine(sandbox_id)
@@ -272,14 +350,20 @@ class SandboxManager(BaseManager):
 
     @monitor_sandbox_operation()
     async def get_status(self, sandbox_id, include_all_states: bool = False) -> SandboxStatusResponse:
-        # get status from meta_store
-        sm = await self._get_current_statemachine(sandbox_id)
+        # probe the operator while the state machine is restored from meta_store
+        probe = asyncio.ensure_future(self._operator.get_status(sandbox_id=sandbox_id))
+        try:
+            sm = await self._get_current_statemachine(sandbox_id)
+        except BaseException:
+            probe.cancel()
+            raise
         if sm is None:
+            probe.cancel()
             raise BadRequestRockError(f"Sandbox {sandbox_id} not found")
 
         # update status from operator
         is_alive = False
-        operator_sandbox_info: SandboxInfo | None = await self._operator.get_status(sandbox_id=sandbox_id)
+        operator_sandbox_info: SandboxInfo | None = await probe
         if operator_sandbox_info is not None:
             is_alive = operator_sandbox_info.get("state") == State.RUNNING
             if sm.current_state.value == State.PENDING and is_alive:
@@ -355,6 +439,9 @@ class SandboxManager(BaseManager):
     async def execute(self, command: Command) -> CommandResponse:
         return await self._proxy_service.execute(command)
 
+    async def batch_execute(self, request: BatchCommand) -> AsyncIterator[BatchCommandResult]:
+        return await self._proxy_service.batch_execute(request)
+
     async def read_file(self, request: ReadFileRequest) -> ReadFileResponse:
         return await self._proxy_service.read_file(request)
 
@@ -362,10 +449,36 @@ class SandboxManager(BaseManager):
     async def write_file(self, request: WriteFileRequest) -> WriteFileResponse:
         return await self._proxy_service.write_file(request)
 
+    @monitor_sandbox_operation()
+    async def wait_process(self, request: WaitProcessRequest) -> WaitProcessResponse:
+        return await self._proxy_service.wait_process(request)
+
+    @property
+    def route_cache(self) -> SandboxRouteCache:
+        return self._proxy_service.route_cache
+
+    async def aclose(self) -> None:
+        for task in list(self._start_watchers):
+            task.cancel()
+        await asyncio.gather(*self._start_watchers, return_exceptions=True)
+        # Let in-flight batch stops finish rather than leave sandboxes half torn down.
+        await asyncio.gather(*self._stop_tasks, return_exceptions=True)
+        await self._readiness.aclose()
+        await self._proxy_service.aclose()
+
     @monitor_sandbox_operation()
     async def upload(self, file: UploadFile, target_path: str, sandbox_id: str) -> UploadResponse:
         return await self._proxy_service.upload(file, target_path, sandbox_id)
 
+    async def upload_status(self, request: UploadStatusRequest) -> UploadChunkResponse:
+        return await self._proxy_service.upload_status(request)
+
+    async def upload_chunk(self, request: UploadChunkRequest, body: AsyncIterable[bytes]) -> UploadChunkResponse:
+        return await self._proxy_service.upload_chunk(request, body)
+
+    async def download(self, request: DownloadChunkRequest) -> StreamingResponse:
+        return await self._proxy_service.download(request)
+
     async def _refresh_timeout(self, sandbox_id: str) -> None:
         timeout_info = await self._meta_store.get_timeout(sandbox_id)
         if timeout_info is None:
@@ -377,13 +490,6 @@ class SandboxManager(BaseManager):
             return
         await self._meta_store.update_timeout(sandbox_id, new_timeout)
 
-    async def _is_expired(self, sandbox_id: str) -> bool:
-        timeout_info = await self._meta_store.get_timeout(sandbox_id)
-        if timeout_info is None:
-            logger.warning("is_expired: timeout key not found for sandbox_id=%s", sandbox_id)
-            return False
-        return SandboxTimeoutHelper.is_expired(timeout_info)
-
     async def _is_actor_alive(self, sandbox_id):
         try:
             actor_name = self.deployment_manager.get_actor_name(sandbox_id)
@@ -395,18 +501,13 @@ class SandboxManager(BaseManager):
 
     async def _check_job_background(self):
         logger.debug("check job background")
-        async for sandbox_id in self._meta_store.iter_alive_sandbox_ids():
-            try:
-                is_expired = await self._is_expired(sandbox_id)
-                if is_expired:
-                    logger.info(f"sandbox_id:[{sandbox_id}] is expired, start to stop")
-                    asyncio.create_task(self.stop(sandbox_id, reason=StopReason.EXPIRED))
-            except asyncio.CancelledError as e:
-                logger.error("check_job_background CancelledError", exc_info=e)
-                continue
-            except Exception as e:
-                logger.error("check_job_background Exception", exc_info=e)
-                continue
+        try:
+            expired = await self._expiry_scheduler.run_once()
+        except Exception as e:
+            logger.error("check_job_background Exception", exc_info=e)
+            return
+        if expired:
+            logger.info(f"stopped {len(expired)} expired sandboxes")
 
     async def get_sandbox_statistics(self, sandbox_id):
         actor_name = self.deployment_manager.get_actor_name(sandbox_id)
@@ -439,3 +540,16 @@ class SandboxManager(BaseManager):
                 raise BadRequestRockError(
                     f"Invalid disk_limit_rootfs size: {deployment_config.disk_limit_rootfs}"
                 )
+
+
+def _start_error(status: SandboxStatusResponse) -> str | None:
+    """The first failed or timed out startup phase as "phase: message", or None."""
+    for phase, details in (status.status or {}).items():
+        if details.get("status") in (Status.FAILED.value, Status.TIMEOUT.value):
+            return f"{phase}: {details.get('message')}"
+    return None
+
+
+async def _completed(tasks: list[asyncio.Task[BatchStopResult]]) -> AsyncIterator[BatchStopResult]:
+    for next_done in asyncio.as_completed(tasks):
+        yield await next_done
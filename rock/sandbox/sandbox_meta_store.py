@@ -2,31 +2,51 @@
 
 Redis remains the source of truth for live sandbox state.
 The database is an async replica used for indexed queries (list_by, etc.).
-All DB operations are awaited for consistency.
+DB operations are awaited for consistency, except ``update`` when
+``database.write_behind_interval_seconds`` enables the write-behind queue.
+
+The Redis commands of each operation are sent as one pipelined transaction, and
+the ``*_many`` variants batch a whole set of sandboxes into a single round trip.
 """
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Iterable
 from typing import TYPE_CHECKING, Any
 
 from rock.actions.sandbox.response import State
 from rock.actions.sandbox.sandbox_info import SandboxInfo, pick_sandbox_info_fields
-from rock.admin.core.redis_key import alive_sandbox_key, timeout_sandbox_key
+from rock.admin.core.redis_key import (
+    SANDBOX_ACTIVE_COUNT_KEY,
+    SANDBOX_ACTIVE_KEY,
+    SANDBOX_CHANGES_CHANNEL,
+    SANDBOX_EXPIRY_KEY,
+    alive_sandbox_key,
+    expiry_lease_key,
+    timeout_sandbox_key,
+)
+from rock.admin.core.sandbox_query import SandboxQuery
 from rock.admin.core.sandbox_table import SandboxTable
 from rock.admin.metrics.decorator import monitor_metastore_operation
 from rock.admin.metrics.monitor import MetricsMonitor
 from rock.config import RockConfig
 
 if TYPE_CHECKING:
+    from redis.asyncio.client import Pipeline
+
     from rock.deployments.config import DockerDeploymentConfig
 from rock.logger import init_logger
+from rock.sandbox.sandbox_write_behind import SandboxWriteBehindQueue
+from rock.sandbox.utils.timeout import SandboxTimeoutHelper
 from rock.utils.providers.redis_provider import RedisProvider
 
 logger = init_logger(__name__)
 
 # States that indicate an active sandbox (not yet stopped/archived).
 _ACTIVE_STATES: list[str] = [State.RUNNING, State.PENDING]
+# Image reported for active sandboxes whose info carries none.
+_DEFAULT_IMAGE = "default"
 
 
 class SandboxMetaStore:
@@ -49,6 +69,11 @@ class SandboxMetaStore:
             user_defined_tags=rock_config.runtime.user_defined_tags if rock_config else {},
             metric_prefix="meta_store",
         )
+        self._change_listeners: list[Callable[[str], None]] = []
+        write_behind_interval = rock_config.database.write_behind_interval_seconds if rock_config else 0
+        self._write_behind: SandboxWriteBehindQueue | None = (
+            SandboxWriteBehindQueue(sandbox_table, write_behind_interval) if write_behind_interval > 0 else None
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -67,7 +92,8 @@ class SandboxMetaStore:
         Parameters
         ----------
         timeout_info:
-            If provided, also write the timeout key (``auto_clear_time`` / ``expire_time``).
+            If provided, also write the timeout key (``auto_clear_time`` / ``expire_time``)
+            and add the sandbox to the expiry index.
         deployment_config:
             ``DockerDeploymentConfig`` snapshot written once to the ``spec`` DB column.
             Redis does not store this.
@@ -77,9 +103,14 @@ class SandboxMetaStore:
         prior DB-fallback read) cannot leak into the alive key.
         """
         redis_payload = pick_sandbox_info_fields(sandbox_info)
-        await self._redis.json_set(alive_sandbox_key(sandbox_id), "$", redis_payload)
-        if timeout_info is not None:
-            await self._redis.json_set(timeout_sandbox_key(sandbox_id), "$", timeout_info)
+        transitions = _active_transitions({sandbox_id: sandbox_info})
+        async with self._redis.pipeline() as pipe:
+            _queue_active_transitions(pipe, transitions)
+            pipe.json().set(alive_sandbox_key(sandbox_id), "$", redis_payload)
+            if timeout_info is not None:
+                _queue_timeout(pipe, sandbox_id, timeout_info)
+            results = await pipe.execute()
+        await self._apply_active_counts(transitions, results)
 
         await self._db.create(sandbox_id, sandbox_info, deployment_config)
 
@@ -91,20 +122,30 @@ class SandboxMetaStore:
         fields like ``spec`` / ``status`` are dropped so they don't pollute the
         alive key. The DB write keeps the full dict — the DB layer has its own
         column-based filtering.
+
+        The merge sets only the given fields (``JSON.SET $.field``), so it needs
+        no prior read and is a single Redis round trip.
         """
-        redis_payload = pick_sandbox_info_fields(sandbox_info)
-        current = await self._redis.json_get(alive_sandbox_key(sandbox_id), "$")
-        merged: dict[str, Any] = {**(current[0] if current else {}), **redis_payload}
-        await self._redis.json_set(alive_sandbox_key(sandbox_id), "$", merged)
+        await self._update_many({sandbox_id: sandbox_info})
 
-        await self._db.update(sandbox_id, sandbox_info)
+    @monitor_metastore_operation
+    async def update_many(self, sandbox_infos: dict[str, SandboxInfo]) -> None:
+        """``update`` for many sandboxes: one Redis round trip for all of them, then the DB updates."""
+        await self._update_many(sandbox_infos)
 
     @monitor_metastore_operation
     async def delete(self, sandbox_id: str) -> None:
         """Delete Redis alive + timeout keys and await DB delete."""
-        await self._redis.json_delete(alive_sandbox_key(sandbox_id))
-        await self._redis.json_delete(timeout_sandbox_key(sandbox_id))
-
+        transitions = {sandbox_id: None}
+        async with self._redis.pipeline() as pipe:
+            _queue_active_transitions(pipe, transitions)
+            _queue_evict(pipe, sandbox_id)
+            results = await pipe.execute()
+        await self._apply_active_counts(transitions, results)
+        self._notify_listeners([sandbox_id])
+
+        if self._write_behind is not None:
+            await self._write_behind.drain(sandbox_id)
         await self._db.delete(sandbox_id)
 
     @monitor_metastore_operation
@@ -118,13 +159,12 @@ class SandboxMetaStore:
         The DB write is awaited before the Redis keys are deleted so that
         the snapshot is always durably stored before the cache disappears.
         """
-        current = await self._redis.json_get(alive_sandbox_key(sandbox_id), "$")
-        merged: dict[str, Any] = {**(current[0] if current else {}), **(final_info or {})}
-        if merged:
-            await self._db.update(sandbox_id, merged)
+        await self._archive_many({sandbox_id: final_info})
 
-        await self._redis.json_delete(alive_sandbox_key(sandbox_id))
-        await self._redis.json_delete(timeout_sandbox_key(sandbox_id))
+    @monitor_metastore_operation
+    async def archive_many(self, final_infos: dict[str, SandboxInfo | None]) -> None:
+        """``archive`` for many sandboxes: one Redis read, the DB snapshots, then one Redis eviction."""
+        await self._archive_many(final_infos)
 
     @monitor_metastore_operation
     async def get(self, sandbox_id: str, check_db: bool = False) -> SandboxInfo | None:
@@ -138,6 +178,15 @@ class SandboxMetaStore:
                 return result
         return None
 
+    @monitor_metastore_operation
+    async def get_many(self, sandbox_ids: list[str]) -> dict[str, SandboxInfo]:
+        """Read the Redis alive keys of many sandboxes in one round trip. Missing IDs are omitted."""
+        if not sandbox_ids:
+            return {}
+        results = await self._redis.json_mget([alive_sandbox_key(sandbox_id) for sandbox_id in sandbox_ids], "$")
+        docs = {sandbox_id: _unwrap_mget_doc(result) for sandbox_id, result in zip(sandbox_ids, results)}
+        return {sandbox_id: doc for sandbox_id, doc in docs.items() if doc is not None}
+
     async def exists(self, sandbox_id: str) -> bool:
         """Return ``True`` when the Redis alive key exists for ``sandbox_id``."""
         return await self.get(sandbox_id) is not None
@@ -152,8 +201,92 @@ class SandboxMetaStore:
 
     @monitor_metastore_operation
     async def update_timeout(self, sandbox_id: str, timeout_info: dict[str, str]) -> None:
-        """Overwrite the Redis timeout key with *timeout_info*."""
-        await self._redis.json_set(timeout_sandbox_key(sandbox_id), "$", timeout_info)
+        """Overwrite the Redis timeout key with *timeout_info* and move the sandbox in the expiry index."""
+        async with self._redis.pipeline() as pipe:
+            _queue_timeout(pipe, sandbox_id, timeout_info)
+            await pipe.execute()
+
+    # ------------------------------------------------------------------
+    # Expiry index
+    # ------------------------------------------------------------------
+
+    async def claim_expired(self, now: int, limit: int, lease_seconds: int, owner: str) -> list[str]:
+        """Lease up to *limit* sandboxes whose indexed expire time is before *now*.
+
+        A sandbox is returned to at most one caller per lease, across all replicas, and is moved
+        ``lease_seconds`` ahead in the index so the next claim skips it. Unless the caller then
+        removes it from the index (stop/archive) or calls ``schedule_expiry``, it becomes due again
+        when the lease runs out.
+        """
+        due = await self._redis.zrange_by_score(SANDBOX_EXPIRY_KEY, now, limit, exclusive=True)
+        if not due:
+            return []
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for sandbox_id in due:
+                pipe.set(expiry_lease_key(sandbox_id), owner, nx=True, ex=lease_seconds)
+            acquired = await pipe.execute()
+        claimed = [sandbox_id for sandbox_id, ok in zip(due, acquired) if ok]
+        if claimed:
+            # GT: a timeout refreshed since the read above already moved further ahead; keep that score.
+            async with self._redis.pipeline() as pipe:
+                pipe.zadd(
+                    SANDBOX_EXPIRY_KEY, {sandbox_id: now + lease_seconds for sandbox_id in claimed}, xx=True, gt=True
+                )
+                await pipe.execute()
+        return claimed
+
+    async def schedule_expiry(self, sandbox_id: str, expire_time: int) -> None:
+        """Put a claimed sandbox back in the expiry index at *expire_time* and drop its lease."""
+        async with self._redis.pipeline() as pipe:
+            pipe.zadd(SANDBOX_EXPIRY_KEY, {sandbox_id: expire_time})
+            pipe.delete(expiry_lease_key(sandbox_id))
+            await pipe.execute()
+
+    async def unschedule_expiry(self, sandbox_id: str) -> None:
+        """Remove a sandbox from the expiry index, e.g. because its timeout key is gone."""
+        async with self._redis.pipeline() as pipe:
+            pipe.zrem(SANDBOX_EXPIRY_KEY, sandbox_id)
+            pipe.delete(expiry_lease_key(sandbox_id))
+            await pipe.execute()
+
+    async def index_missing_expiries(self) -> int:
+        """Add alive sandboxes that have a timeout key but no expiry index entry yet; returns how many were added.
+
+        Sandboxes created before the index existed are only found this way.
+        """
+        sandbox_ids = [sandbox_id async for sandbox_id in self.iter_alive_sandbox_ids()]
+        if not sandbox_ids:
+            return 0
+        results = await self._redis.json_mget([timeout_sandbox_key(sandbox_id) for sandbox_id in sandbox_ids], "$")
+        scores = {}
+        for sandbox_id, result in zip(sandbox_ids, results):
+            timeout_info = _unwrap_mget_doc(result)
+            if timeout_info is not None:
+                scores[sandbox_id] = SandboxTimeoutHelper.expire_time(timeout_info)
+        if not scores:
+            return 0
+        async with self._redis.pipeline() as pipe:
+            pipe.zadd(SANDBOX_EXPIRY_KEY, scores, nx=True)
+            [added] = await pipe.execute()
+        return added
+
+    def add_change_listener(self, listener: Callable[[str], None]) -> None:
+        """Register a callback invoked with the sandbox ID whenever this store changes its alive key."""
+        self._change_listeners.append(listener)
+
+    async def notify_change(self, sandbox_id: str) -> None:
+        """Report a change of *sandbox_id* that is not a meta store write, e.g. its start finished."""
+        self._notify_listeners([sandbox_id])
+        await self._redis.publish(SANDBOX_CHANGES_CHANNEL, sandbox_id)
+
+    def subscribe_changes(self) -> AsyncIterator[str | None]:
+        """Yield sandbox IDs whose alive key was changed by any replica (Redis pub/sub), or None when idle."""
+        return self._redis.subscribe(SANDBOX_CHANGES_CHANNEL)
+
+    async def aclose(self) -> None:
+        """Flush queued write-behind DB updates. Call before closing the DB provider."""
+        if self._write_behind is not None:
+            await self._write_behind.aclose()
 
     async def iter_alive_sandbox_ids(self) -> AsyncIterator[str]:
         """Yield active sandbox IDs from the DB."""
@@ -162,10 +295,41 @@ class SandboxMetaStore:
             if sandbox_id:
                 yield sandbox_id
 
-    async def iter_alive_sandbox_info(self) -> AsyncIterator[SandboxInfo]:
-        """Yield active sandbox info from the DB."""
-        for sandbox_info in await self._db.list_by_in("state", _ACTIVE_STATES):
-            yield sandbox_info
+    async def iter_alive_sandbox_info(self, page_size: int | None = None) -> AsyncIterator[SandboxInfo]:
+        """Yield active sandbox info from the DB, reading *page_size* rows per query if given."""
+        if page_size is None:
+            for sandbox_info in await self._db.list_by_in("state", _ACTIVE_STATES):
+                yield sandbox_info
+            return
+        after = None
+        while True:
+            page = await self._db.list_by_in("state", _ACTIVE_STATES, after=after, limit=page_size)
+            for sandbox_info in page:
+                yield sandbox_info
+            if len(page) < page_size:
+                return
+            after = page[-1]["sandbox_id"]
+
+    # ------------------------------------------------------------------
+    # Active sandbox counts
+    # ------------------------------------------------------------------
+
+    async def count_active_by_image(self) -> dict[str, int]:
+        """Number of pending/running sandboxes per image, kept up to date by every state write."""
+        counts = await self._redis.hgetall(SANDBOX_ACTIVE_COUNT_KEY)
+        return {image: max(int(count), 0) for image, count in counts.items()}
+
+    async def reset_active_sandboxes(self, images: dict[str, str]) -> None:
+        """Replace the active sandbox index with *images* (sandbox ID -> image), e.g. after a full DB scan.
+
+        Corrects drift left by writes that failed between updating the index and the counts.
+        """
+        async with self._redis.pipeline() as pipe:
+            pipe.delete(SANDBOX_ACTIVE_KEY, SANDBOX_ACTIVE_COUNT_KEY)
+            if images:
+                pipe.hset(SANDBOX_ACTIVE_KEY, mapping=images)
+                pipe.hset(SANDBOX_ACTIVE_COUNT_KEY, mapping=Counter(images.values()))
+            await pipe.execute()
 
     @monitor_metastore_operation
     async def batch_get(self, sandbox_ids: list[str]) -> list[SandboxInfo]:
@@ -179,3 +343,144 @@ class SandboxMetaStore:
     async def list_by(self, field: str, value: str | int | float | bool) -> list[SandboxInfo]:
         """Query sandboxes by *field* == *value* from the DB."""
         return await self._db.list_by(field, value)
+
+    @monitor_metastore_operation
+    async def query(self, query: SandboxQuery) -> list[SandboxInfo]:
+        """Query sandboxes from the DB with filters, paging and projection applied in SQL."""
+        return await self._db.query(query)
+
+    @monitor_metastore_operation
+    async def count(self, query: SandboxQuery) -> int:
+        """Count the DB rows matching the filters of *query*."""
+        return await self._db.count(query)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    async def _update_many(self, sandbox_infos: dict[str, SandboxInfo]) -> None:
+        if not sandbox_infos:
+            return
+        transitions = _active_transitions(sandbox_infos)
+        async with self._redis.pipeline() as pipe:
+            _queue_active_transitions(pipe, transitions)
+            for sandbox_id, sandbox_info in sandbox_infos.items():
+                _queue_merge(pipe, alive_sandbox_key(sandbox_id), pick_sandbox_info_fields(sandbox_info))
+                pipe.publish(SANDBOX_CHANGES_CHANNEL, sandbox_id)
+            results = await pipe.execute()
+        await self._apply_active_counts(transitions, results)
+        self._notify_listeners(sandbox_infos)
+
+        if self._write_behind is not None:
+            for sandbox_id, sandbox_info in sandbox_infos.items():
+                self._write_behind.put(sandbox_id, sandbox_info)
+            return
+        await self._db.update_many(sandbox_infos)
+
+    async def _archive_many(self, final_infos: dict[str, SandboxInfo | None]) -> None:
+        if not final_infos:
+            return
+        sandbox_ids = list(final_infos)
+        current = await self._redis.json_mget([alive_sandbox_key(sandbox_id) for sandbox_id in sandbox_ids], "$")
+
+        snapshots: dict[str, SandboxInfo] = {}
+        for sandbox_id, result in zip(sandbox_ids, current):
+            # A queued write-behind update may carry DB-only fields the alive key does not have.
+            pending = await self._write_behind.drain(sandbox_id) if self._write_behind is not None else None
+            doc = _unwrap_mget_doc(result)
+            merged: dict[str, Any] = {**(pending or {}), **(doc or {}), **(final_infos[sandbox_id] or {})}
+            if merged:
+                snapshots[sandbox_id] = merged
+        # Upsert, so the snapshot survives even if the DB insert at create time was lost.
+        await self._db.upsert_many(snapshots)
+
+        transitions = dict.fromkeys(sandbox_ids)
+        async with self._redis.pipeline() as pipe:
+            _queue_active_transitions(pipe, transitions)
+            for sandbox_id in sandbox_ids:
+                _queue_evict(pipe, sandbox_id)
+            results = await pipe.execute()
+        await self._apply_active_counts(transitions, results)
+        self._notify_listeners(sandbox_ids)
+
+    async def _apply_active_counts(self, transitions: dict[str, str | None], results: list[Any]) -> None:
+        """Move the per-image counts by the transitions that actually changed the active index.
+
+        Only writes that change a sandbox's membership reach Redis here, so keeping the counts costs
+        a round trip per state change rather than a scan of every active sandbox.
+        """
+        deltas: Counter[str] = Counter()
+        index = 0
+        for sandbox_id, image in transitions.items():
+            if image is None:
+                old_image, removed = results[index], results[index + 1]
+                index += 2
+                if removed:
+                    deltas[old_image] -= 1
+            else:
+                if results[index]:
+                    deltas[image] += 1
+                index += 1
+        changed = {image: delta for image, delta in deltas.items() if delta}
+        if not changed:
+            return
+        async with self._redis.pipeline() as pipe:
+            for image, delta in changed.items():
+                pipe.hincrby(SANDBOX_ACTIVE_COUNT_KEY, image, delta)
+            await pipe.execute()
+
+    def _notify_listeners(self, sandbox_ids: Iterable[str]) -> None:
+        """Tell local listeners right away; other replicas learn through the PUBLISH queued with the write."""
+        for sandbox_id in sandbox_ids:
+            for listener in self._change_listeners:
+                listener(sandbox_id)
+
+
+def _queue_merge(pipe: Pipeline, key: str, fields: dict[str, Any]) -> None:
+    """Queue a shallow merge of *fields* into the JSON document at *key*, creating it if missing."""
+    pipe.json().set(key, "$", {}, nx=True)
+    for field, value in fields.items():
+        pipe.json().set(key, f"$.{field}", value)
+
+
+def _active_transitions(sandbox_infos: dict[str, SandboxInfo]) -> dict[str, str | None]:
+    """Sandbox ID -> image for writes entering an active state, -> None for writes leaving it.
+
+    Writes that do not carry ``state`` do not change the active index and are left out.
+    """
+    transitions: dict[str, str | None] = {}
+    for sandbox_id, sandbox_info in sandbox_infos.items():
+        state = sandbox_info.get("state")
+        if state is None:
+            continue
+        transitions[sandbox_id] = (sandbox_info.get("image") or _DEFAULT_IMAGE) if state in _ACTIVE_STATES else None
+    return transitions
+
+
+def _queue_active_transitions(pipe: Pipeline, transitions: dict[str, str | None]) -> None:
+    """Queue the active index changes first, so ``_apply_active_counts`` finds their results at the front."""
+    for sandbox_id, image in transitions.items():
+        if image is None:
+            pipe.hget(SANDBOX_ACTIVE_KEY, sandbox_id)
+            pipe.hdel(SANDBOX_ACTIVE_KEY, sandbox_id)
+        else:
+            pipe.hsetnx(SANDBOX_ACTIVE_KEY, sandbox_id, image)
+
+
+def _queue_timeout(pipe: Pipeline, sandbox_id: str, timeout_info: dict[str, str]) -> None:
+    pipe.json().set(timeout_sandbox_key(sandbox_id), "$", timeout_info)
+    pipe.zadd(SANDBOX_EXPIRY_KEY, {sandbox_id: SandboxTimeoutHelper.expire_time(timeout_info)})
+
+
+def _queue_evict(pipe: Pipeline, sandbox_id: str) -> None:
+    pipe.json().delete(alive_sandbox_key(sandbox_id))
+    pipe.json().delete(timeout_sandbox_key(sandbox_id))
+    pipe.zrem(SANDBOX_EXPIRY_KEY, sandbox_id)
+    pipe.publish(SANDBOX_CHANGES_CHANNEL, sandbox_id)
+
+
+def _unwrap_mget_doc(result: Any) -> SandboxInfo | None:
+    """One JSON.MGET ``$`` entry: Redis Stack wraps each document in a list, FakeRedis does not."""
+    if isinstance(result, list):
+        return result[0] if result else None
+    return result or None
@@ -0,0 +1,103 @@
+"""SandboxReadinessRegistry - lets callers block until a sandbox is ready instead of polling get_status.
+
+Waiters are kept in memory per sandbox and woken whenever the sandbox's meta store entry changes:
+directly for writes made by this replica, and through the ``sandbox:changes`` Redis channel for
+writes made by any other. A woken waiter re-checks the sandbox once; a slow fallback re-check
+covers notifications that never come (e.g. the replica watching the start went away).
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from rock.logger import init_logger
+from rock.sandbox.sandbox_meta_store import SandboxMetaStore
+
+logger = init_logger(__name__)
+
+RESUBSCRIBE_BACKOFF_SECONDS = 1.0
+
+T = TypeVar("T")
+
+
+class SandboxReadinessRegistry:
+    def __init__(self, meta_store: SandboxMetaStore, poll_interval_seconds: float):
+        self._meta_store = meta_store
+        self._poll_interval_seconds = poll_interval_seconds
+        self._waiters: dict[str, set[asyncio.Event]] = {}
+        self._subscribe_task: asyncio.Task | None = None
+        self._closed = False
+        meta_store.add_change_listener(self.notify)
+
+    @property
+    def waiting(self) -> int:
+        """Number of callers currently blocked in :meth:`wait`."""
+        return sum(len(events) for events in self._waiters.values())
+
+    async def wait(self, sandbox_id: str, check: Callable[[], Awaitable[T | None]], timeout: float) -> T | None:
+        """Call *check* until it returns a result, re-checking only when *sandbox_id* changes.
+
+        Returns None if *check* still had no result after *timeout* seconds. Exceptions from
+        *check* propagate.
+        """
+        self._ensure_subscribed()
+        deadline = time.monotonic() + timeout
+        event = asyncio.Event()
+        self._waiters.setdefault(sandbox_id, set()).add(event)
+        try:
+            while True:
+                # Cleared before checking, so a change landing during the check is not lost.
+                event.clear()
+                result = await check()
+                if result is not None:
+                    return result
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(event.wait(), min(remaining, self._poll_interval_seconds))
+        finally:
+            events = self._waiters.get(sandbox_id)
+            if events is not None:
+                events.discard(event)
+                if not events:
+                    del self._waiters[sandbox_id]
+
+    def notify(self, sandbox_id: str) -> None:
+        """Wake every waiter of *sandbox_id*."""
+        for event in self._waiters.get(sandbox_id, ()):
+            event.set()
+
+    async def aclose(self) -> None:
+        # The subscriber also stops on its own at the next idle tick, see SandboxRouteCache.aclose.
+        self._closed = True
+        if self._subscribe_task is not None and not self._subscribe_task.done():
+            self._subscribe_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._subscribe_task
+        self._subscribe_task = None
+
+    def _ensure_subscribed(self) -> None:
+        task = self._subscribe_task
+        running_here = task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop()
+        if not self._closed and not running_here:
+            self._subscribe_task = asyncio.get_running_loop().create_task(self._subscribe_loop())
+
+    async def _subscribe_loop(self) -> None:
+        while not self._closed:
+            try:
+                async for sandbox_id in self._meta_store.subscribe_changes():
+                    if self._closed:
+                        return
+                    if sandbox_id is not None:
+                        self.notify(sandbox_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Sandbox change subscription failed, retrying: {e}")
+            # Changes may have been missed while disconnected.
+            for sandbox_id in list(self._waiters):
+                self.notify(sandbox_id)
+            await asyncio.sleep(RESUBSCRIBE_BACKOFF_SECONDS)
@@ -0,0 +1,74 @@
+"""Write-behind queue from SandboxMetaStore to the SQL replica.
+
+Redis is the source of truth for live sandbox state and the DB only serves indexed queries, so status
+updates may reach the DB a little later. Updates for the same sandbox that arrive before the next flush
+are merged, and each flush writes every pending sandbox in one ``SandboxTable.update_many`` transaction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import Any
+
+from rock.admin.core.sandbox_table import SandboxTable
+from rock.logger import init_logger
+
+logger = init_logger(__name__)
+
+
+class SandboxWriteBehindQueue:
+    def __init__(self, sandbox_table: SandboxTable, flush_interval_seconds: float):
+        self._db = sandbox_table
+        self._flush_interval_seconds = flush_interval_seconds
+        self._pending: dict[str, dict[str, Any]] = {}
+        # Held while a flush writes, so writes land in order and drain() can wait for them.
+        self._write_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def put(self, sandbox_id: str, sandbox_info: dict[str, Any]) -> None:
+        """Queue a DB update; later fields for the same sandbox override earlier ones until the next flush."""
+        self._pending.setdefault(sandbox_id, {}).update(sandbox_info)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def drain(self, sandbox_id: str) -> dict[str, Any] | None:
+        """Take the pending update for *sandbox_id* out of the queue and wait for any write already in flight.
+
+        Callers that write the row themselves (archive, delete) use this so a queued update cannot land
+        after their write.
+        """
+        async with self._write_lock:
+            return self._pending.pop(sandbox_id, None)
+
+    async def flush(self) -> None:
+        """Write all pending updates to the DB now."""
+        async with self._write_lock:
+            while self._pending:
+                batch, self._pending = self._pending, {}
+                try:
+                    await self._db.update_many(batch)
+                except asyncio.CancelledError:
+                    # Requeue so aclose() still writes them; newer fields win.
+                    for sandbox_id, info in batch.items():
+                        self._pending[sandbox_id] = {**info, **self._pending.get(sandbox_id, {})}
+                    raise
+                except Exception as e:
+                    logger.warning(f"Write-behind DB update failed for {len(batch)} sandboxes: {e}")
+
+    async def aclose(self) -> None:
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+        self._flush_task = None
+        await self.flush()
+
+    async def _flush_loop(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self._flush_interval_seconds)
+            await self.flush()
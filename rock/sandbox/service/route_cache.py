@@ -0,0 +1,212 @@
+"""In-process routing cache for SandboxProxyService.
+
+Maps sandbox_id to the sandbox info needed to reach its rocklet (host_ip, port_mapping, state) so
+that proxied calls do not read Redis on every command. Entries expire after a TTL and are dropped as
+soon as SandboxMetaStore reports a change, either locally or from another replica via pub/sub.
+
+Expire-time refreshes ("this sandbox is still in use") are recorded in memory and written back in
+the background, at most once per sandbox per flush interval.
+"""
+
+import asyncio
+import contextlib
+import copy
+import time
+from collections.abc import Callable
+
+from rock.actions.sandbox.sandbox_info import SandboxInfo
+from rock.logger import init_logger
+from rock.sandbox.sandbox_meta_store import SandboxMetaStore
+from rock.sandbox.utils.timeout import SandboxTimeoutHelper
+
+logger = init_logger(__name__)
+
+RESUBSCRIBE_BACKOFF_SECONDS = 1.0
+
+
+class SandboxRouteCache:
+    def __init__(
+        self,
+        meta_store: SandboxMetaStore,
+        ttl_seconds: float,
+        refresh_interval_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._meta_store = meta_store
+        self._ttl_seconds = ttl_seconds
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._clock = clock
+        self._entries: dict[str, tuple[float, SandboxInfo]] = {}
+        self._loading: dict[str, asyncio.Future] = {}
+        # sandbox_id -> [loads in flight, invalidations seen while they ran]
+        self._watched: dict[str, list[int]] = {}
+        self._pending_refresh: set[str] = set()
+        self._flush_task: asyncio.Task | None = None
+        self._subscribe_task: asyncio.Task | None = None
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds > 0
+
+    async def get(self, sandbox_id: str) -> SandboxInfo | None:
+        """Return routing info for *sandbox_id*, reading the meta store only on a miss.
+
+        Concurrent misses for the same sandbox share one read. Only routable sandboxes
+        (with a host_ip) are cached. Every caller gets its own copy of the info.
+        """
+        self._ensure_subscribed()
+        entry = self._entries.get(sandbox_id)
+        if entry is not None and entry[0] > self._clock():
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+        self.misses += 1
+        loading = self._loading.get(sandbox_id)
+        if loading is not None:
+            return copy.deepcopy(await asyncio.shield(loading))
+
+        loading = asyncio.get_running_loop().create_future()
+        self._loading[sandbox_id] = loading
+        generation = self._watch(sandbox_id)
+        try:
+            sandbox_info = await self._meta_store.get(sandbox_id)
+        except asyncio.CancelledError:
+            loading.cancel()
+            raise
+        except Exception as e:
+            loading.set_exception(e)
+            # Mark retrieved so lone failures do not log "exception was never retrieved".
+            loading.exception()
+            raise
+        finally:
+            del self._loading[sandbox_id]
+            # An invalidation that raced with the read may describe a newer state than what we read.
+            fresh = self._unwatch(sandbox_id, generation)
+        if sandbox_info and sandbox_info.get("host_ip") is not None and fresh:
+            self._entries[sandbox_id] = (self._clock() + self._ttl_seconds, copy.deepcopy(sandbox_info))
+        loading.set_result(sandbox_info)
+        return copy.deepcopy(sandbox_info)
+
+    async def get_many(self, sandbox_ids: list[str]) -> dict[str, SandboxInfo]:
+        """Return routing info for many sandboxes, reading all misses from the meta store in one round trip.
+
+        Sandboxes the meta store does not know are omitted.
+        """
+        self._ensure_subscribed()
+        now = self._clock()
+        routes: dict[str, SandboxInfo] = {}
+        missing = []
+        for sandbox_id in sandbox_ids:
+            entry = self._entries.get(sandbox_id)
+            if entry is not None and entry[0] > now:
+                routes[sandbox_id] = copy.deepcopy(entry[1])
+            else:
+                missing.append(sandbox_id)
+        self.hits += len(routes)
+        self.misses += len(missing)
+        if not missing:
+            return routes
+        generations = {sandbox_id: self._watch(sandbox_id) for sandbox_id in missing}
+        try:
+            loaded = await self._meta_store.get_many(missing)
+        finally:
+            fresh = {
+                sandbox_id for sandbox_id, generation in generations.items() if self._unwatch(sandbox_id, generation)
+            }
+        expires_at = self._clock() + self._ttl_seconds
+        for sandbox_id, sandbox_info in loaded.items():
+            if sandbox_info.get("host_ip") is not None and sandbox_id in fresh:
+                self._entries[sandbox_id] = (expires_at, copy.deepcopy(sandbox_info))
+        routes.update(loaded)
+        return routes
+
+    def invalidate(self, sandbox_id: str) -> None:
+        watched = self._watched.get(sandbox_id)
+        if watched is not None:
+            watched[1] += 1
+        self._entries.pop(sandbox_id, None)
+
+    def clear(self) -> None:
+        for watched in self._watched.values():
+            watched[1] += 1
+        self._entries.clear()
+
+    def _watch(self, sandbox_id: str) -> int:
+        """Track invalidations of *sandbox_id* while it is read from the meta store; returns the current count."""
+        watched = self._watched.setdefault(sandbox_id, [0, 0])
+        watched[0] += 1
+        return watched[1]
+
+    def _unwatch(self, sandbox_id: str, generation: int) -> bool:
+        """End a read started by :meth:`_watch`; True if *sandbox_id* was not invalidated meanwhile."""
+        watched = self._watched[sandbox_id]
+        watched[0] -= 1
+        if watched[0] == 0:
+            del self._watched[sandbox_id]
+        return watched[1] == generation
+
+    def touch(self, sandbox_id: str) -> None:
+        """Schedule an expire-time refresh for *sandbox_id*; repeated touches before the next flush coalesce."""
+        self._pending_refresh.add(sandbox_id)
+        if not _is_running_here(self._flush_task):
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def flush(self) -> None:
+        """Write back all pending expire-time refreshes now."""
+        pending, self._pending_refresh = self._pending_refresh, set()
+        results = await asyncio.gather(*[self._refresh_expire_time(sid) for sid in pending], return_exceptions=True)
+        for sandbox_id, result in zip(pending, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to refresh expire time for sandbox {sandbox_id}: {result}")
+
+    async def aclose(self) -> None:
+        # The subscriber also stops on its own at the next idle tick: a pub/sub read can swallow a
+        # cancellation that races with an arriving reply.
+        self._closed = True
+        for task in (self._flush_task, self._subscribe_task):
+            if task is not None and not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._flush_task = None
+        self._subscribe_task = None
+        await self.flush()
+
+    async def _refresh_expire_time(self, sandbox_id: str) -> None:
+        timeout_info = await self._meta_store.get_timeout(sandbox_id)
+        if timeout_info is None:
+            return
+        new_timeout = SandboxTimeoutHelper.refresh_timeout(timeout_info)
+        if new_timeout is not None:
+            await self._meta_store.update_timeout(sandbox_id, new_timeout)
+
+    async def _flush_loop(self) -> None:
+        while self._pending_refresh:
+            await asyncio.sleep(self._refresh_interval_seconds)
+            await self.flush()
+
+    def _ensure_subscribed(self) -> None:
+        if not self._closed and not _is_running_here(self._subscribe_task):
+            self._subscribe_task = asyncio.get_running_loop().create_task(self._subscribe_loop())
+
+    async def _subscribe_loop(self) -> None:
+        while not self._closed:
+            try:
+                async for sandbox_id in self._meta_store.subscribe_changes():
+                    if self._closed:
+                        return
+                    if sandbox_id is not None:
+                        self.invalidate(sandbox_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Sandbox change subscription failed, retrying: {e}")
+            # Changes may have been missed while disconnected.
+            self.clear()
+            await asyncio.sleep(RESUBSCRIBE_BACKOFF_SECONDS)
+
+
+def _is_running_here(task: asyncio.Task | None) -> bool:
+    return task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop()
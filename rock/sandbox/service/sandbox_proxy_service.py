@@ -1,5 +1,6 @@
 import asyncio  # noqa: I001
 import json
+from collections.abc import AsyncIterable, AsyncIterator
 from fastapi.responses import JSONResponse, StreamingResponse
 from starlette.datastructures import Headers
 
@@ -14,24 +15,33 @@ from starlette.status import HTTP_504_GATEWAY_TIMEOUT
 from rock import env_vars
 from rock.actions import (
     BashObservation,
+    BatchCommandResult,
     CloseBashSessionResponse,
     CommandResponse,
     CreateBashSessionResponse,
     IsAliveResponse,
     ReadFileResponse,
+    UploadChunkResponse,
     UploadResponse,
+    WaitProcessResponse,
     WriteFileResponse,
 )
 from rock.actions.sandbox.response import State
 from rock.actions.sandbox.sandbox_info import SandboxInfo
+from rock.admin.core.sandbox_query import SandboxQuery, decode_cursor, encode_cursor, is_filterable
 from rock.admin.metrics.decorator import monitor_sandbox_operation
 from rock.admin.metrics.monitor import MetricsMonitor
 from rock.admin.proto.request import SandboxBashAction as BashAction
+from rock.admin.proto.request import SandboxBatchCommand as BatchCommand
 from rock.admin.proto.request import SandboxCloseBashSessionRequest as CloseBashSessionRequest
 from rock.admin.proto.request import SandboxCommand as Command
 from rock.admin.proto.request import SandboxCreateSessionRequest as CreateSessionRequest
+from rock.admin.proto.request import SandboxDownloadChunkRequest as DownloadChunkRequest
 from rock.admin.proto.request import SandboxQueryParams
 from rock.admin.proto.request import SandboxReadFileRequest as ReadFileRequest
+from rock.admin.proto.request import SandboxUploadChunkRequest as UploadChunkRequest
+from rock.admin.proto.request import SandboxUploadStatusRequest as UploadStatusRequest
+from rock.admin.proto.request import SandboxWaitProcessRequest as WaitProcessRequest
 from rock.admin.proto.request import SandboxWriteFileRequest as WriteFileRequest
 from rock.admin.proto.response import SandboxListResponse, SandboxListStatusResponse, SandboxStatusResponse
 from rock.config import OssConfig, ProxyServiceConfig, RockConfig
@@ -40,13 +50,42 @@ from rock.deployments.status import ServiceStatus
 from rock.common.port_validation import validate_port_forward_port
 from rock.logger import init_logger
 from rock.sandbox.sandbox_meta_store import SandboxMetaStore
+from rock.sandbox.service.route_cache import SandboxRouteCache
 from rock.sandbox.utils.proxy import build_upstream_ws_headers
 from rock.sandbox.utils.timeout import SandboxTimeoutHelper
 from rock.sdk.common.exceptions import BadRequestRockError
-from rock.utils import EAGLE_EYE_TRACE_ID, trace_id_ctx_var
+from rock.utils import EAGLE_EYE_TRACE_ID, HttpClientPool, trace_id_ctx_var
+from rock.utils.file_transfer import CHUNK_SHA256_HEADER, FILE_SIZE_HEADER
 
 logger = init_logger(__name__)
 
+# Columns read by SandboxListStatusResponse.from_sandbox_info; list_sandboxes never loads spec or status.
+_LIST_FIELDS = (
+    "sandbox_id",
+    "phases",
+    "state",
+    "port_mapping",
+    "host_ip",
+    "host_name",
+    "image",
+    "user_id",
+    "experiment_id",
+    "namespace",
+    "cpus",
+    "memory",
+    "rock_authorization_encrypted",
+)
+
+
+def _list_fields(fields: str | None) -> list[str]:
+    if fields is None:
+        return list(_LIST_FIELDS)
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in _LIST_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown sandbox fields: {', '.join(unknown)}")
+    return requested
+
 
 class SandboxProxyService:
     _httpx_client = None
@@ -92,8 +131,23 @@ class SandboxProxyService:
             )
 
         self._batch_get_status_max_count = rock_config.proxy_service.batch_get_status_max_count
+        self._route_cache = SandboxRouteCache(
+            meta_store,
+            ttl_seconds=self.proxy_config.route_cache_ttl_seconds,
+            refresh_interval_seconds=self.proxy_config.expire_refresh_interval_seconds,
+        )
+        if self._route_cache.enabled:
+            meta_store.add_change_listener(self._route_cache.invalidate)
         self._validate_oss_config_or_warn()
 
+    @property
+    def route_cache(self) -> SandboxRouteCache:
+        return self._route_cache
+
+    async def aclose(self) -> None:
+        """Flush pending expire-time refreshes and stop the route cache's background tasks."""
+        await self._route_cache.aclose()
+
     def _validate_oss_config_or_warn(self) -> None:
         # Same resolution order as gen_oss_sts_token: env > YAML
         endpoint = env_vars.ROCK_OSS_BUCKET_ENDPOINT or self.oss_config.endpoint
@@ -179,6 +233,24 @@ class SandboxProxyService:
         )
         return WriteFileResponse(**response)
 
+    @monitor_sandbox_operation()
+    async def wait_process(self, request: WaitProcessRequest) -> WaitProcessResponse:
+        sandbox_id = request.sandbox_id
+        await self._update_expire_time(sandbox_id)
+        sandbox_status_dicts = await self.get_service_status(sandbox_id)
+        # Long poll: leave headroom over the rocklet-side wait so the upstream answers before we time out.
+        response = await self._send_request(
+            sandbox_id,
+            sandbox_status_dicts[0],
+            "wait_process",
+            None,
+            request.model_dump(),
+            None,
+            "POST",
+            timeout=request.timeout + self.proxy_config.timeout,
+        )
+        return WaitProcessResponse(**response)
+
     @monitor_sandbox_operation()
     async def upload(self, file: UploadFile, target_path: str, sandbox_id: str) -> UploadResponse:
         await self._update_expire_time(sandbox_id)
@@ -188,6 +260,69 @@ class SandboxProxyService:
         response = await self._send_request(sandbox_id, sandbox_status_dicts[0], "upload", data, None, files, "POST")
         return UploadResponse(**response)
 
+    @monitor_sandbox_operation()
+    async def upload_status(self, request: UploadStatusRequest) -> UploadChunkResponse:
+        sandbox_id = request.sandbox_id
+        await self._update_expire_time(sandbox_id)
+        sandbox_status_dicts = await self.get_service_status(sandbox_id)
+        response = await self._send_request(
+            sandbox_id, sandbox_status_dicts[0], "upload_status", None, None, None, "GET", params=request.model_dump()
+        )
+        return UploadChunkResponse(**response)
+
+    @monitor_sandbox_operation()
+    async def upload_chunk(self, request: UploadChunkRequest, body: AsyncIterable[bytes]) -> UploadChunkResponse:
+        """Forward one chunk of a resumable upload, relaying the body as it arrives instead of buffering it."""
+        sandbox_id = request.sandbox_id
+        await self._update_expire_time(sandbox_id)
+        sandbox_status_dicts = await self.get_service_status(sandbox_id)
+        response = await self._send_request(
+            sandbox_id,
+            sandbox_status_dicts[0],
+            "upload_chunk",
+            None,
+            None,
+            None,
+            "POST",
+            params=request.model_dump(),
+            content=body,
+        )
+        return UploadChunkResponse(**response)
+
+    @monitor_sandbox_operation()
+    async def download(self, request: DownloadChunkRequest) -> StreamingResponse:
+        """Relay a byte range of a sandbox file from the rocklet without buffering it."""
+        sandbox_id = request.sandbox_id
+        await self._update_expire_time(sandbox_id)
+        sandbox_status_dicts = await self.get_service_status(sandbox_id)
+        service_status = ServiceStatus.from_dict(sandbox_status_dicts[0])
+        url = f"{self._api_url(sandbox_status_dicts[0].get('host_ip'), service_status)}/download"
+        upstream = await self._httpx_client.send(
+            self._httpx_client.build_request(
+                "GET", url, headers=self._headers(sandbox_id), params=request.model_dump()
+            ),
+            stream=True,
+        )
+        if upstream.status_code != 200:
+            try:
+                await upstream.aread()
+            finally:
+                await upstream.aclose()
+            raise Exception(f"download {request.path} failed: {upstream.status_code} {upstream.text}")
+
+        async def relay():
+            try:
+                async for data in upstream.aiter_raw():
+                    yield data
+            finally:
+                await upstream.aclose()
+
+        return StreamingResponse(
+            relay(),
+            media_type="application/octet-stream",
+            headers={name: upstream.headers[name] for name in (FILE_SIZE_HEADER, CHUNK_SHA256_HEADER)},
+        )
+
     @monitor_sandbox_operation()
     async def execute(self, command: Command) -> CommandResponse:
         sandbox_id = command.sandbox_id
@@ -198,6 +333,52 @@ class SandboxProxyService:
         )
         return CommandResponse(**response)
 
+    @monitor_sandbox_operation()
+    async def batch_execute(self, request: BatchCommand) -> AsyncIterator[BatchCommandResult]:
+        """Run one command in many sandboxes and return an iterator of the results in completion order.
+
+        All routes are read in one round trip and at most ``batch_execute_concurrency`` commands are
+        in flight at once. Per-sandbox failures are reported in the results rather than raised.
+        """
+        sandbox_ids = list(dict.fromkeys(request.sandbox_ids))
+        if len(sandbox_ids) > self._batch_get_status_max_count:
+            raise BadRequestRockError(
+                message=f"sandbox_ids count too large, max count is {self._batch_get_status_max_count}"
+            )
+        routes = await self._get_routes(sandbox_ids)
+        logger.info(f"batch_execute, sandbox_ids count is {len(sandbox_ids)}, routable count is {len(routes)}")
+        return self._batch_execute_results(request, sandbox_ids, routes)
+
+    async def _batch_execute_results(
+        self, request: BatchCommand, sandbox_ids: list[str], routes: dict[str, SandboxInfo]
+    ) -> AsyncIterator[BatchCommandResult]:
+        semaphore = asyncio.Semaphore(self.proxy_config.batch_execute_concurrency)
+        fields = request.model_dump(exclude={"sandbox_ids"})
+
+        async def run(sandbox_id: str) -> BatchCommandResult:
+            route = routes.get(sandbox_id)
+            if route is None or route.get("host_ip") is None:
+                return BatchCommandResult(sandbox_id=sandbox_id, error=f"sandbox {sandbox_id} not started")
+            async with semaphore:
+                try:
+                    await self._update_expire_time(sandbox_id)
+                    command = Command(**fields, sandbox_id=sandbox_id)
+                    response = await self._send_request(
+                        sandbox_id, route, "execute", None, command.model_dump(), None, "POST"
+                    )
+                    return BatchCommandResult(sandbox_id=sandbox_id, result=CommandResponse(**response))
+                except Exception as e:
+                    return BatchCommandResult(sandbox_id=sandbox_id, error=str(e))
+
+        tasks = [asyncio.create_task(run(sandbox_id)) for sandbox_id in sandbox_ids]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The client went away: do not keep running commands nobody reads the results of.
+            for task in tasks:
+                task.cancel()
+
     @monitor_sandbox_operation()
     async def batch_get_sandbox_status(self, sandbox_ids: list[str]) -> list[SandboxStatusResponse]:
         if sandbox_ids is None:
@@ -219,25 +400,48 @@ class SandboxProxyService:
 
     @monitor_sandbox_operation()
     async def list_sandboxes(self, query_params: SandboxQueryParams) -> SandboxListResponse:
+        """List pending/running sandboxes matching *query_params*, one page per call.
+
+        Filters, paging and the column list are applied by the DB. Pass the ``next_cursor`` of a
+        response as ``cursor`` to read the next page; ``page`` is still accepted but costs an
+        OFFSET scan. ``count=false`` skips computing ``total``.
+        """
         page = int(query_params.pop("page", "1"))
         page_size = int(query_params.pop("page_size", "500"))
+        cursor = query_params.pop("cursor", None)
+        fields = query_params.pop("fields", None)
+        with_count = query_params.pop("count", "true").lower() != "false"
         if page < 1 or page_size < 1:
             raise BadRequestRockError(f"page parameter invalid, page is {page}, page_size is {page_size}")
         if page_size > self._batch_get_status_max_count:
             raise BadRequestRockError(f"page_size exceeds maximum {self._batch_get_status_max_count}")
+        if cursor is not None and page > 1:
+            raise BadRequestRockError("cursor and page cannot be used together")
         logger.info(f"list sandboxes with filters: {query_params}, page: {page}, page_size: {page_size}")
+
+        if not all(is_filterable(key) for key in query_params):
+            # Unknown filter keys never matched a sandbox; keep answering them with an empty page.
+            return SandboxListResponse(items=[], total=0, has_more=False)
         try:
-            all_sandbox_data = await self.list_all_sandboxes_by_query_params(query_params)
-            total = len(all_sandbox_data)
-            start_index = (page - 1) * page_size
-            end_index = start_index + page_size
-            page_data = all_sandbox_data[start_index:end_index]
-            has_more = end_index < total
-            logger.info(f"Returning page {page} with {len(page_data)} items, total: {total}, has_more: {has_more}")
-            return SandboxListResponse(items=page_data, total=total, has_more=has_more)
-        except Exception as e:
-            logger.error(f"Error filtering sandboxes: {e}", exc_info=True)
-            raise
+            query = SandboxQuery(
+                filters=dict(query_params),
+                states=[State.RUNNING, State.PENDING],
+                fields=_list_fields(fields),
+                limit=page_size + 1,
+                after=decode_cursor(cursor) if cursor else None,
+                offset=(page - 1) * page_size,
+            )
+            rows = await self._meta_store.query(query)
+            total = await self._meta_store.count(query) if with_count else None
+        except ValueError as e:
+            raise BadRequestRockError(str(e)) from e
+
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        next_cursor = encode_cursor(rows[-1]["sandbox_id"]) if has_more else None
+        items = [SandboxListStatusResponse.from_sandbox_info(row) for row in rows]
+        logger.info(f"Returning {len(items)} sandboxes, total: {total}, has_more: {has_more}")
+        return SandboxListResponse(items=items, total=total, has_more=has_more, next_cursor=next_cursor)
 
     async def websocket_proxy(
         self,
@@ -629,11 +833,19 @@ class SandboxProxyService:
             logger.info(f"Connection closed in {direction}: {e}")
 
     async def get_service_status(self, sandbox_id: str):
-        sandbox_info = await self._meta_store.get(sandbox_id)
+        if self._route_cache.enabled:
+            sandbox_info = await self._route_cache.get(sandbox_id)
+        else:
+            sandbox_info = await self._meta_store.get(sandbox_id)
         if not sandbox_info or sandbox_info.get("host_ip") is None:
             raise Exception(f"sandbox {sandbox_id} not started")
         return [sandbox_info]
 
+    async def _get_routes(self, sandbox_ids: list[str]) -> dict[str, SandboxInfo]:
+        if self._route_cache.enabled:
+            return await self._route_cache.get_many(sandbox_ids)
+        return await self._meta_store.get_many(sandbox_ids)
+
     async def _send_request(
         self,
         sandbox_id: str,
@@ -643,6 +855,9 @@ class SandboxProxyService:
         json_data: dict | None,
         files: dict | None,
         method: str,
+        timeout: float | None = None,
+        params: dict | None = None,
+        content: AsyncIterable[bytes] | None = None,
     ):
         host_ip = sandbox_status_dict.get("host_ip")
         service_status = ServiceStatus.from_dict(sandbox_status_dict)
@@ -655,6 +870,11 @@ class SandboxProxyService:
         logger.info(f"json_data: {json_data}")
 
         # Make request
+        request_kwargs = {"timeout": timeout} if timeout is not None else {}
+        if params is not None:
+            request_kwargs["params"] = params
+        if content is not None:
+            request_kwargs["content"] = content
         try:
             response = await self._httpx_client.request(
                 method=method,
@@ -663,6 +883,7 @@ class SandboxProxyService:
                 json=json_data if json_data else None,
                 data=data if data else None,
                 files=files if files else None,
+                **request_kwargs,
             )
             if response.status_code == 511:
                 return {"exit_code": -1, "failure_reason": response.json()["rockletexception"]["message"]}
@@ -805,6 +1026,9 @@ class SandboxProxyService:
             logger.error(f"Error forwarding message {direction}: {e}")
 
     async def _update_expire_time(self, sandbox_id):
+        if self._route_cache.enabled:
+            self._route_cache.touch(sandbox_id)
+            return
         timeout_info = await self._meta_store.get_timeout(sandbox_id)
         if timeout_info is None:
             return
@@ -812,34 +1036,6 @@ class SandboxProxyService:
         if new_timeout is not None:
             await self._meta_store.update_timeout(sandbox_id, new_timeout)
 
-    async def list_all_sandboxes_by_query_params(self, query_params: SandboxQueryParams):
-        all_ids = []
-        async for sandbox_id in self._meta_store.iter_alive_sandbox_ids():
-            all_ids.append(sandbox_id)
-        if not all_ids:
-            return []
-
-        all_sandbox_data = []
-        batch_size = self._batch_get_status_max_count
-        for i in range(0, len(all_ids), batch_size):
-            batch_ids = all_ids[i : i + batch_size]
-            sandbox_infos_list = await self._meta_store.batch_get(batch_ids)
-            for sandbox_info in sandbox_infos_list:
-                state = sandbox_info.get("state")
-                if state not in (State.RUNNING, State.PENDING):
-                    continue
-                if self._matches_query_params(sandbox_info, query_params):
-                    all_sandbox_data.append(SandboxListStatusResponse.from_sandbox_info(sandbox_info))
-        return all_sandbox_data
-
-    def _matches_query_params(self, sandbox_info: SandboxInfo, query_params: SandboxQueryParams) -> bool:
-        if not query_params:
-            return True
-        for filter_key, filter_value in query_params.items():
-            if filter_key not in sandbox_info or sandbox_info[filter_key] != filter_value:
-                return False
-        return True
-
     async def host_proxy(
         self,
         host_ip: str,
@@ -870,34 +1066,35 @@ class SandboxProxyService:
         request_headers = filter_headers(headers)
         payload = body or {}
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(90)) as http_client:
-            try:
-                resp = await http_client.post(
-                    url=target_url,
-                    json=payload,
-                    headers=request_headers,
-                )
-            except httpx.RequestError as exc:
-                logger.error(f"Error forwarding request to {target_url}: {exc}", exc_info=True)
-                raise Exception(f"Service unavailable: Rocklet at {host_ip}:{Port.PROXY.value} is not reachable.")
-
-            content_type = resp.headers.get("content-type", "")
-            response_headers = filter_headers(resp.headers)
+        try:
+            resp = await HttpClientPool.request(
+                "POST",
+                target_url,
+                json=payload,
+                headers=request_headers,
+                timeout=httpx.Timeout(90),
+            )
+        except httpx.RequestError as exc:
+            logger.error(f"Error forwarding request to {target_url}: {exc}", exc_info=True)
+            raise Exception(f"Service unavailable: Rocklet at {host_ip}:{Port.PROXY.value} is not reachable.")
 
-            if "application/json" in content_type:
-                return JSONResponse(
-                    status_code=resp.status_code,
-                    content=resp.json(),
-                    headers=response_headers,
-                )
+        content_type = resp.headers.get("content-type", "")
+        response_headers = filter_headers(resp.headers)
 
-            return Response(
+        if "application/json" in content_type:
+            return JSONResponse(
                 status_code=resp.status_code,
-                content=resp.content,
-                media_type=content_type or "application/octet-stream",
+                content=resp.json(),
                 headers=response_headers,
             )
 
+        return Response(
+            status_code=resp.status_code,
+            content=resp.content,
+            media_type=content_type or "application/octet-stream",
+            headers=response_headers,
+        )
+
     async def http_proxy(
         self,
         sandbox_id: str,
@@ -0,0 +1,84 @@
+import asyncio
+from collections import defaultdict
+
+from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
+
+from rock.admin.metrics.constants import MetricsConstants
+from rock.admin.metrics.monitor import MetricsMonitor
+from rock.config import WarmPoolConfig
+from rock.logger import init_logger
+from rock.sandbox.job.warm_pool_actor import WarmPoolActor, warm_pool_actor_name
+from rock.utils import RayUtil
+
+logger = init_logger(__name__)
+
+
+class WarmPoolService:
+    """Keeps a WarmPoolActor on every alive worker node and reports the pools' hit/miss metrics."""
+
+    def __init__(self, config: WarmPoolConfig, metrics_monitor: MetricsMonitor | None = None):
+        self._config = config
+        self._metrics_monitor = metrics_monitor
+        self._actors: dict[str, WarmPoolActor] = {}
+        self._task: asyncio.Task | None = None
+
+    async def init(self):
+        if not self._config.enabled:
+            logger.info("WarmPoolService not started, warm pool is disabled")
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info("WarmPoolService started")
+
+    async def _run(self):
+        while True:
+            try:
+                await self._ensure_actors()
+                await self.report_metrics()
+            except Exception as e:
+                logger.error(f"Warm pool maintenance failed: {e}", exc_info=True)
+            await asyncio.sleep(self._config.metrics_interval_seconds)
+
+    async def _ensure_actors(self):
+        """Start a pool actor on nodes that joined since the last round."""
+        for node in await RayUtil.get_alive_worker_nodes():
+            node_id = node["NodeID"]
+            if node_id in self._actors:
+                continue
+            actor = WarmPoolActor.options(
+                name=warm_pool_actor_name(node_id),
+                lifetime="detached",
+                get_if_exists=True,
+                scheduling_strategy=NodeAffinitySchedulingStrategy(node_id=node_id, soft=False),
+            ).remote(self._config)
+            await RayUtil.async_ray_get(actor.start.remote())
+            self._actors[node_id] = actor
+            logger.info(f"Warm pool actor started on node {node_id}")
+
+    async def report_metrics(self) -> dict[str, dict[str, int]]:
+        """Sum hits, misses and idle containers per image over all nodes and record them as gauges."""
+        totals: dict[str, dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0, "idle": 0})
+        for node_id, actor in list(self._actors.items()):
+            try:
+                pool_metrics = await RayUtil.async_ray_get(actor.metrics.remote())
+            except Exception as e:
+                # The node or the actor is gone; it is started again if the node is still alive.
+                logger.warning(f"Failed to get warm pool metrics from node {node_id}: {e}")
+                del self._actors[node_id]
+                continue
+            for spec in pool_metrics:
+                image_totals = totals[spec["image"]]
+                for name in image_totals:
+                    image_totals[name] += spec[name]
+        if self._metrics_monitor is not None:
+            for image, image_totals in totals.items():
+                attributes = {"image": image}
+                self._metrics_monitor.record_gauge_by_name(
+                    MetricsConstants.WARM_POOL_HIT, image_totals["hits"], attributes
+                )
+                self._metrics_monitor.record_gauge_by_name(
+                    MetricsConstants.WARM_POOL_MISS, image_totals["misses"], attributes
+                )
+                self._metrics_monitor.record_gauge_by_name(
+                    MetricsConstants.WARM_POOL_IDLE, image_totals["idle"], attributes
+                )
+        return dict(totals)
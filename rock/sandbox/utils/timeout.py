@@ -45,7 +45,12 @@ class SandboxTimeoutHelper:
         }
 
     @staticmethod
-    def is_expired(timeout_info: dict[str, str]) -> bool:
-        """Return *True* when ``expire_time`` in *timeout_info* is in the past."""
-        expire_time = int(timeout_info.get(env_vars.ROCK_SANDBOX_EXPIRE_TIME_KEY, 0))
-        return int(time.time()) > expire_time
+    def expire_time(timeout_info: dict[str, str]) -> int:
+        """Return ``expire_time`` from *timeout_info* in epoch seconds, 0 if missing."""
+        return int(timeout_info.get(env_vars.ROCK_SANDBOX_EXPIRE_TIME_KEY, 0))
+
+    @staticmethod
+    def is_expired(timeout_info: dict[str, str], now: float | None = None) -> bool:
+        """Return *True* when ``expire_time`` in *timeout_info* is before *now* (defaults to the current time)."""
+        now = time.time() if now is None else now
+        return int(now) > SandboxTimeoutHelper.expire_time(timeout_info)
@@ -1,4 +1,5 @@
-from .registration import make
+from .registration import make, make_vec
 from .rock_env import RockEnv
+from .vector_rock_env import VectorRockEnv
 
-__all__ = ["make", "RockEnv"]
+__all__ = ["make", "make_vec", "RockEnv", "VectorRockEnv"]
@@ -1,5 +1,6 @@
 from rock.actions import Env
 from rock.sdk.envs.rock_env import RockEnv
+from rock.sdk.envs.vector_rock_env import VectorRockEnv
 
 
 def make(env_id: str, **kwargs) -> Env:
@@ -18,3 +19,18 @@ def make(env_id: str, **kwargs) -> Env:
     """
 
     return RockEnv(env_id=env_id, **kwargs)
+
+
+def make_vec(env_id: str, num_envs: int) -> VectorRockEnv:
+    """
+    Create a batch of Rock environments that are stepped and reset together.
+
+    Args:
+        env_id: Environment ID.
+        num_envs: Number of environments.
+
+    Returns:
+        Vector environment instance.
+    """
+
+    return VectorRockEnv(env_id=env_id, num_envs=num_envs)
@@ -0,0 +1,188 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import httpx
+
+from rock import env_vars
+from rock.logger import init_logger
+
+logger = init_logger(__name__)
+
+
+class VectorRockEnv:
+    def __init__(self, env_id: str, num_envs: int) -> None:
+        """
+        Initialize a batch of environments that are stepped and reset together.
+
+        Each step or reset is a single Admin API request for all environments, fanned out on the server.
+
+        Args:
+            env_id: Environment ID.
+            num_envs: Number of environments.
+
+        Raises:
+            Exception: Raised when any environment fails to initialize; the ones already made are closed.
+        """
+        if num_envs < 1:
+            raise ValueError("num_envs must be at least 1")
+        self._env_id = env_id
+        self.num_envs = num_envs
+        self._client = httpx.Client(timeout=httpx.Timeout(timeout=300.0, connect=300.0, read=300.0))
+        self._sandbox_ids: list[str] = []
+        self._is_closed = False
+        try:
+            self._initialize_environments()
+        except Exception as e:
+            self.close()
+            raise Exception(f"Failed to initialize environments: {e}") from e
+
+    @property
+    def sandbox_ids(self) -> list[str]:
+        return list(self._sandbox_ids)
+
+    def _initialize_environments(self) -> None:
+        """Make the environments concurrently (``ROCK_GEM_VECTOR_ENV_CONCURRENCY`` at a time); startup is per env."""
+
+        def make_one(_) -> str:
+            result = self._call_admin_api("make", {"env_id": self._env_id})
+            sandbox_id = result.get("sandbox_id")
+            if not sandbox_id:
+                raise Exception("Failed to get environment instance ID")
+            return sandbox_id
+
+        with ThreadPoolExecutor(max_workers=min(self.num_envs, env_vars.ROCK_GEM_VECTOR_ENV_CONCURRENCY)) as pool:
+            futures = [pool.submit(make_one, i) for i in range(self.num_envs)]
+        errors = []
+        for future in futures:
+            if future.exception() is not None:
+                errors.append(future.exception())
+            else:
+                self._sandbox_ids.append(future.result())
+        if errors:
+            raise errors[0]
+
+    def step(self, actions: list[str]) -> tuple[list[Any], list[float], list[bool], list[bool], list[dict[str, Any]]]:
+        """
+        Execute one action in each environment.
+
+        Args:
+            actions: One action per environment, in the order of ``sandbox_ids``.
+
+        Returns:
+            Lists of observations, rewards, termination statuses, truncation statuses and infos. An
+            environment whose step failed gets observation None, reward 0.0, truncated True and the
+            error message under ``info["error"]``, so the caller can reset it.
+
+        Raises:
+            Exception: Raised when the batch request itself fails or the environments are closed.
+        """
+        if len(actions) != self.num_envs:
+            raise ValueError(f"expected {self.num_envs} actions, got {len(actions)}")
+        steps = [
+            {"sandbox_id": sandbox_id, "action": action}
+            for sandbox_id, action in zip(self._sandbox_ids_or_raise(), actions)
+        ]
+        try:
+            results = self._call_admin_api("step_batch", {"steps": steps})["results"]
+        except Exception as e:
+            raise Exception(f"Failed to execute batch step: {e}") from e
+
+        observations, rewards, terminated, truncated, infos = [], [], [], [], []
+        for result in results:
+            response = result.get("response")
+            if response is None:
+                observations.append(None)
+                rewards.append(0.0)
+                terminated.append(False)
+                truncated.append(True)
+                infos.append({"error": result.get("error")})
+                continue
+            observations.append(response["observation"])
+            rewards.append(response["reward"])
+            terminated.append(response["terminated"])
+            truncated.append(response["truncated"])
+            infos.append(response["info"])
+        return observations, rewards, terminated, truncated, infos
+
+    def reset(self, seed: int | list[int | None] | None = None) -> tuple[list[Any], list[dict[str, Any]]]:
+        """
+        Reset every environment to its initial state.
+
+        Args:
+            seed: Random seed. An int seeds environment ``i`` with ``seed + i``; a list gives one seed per environment.
+
+        Returns:
+            Lists of initial observations and infos. An environment whose reset failed gets observation
+            None and the error message under ``info["error"]``.
+
+        Raises:
+            Exception: Raised when the batch request itself fails or the environments are closed.
+        """
+        if seed is None or isinstance(seed, int):
+            seeds = [None if seed is None else seed + i for i in range(self.num_envs)]
+        else:
+            if len(seed) != self.num_envs:
+                raise ValueError(f"expected {self.num_envs} seeds, got {len(seed)}")
+            seeds = seed
+        resets = [{"sandbox_id": sandbox_id, "seed": s} for sandbox_id, s in zip(self._sandbox_ids_or_raise(), seeds)]
+        try:
+            results = self._call_admin_api("reset_batch", {"resets": resets})["results"]
+        except Exception as e:
+            raise Exception(f"Failed to execute batch reset: {e}") from e
+
+        observations, infos = [], []
+        for result in results:
+            response = result.get("response")
+            if response is None:
+                observations.append(None)
+                infos.append({"error": result.get("error")})
+                continue
+            observations.append(response["observation"])
+            infos.append(response["info"])
+        return observations, infos
+
+    def close(self) -> None:
+        """
+        Close all environments and clean up resources.
+
+        Raises:
+            Exception: Raised when closing any environment fails; the others are still closed.
+        """
+        if self._is_closed:
+            return
+        self._is_closed = True
+        sandbox_ids, self._sandbox_ids = self._sandbox_ids, []
+        try:
+            if not sandbox_ids:
+                return
+            with ThreadPoolExecutor(
+                max_workers=min(len(sandbox_ids), env_vars.ROCK_GEM_VECTOR_ENV_CONCURRENCY)
+            ) as pool:
+                futures = [
+                    pool.submit(self._call_admin_api, "close", {"sandbox_id": sandbox_id}) for sandbox_id in sandbox_ids
+                ]
+            errors = [future.exception() for future in futures if future.exception() is not None]
+            if errors:
+                raise Exception(f"Failed to close {len(errors)} of {len(sandbox_ids)} environments: {errors[0]}")
+        finally:
+            self._client.close()
+
+    def _sandbox_ids_or_raise(self) -> list[str]:
+        if self._is_closed:
+            raise Exception("Environments are closed")
+        return self._sandbox_ids
+
+    def _call_admin_api(self, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+        url = f"{env_vars.ROCK_BASE_URL}/apis/v1/envs/gem/{endpoint}"
+        headers = {"Content-Type": "application/json"}
+        try:
+            logger.debug(f"Calling Admin API {url} with params: {params}")
+            response = self._client.post(url, headers=headers, json=params)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            raise Exception(f"HTTP error {e.response.status_code} for {endpoint}: {e.response.text}") from e
+        except httpx.RequestError as e:
+            raise Exception(f"Request error for {url}: {e}") from e
+        except ValueError as e:
+            raise Exception(f"JSON decode error for {url}: {e}") from e
@@ -3,16 +3,19 @@
 # import when rock.sdk.job is triggered mid-bench-load.
 import rock.sdk.job.trial.bash  # noqa: F401
 from rock.sdk.job.api import Job
-from rock.sdk.job.config import BashJobConfig, JobConfig
+from rock.sdk.job.config import BashJobConfig, JobConfig, SandboxPoolConfig, SchedulingConfig
 from rock.sdk.job.executor import JobClient, JobExecutor, TrialClient
-from rock.sdk.job.operator import Operator, ScatterOperator
+from rock.sdk.job.operator import Operator, QueueOperator, Reducer, ScatterOperator, ScoreReducer, ScoreSummary
 from rock.sdk.job.result import ExceptionInfo, JobResult, JobStatus, TrialResult
+from rock.sdk.job.sandbox_pool import SandboxPool
 from rock.sdk.job.trial import AbstractTrial, register_trial
 
 __all__ = [
     "Job",
     "JobConfig",
     "BashJobConfig",
+    "SchedulingConfig",
+    "SandboxPoolConfig",
     "JobResult",
     "JobStatus",
     "TrialResult",
@@ -20,8 +23,13 @@ __all__ = [
     "JobExecutor",
     "JobClient",
     "TrialClient",
+    "SandboxPool",
     "Operator",
     "ScatterOperator",
+    "QueueOperator",
+    "Reducer",
+    "ScoreReducer",
+    "ScoreSummary",
     "AbstractTrial",
     "register_trial",
 ]
@@ -8,11 +8,15 @@ Usage:
     job = Job(config, operator=ScatterOperator(size=8))
     await job.submit()
     result = await job.wait()
+    # or, results as trials finish
+    async for trial_result in Job(config, operator=ScatterOperator(size=8)).stream():
+        ...
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterator, Callable
+from typing import TYPE_CHECKING, TypeVar
 
 from rock.sdk.job.executor import JobExecutor
 from rock.sdk.job.operator import ScatterOperator
@@ -21,9 +25,11 @@ from rock.sdk.job.result import JobResult, JobStatus
 if TYPE_CHECKING:
     from rock.sdk.job.config import JobConfig
     from rock.sdk.job.executor import JobClient
-    from rock.sdk.job.operator import Operator
+    from rock.sdk.job.operator import Operator, Reducer
     from rock.sdk.job.result import TrialResult
 
+A = TypeVar("A")
+
 
 class Job:
     """Job Facade — the thin user-facing entry point.
@@ -47,6 +53,17 @@ class Job:
         await self.submit()
         return await self.wait()
 
+    async def stream(self) -> AsyncIterator[TrialResult]:
+        """Run the job and yield each TrialResult as its trial finishes (list-returning collect() is flattened)."""
+        async for _, result in self._executor.stream(self._operator, self._config):
+            for r in result if isinstance(result, list) else [result]:
+                yield r
+
+    async def reduce(self, reducer: Reducer[A]) -> AsyncIterator[A]:
+        """Run the job and yield ``reducer``'s partial aggregate after each finished trial."""
+        async for aggregate in self._executor.reduce(self._operator, self._config, reducer):
+            yield aggregate
+
     async def submit(self) -> None:
         """Non-blocking submit: operator generates trials, executor starts them."""
         self._job_client = await self._executor.submit(self._operator, self._config)
@@ -58,11 +75,10 @@ class Job:
         raw = await self._executor.wait(self._job_client)
         return self._build_result(raw)
 
-    async def cancel(self) -> None:
-        """Kill all running trials."""
+    async def cancel(self, progress: Callable[[int, int], None] | None = None) -> None:
+        """Stop all trial sandboxes in bulk; ``progress`` receives ``(stopped, total)`` as they go down."""
         if self._job_client:
-            for tc in self._job_client.trials:
-                await tc.sandbox.arun(cmd=f"kill {tc.pid}", session=tc.session)
+            await self._executor.cancel(self._job_client, progress)
 
     def _build_result(self, raw_results: list[TrialResult | list[TrialResult]]) -> JobResult:
         """Flatten list-returning collect() outputs into JobResult.trial_results.
@@ -2,6 +2,8 @@
 
 JobConfig    — base config with shared job-scheduling fields
 BashJobConfig — simple script execution
+SchedulingConfig — admission control for JobExecutor (JobConfig.scheduling)
+SandboxPoolConfig — sandbox reuse across trials (JobConfig.sandbox_pool)
 
 Environment config lives in rock.sdk.envhub.config.EnvironmentConfig.
 Harbor's HarborJobConfig lives in rock.sdk.bench.models.job.config.
@@ -20,6 +22,40 @@ from rock.sdk.envhub import EnvironmentConfig
 logger = init_logger(__name__)
 
 
+class SchedulingConfig(BaseModel):
+    """How JobExecutor admits trials: in-flight window, admin back-off, checkpointing."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    # Trials running at once (started and not yet collected); None means no cap.
+    max_in_flight: int | None = Field(default=None, ge=1)
+    # Trials concurrently in sandbox start / setup / launch — the admin-heavy part.
+    # Halved when the admin error rate crosses the threshold, grown back by one per window of successes.
+    submit_concurrency: int = Field(default=32, ge=1)
+    error_rate_threshold: float = Field(default=0.2, gt=0, le=1)
+    error_window: int = Field(default=20, ge=1)
+    backoff_seconds: float = Field(default=1.0, ge=0)
+    max_backoff_seconds: float = Field(default=60.0, ge=0)
+    # Once no trial is waiting, give a trial running past this percentile of finished trials'
+    # durations one backup copy; the first copy to finish wins. None disables speculation.
+    speculation_percentile: float | None = Field(default=None, gt=0, lt=1)
+    speculation_min_finished: int = Field(default=5, ge=1)
+    # JSONL file of completed trials; a restarted job with the same file skips them.
+    checkpoint_path: str | None = None
+
+
+class SandboxPoolConfig(BaseModel):
+    """Reuse of started sandboxes across trials with the same sandbox spec."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: bool = False
+    # Trials a sandbox serves before it is stopped and replaced.
+    max_uses: int = Field(default=10, ge=1)
+    # Run between trials (e.g. a workdir wipe or a snapshot restore); a non-zero exit recycles the sandbox.
+    reset_command: str | None = None
+
+
 class JobConfig(BaseModel):
     """Base config — shared fields for all job types."""
 
@@ -29,6 +65,8 @@ class JobConfig(BaseModel):
     experiment_id: str | None = None
     labels: dict[str, str] = Field(default_factory=dict)
     timeout: int = 7200
+    scheduling: SchedulingConfig = Field(default_factory=SchedulingConfig)
+    sandbox_pool: SandboxPoolConfig = Field(default_factory=SandboxPoolConfig)
 
     @model_validator(mode="after")
     def _sync_experiment_id(self) -> JobConfig:
@@ -4,21 +4,36 @@ Flow:
     submit(operator, config)  — apply operator to get TrialList, start all sandboxes
                                 in parallel, return JobClient (list of TrialClient)
     wait(job_client)          — wait for all trials, collect results, return list[TrialResult]
-    run(operator, config)     — submit + wait
+    cancel(job_client)        — stop every trial's sandbox in bulk
+    stream(operator, config)  — run trials under config.scheduling, yield results as trials finish
+    reduce(operator, config, reducer) — stream, folded into partial aggregates
+    run(operator, config)     — stream, collected back into TrialList order
+
+Sandbox starts are admitted through an AdmissionController (config.scheduling.submit_concurrency,
+backing off on admin errors) in both paths. With config.sandbox_pool enabled (or a SandboxPool passed
+to JobExecutor), stream/run lease sandboxes from the pool and hand them back after each trial.
 """
 
 from __future__ import annotations
 
 import asyncio
+import bisect
+import contextlib
+import heapq
+import math
 import os
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
-from rock.actions import CreateBashSessionRequest
+from rock.actions import CloseSessionRequest, CreateBashSessionRequest
 from rock.logger import init_logger
-from rock.sdk.job.operator import Operator
-from rock.sdk.job.result import TrialResult
-from rock.sdk.sandbox.client import Sandbox
+from rock.sdk.job.operator import Operator, Reducer
+from rock.sdk.job.result import ExceptionInfo, TrialResult
+from rock.sdk.job.sandbox_pool import SandboxPool
+from rock.sdk.job.scheduler import AdmissionController, TrialCheckpoint
+from rock.sdk.sandbox.client import Sandbox, stop_sandboxes
 
 if TYPE_CHECKING:
     from rock.sdk.job.config import JobConfig
@@ -26,6 +41,8 @@ if TYPE_CHECKING:
 
 logger = init_logger(__name__)
 
+A = TypeVar("A")
+
 
 @dataclass
 class TrialClient:
@@ -45,20 +62,41 @@ class JobClient:
 
 
 class JobExecutor:
-    """Execution engine: drives Operator to generate trials, runs in parallel, collects results."""
+    """Execution engine: drives Operator to generate trials, runs in parallel, collects results.
+
+    A ``sandbox_pool`` passed here is shared by every job this executor streams
+    and is left open; otherwise stream() creates and closes its own pool when
+    ``config.sandbox_pool.enabled``.
+    """
+
+    def __init__(self, sandbox_pool: SandboxPool | None = None):
+        self._sandbox_pool = sandbox_pool
 
     async def run(self, operator: Operator, config: JobConfig) -> list[TrialResult | list[TrialResult]]:
-        """Full lifecycle: submit + wait."""
-        job_client = await self.submit(operator, config)
-        return await self.wait(job_client)
+        """Full lifecycle; results are returned in TrialList order."""
+        results = {index: result async for index, result in self.stream(operator, config)}
+        return [results[index] for index in sorted(results)]
 
     async def submit(self, operator: Operator, config: JobConfig) -> JobClient:
-        """Operator generates TrialList, start all sandboxes in parallel."""
+        """Operator generates TrialList, start all sandboxes in parallel (bounded by admission control)."""
         trial_list = operator.apply(config)
         if not trial_list:
             return JobClient(trials=[])
-        trial_clients = await asyncio.gather(*[self._do_submit(t) for t in trial_list])
-        return JobClient(trials=list(trial_clients))
+        admission = AdmissionController(config.scheduling)
+
+        async def _admitted_submit(trial: AbstractTrial) -> TrialClient:
+            async with admission.admit():
+                return await self._do_submit(trial)
+
+        # Admission is FIFO, so creating the tasks in priority order admits higher priorities first.
+        order = sorted(range(len(trial_list)), key=lambda i: -trial_list[i].priority)
+        tasks = {i: asyncio.ensure_future(_admitted_submit(trial_list[i])) for i in order}
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                task.cancel()
+        return JobClient(trials=[tasks[i].result() for i in range(len(trial_list))])
 
     async def wait(self, job_client: JobClient) -> list[TrialResult | list[TrialResult]]:
         """Wait for all trials, collect results in parallel.
@@ -71,6 +109,145 @@ class JobExecutor:
             return []
         return list(await asyncio.gather(*[self._do_wait(tc) for tc in job_client.trials]))
 
+    async def cancel(self, job_client: JobClient, progress: Callable[[int, int], None] | None = None) -> int:
+        """Stop the sandboxes of all trials, killing whatever still runs in them.
+
+        The sandboxes are stopped through ``stop_sandboxes``, one bulk request per admin server.
+        ``progress`` is called with ``(stopped, total)`` as each stop completes. Returns how many
+        sandboxes failed to stop.
+        """
+        sandboxes = {tc.sandbox.sandbox_id: tc.sandbox for tc in job_client.trials if tc.sandbox.sandbox_id}
+        done = failed = 0
+        async for result in stop_sandboxes(sandboxes.values()):
+            done += 1
+            if result.error:
+                failed += 1
+                logger.warning(f"Failed to stop trial sandbox {result.sandbox_id}: {result.error}")
+            if progress:
+                progress(done, len(sandboxes))
+        logger.info(f"Cancelled job: stopped {done - failed}/{len(sandboxes)} trial sandboxes")
+        return failed
+
+    async def stream(
+        self, operator: Operator, config: JobConfig
+    ) -> AsyncIterator[tuple[int, TrialResult | list[TrialResult]]]:
+        """Run the TrialList and yield ``(index, result)`` as each trial finishes.
+
+        ``index`` is the trial's position in the TrialList. Scheduling follows
+        ``operator.configure(config)``: at most ``scheduling.max_in_flight``
+        trials run at once, higher ``priority`` first. A trial that fails to
+        start yields a failed TrialResult instead of aborting the job. With
+        ``scheduling.checkpoint_path`` set, trials checkpointed as completed by
+        an earlier run are yielded first and not re-run. With
+        ``scheduling.speculation_percentile`` set, stragglers get a backup copy
+        and each index is still yielded once. Trials run on pooled sandboxes
+        when a pool is configured.
+        """
+        trial_list = operator.apply(config)
+        config = operator.configure(config)
+        scheduling = config.scheduling
+        checkpoint = TrialCheckpoint(scheduling.checkpoint_path) if scheduling.checkpoint_path else None
+        completed = checkpoint.load() if checkpoint else {}
+        for index, result in sorted(completed.items()):
+            if index < len(trial_list):
+                yield index, result
+
+        queue = [(-t.priority, i, t) for i, t in enumerate(trial_list) if i not in completed]
+        heapq.heapify(queue)
+        remaining = len(queue)
+        if remaining:
+            logger.info(f"Scheduling {remaining} trials, job_name={config.job_name}, {len(completed)} checkpointed")
+        admission = AdmissionController(scheduling)
+        pool = self._sandbox_pool
+        owns_pool = pool is None and config.sandbox_pool.enabled and remaining > 0
+        if owns_pool:
+            pool = SandboxPool(config.sandbox_pool)
+        in_flight = asyncio.Semaphore(scheduling.max_in_flight) if scheduling.max_in_flight else None
+        finished: asyncio.Queue[tuple[int, TrialResult | list[TrialResult]]] = asyncio.Queue()
+        running: set[asyncio.Task] = set()
+        attempts: dict[int, set[asyncio.Task]] = defaultdict(set)
+        started_at: dict[int, float] = {}
+        durations: list[float] = []  # kept sorted
+        speculated: set[int] = set()
+        progress = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        async def _run_trial(index: int, trial: AbstractTrial) -> None:
+            try:
+                result = await self._do_run(trial, admission, pool)
+            finally:
+                if in_flight is not None:
+                    in_flight.release()
+                progress.set()
+            finished.put_nowait((index, result))
+
+        def _launch(index: int, trial: AbstractTrial) -> None:
+            task = asyncio.create_task(_run_trial(index, trial))
+            attempts[index].add(task)
+            running.add(task)
+            task.add_done_callback(running.discard)
+
+        async def _dispatch() -> None:
+            while queue:
+                if in_flight is not None:
+                    await in_flight.acquire()
+                _, index, trial = heapq.heappop(queue)
+                started_at[index] = loop.time()
+                _launch(index, trial)
+
+        async def _speculate(percentile: float) -> None:
+            while True:
+                progress.clear()
+                wake_in = None
+                if not queue and len(durations) >= scheduling.speculation_min_finished:
+                    threshold = _percentile(durations, percentile)
+                    for index, started in list(started_at.items()):
+                        if index not in attempts or index in speculated:
+                            continue
+                        due_in = started + threshold - loop.time()
+                        if due_in > 0:
+                            wake_in = due_in if wake_in is None else min(wake_in, due_in)
+                        elif in_flight is None or not in_flight.locked():
+                            if in_flight is not None:
+                                await in_flight.acquire()
+                            speculated.add(index)
+                            logger.info(f"Speculatively re-running straggler trial {index}, job_name={config.job_name}")
+                            _launch(index, trial_list[index])
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(progress.wait(), wake_in)
+
+        helpers = [asyncio.create_task(_dispatch())]
+        if scheduling.speculation_percentile is not None:
+            helpers.append(asyncio.create_task(_speculate(scheduling.speculation_percentile)))
+        try:
+            while remaining:
+                index, result = await finished.get()
+                if index not in attempts:
+                    continue  # a slower copy of a trial that already finished
+                for task in attempts.pop(index):
+                    task.cancel()
+                if index not in speculated:
+                    bisect.insort(durations, loop.time() - started_at[index])
+                remaining -= 1
+                progress.set()
+                if checkpoint is not None and _is_completed(result):
+                    checkpoint.record(index, result)
+                yield index, result
+        finally:
+            for task in (*helpers, *running):
+                task.cancel()
+            await asyncio.gather(*helpers, *running, return_exceptions=True)
+            if owns_pool:
+                await pool.close()
+
+    async def reduce(self, operator: Operator, config: JobConfig, reducer: Reducer[A]) -> AsyncIterator[A]:
+        """Gather stage over stream(): yield ``reducer``'s aggregate after each finished trial."""
+        aggregate = reducer.initial()
+        async for _, result in self.stream(operator, config):
+            for r in result if isinstance(result, list) else [result]:
+                aggregate = reducer.step(aggregate, r)
+            yield aggregate
+
     # ── Internal: per-trial submit/wait ──
 
     @staticmethod
@@ -85,12 +262,64 @@ class JobExecutor:
 
         return f"{USER_DEFINED_LOGS}/rock_job_{config.job_name or 'default'}"
 
-    async def _do_submit(self, trial: AbstractTrial) -> TrialClient:
-        """Start sandbox + execute script for a single trial."""
+    async def _do_run(
+        self, trial: AbstractTrial, admission: AdmissionController, pool: SandboxPool | None = None
+    ) -> TrialResult | list[TrialResult]:
+        """Submit under admission control, then wait; failures become a failed TrialResult."""
+        try:
+            async with admission.admit():
+                client = await self._do_submit(trial, pool)
+            try:
+                result = await self._do_wait(client)
+            except asyncio.CancelledError:
+                await self._abandon(client, pool)
+                raise
+            except Exception:
+                if pool is not None:
+                    await pool.release(client.sandbox, reusable=False)
+                raise
+            if pool is not None:
+                await self._return_to_pool(pool, client, reusable=_is_completed(result))
+            return result
+        except Exception as e:
+            logger.warning(f"Trial failed: job_name={trial._config.job_name}, error={e}")
+            return TrialResult(
+                task_name=trial._config.job_name or "",
+                exception_info=ExceptionInfo(exception_type=type(e).__name__, exception_message=str(e)),
+                exit_code=1,
+            )
+
+    async def _do_submit(self, trial: AbstractTrial, pool: SandboxPool | None = None) -> TrialClient:
+        """Start sandbox (or lease one from ``pool``) + execute script for a single trial."""
+        config = trial._config
+        if pool is None:
+            sandbox = Sandbox(config.environment)
+            launched = False
+            try:
+                await sandbox.start()
+                logger.info(f"Sandbox started: sandbox_id={sandbox.sandbox_id}, job_name={config.job_name}")
+                client = await self._launch(trial, sandbox)
+                launched = True
+                return client
+            finally:
+                # Also on cancellation, or a sandbox started for a trial that never ran keeps running.
+                if not launched:
+                    await self._close_sandbox(sandbox)
+        sandbox = await pool.lease(config.environment)
+        logger.info(f"Sandbox leased: sandbox_id={sandbox.sandbox_id}, job_name={config.job_name}")
+        launched = False
+        try:
+            client = await self._launch(trial, sandbox)
+            launched = True
+            return client
+        finally:
+            # Also on cancellation (a lost speculative race, Job.cancel), or the lease is never returned.
+            if not launched:
+                await pool.release(sandbox, reusable=False)
+
+    async def _launch(self, trial: AbstractTrial, sandbox: Sandbox) -> TrialClient:
+        """Prepare a started sandbox for the trial and launch its script under nohup."""
         config = trial._config
-        sandbox = Sandbox(config.environment)
-        await sandbox.start()
-        logger.info(f"Sandbox started: sandbox_id={sandbox.sandbox_id}, job_name={config.job_name}")
 
         # G4: let trial backfill config from sandbox state before setup
         await trial.on_sandbox_ready(sandbox)
@@ -119,10 +348,39 @@ class JobExecutor:
         logger.info(f"Trial started: pid={pid}, job_name={config.job_name}")
         return TrialClient(sandbox=sandbox, session=session, pid=pid, trial=trial)
 
+    @staticmethod
+    async def _abandon(client: TrialClient, pool: SandboxPool | None) -> None:
+        """Stop a trial that lost a speculative race or whose stream was closed, together with its sandbox."""
+        try:
+            await client.sandbox.arun(cmd=f"kill {client.pid}", session=client.session)
+        except Exception as e:
+            logger.warning(f"Failed to kill trial pid={client.pid} on sandbox {client.sandbox.sandbox_id}: {e}")
+        if pool is not None:
+            await pool.release(client.sandbox, reusable=False)
+            return
+        await JobExecutor._close_sandbox(client.sandbox)
+
+    @staticmethod
+    async def _close_sandbox(sandbox: Sandbox) -> None:
+        """Stop a sandbox whose trial will not run to completion."""
+        try:
+            await sandbox.close()
+        except Exception as e:
+            logger.warning(f"Failed to stop sandbox {sandbox.sandbox_id} of abandoned trial: {e}")
+
+    @staticmethod
+    async def _return_to_pool(pool: SandboxPool, client: TrialClient, reusable: bool) -> None:
+        """Close the trial's session so the next trial can open its own, then release the sandbox."""
+        if reusable:
+            try:
+                await client.sandbox.close_session(CloseSessionRequest(session=client.session))
+            except Exception as e:
+                logger.warning(f"Failed to close session {client.session}, recycling sandbox: {e}")
+                reusable = False
+        await pool.release(client.sandbox, reusable=reusable)
+
     async def _do_wait(self, client: TrialClient) -> TrialResult | list[TrialResult]:
         """Wait for a single trial to finish, call trial.collect()."""
-        from rock.sdk.job.result import ExceptionInfo
-
         config = client.trial._config
         success, message = await client.sandbox.wait_for_process_completion(
             pid=client.pid,
@@ -165,3 +423,11 @@ class JobExecutor:
         oss_env = {k: v for k, v in os.environ.items() if k.startswith("OSS")}
         merged = {**oss_env, **config.environment.env}
         return merged or None
+
+
+def _is_completed(result: TrialResult | list[TrialResult]) -> bool:
+    return all(r.exception_info is None for r in (result if isinstance(result, list) else [result]))
+
+
+def _percentile(ordered: list[float], percentile: float) -> float:
+    return ordered[max(0, math.ceil(percentile * len(ordered)) - 1)]
@@ -1,14 +1,24 @@
-"""Operator — generic algorithm that produces a TrialList from a JobConfig."""
+"""Operator — generic algorithm that produces a TrialList from a JobConfig.
+
+ScatterOperator — N identical trials, all admitted up front
+QueueOperator   — one trial per task, pulled by a fixed set of workers as they go idle,
+                  with optional speculative re-execution of stragglers
+Reducer         — gather stage: folds trial results into a partial aggregate as trials finish
+"""
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from pydantic import BaseModel
 
 from rock.sdk.job.trial.registry import _create_trial
 
 if TYPE_CHECKING:
     from rock.sdk.job.config import JobConfig
+    from rock.sdk.job.result import TrialResult
     from rock.sdk.job.trial.abstract import AbstractTrial
 
 
@@ -24,6 +34,13 @@ class Operator(ABC):
         """Generate a TrialList from config. Empty list means no-op."""
         ...
 
+    def configure(self, config: JobConfig) -> JobConfig:
+        """Job-level config JobExecutor schedules the TrialList with (scheduling, sandbox_pool).
+
+        Default: ``config`` unchanged. Operators that imply a scheduling policy return an updated copy.
+        """
+        return config
+
 
 class ScatterOperator(Operator):
     """Scatter: create `size` identical Trial instances from config.
@@ -44,3 +61,88 @@ class ScatterOperator(Operator):
             return []
         trial = _create_trial(config)
         return [trial] * self.size
+
+
+class QueueOperator(Operator):
+    """Work queue: one trial per task config, pulled by ``workers`` sandboxes as they go idle.
+
+    Unlike a static partition, a slow task only delays the worker running it — the
+    other workers keep pulling. Workers are pooled sandboxes (``sandbox_pool`` is
+    enabled), so an idle worker takes the next task without a sandbox restart.
+
+    With ``speculate_percentile`` set (e.g. 0.9), once the queue is drained a trial
+    still running past that percentile of finished trials' durations gets one
+    backup copy on an idle worker; the first copy to finish wins and the other is
+    cancelled.
+
+    Usage:
+      QueueOperator(tasks=[BashJobConfig(script=s) for s in scripts], workers=16)
+      QueueOperator(tasks, workers=16, speculate_percentile=0.9)
+    """
+
+    def __init__(self, tasks: Sequence[JobConfig], workers: int, speculate_percentile: float | None = None):
+        if workers <= 0:
+            raise ValueError(f"workers must be positive, got {workers}")
+        self.tasks = list(tasks)
+        self.workers = workers
+        self.speculate_percentile = speculate_percentile
+
+    def apply(self, config: JobConfig) -> list[AbstractTrial]:
+        return [_create_trial(task) for task in self.tasks]
+
+    def configure(self, config: JobConfig) -> JobConfig:
+        scheduling = config.scheduling.model_copy(
+            update={"max_in_flight": self.workers, "speculation_percentile": self.speculate_percentile}
+        )
+        sandbox_pool = config.sandbox_pool.model_copy(update={"enabled": True})
+        return config.model_copy(update={"scheduling": scheduling, "sandbox_pool": sandbox_pool})
+
+
+A = TypeVar("A")
+
+
+class Reducer(ABC, Generic[A]):
+    """Gather stage: ``step`` folds each finished TrialResult into the aggregate.
+
+    JobExecutor.reduce / Job.reduce yield the aggregate after every step, so
+    partial results are visible while the job is still running.
+    """
+
+    @abstractmethod
+    def initial(self) -> A:
+        """Aggregate before any trial has finished."""
+
+    @abstractmethod
+    def step(self, aggregate: A, result: TrialResult) -> A:
+        """Return the aggregate with ``result`` folded in."""
+
+
+class ScoreSummary(BaseModel):
+    """Running counts and mean score of finished trials."""
+
+    n_completed: int = 0
+    n_failed: int = 0
+    total_score: float = 0.0
+
+    @property
+    def n_finished(self) -> int:
+        return self.n_completed + self.n_failed
+
+    @property
+    def score(self) -> float:
+        return self.total_score / self.n_finished if self.n_finished else 0.0
+
+
+class ScoreReducer(Reducer[ScoreSummary]):
+    """Partial JobResult statistics: completed / failed counts and mean score so far."""
+
+    def initial(self) -> ScoreSummary:
+        return ScoreSummary()
+
+    def step(self, aggregate: ScoreSummary, result: TrialResult) -> ScoreSummary:
+        failed = result.status == "failed"
+        return ScoreSummary(
+            n_completed=aggregate.n_completed + (not failed),
+            n_failed=aggregate.n_failed + failed,
+            total_score=aggregate.total_score + result.score,
+        )
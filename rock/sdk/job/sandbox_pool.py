@@ -0,0 +1,110 @@
+"""SandboxPool — hands started sandboxes from finished trials to the next trial with the same sandbox spec.
+
+A sandbox's spec is its SandboxConfig (image, resources, cluster, ...); trial-level settings such as
+uploads and env are applied by each trial's own setup. Between trials the pool runs the configured
+reset command, and it stops a sandbox instead of reusing it once it has served ``max_uses`` trials,
+when its trial failed, or when the reset fails.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from rock.logger import init_logger
+from rock.sdk.sandbox.client import Sandbox
+from rock.sdk.sandbox.config import SandboxConfig
+
+if TYPE_CHECKING:
+    from rock.sdk.job.config import SandboxPoolConfig
+
+logger = init_logger(__name__)
+
+
+class SandboxPool:
+    """Trial-level sandbox pool.
+
+    Usage:
+        sandbox = await pool.lease(config.environment)
+        ...  # run the trial
+        await pool.release(sandbox, reusable=trial_succeeded)
+        ...
+        await pool.close()  # stops every sandbox the pool still holds
+    """
+
+    def __init__(self, config: SandboxPoolConfig):
+        self._config = config
+        self._idle: dict[str, list[Sandbox]] = defaultdict(list)
+        self._keys: dict[Sandbox, str] = {}
+        self._uses: dict[Sandbox, int] = {}
+        self._leased: set[Sandbox] = set()
+        self._closed = False
+        self.started = 0
+        self.reused = 0
+        self.recycled = 0
+
+    async def lease(self, environment: SandboxConfig) -> Sandbox:
+        """Return an idle sandbox started from the same spec, or start a new one."""
+        if self._closed:
+            raise RuntimeError("SandboxPool is closed")
+        key = _spec_key(environment)
+        idle = self._idle.get(key)
+        if idle:
+            sandbox = idle.pop()
+            self.reused += 1
+        else:
+            sandbox = Sandbox(environment)
+            await sandbox.start()
+            self.started += 1
+            self._keys[sandbox] = key
+            self._uses[sandbox] = 0
+        self._uses[sandbox] += 1
+        self._leased.add(sandbox)
+        return sandbox
+
+    async def release(self, sandbox: Sandbox, reusable: bool = True) -> None:
+        """Give a leased sandbox back: reset it for the next trial, or stop it."""
+        self._leased.discard(sandbox)
+        if reusable and not self._closed and self._uses[sandbox] < self._config.max_uses:
+            if await self._reset(sandbox):
+                self._idle[self._keys[sandbox]].append(sandbox)
+                return
+        await self._recycle(sandbox)
+
+    async def close(self) -> None:
+        """Stop all idle and still-leased sandboxes."""
+        self._closed = True
+        sandboxes = [*self._leased, *(s for idle in self._idle.values() for s in idle)]
+        self._leased.clear()
+        self._idle.clear()
+        await asyncio.gather(*[self._recycle(s) for s in sandboxes])
+
+    async def _reset(self, sandbox: Sandbox) -> bool:
+        if not self._config.reset_command:
+            return True
+        try:
+            obs = await sandbox.arun(self._config.reset_command)
+        except Exception as e:
+            logger.warning(f"Sandbox reset failed, recycling: sandbox_id={sandbox.sandbox_id}, error={e}")
+            return False
+        if obs.exit_code != 0:
+            logger.warning(
+                f"Sandbox reset exited with {obs.exit_code}, recycling: sandbox_id={sandbox.sandbox_id}, "
+                f"output={obs.output}"
+            )
+            return False
+        return True
+
+    async def _recycle(self, sandbox: Sandbox) -> None:
+        self._keys.pop(sandbox, None)
+        self._uses.pop(sandbox, None)
+        self.recycled += 1
+        try:
+            await sandbox.close()
+        except Exception as e:
+            logger.warning(f"Failed to stop pooled sandbox {sandbox.sandbox_id}: {e}")
+
+
+def _spec_key(environment: SandboxConfig) -> str:
+    return environment.model_dump_json(include=set(SandboxConfig.model_fields))
@@ -0,0 +1,165 @@
+"""Admission control and checkpointing for JobExecutor.
+
+AdmissionController — adaptive cap on trials concurrently going through sandbox start / setup / launch.
+                      Every call in that phase hits the admin server, so admission backs off when the
+                      admin error rate rises (AIMD: halve the window and pause, then grow it back).
+TrialCheckpoint     — append-only JSONL record of completed trials, so a restarted job skips them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from rock.logger import init_logger
+from rock.sdk.job.result import TrialResult
+
+if TYPE_CHECKING:
+    from rock.sdk.job.config import SchedulingConfig
+
+logger = init_logger(__name__)
+
+
+class AdmissionController:
+    """Bounded, self-tuning admission window.
+
+    Usage:
+        async with admission.admit():
+            await start_trial()   # an exception counts as an admin error
+    """
+
+    def __init__(self, config: SchedulingConfig, clock: Callable[[], float] = time.monotonic):
+        self._max_limit = config.submit_concurrency
+        self._limit = float(config.submit_concurrency)
+        self._threshold = config.error_rate_threshold
+        self._outcomes: deque[bool] = deque(maxlen=config.error_window)
+        self._base_backoff = config.backoff_seconds
+        self._max_backoff = config.max_backoff_seconds
+        self._clock = clock
+        self._backoff = 0.0
+        self._resume_at = 0.0
+        self._active = 0
+        self._changed = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return max(1, int(self._limit))
+
+    @property
+    def error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    @contextlib.asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        await self._acquire()
+        try:
+            yield
+        except Exception:
+            await self._release(success=False)
+            raise
+        except BaseException:
+            await self._release(success=None)
+            raise
+        await self._release(success=True)
+
+    async def _acquire(self) -> None:
+        while True:
+            async with self._changed:
+                delay = self._resume_at - self._clock()
+                if delay <= 0:
+                    if self._active < self.limit:
+                        self._active += 1
+                        return
+                    await self._changed.wait()
+                    continue
+            await asyncio.sleep(delay)
+
+    async def _release(self, success: bool | None) -> None:
+        async with self._changed:
+            self._active -= 1
+            if success is not None:
+                self._record(success)
+            self._changed.notify_all()
+
+    def _record(self, success: bool) -> None:
+        self._outcomes.append(success)
+        if success:
+            self._backoff = 0.0
+            if self.error_rate < self._threshold:
+                self._limit = min(float(self._max_limit), self._limit + 1 / self._limit)
+            return
+        if self.error_rate >= self._threshold:
+            self._limit = max(1.0, self._limit / 2)
+            self._backoff = min(self._max_backoff, self._backoff * 2 or self._base_backoff)
+            self._resume_at = self._clock() + self._backoff
+            # Judge the reduced window on fresh outcomes only.
+            self._outcomes.clear()
+            logger.warning(f"Admin errors rising, admitting {self.limit} trials after {self._backoff:.1f}s back-off")
+
+
+class TrialCheckpoint:
+    """Completed trial results keyed by the trial's index in the operator's TrialList.
+
+    Relies on the operator producing the same TrialList on restart.
+    """
+
+    def __init__(self, path: str | Path):
+        self._path = Path(path)
+
+    def load(self) -> dict[int, TrialResult | list[TrialResult]]:
+        if not self._path.exists():
+            return {}
+        completed: dict[int, TrialResult | list[TrialResult]] = {}
+        with self._path.open() as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                results = [_load_result(r["type"], r["data"]) for r in record["results"]]
+                completed[record["index"]] = results if record["many"] else results[0]
+        return completed
+
+    def record(self, index: int, result: TrialResult | list[TrialResult]) -> None:
+        results = result if isinstance(result, list) else [result]
+        record = {
+            "index": index,
+            "many": isinstance(result, list),
+            "results": [
+                {"type": f"{type(r).__module__}.{type(r).__qualname__}", "data": r.model_dump(mode="json")}
+                for r in results
+            ],
+        }
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.open("a") as f:
+            f.write(json.dumps(record) + "\n")
+
+
+def _load_result(type_path: str, data: dict) -> TrialResult:
+    """Rebuild a recorded result as the TrialResult subclass it was written from.
+
+    The type path comes from the checkpoint file, so it is only matched against TrialResult subclasses
+    that are already loaded; nothing is imported on its behalf. Unknown types load as plain TrialResult.
+    """
+    result_type = _trial_result_types().get(type_path)
+    if result_type is None:
+        logger.warning(f"Checkpoint result type {type_path!r} is not a loaded TrialResult, loading as TrialResult")
+        result_type = TrialResult
+    return result_type.model_validate(data)
+
+
+def _trial_result_types() -> dict[str, type[TrialResult]]:
+    types: dict[str, type[TrialResult]] = {}
+    pending = [TrialResult]
+    while pending:
+        result_type = pending.pop()
+        types[f"{result_type.__module__}.{result_type.__qualname__}"] = result_type
+        pending.extend(result_type.__subclasses__())
+    return types
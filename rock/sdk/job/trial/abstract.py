@@ -28,6 +28,9 @@ class AbstractTrial(ABC):
     Trial does not manage sandbox lifecycle (managed by JobExecutor).
     """
 
+    # JobExecutor admits higher-priority trials first; equal priorities keep TrialList order.
+    priority: int = 0
+
     def __init__(self, config: JobConfig):
         self._config = config
 
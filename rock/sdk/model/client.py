@@ -1,8 +1,7 @@
-import asyncio
 import json
 import logging
+import os
 import time
-from pathlib import Path
 
 from rock.sdk.model.server.config import (
     LOG_FILE,
@@ -12,6 +11,7 @@ from rock.sdk.model.server.config import (
     RESPONSE_START_MARKER,
     SESSION_END_MARKER,
 )
+from rock.sdk.model.server.log_tail import LogTail, append_line
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,12 @@ class ModelClient:
             self.log_file = log_file_name
         else:
             self.log_file = LOG_FILE
+        # The CLI creates a client per call, so how far the log has been read is kept next to it on disk.
+        self._state_file = f"{self.log_file}.client.json"
+        self._tail = LogTail(self.log_file, reader="client", on_rewind=self._forget_lines)
+        self._last_request_line: str | None = None
+        self._last_response_line: str | None = None
+        self._load_state()
 
     async def anti_call_llm(self, index: int, last_response: str | None = None) -> str:
         """anti call llm, input is response of llm, output is the next request to llm"""
@@ -31,13 +37,17 @@ class ModelClient:
         if 0 == index:
             if last_response is not None:
                 raise ValueError("last_response must be None when index is 0")
-            await self.wait_for_first_request()
-            return await self.pop_request(index + 1)
-
-        if last_response is None:
+        elif last_response is None:
             raise ValueError("last_response must not be None when index is greater than 0")
-        await self.push_response(index=index, last_response=last_response)
-        return await self.pop_request(index + 1)
+
+        try:
+            if 0 == index:
+                await self.wait_for_first_request()
+            else:
+                await self.push_response(index=index, last_response=last_response)
+            return await self.pop_request(index + 1)
+        finally:
+            self._tail.close()
 
     async def push_response(self, index: int, last_response: str):
         content = await self._construct_response(last_response, index)
@@ -55,8 +65,7 @@ class ModelClient:
         await self._append_response(content)
 
     async def _append_response(self, content: str):
-        with open(self.log_file, "a") as f:
-            f.write(content)
+        append_line(self.log_file, content)
 
     async def pop_request(self, index: int) -> str:
         while True:
@@ -67,7 +76,7 @@ class ModelClient:
             if meta.get("index") == index:
                 return request_json
             logger.debug(f"Last request {last_request_line} is not the index {index} we want, waiting...")
-            await asyncio.sleep(1)
+            await self._tail.wait(1)
 
     async def parse_request_line(self, line_content: str) -> tuple[str, dict]:
         if SESSION_END_MARKER in line_content:
@@ -85,41 +94,63 @@ class ModelClient:
         return response_json, meta
 
     async def read_last_request_line(self) -> str:
-        with open(self.log_file) as f:
-            lines = f.readlines()
-            line_index = len(lines) - 1
-            while line_index >= 0:
-                line = lines[line_index]
-                if REQUEST_START_MARKER in line or SESSION_END_MARKER in line:
-                    return line
-                line_index -= 1
+        self._read_new_lines()
+        if self._last_request_line is None:
             raise ValueError(f"No request found in log file {self.log_file}")
+        return self._last_request_line
 
     async def read_last_response_line(self) -> str | None:
-        with open(self.log_file) as f:
-            lines = f.readlines()
-            line_index = len(lines) - 1
-            while line_index >= 0:
-                line = lines[line_index]
-                if RESPONSE_START_MARKER in line:
-                    return line
-                line_index -= 1
-            return None
+        self._read_new_lines()
+        return self._last_response_line
 
     async def wait_for_first_request(self):
         while True:
-            if not Path(self.log_file).exists():
+            try:
+                size = os.stat(self.log_file).st_size
+            except FileNotFoundError:
                 logger.debug(f"Log file {self.log_file} not found, waiting...")
-                await asyncio.sleep(1)
+                await self._tail.wait(1)
+                continue
+            if size == 0:
+                logger.debug(f"Log file {self.log_file} is empty, waiting for the first request...")
+                await self._tail.wait(1)
                 continue
-            with open(self.log_file) as f:
-                lines = f.readlines()
-                if len(lines) == 0:
-                    logger.debug(f"Log file {self.log_file} is empty, waiting for the first request...")
-                    await asyncio.sleep(1)
-                    continue
-                else:
-                    return
+            return
+
+    def _read_new_lines(self):
+        lines = self._tail.read_lines()
+        for line in lines:
+            if REQUEST_START_MARKER in line or SESSION_END_MARKER in line:
+                self._last_request_line = line
+            elif RESPONSE_START_MARKER in line:
+                self._last_response_line = line
+        if lines:
+            self._save_state()
+
+    def _forget_lines(self):
+        self._last_request_line = None
+        self._last_response_line = None
+
+    def _load_state(self):
+        try:
+            with open(self._state_file) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        self._tail.restore(state)
+        self._last_request_line = state.get("last_request_line")
+        self._last_response_line = state.get("last_response_line")
+
+    def _save_state(self):
+        state = {
+            **self._tail.state(),
+            "last_request_line": self._last_request_line,
+            "last_response_line": self._last_response_line,
+        }
+        tmp_file = f"{self._state_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_file, self._state_file)
 
     async def _construct_response(self, last_response: str, index: int) -> str:
         meta = {
@@ -15,6 +15,7 @@ from rock.sdk.model.server.config import (
     RESPONSE_START_MARKER,
     SESSION_END_MARKER,
 )
+from rock.sdk.model.server.log_tail import LogTail, append_line
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,14 @@ class FileHandler:
 
     def __init__(self, log_file: str = LOG_FILE):
         self.log_file = log_file
+        # All pollers share one tail: each new line is read once and handed to whichever request it answers.
+        self._tail = LogTail(log_file, reader="server", on_rewind=self._reset)
+        self._responses: dict[int, dict[str, Any]] = {}
+        self._session_ended = False
+
+    def _reset(self) -> None:
+        self._responses.clear()
+        self._session_ended = False
 
     def write_request(self, request_data: dict[str, Any], index: int) -> None:
         """
@@ -38,49 +47,30 @@ class FileHandler:
 
         line = f"{REQUEST_START_MARKER}{request_json}{REQUEST_END_MARKER}{meta_json}\n"
 
-        # Write with file locking
-        with open(self.log_file, "a") as f:
-            f.write(line)
-            f.flush()
+        append_line(self.log_file, line)
 
         logger.info(f"Wrote request with index {index} to log file")
 
     async def poll_for_response(self, request_index: int) -> dict[str, Any] | None:
         """
-        Poll log file for response matching the request index.
+        Wait for the response matching the request index, reading only lines appended since the last poll.
 
         Format: LLM_RESPONSE_START{json}LLM_RESPONSE_END{meta}
 
         Returns the response data or None if not found.
         """
-        # Keep track of file position to avoid re-reading entire file
-        last_position = 0
-
         while True:
             try:
-                with open(self.log_file) as f:
-                    # Seek to last read position
-                    f.seek(last_position)
-
-                    # Read new lines
-                    lines = f.readlines()
-                    last_position = f.tell()
-
-                    # Parse lines for response
-                    for line in lines:
-                        if RESPONSE_START_MARKER in line and RESPONSE_END_MARKER in line:
-                            response_data, meta = self._parse_response_line(line)
-                            if response_data and meta and meta.get("index") == request_index:
-                                logger.info(f"Found response for index {request_index}")
-                                return response_data
-
-                        # Check for session end
-                        if SESSION_END_MARKER in line:
-                            logger.info("Session ended")
-                            return None
-
-                # Wait before polling again (async sleep allows other requests to be processed)
-                await asyncio.sleep(POLLING_INTERVAL_SECONDS)
+                self._read_new_lines()
+                if request_index in self._responses:
+                    logger.info(f"Found response for index {request_index}")
+                    return self._responses.pop(request_index)
+                if self._session_ended:
+                    logger.info("Session ended")
+                    return None
+
+                # Wait for the next append (async wait allows other requests to be processed)
+                await self._tail.wait(POLLING_INTERVAL_SECONDS)
 
             except asyncio.CancelledError:
                 logger.info(f"Request {request_index} cancelled (client disconnected)")
@@ -89,6 +79,16 @@ class FileHandler:
                 logger.error(f"Error polling for response: {e}")
                 await asyncio.sleep(POLLING_INTERVAL_SECONDS)
 
+    def _read_new_lines(self) -> None:
+        """Parse lines appended since the last read into pending responses and the session end flag."""
+        for line in self._tail.read_lines():
+            if RESPONSE_START_MARKER in line and RESPONSE_END_MARKER in line:
+                response_data, meta = self._parse_response_line(line)
+                if response_data and meta and meta.get("index") is not None:
+                    self._responses[meta["index"]] = response_data
+            if SESSION_END_MARKER in line:
+                self._session_ended = True
+
     def _parse_response_line(self, line: str) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
         """
         Parse a response line to extract response data and meta.
@@ -119,8 +119,6 @@ class FileHandler:
 
     def write_session_end(self) -> None:
         """Write SESSION_END marker to log file."""
-        with open(self.log_file, "a") as f:
-            f.write(f"{SESSION_END_MARKER}\n")
-            f.flush()
+        append_line(self.log_file, f"{SESSION_END_MARKER}\n")
 
         logger.info("Wrote SESSION_END to log file")
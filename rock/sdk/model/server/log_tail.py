@@ -0,0 +1,168 @@
+"""Incremental reads and wakeups on the request/response log shared by the model service and ModelClient.
+
+Both sides append lines to one log file and wait for the other side's next line. Instead of
+rereading the whole file on a timer, each reader keeps the byte offset it has read up to and only
+reads what was appended since. Writers wake waiting readers with a datagram on a per-reader unix
+socket next to the log (``<log>.<reader>-<pid>.sock``). Wakeups are an optimization only: readers
+still re-check the file after ``poll_interval`` seconds, so a lost datagram (or a platform without
+unix sockets) only costs latency.
+"""
+
+import asyncio
+import contextlib
+import glob
+import logging
+import os
+import socket
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+# Bytes just before the read offset that must be unchanged for the offset to still be valid. They end
+# with the last line's timestamped meta, so a replaced log that reused the inode is still detected.
+_MARK_SIZE = 64
+
+_notify_socket: socket.socket | None = None
+
+
+def append_line(log_file: str, line: str) -> None:
+    """Append *line* (which must end with a newline) to *log_file* and wake its readers."""
+    with open(log_file, "a") as f:
+        f.write(line)
+        f.flush()
+    notify_readers(log_file)
+
+
+def notify_readers(log_file: str) -> None:
+    global _notify_socket
+    if not hasattr(socket, "AF_UNIX"):
+        return
+    if _notify_socket is None:
+        _notify_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        _notify_socket.setblocking(False)
+    for path in glob.glob(f"{glob.escape(log_file)}.*.sock"):
+        try:
+            _notify_socket.sendto(b"\0", path)
+        except BlockingIOError:
+            # The reader's buffer is full of earlier wakeups it has not consumed yet.
+            pass
+        except (ConnectionRefusedError, FileNotFoundError):
+            # Left behind by a reader that exited without cleaning up.
+            with contextlib.suppress(OSError):
+                os.unlink(path)
+        except OSError as e:
+            logger.debug(f"Failed to wake log reader {path}: {e}")
+
+
+class LogTail:
+    """Follows *log_file* from a byte offset, returning only complete lines appended since the last read.
+
+    The offset (and the inode it belongs to) can be saved with ``state()`` and handed to a later
+    ``LogTail`` with ``restore()``, so a reader in a short-lived process continues where the
+    previous one stopped. If the log is replaced or truncated (seen as a different inode, a shorter file, or
+    different bytes before the offset) the tail starts over from the beginning and calls *on_rewind*.
+    """
+
+    def __init__(self, log_file: str, reader: str, on_rewind: Callable[[], None] | None = None):
+        self.log_file = log_file
+        self.reader = reader
+        self.offset = 0
+        self._inode: int | None = None
+        self._mark = b""
+        self._on_rewind = on_rewind
+        self._sock: socket.socket | None = None
+        self._sock_path: str | None = None
+        self._wakeup: asyncio.Future | None = None
+        self._woken = False
+
+    def state(self) -> dict:
+        return {"offset": self.offset, "inode": self._inode, "mark": self._mark.hex()}
+
+    def restore(self, state: dict) -> None:
+        self.offset = state.get("offset", 0)
+        self._inode = state.get("inode")
+        self._mark = bytes.fromhex(state.get("mark", ""))
+
+    def read_lines(self) -> list[str]:
+        try:
+            f = open(self.log_file, "rb")
+        except FileNotFoundError:
+            return []
+        with f:
+            stat = os.fstat(f.fileno())
+            if stat.st_ino != self._inode or stat.st_size < self.offset or not self._mark_matches(f):
+                if self._inode is not None and self._on_rewind is not None:
+                    self._on_rewind()
+                self._inode, self.offset, self._mark = stat.st_ino, 0, b""
+            f.seek(self.offset)
+            data = f.read()
+        # A line still being written is left for the next read.
+        end = data.rfind(b"\n") + 1
+        if end:
+            self._mark = (self._mark + data[:end])[-_MARK_SIZE:]
+        self.offset += end
+        # Split on "\n" only: str.splitlines would also break on separators allowed inside the JSON payloads.
+        return data[:end].decode("utf-8").split("\n")[:-1]
+
+    def _mark_matches(self, f) -> bool:
+        f.seek(self.offset - len(self._mark))
+        return f.read(len(self._mark)) == self._mark
+
+    async def wait(self, poll_interval: float) -> None:
+        """Return once a writer signals new data, or after *poll_interval* seconds at the latest.
+
+        Several coroutines may wait on the same tail; one wakeup releases all of them.
+        """
+        if self._sock is None:
+            if self._listen():
+                # Appends made before the socket was bound sent no wakeup, so let the caller re-read first.
+                return
+            await asyncio.sleep(poll_interval)
+            return
+        if self._woken:
+            self._woken = False
+            return
+        if self._wakeup is None or self._wakeup.done():
+            self._wakeup = asyncio.get_running_loop().create_future()
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(asyncio.shield(self._wakeup), poll_interval)
+
+    def close(self) -> None:
+        if self._sock is not None:
+            with contextlib.suppress(Exception):
+                asyncio.get_running_loop().remove_reader(self._sock.fileno())
+            self._sock.close()
+            self._sock = None
+            with contextlib.suppress(OSError):
+                os.unlink(self._sock_path)
+
+    def _listen(self) -> bool:
+        """Bind the wakeup socket, retried on each wait until it succeeds (the log's directory may not exist yet)."""
+        if not hasattr(socket, "AF_UNIX"):
+            return False
+        self._sock_path = f"{self.log_file}.{self.reader}-{os.getpid()}.sock"
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._sock_path)
+            sock.bind(self._sock_path)
+            sock.setblocking(False)
+            asyncio.get_running_loop().add_reader(sock.fileno(), self._on_readable)
+        except (OSError, NotImplementedError) as e:
+            # e.g. a socket path over the platform limit, or an event loop without add_reader.
+            logger.debug(f"Log wakeups unavailable for {self.log_file}, polling instead: {e}")
+            sock.close()
+            with contextlib.suppress(OSError):
+                os.unlink(self._sock_path)
+            return False
+        self._sock = sock
+        return True
+
+    def _on_readable(self) -> None:
+        with contextlib.suppress(BlockingIOError):
+            while self._sock.recv(64):
+                pass
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+        else:
+            self._woken = True
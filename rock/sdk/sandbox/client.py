@@ -6,9 +6,11 @@ import os
 import time
 import uuid
 import warnings
+from collections.abc import AsyncIterator, Iterable
 from enum import Enum
 from pathlib import Path
 
+import httpx
 from httpx import ReadTimeout
 from typing_extensions import deprecated
 
@@ -16,6 +18,8 @@ from rock.actions import (
     AbstractSandbox,
     Action,
     BashAction,
+    BatchCommandResult,
+    BatchStopResult,
     CloseResponse,
     CloseSessionRequest,
     CloseSessionResponse,
@@ -33,9 +37,11 @@ from rock.actions import (
     UploadMode,
     UploadRequest,
     UploadResponse,
+    WaitProcessResponse,
     WriteFileRequest,
     WriteFileResponse,
 )
+from rock.actions.sandbox.response import DownloadFileResponse
 from rock.common.constants import PID_PREFIX, PID_SUFFIX
 from rock.sdk.common.constants import RunModeType
 from rock.sdk.common.exceptions import (
@@ -54,10 +60,34 @@ from rock.sdk.sandbox.oss_client import OssClient
 from rock.sdk.sandbox.process import Process
 from rock.sdk.sandbox.remote_user import LinuxRemoteUser, RemoteUser
 from rock.sdk.sandbox.runtime_env.base import RuntimeEnv, RuntimeEnvId
-from rock.utils import HttpUtils, extract_nohup_pid, retry_async
+from rock.utils import HttpClientPool, HttpUtils, extract_nohup_pid, retry_async
+from rock.utils.file_transfer import (
+    CHUNK_SHA256_HEADER,
+    FILE_SIZE_HEADER,
+    TRANSFER_CHUNK_SIZE,
+    aiter_file_range,
+    file_range_sha256,
+    finish_transfer,
+    partial_size,
+    sha256_hex,
+    write_chunk,
+)
 
 logger = logging.getLogger(__name__)
 
+WAIT_PROCESS_LONG_POLL_SECONDS = 60
+WAIT_PROCESS_READ_TIMEOUT_MARGIN = 30
+# Longest single /wait_ready long-poll during start; must stay within the server's limit.
+WAIT_READY_LONG_POLL_SECONDS = 60
+# Consecutive failed attempts at one chunk before an upload or download gives up.
+TRANSFER_CHUNK_RETRIES = 3
+# Delay before the first retry of a chunk; it doubles with every further failed attempt.
+TRANSFER_RETRY_DELAY_SECONDS = 0.5
+# Commands in flight at once when SandboxGroup.execute falls back to one request per sandbox.
+BATCH_EXECUTE_FALLBACK_CONCURRENCY = 32
+# Stops in flight at once when stop_sandboxes falls back to one request per sandbox.
+BATCH_STOP_FALLBACK_CONCURRENCY = 32
+
 
 class RunMode(str, Enum):
     NORMAL = "normal"
@@ -74,6 +104,7 @@ class Sandbox(AbstractSandbox):
     _cluster: str | None = None
     _namespace: str | None = None
     _experiment_id: str | None = None
+    _wait_ready_supported: bool = True
     agent: RockAgent | None = None
     model_service: ModelService | None = None
     remote_user: RemoteUser | None = None
@@ -223,8 +254,8 @@ class Sandbox(AbstractSandbox):
         self._host_ip = response.get("result").get("host_ip")
 
         start_time = time.time()
-        while time.time() - start_time < self.config.startup_timeout:
-            sandbox_info = await self.get_status()
+        while (remaining := self.config.startup_timeout - (time.time() - start_time)) > 0:
+            sandbox_info = await self._wait_ready(min(remaining, WAIT_READY_LONG_POLL_SECONDS))
             if sandbox_info.namespace is not None:
                 self._namespace = sandbox_info.namespace
             if sandbox_info.experiment_id is not None:
@@ -235,11 +266,32 @@ class Sandbox(AbstractSandbox):
             error_msg = await self._parse_error_message_from_status(sandbox_info.status)
             if error_msg:
                 raise InternalServerRockError(f"Failed to start sandbox because {error_msg}, sandbox: {str(self)}")
-            await asyncio.sleep(3)
         raise InternalServerRockError(
             f"Failed to start sandbox within {self.config.startup_timeout}s, sandbox: {str(self)}"
         )
 
+    async def _wait_ready(self, timeout: float) -> SandboxStatusResponse:
+        """Block until the sandbox is alive or failed to start, or for at most ``timeout`` seconds.
+
+        Admin servers without ``/wait_ready`` are polled through ``get_status`` instead.
+        """
+        if self._wait_ready_supported:
+            url = f"{self._url}/wait_ready?sandbox_id={self.sandbox_id}&timeout={max(timeout, 1.0):.1f}"
+            try:
+                response = await HttpUtils.get(url, self._build_headers())
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 404:
+                    raise
+                self._wait_ready_supported = False
+            else:
+                if "Success" != response.get("status"):
+                    raise Exception(f"Failed to wait for sandbox ready: {response}")
+                return SandboxStatusResponse(**response.get("result"))
+        sandbox_info = await self.get_status()
+        if not sandbox_info.is_alive:
+            await asyncio.sleep(min(3, timeout))
+        return sandbox_info
+
     async def is_alive(self) -> IsAliveResponse:
         try:
             status_response = await self.get_status()
@@ -701,15 +753,51 @@ class Sandbox(AbstractSandbox):
             return WriteFileResponse(success=False, message=f"Failed to write file {path}: upload response: {response}")
         return WriteFileResponse(success=True, message=f"Successfully write content to file {path}")
 
+    async def wait_process(self, pid: int, timeout: float = 60) -> WaitProcessResponse:
+        """Block on the sandbox side until `pid` exits or `timeout` seconds elapse."""
+        url = f"{self._url}/wait_process"
+        headers = self._build_headers()
+        data = {"sandbox_id": self.sandbox_id, "pid": pid, "timeout": timeout}
+        response = await HttpUtils.post(url, headers, data, read_timeout=timeout + WAIT_PROCESS_READ_TIMEOUT_MARGIN)
+        logging.debug(f"Wait process response: {response}")
+        if "Success" != response.get("status"):
+            raise Exception(f"Failed to wait process {pid}: {response}")
+        result: dict = response.get("result")  # type: ignore
+        return WaitProcessResponse(**result)
+
     async def wait_for_process_completion(
         self, pid: int, session: str, wait_timeout: int, wait_interval: int
     ) -> tuple[bool, str]:
         """
         Wait for process completion.
 
+        Long-polls the sandbox's wait_process endpoint, which returns as soon as the process
+        exits. Falls back to polling `kill -0` every `wait_interval` seconds when the endpoint
+        is unavailable (e.g. an older rocklet).
+
         Returns:
                 tuple[bool, str]: (success status, message)
         """
+        start_time = time.perf_counter()
+        end_time = start_time + wait_timeout
+        # Each long poll refreshes the sandbox expire time, so keep it below auto_clear_seconds.
+        long_poll_timeout = max(1, min(WAIT_PROCESS_LONG_POLL_SECONDS, self.config.auto_clear_seconds - 2))
+        try:
+            while (remaining := end_time - time.perf_counter()) > 0:
+                response = await self.wait_process(pid, timeout=min(remaining, long_poll_timeout))
+                if response.exited:
+                    elapsed = time.perf_counter() - start_time
+                    return True, f"Process completed successfully in {elapsed:.1f}s"
+            elapsed = time.perf_counter() - start_time
+            return False, f"Process {pid} did not complete within {elapsed:.1f}s (timeout: {wait_timeout}s)"
+        except Exception as e:
+            logger.info(f"wait_process unavailable for pid {pid}, falling back to polling: {e}")
+        remaining = max(1, math.ceil(end_time - time.perf_counter()))
+        return await self._poll_process_completion(pid, session, remaining, wait_interval)
+
+    async def _poll_process_completion(
+        self, pid: int, session: str, wait_timeout: int, wait_interval: int
+    ) -> tuple[bool, str]:
         wait_interval = max(5, wait_interval)  # Minimum interval 5 seconds
         wait_interval = min(self.config.auto_clear_seconds - 2, wait_interval)  # wait_interval < auto_clear_seconds
         check_alive_cmd = f"kill -0 {pid}"
@@ -802,38 +890,132 @@ class Sandbox(AbstractSandbox):
                     message="Failed to upload file, please setup oss bucket first",
                 )
             # Otherwise fall through to admin /upload (natural degradation for auto / default large files)
+        upload_response = None
+        if os.path.getsize(file_path) > TRANSFER_CHUNK_SIZE:
+            upload_response = await self._upload_in_chunks(file_path, target_path)
+        if upload_response is None:
+            upload_response = await self._upload_multipart(file_path, target_path)
+        if not upload_response.success:
+            return upload_response
+        # Admin /upload succeeded; opportunistically persist to OSS in background.
+        # Skipped silently when OSS is not configured/available.
+        # ensure_setup is idempotent and short-circuits when OSS is unavailable,
+        # so small-file-only flows still get a chance to bootstrap OSS persistence.
+        if await self._oss.ensure_setup() and self._oss.is_available:
+            await self._oss.schedule_async_persistence(path_str, target_path)
+        return upload_response
+
+    async def _upload_multipart(self, file_path: Path, target_path: str) -> UploadResponse:
         url = f"{self._url}/upload"
         headers = self._build_headers()
-
-        # Process file data
-        if isinstance(file_path, str | Path):
-            with open(file_path, "rb") as f:
-                file_content = f.read()
-
-            filename = file_path.name
-            content_type = mimetypes.guess_type(str(file_path))[0] or "application/octet-stream"
-
-        else:
-            return UploadResponse(success=False, message=f"Unsupported file input type: {type(file_path)}")
-
+        content_type = mimetypes.guess_type(str(file_path))[0] or "application/octet-stream"
         data = {
             "target_path": target_path,
             "sandbox_id": self.sandbox_id,
         }
-
-        files = {"file": (filename, file_content, content_type)}
-
-        response = await HttpUtils.post_multipart(url, headers, data=data, files=files)
+        # The open file is streamed by httpx rather than read into memory up front.
+        with open(file_path, "rb") as f:
+            files = {"file": (file_path.name, f, content_type)}
+            response = await HttpUtils.post_multipart(url, headers, data=data, files=files)
         logging.debug(f"Upload response: {response}")
         if "Success" != response.get("status"):
             return UploadResponse(success=False, message=f"Failed to execute command: upload response: {response}")
-        # Admin /upload succeeded; opportunistically persist to OSS in background.
-        # Skipped silently when OSS is not configured/available.
-        # ensure_setup is idempotent and short-circuits when OSS is unavailable,
-        # so small-file-only flows still get a chance to bootstrap OSS persistence.
-        if await self._oss.ensure_setup() and self._oss.is_available:
-            await self._oss.schedule_async_persistence(path_str, target_path)
-        return UploadResponse(success=True, message=f"Successfully uploaded file {filename} to {target_path}")
+        return UploadResponse(success=True, message=f"Successfully uploaded file {file_path.name} to {target_path}")
+
+    async def _upload_in_chunks(
+        self, file_path: Path, target_path: str, extract: bool = False
+    ) -> UploadResponse | None:
+        """Upload *file_path* one sha256-checked chunk at a time, so memory use does not grow with the file.
+
+        Resumes from whatever part of the file the sandbox already holds. Returns None when the
+        server predates chunked uploads.
+        """
+        headers = self._build_headers()
+        params = {"sandbox_id": self.sandbox_id, "target_path": target_path}
+        try:
+            offset = await self._upload_offset(params)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            raise
+        size = file_path.stat().st_size
+        if offset > size:
+            offset = 0
+        failures = 0
+        while True:
+            length = min(TRANSFER_CHUNK_SIZE, size - offset)
+            sha256 = await asyncio.to_thread(file_range_sha256, file_path, offset, length)
+            final = offset + length >= size
+            chunk_params = {**params, "offset": offset, "sha256": sha256, "final": final, "extract": extract}
+            # Hash first, then stream the range from disk, so the chunk is never held in memory whole.
+            body = aiter_file_range(file_path, offset, length)
+            try:
+                response = await HttpUtils.post_content(f"{self._url}/upload_chunk", headers, body, chunk_params)
+            except httpx.HTTPError as e:
+                response = {"error": str(e)}
+            result = response.get("result") or {}
+            if response.get("status") == "Success" and result.get("success"):
+                if final:
+                    return UploadResponse(
+                        success=True, message=f"Successfully uploaded file {file_path.name} to {target_path}"
+                    )
+                offset, failures = result["offset"], 0
+                continue
+            failures += 1
+            if failures > TRANSFER_CHUNK_RETRIES:
+                return UploadResponse(success=False, message=f"Failed to upload chunk at offset {offset}: {response}")
+            await asyncio.sleep(TRANSFER_RETRY_DELAY_SECONDS * 2 ** (failures - 1))
+            # A rejected chunk reports where the sandbox stands; after a lost request, ask.
+            try:
+                offset = result["offset"] if "offset" in result else await self._upload_offset(params)
+            except httpx.HTTPError:
+                pass
+
+    async def _upload_offset(self, params: dict) -> int:
+        response = await HttpUtils.get(f"{self._url}/upload_status", self._build_headers(), params=params)
+        if response.get("status") != "Success":
+            raise InternalServerRockError(f"Failed to get upload status: {response}")
+        return response["result"]["offset"]
+
+    async def download_by_path(self, remote_path: str, local_path: str | Path) -> DownloadFileResponse:
+        """Download a sandbox file over HTTP one sha256-checked chunk at a time.
+
+        An interrupted download resumes from the ``<local_path>.rock-part`` file it left behind.
+        """
+        local_path = Path(local_path)
+        url = f"{self._url}/download"
+        headers = self._build_headers()
+        offset = partial_size(local_path)
+        failures = 0
+        while True:
+            params = {"sandbox_id": self.sandbox_id, "path": remote_path, "offset": offset}
+            try:
+                response = await HttpUtils.get_content(url, headers, params=params)
+                # Failures come back as a JSON RockResponse instead of file bytes.
+                error = None if CHUNK_SHA256_HEADER in response.headers else response.text
+            except httpx.HTTPError as e:
+                error = str(e)
+            if error is None and sha256_hex(response.content) != response.headers[CHUNK_SHA256_HEADER]:
+                error = f"sha256 mismatch for chunk at {offset}"
+            if error is not None:
+                failures += 1
+                if failures > TRANSFER_CHUNK_RETRIES:
+                    return DownloadFileResponse(success=False, message=f"Failed to download {remote_path}: {error}")
+                await asyncio.sleep(TRANSFER_RETRY_DELAY_SECONDS * 2 ** (failures - 1))
+                continue
+            failures = 0
+            size = int(response.headers[FILE_SIZE_HEADER])
+            if offset > size:
+                # The remote file shrank since the partial download started.
+                offset = 0
+                continue
+            await asyncio.to_thread(write_chunk, local_path, offset, response.content)
+            offset += len(response.content)
+            if offset >= size:
+                await asyncio.to_thread(finish_transfer, local_path)
+                return DownloadFileResponse(
+                    success=True, message=f"Successfully downloaded {remote_path} to {local_path}"
+                )
 
     async def read_file(self, request: ReadFileRequest) -> ReadFileResponse:
         url = f"{self._url}/read_file"
@@ -1017,8 +1199,142 @@ class SandboxGroup:
         )
 
     async def stop(self):
-        tasks = [sandbox.stop() for sandbox in self.sandbox_list]
-        await asyncio.gather(
-            *tasks, return_exceptions=True
-        )  # Use return_exceptions=True to ensure continuation even if some fail
-        logging.info(f"Stopped {len(self.sandbox_list)} sandboxes")
+        failed = [result async for result in stop_sandboxes(self.sandbox_list) if result.error]
+        for result in failed:
+            logging.warning(f"Failed to stop sandbox {result.sandbox_id}, IGNORE: {result.error}")
+        logging.info(f"Stopped {len(self.sandbox_list) - len(failed)} sandboxes")
+
+    async def execute(self, command: Command) -> AsyncIterator[BatchCommandResult]:
+        """Run *command* in every started sandbox of the group, yielding each result as soon as it completes.
+
+        The admin server fans the command out and streams the results back over a single request.
+        Servers without ``/batch_execute`` get one ``execute`` request per sandbox instead.
+        """
+        sandboxes = {sandbox.sandbox_id: sandbox for sandbox in self.sandbox_list if sandbox.sandbox_id}
+        if not sandboxes:
+            return
+        sandbox = next(iter(sandboxes.values()))
+        url = f"{sandbox.url}/batch_execute"
+        data = {
+            "command": command.command,
+            "sandbox_ids": list(sandboxes),
+            "timeout": command.timeout,
+            "cwd": command.cwd,
+            "env": command.env,
+        }
+        # No read timeout: the next result may be a whole command's runtime away.
+        timeout = httpx.Timeout(timeout=300.0, read=None)
+        async with HttpClientPool.stream(
+            "POST", url, headers=sandbox._build_headers(), json=data, timeout=timeout
+        ) as response:
+            if response.status_code != 404:
+                response.raise_for_status()
+                if not response.headers.get("content-type", "").startswith("application/x-ndjson"):
+                    raise Exception(f"Failed to batch execute command {data}, response: {await response.aread()}")
+                async for line in response.aiter_lines():
+                    if line:
+                        yield BatchCommandResult.model_validate_json(line)
+                return
+
+        semaphore = asyncio.Semaphore(BATCH_EXECUTE_FALLBACK_CONCURRENCY)
+
+        async def execute_one(sandbox_id: str, sandbox: Sandbox) -> BatchCommandResult:
+            async with semaphore:
+                try:
+                    return BatchCommandResult(sandbox_id=sandbox_id, result=await sandbox.execute(command))
+                except Exception as e:
+                    return BatchCommandResult(sandbox_id=sandbox_id, error=str(e))
+
+        for next_done in asyncio.as_completed([execute_one(*item) for item in sandboxes.items()]):
+            yield await next_done
+
+
+async def stop_sandboxes(sandboxes: Iterable[Sandbox]) -> AsyncIterator[BatchStopResult]:
+    """Stop every started sandbox in *sandboxes*, yielding each outcome as soon as it is known.
+
+    Sandboxes behind the same admin server and cluster are stopped with one ``/batch_stop`` request, which the
+    server tears down in parallel. Servers without it get one ``stop`` request per sandbox instead. Never raises
+    for a failed stop or an unreachable server: every sandbox gets a result, with ``error`` set if it failed.
+    """
+    batches: dict[tuple[str, str | None], dict[str, Sandbox]] = {}
+    for sandbox in sandboxes:
+        if sandbox.sandbox_id:
+            batches.setdefault((sandbox.url, sandbox._cluster), {})[sandbox.sandbox_id] = sandbox
+    streams = [_batch_stop(batch) for batch in batches.values()]
+    if len(streams) == 1:
+        async for result in streams[0]:
+            yield result
+        return
+
+    queue: asyncio.Queue[BatchStopResult | None] = asyncio.Queue()
+
+    async def drain(stream: AsyncIterator[BatchStopResult]) -> None:
+        try:
+            async for result in stream:
+                await queue.put(result)
+        finally:
+            await queue.put(None)
+
+    tasks = [asyncio.create_task(drain(stream)) for stream in streams]
+    try:
+        pending = len(tasks)
+        while pending:
+            result = await queue.get()
+            if result is None:
+                pending -= 1
+            else:
+                yield result
+        await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _batch_stop(sandboxes: dict[str, Sandbox]) -> AsyncIterator[BatchStopResult]:
+    sandbox = next(iter(sandboxes.values()))
+    url = f"{sandbox.url}/batch_stop"
+    data = {"sandbox_ids": list(sandboxes)}
+    # No read timeout: a large batch can take a while between results.
+    timeout = httpx.Timeout(timeout=300.0, read=None)
+    reported: set[str] = set()
+    try:
+        async with HttpClientPool.stream(
+            "POST", url, headers=sandbox._build_headers(), json=data, timeout=timeout
+        ) as response:
+            if response.status_code != 404:
+                response.raise_for_status()
+                if not response.headers.get("content-type", "").startswith("application/x-ndjson"):
+                    raise Exception(f"unexpected batch_stop response: {await response.aread()}")
+                async for line in response.aiter_lines():
+                    if line:
+                        result = BatchStopResult.model_validate_json(line)
+                        reported.add(result.sandbox_id)
+                        yield result
+                error = "no stop result returned by the server"
+            else:
+                error = None
+    except Exception as e:
+        logging.warning(f"Failed to batch stop sandboxes at {url}: {e}")
+        error = f"Failed to batch stop sandboxes: {e}"
+    if error is not None:
+        for sandbox_id in sandboxes:
+            if sandbox_id not in reported:
+                yield BatchStopResult(sandbox_id=sandbox_id, error=error)
+        return
+
+    semaphore = asyncio.Semaphore(BATCH_STOP_FALLBACK_CONCURRENCY)
+
+    async def stop_one(sandbox_id: str, sandbox: Sandbox) -> BatchStopResult:
+        async with semaphore:
+            try:
+                response = await HttpUtils.post(
+                    f"{sandbox.url}/stop", sandbox._build_headers(), {"sandbox_id": sandbox_id}
+                )
+            except Exception as e:
+                return BatchStopResult(sandbox_id=sandbox_id, error=str(e))
+            if "Success" != response.get("status"):
+                return BatchStopResult(sandbox_id=sandbox_id, error=f"Failed to stop sandbox: {response}")
+            return BatchStopResult(sandbox_id=sandbox_id)
+
+    for next_done in asyncio.as_completed([stop_one(*item) for item in sandboxes.items()]):
+        yield await next_done
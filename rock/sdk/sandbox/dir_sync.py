@@ -0,0 +1,356 @@
+"""Incremental directory sync behind LinuxFileSystem.upload_dir.
+
+A sync compares a manifest of the local directory with one of the target directory, which a single
+``find`` call lists in the sandbox: entry type, size, mtime and permission bits, plus a sha256 from
+both ends for files whose size matches but whose mtime does not. Only new and changed entries are
+sent, packed into tar archives of at most ``ARCHIVE_BYTES`` that are packed, uploaded and extracted
+in parallel. Remote entries that no longer exist locally are deleted, and entries whose content is
+current but whose permission bits differ are chmod-ed. Already compressed files (by suffix) go
+into uncompressed archives whatever the chosen compression.
+
+Sandboxes whose ``find`` cannot print a manifest (e.g. busybox) get the whole directory, replacing
+the target directory as upload_dir always did.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import shlex
+import stat
+import tarfile
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+from rock.actions.sandbox.base import AbstractSandbox
+from rock.actions.sandbox.request import Command
+from rock.logger import init_logger
+from rock.utils.file_transfer import file_range_sha256
+
+logger = init_logger(__name__)
+
+Compression = Literal["gzip", "zstd", "none"]
+
+# Upper bound on the file bytes packed into one archive; larger files get an archive of their own.
+ARCHIVE_BYTES = 64 * 1024 * 1024
+# Archives packed, uploaded and extracted at once.
+SYNC_CONCURRENCY = 4
+# Paths per remote rm / sha256sum command, well below ARG_MAX.
+PATHS_PER_COMMAND = 512
+GZIP_LEVEL = 6
+COMPRESSED_SUFFIXES = frozenset(
+    {
+        ".7z", ".bz2", ".gif", ".gz", ".jar", ".jpeg", ".jpg", ".lz4", ".mp3", ".mp4", ".parquet",
+        ".png", ".rar", ".tgz", ".webp", ".whl", ".xz", ".zip", ".zst",
+    }
+)  # fmt: skip
+
+# Prints "zstd" or "-" (whether the sandbox can decompress zstd), then one NUL-separated
+# type/size/mtime/mode/path/link-target record per entry under the target directory, creating it first.
+_MANIFEST_SCRIPT = r"""
+command -v tar >/dev/null 2>&1 || exit 3
+mkdir -p "$1" && cd "$1" || exit 4
+if command -v zstd >/dev/null 2>&1; then printf 'zstd\0'; else printf -- '-\0'; fi
+find . -mindepth 1 -printf '%y\0%s\0%T@\0%m\0%P\0%l\0'
+"""
+_NO_TAR = 3
+_SUFFIXES = {"gzip": ".tar.gz", "zstd": ".tar.zst", "none": ".tar"}
+_EXTRACT = {
+    "gzip": "tar -xzf {archive} -C {target}",
+    "zstd": "zstd -dc {archive} | tar -xf - -C {target}",
+    "none": "tar -xf {archive} -C {target}",
+}
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    kind: str
+    """Entry type as printed by find's ``%y``: "f" file, "d" directory, "l" symlink."""
+    size: int = 0
+    mtime: int = 0
+    """Milliseconds. The pax archives sent here keep sub-second mtimes, to about a microsecond."""
+    link: str = ""
+    """Symlink target."""
+    mode: int = 0
+    """Permission bits (``st_mode & 0o7777``); not kept for symlinks, whose mode cannot be set."""
+
+
+Manifest = dict[str, ManifestEntry]
+
+
+@dataclass
+class SyncPlan:
+    send: list[str] = field(default_factory=list)
+    """Local entries to send, parents before children."""
+    verify: list[str] = field(default_factory=list)
+    """Files of equal size but different mtime; sent only if their sha256 differs."""
+    delete: list[str] = field(default_factory=list)
+    """Remote entries to remove first; none is inside another."""
+    chmod: list[str] = field(default_factory=list)
+    """Entries not sent whose permission bits differ, chmod-ed after the archives are extracted."""
+    unchanged: int = 0
+
+
+@dataclass
+class SyncStats:
+    files_sent: int = 0
+    bytes_sent: int = 0
+    """Archive bytes uploaded."""
+    archives: int = 0
+    deleted: int = 0
+    chmodded: int = 0
+    unchanged: int = 0
+    full: bool = False
+    """Whether the target had no usable manifest and was replaced whole."""
+
+
+def local_manifest(root: Path) -> Manifest:
+    """Manifest of *root*, keyed by POSIX path relative to it. Special files are skipped."""
+    manifest: Manifest = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        base = Path(dirpath)
+        for name in [*dirnames, *filenames]:
+            path = base / name
+            st = path.lstat()
+            rel = path.relative_to(root).as_posix()
+            if stat.S_ISLNK(st.st_mode):
+                manifest[rel] = ManifestEntry("l", link=os.readlink(path))
+            elif stat.S_ISDIR(st.st_mode):
+                manifest[rel] = ManifestEntry("d", mode=stat.S_IMODE(st.st_mode))
+            elif stat.S_ISREG(st.st_mode):
+                manifest[rel] = ManifestEntry(
+                    "f", st.st_size, round(st.st_mtime_ns / 1e6), mode=stat.S_IMODE(st.st_mode)
+                )
+    return manifest
+
+
+def parse_remote_manifest(output: str) -> tuple[bool, Manifest]:
+    """Parse ``_MANIFEST_SCRIPT`` output into (sandbox has zstd, manifest)."""
+    fields = output.split("\0")
+    manifest: Manifest = {}
+    for i in range(1, len(fields) - 5, 6):
+        kind, size, mtime, mode, path, link = fields[i : i + 6]
+        if kind == "f":
+            manifest[path] = ManifestEntry("f", int(size), round(float(mtime) * 1000), mode=int(mode, 8))
+        elif kind == "l":
+            manifest[path] = ManifestEntry("l", link=link)
+        else:
+            manifest[path] = ManifestEntry(kind, mode=int(mode, 8))
+    return fields[0] == "zstd", manifest
+
+
+def plan_sync(local: Manifest, remote: Manifest) -> SyncPlan:
+    plan = SyncPlan()
+    replaced: set[str] = set()
+    for path, entry in local.items():
+        theirs = remote.get(path)
+        if theirs is None:
+            plan.send.append(path)
+        elif theirs.kind != entry.kind or (entry.kind == "l" and theirs.link != entry.link):
+            replaced.add(path)
+            plan.send.append(path)
+        elif entry.kind == "f" and entry.size != theirs.size:
+            plan.send.append(path)
+        else:
+            if entry.kind == "f" and entry.mtime != theirs.mtime:
+                plan.verify.append(path)
+            if entry.mode != theirs.mode:
+                plan.chmod.append(path)
+            elif entry.kind != "f" or entry.mtime == theirs.mtime:
+                plan.unchanged += 1
+    deleted: set[str] = set()
+    for path in sorted(replaced.union(p for p in remote if p not in local)):
+        parts = path.split("/")
+        if not any("/".join(parts[:i]) in deleted for i in range(1, len(parts))):
+            deleted.add(path)
+            plan.delete.append(path)
+    return plan
+
+
+def split_archives(paths: list[str], local: Manifest, archive_bytes: int) -> list[tuple[list[str], bool]]:
+    """Group *paths* into ``(paths, compress)`` archives of at most *archive_bytes* of file data each."""
+    archives: list[tuple[list[str], bool]] = []
+    for compress in (True, False):
+        batch: list[str] = []
+        size = 0
+        for path in paths:
+            if (Path(path).suffix.lower() not in COMPRESSED_SUFFIXES) != compress:
+                continue
+            entry_size = local[path].size
+            if batch and size + entry_size > archive_bytes:
+                archives.append((batch, compress))
+                batch, size = [], 0
+            batch.append(path)
+            size += entry_size
+        if batch:
+            archives.append((batch, compress))
+    return archives
+
+
+def write_archive(root: Path, paths: list[str], dest: Path, compression: Compression) -> None:
+    """Write *paths* (relative to *root*, not recursing into directories) to a tar at *dest*."""
+    if compression == "zstd":
+        zstandard = _zstandard()
+        with open(dest, "wb") as raw, zstandard.ZstdCompressor().stream_writer(raw) as out:
+            with tarfile.open(fileobj=out, mode="w|") as tf:
+                _add_all(tf, root, paths)
+        return
+    if compression == "gzip":
+        tf = tarfile.open(dest, "w:gz", compresslevel=GZIP_LEVEL)
+    else:
+        tf = tarfile.open(dest, "w")
+    with tf:
+        _add_all(tf, root, paths)
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstandard is required for zstd compression. Install it with: pip install zstandard")
+    return zstandard
+
+
+def _sha256(path: Path) -> str:
+    return file_range_sha256(path, 0, path.stat().st_size)
+
+
+def _add_all(tf: tarfile.TarFile, root: Path, paths: list[str]) -> None:
+    for path in paths:
+        tf.add(str(root / path), arcname=path, recursive=False)
+
+
+class DirSync:
+    """Syncs a local directory into a sandbox directory.
+
+    Usage:
+        stats = await DirSync(sandbox, compression="zstd").run(Path("./repo"), "/workspace/repo")
+    """
+
+    def __init__(
+        self,
+        sandbox: AbstractSandbox,
+        compression: Compression = "gzip",
+        extract_timeout: int = 600,
+        concurrency: int = SYNC_CONCURRENCY,
+        archive_bytes: int = ARCHIVE_BYTES,
+    ):
+        if compression not in _SUFFIXES:
+            raise ValueError(f"compression must be one of {list(_SUFFIXES)}, got {compression!r}")
+        if compression == "zstd":
+            _zstandard()
+        self._sandbox = sandbox
+        self._compression: Compression = compression
+        self._extract_timeout = extract_timeout
+        self._concurrency = concurrency
+        self._archive_bytes = archive_bytes
+
+    async def run(self, source: Path, target_dir: str) -> SyncStats:
+        listing, local = await asyncio.gather(
+            self._sandbox.execute(Command(command=["sh", "-c", _MANIFEST_SCRIPT, "sh", target_dir])),
+            asyncio.to_thread(local_manifest, source),
+        )
+        if listing.exit_code == _NO_TAR:
+            raise Exception("sandbox has no tar command; cannot extract tarball")
+        stats = SyncStats(full=listing.exit_code != 0)
+        if stats.full:
+            logger.warning(f"No manifest of {target_dir} (exit code {listing.exit_code}), replacing it whole")
+            has_zstd, remote = False, {}
+            await self._run(["sh", "-c", 'rm -rf "$1" && mkdir -p "$1"', "sh", target_dir], "clear target_dir")
+        else:
+            has_zstd, remote = parse_remote_manifest(listing.stdout)
+
+        plan = plan_sync(local, remote)
+        if plan.verify:
+            await self._verify(source, target_dir, plan)
+        stats.unchanged = plan.unchanged
+
+        for i in range(0, len(plan.delete), PATHS_PER_COMMAND):
+            paths = [f"{target_dir.rstrip('/')}/{path}" for path in plan.delete[i : i + PATHS_PER_COMMAND]]
+            await self._run(["rm", "-rf", "--", *paths], "delete")
+        stats.deleted = len(plan.delete)
+
+        compression = self._compression
+        if compression == "zstd" and not has_zstd:
+            logger.warning("Sandbox has no zstd, falling back to gzip")
+            compression = "gzip"
+        semaphore = asyncio.Semaphore(self._concurrency)
+        archives = split_archives(plan.send, local, self._archive_bytes)
+        sizes = await asyncio.gather(
+            *[
+                self._transfer(source, target_dir, index, paths, compression if compress else "none", semaphore)
+                for index, (paths, compress) in enumerate(archives)
+            ]
+        )
+        stats.files_sent = len(plan.send)
+        stats.bytes_sent = sum(sizes)
+        stats.archives = len(archives)
+
+        by_mode: dict[int, list[str]] = {}
+        for path in plan.chmod:
+            by_mode.setdefault(local[path].mode, []).append(f"{target_dir.rstrip('/')}/{path}")
+        for mode, paths in by_mode.items():
+            for i in range(0, len(paths), PATHS_PER_COMMAND):
+                await self._run(["chmod", f"{mode:o}", "--", *paths[i : i + PATHS_PER_COMMAND]], "chmod")
+        stats.chmodded = len(plan.chmod)
+        return stats
+
+    async def _verify(self, source: Path, target_dir: str, plan: SyncPlan) -> None:
+        """Move files whose sha256 matches on both ends from ``plan.verify`` to unchanged (or chmod), the rest to send."""
+        remote: dict[str, str] = {}
+        for i in range(0, len(plan.verify), PATHS_PER_COMMAND):
+            paths = plan.verify[i : i + PATHS_PER_COMMAND]
+            response = await self._sandbox.execute(Command(command=["sha256sum", "--", *paths], cwd=target_dir))
+            for line in response.stdout.splitlines():
+                digest, _, path = line.partition("  ")
+                remote[path] = digest
+        chmod = set(plan.chmod)
+        for path in plan.verify:
+            if remote.get(path) != await asyncio.to_thread(_sha256, source / path):
+                plan.send.append(path)
+                chmod.discard(path)
+            elif path not in chmod:
+                plan.unchanged += 1
+        plan.chmod = [path for path in plan.chmod if path in chmod]
+
+    async def _transfer(
+        self,
+        source: Path,
+        target_dir: str,
+        index: int,
+        paths: list[str],
+        compression: Compression,
+        semaphore: asyncio.Semaphore,
+    ) -> int:
+        from rock.sdk.sandbox.client import RunMode
+
+        async with semaphore:
+            name = f"rock_sync_{time.time_ns()}_{index}{_SUFFIXES[compression]}"
+            local_path = Path(tempfile.gettempdir()) / name
+            remote_path = f"/tmp/{name}"
+            try:
+                await asyncio.to_thread(write_archive, source, paths, local_path, compression)
+                size = local_path.stat().st_size
+                upload_response = await self._sandbox.upload_by_path(file_path=str(local_path), target_path=remote_path)
+                if not upload_response.success:
+                    raise Exception(f"tar upload failed: {upload_response.message}")
+                extract = _EXTRACT[compression].format(archive=shlex.quote(remote_path), target=shlex.quote(target_dir))
+                extract_cmd = f"set -o pipefail; {extract}; rc=$?; rm -f {shlex.quote(remote_path)}; exit $rc"
+                res = await self._sandbox.arun(
+                    cmd=f"bash -c {shlex.quote(extract_cmd)}",
+                    mode=RunMode.NOHUP,
+                    wait_timeout=self._extract_timeout,
+                )
+                if res.exit_code != 0:
+                    raise Exception(f"tar extract failed: {res.output}")
+                return size
+            finally:
+                local_path.unlink(missing_ok=True)
+
+    async def _run(self, command: list[str], what: str) -> None:
+        response = await self._sandbox.execute(Command(command=command))
+        if response.exit_code != 0:
+            raise Exception(f"{what} failed: {response.stderr}")
@@ -1,16 +1,14 @@
-import shlex
-import tarfile
-import tempfile
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 
-from rock.actions import CreateBashSessionRequest, Observation
+from rock.actions import Observation
 from rock.actions.sandbox.base import AbstractSandbox
 from rock.actions.sandbox.request import ChmodRequest, ChownRequest, Command
 from rock.actions.sandbox.response import ChmodResponse, ChownResponse, CommandResponse, DownloadFileResponse
 from rock.logger import init_logger
 from rock.sdk.sandbox.constants import ENSURE_OSSUTIL_SCRIPT
+from rock.sdk.sandbox.dir_sync import Compression, DirSync
 
 logger = init_logger(__name__)
 
@@ -35,6 +33,7 @@ class FileSystem(ABC):
         source_dir: str | Path,
         target_dir: str,
         extract_timeout: int = 600,
+        compression: Compression = "gzip",
     ) -> Observation:
         pass
 
@@ -88,23 +87,21 @@ class LinuxFileSystem(FileSystem):
         source_dir: str | Path,
         target_dir: str,
         extract_timeout: int = 600,
+        compression: Compression = "gzip",
     ) -> Observation:
-        """Upload local directory to sandbox using tar.gz (simple version).
+        """Make target_dir in the sandbox a copy of a local directory, sending only what changed.
 
-        - Create a random bash session internally
-        - Check 'tar' exists; if not, return Observation with exit_code != 0
-        - Pack source_dir fully into a tar.gz locally
-        - Upload to sandbox /tmp
-        - Extract into target_dir
-        - Always cleanup local tar.gz
+        - Compare the local directory with target_dir by path, type, size, mtime, permission bits
+          and, where size matches but mtime does not, sha256 (see rock.sdk.sandbox.dir_sync)
+        - Delete remote entries that no longer exist locally, chmod those whose permission bits differ
+        - Pack new and changed entries into tar archives (``compression``: "gzip", "zstd" or
+          "none"; already compressed files are never recompressed), then upload and extract
+          them in parallel
+        - Sandboxes that cannot list target_dir get the whole directory, as before
 
         Returns:
             Observation(exit_code=0) on success, otherwise exit_code!=0 with failure_reason.
         """
-        local_tar_path: Path | None = None
-        remote_tar_path: str | None = None
-        session: str | None = None
-
         try:
             src = Path(source_dir).expanduser().resolve()
             if not src.exists():
@@ -114,70 +111,21 @@ class LinuxFileSystem(FileSystem):
             if not isinstance(target_dir, str) or not target_dir.startswith("/"):
                 return Observation(exit_code=1, failure_reason=f"target_dir must be absolute path: {target_dir}")
 
-            ts = str(time.time_ns())
-            local_tar_path = Path(tempfile.gettempdir()) / f"rock_upload_{ts}.tar.gz"
-            remote_tar_path = f"/tmp/rock_upload_{ts}.tar.gz"
-            session = f"bash-{ts}"
-
-            # create bash session
-            await self.sandbox.create_session(CreateBashSessionRequest(session=session))
-
-            # check tar exists
-            check = await self.sandbox.arun(
-                cmd="command -v tar >/dev/null 2>&1",
-                session=session,
-            )
-            if check.exit_code != 0:
-                return Observation(exit_code=1, failure_reason="sandbox has no tar command; cannot extract tarball")
-
-            # pack locally
-            try:
-                with tarfile.open(local_tar_path, "w:gz") as tf:
-                    tf.add(str(src), arcname=".")
-            except Exception as e:
-                raise Exception(f"tar pack failed: {e}")
-
-            # upload tarball
-            upload_response = await self.sandbox.upload_by_path(
-                file_path=str(local_tar_path), target_path=remote_tar_path
-            )
-            if not upload_response.success:
-                return Observation(exit_code=1, failure_reason=f"tar upload failed: {upload_response.message}")
-
-            # extract
-            extract_cmd = (
-                f"rm -rf {shlex.quote(target_dir)} && mkdir -p {shlex.quote(target_dir)} && "
-                f"tar -xzf {shlex.quote(remote_tar_path)} -C {shlex.quote(target_dir)}"
+            stats = await DirSync(self.sandbox, compression=compression, extract_timeout=extract_timeout).run(
+                src, target_dir
             )
-            from rock.sdk.sandbox.client import RunMode
-
-            res = await self.sandbox.arun(
-                cmd=f"bash -c {shlex.quote(extract_cmd)}",
-                mode=RunMode.NOHUP,
-                wait_timeout=extract_timeout,
+            return Observation(
+                exit_code=0,
+                output=(
+                    f"uploaded {src} -> {target_dir}: {stats.files_sent} entries sent in {stats.archives} archives "
+                    f"({stats.bytes_sent} bytes), {stats.deleted} deleted, {stats.chmodded} chmodded, "
+                    f"{stats.unchanged} unchanged"
+                ),
             )
-            if res.exit_code != 0:
-                return Observation(exit_code=1, failure_reason=f"tar extract failed: {res.output}")
-
-            # cleanup remote tarball
-            try:
-                await self.sandbox.execute(Command(command=["rm", "-f", remote_tar_path]))
-            except Exception:
-                pass
-
-            return Observation(exit_code=0, output=f"uploaded {src} -> {target_dir} via tar")
 
         except Exception as e:
             return Observation(exit_code=1, failure_reason=f"upload_dir unexpected error: {e}")
 
-        finally:
-            # cleanup local tarball
-            try:
-                if local_tar_path and local_tar_path.exists():
-                    local_tar_path.unlink()
-            except Exception:
-                pass
-
     async def download_file(
         self,
         remote_path: str,
@@ -19,6 +19,7 @@ from .docker import (
     ImageUtil,
 )
 from .http import (
+    HttpClientPool,
     HttpUtils,
     wait_until_alive,
 )
@@ -32,6 +33,7 @@ from .retry import (
 from .system import (
     extract_nohup_pid,
     find_free_port,
+    find_free_ports,
     get_host_ip,
     get_instance_id,
     get_uniagent_endpoint,
@@ -58,6 +60,7 @@ __all__ = [
     "run_shell_command",
     "extract_nohup_pid",
     "find_free_port",
+    "find_free_ports",
     "refresh_docker_used_ports",
     "release_port",
     "get_instance_id",
@@ -76,6 +79,7 @@ __all__ = [
     "FileUtil",
     "ListUtil",
     # HTTP utilities
+    "HttpClientPool",
     "HttpUtils",
     "wait_until_alive",
     # Docker utilities
@@ -4,6 +4,7 @@ import concurrent.futures
 import signal
 import threading
 import time
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Generic, TypeVar
@@ -15,6 +16,7 @@ _thread_pool = None
 _thread_pool_lock = threading.Lock()
 _global_executor: ThreadPoolExecutor | None = None
 MAX_WORKERS = 300
+_stage_listeners: list[Callable[[str, str, float], None]] = []
 
 
 def _get_thread_pool():
@@ -44,6 +46,8 @@ def _run_in_new_loop(coro):
     try:
         return new_loop.run_until_complete(coro)
     finally:
+        # As asyncio.run does; this also closes the loop's pooled HTTP clients.
+        new_loop.run_until_complete(new_loop.shutdown_asyncgens())
         new_loop.close()
 
 
@@ -98,7 +102,19 @@ class Timer:
 
 
 class StageTimer:
-    """Context manager that logs elapsed time for a named stage."""
+    """Context manager that logs elapsed time for a named stage.
+
+    Listeners registered with ``add_listener`` are also called with ``(phase, description, seconds)``
+    for every stage that finishes in this process, e.g. to aggregate startup timings in benchmarks.
+    """
+
+    @staticmethod
+    def add_listener(listener: Callable[[str, str, float], None]) -> None:
+        _stage_listeners.append(listener)
+
+    @staticmethod
+    def remove_listener(listener: Callable[[str, str, float], None]) -> None:
+        _stage_listeners.remove(listener)
 
     def __init__(self, phase: str, description: str, logger):
         self._phase = phase
@@ -113,6 +129,8 @@ class StageTimer:
     def __exit__(self, exc_type, exc_val, exc_tb):
         duration = time.perf_counter() - self._start_time
         self._logger.info(f"[{self._phase}] {self._description} took {duration:.3f} s")
+        for listener in _stage_listeners:
+            listener(self._phase, self._description, duration)
         return False
 
 
@@ -191,9 +209,13 @@ class RayUtil:
         return alive_worker_nodes
 
     @staticmethod
-    async def async_ray_get(ray_future):
-        """Async wrapper for ray.get"""
-        import ray
+    def as_asyncio_future(ray_future) -> asyncio.Future:
+        """Bridge an ObjectRef to an asyncio future resolved by Ray's completion callback (no worker thread)"""
+        return asyncio.wrap_future(ray_future.future())
 
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(get_executor(), ray.get, ray_future)
+    @staticmethod
+    async def async_ray_get(ray_future):
+        """Await an ObjectRef, or a list of them, on the running event loop"""
+        if isinstance(ray_future, list):
+            return list(await asyncio.gather(*[RayUtil.as_asyncio_future(ref) for ref in ray_future]))
+        return await RayUtil.as_asyncio_future(ray_future)
@@ -0,0 +1,171 @@
+"""Chunked, resumable file transfer between the SDK, the proxy and the rocklet.
+
+A file travels as a sequence of chunks, one request each, tagged with the byte offset it starts at
+and the sha256 of its bytes. The rocklet streams every chunk straight to ``<target>.rock-part``
+next to the target and moves it into place (or extracts it, for archives) once the final chunk
+lands. An interrupted transfer resumes from the size of the partial file. Downloads mirror this:
+each requested range comes back with its sha256 and the total file size in response headers.
+
+Chunks are streamed in ``STREAM_BUFFER_SIZE`` pieces on every hop, so memory use does not depend on
+the chunk or file size.
+"""
+
+import asyncio
+import hashlib
+import os
+import tarfile
+import zipfile
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+
+TRANSFER_CHUNK_SIZE = 8 * 1024 * 1024
+STREAM_BUFFER_SIZE = 1024 * 1024
+PARTIAL_SUFFIX = ".rock-part"
+
+FILE_SIZE_HEADER = "X-Rock-File-Size"
+CHUNK_SHA256_HEADER = "X-Rock-Chunk-Sha256"
+
+
+def partial_path(target_path: str | Path) -> Path:
+    """Where the bytes of an unfinished transfer to *target_path* are kept."""
+    target_path = Path(target_path)
+    return target_path.with_name(target_path.name + PARTIAL_SUFFIX)
+
+
+def partial_size(target_path: str | Path) -> int:
+    """Bytes of *target_path* received so far, i.e. the offset the next chunk must start at."""
+    try:
+        return partial_path(target_path).stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_range_sha256(path: str | Path, offset: int, length: int) -> str:
+    digest = hashlib.sha256()
+    for data in iter_file_range(path, offset, length):
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def iter_file_range(
+    path: str | Path, offset: int, length: int, buffer_size: int = STREAM_BUFFER_SIZE
+) -> Iterator[bytes]:
+    """Yield up to *length* bytes of *path* starting at *offset*, *buffer_size* bytes at a time."""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        while length > 0:
+            data = f.read(min(buffer_size, length))
+            if not data:
+                return
+            length -= len(data)
+            yield data
+
+
+async def aiter_file_range(
+    path: str | Path, offset: int, length: int, buffer_size: int = STREAM_BUFFER_SIZE
+) -> AsyncIterator[bytes]:
+    """Async variant of `iter_file_range` that reads off the event loop, for use as a request body."""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        while length > 0:
+            data = await asyncio.to_thread(f.read, min(buffer_size, length))
+            if not data:
+                return
+            length -= len(data)
+            yield data
+
+
+class ChunkWriter:
+    """Writes one chunk into the partial file of a transfer, hashing it on the way.
+
+    The chunk overwrites anything already stored at or after *offset*; ``discard`` cuts the
+    partial file back to *offset* so a corrupt chunk leaves no trace.
+    """
+
+    def __init__(self, target_path: str | Path, offset: int):
+        self.path = partial_path(target_path)
+        self.offset = offset
+        self.written = 0
+        self._digest = hashlib.sha256()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "r+b" if offset else "wb")
+        self._file.seek(offset)
+        self._file.truncate()
+
+    def write(self, data: bytes) -> None:
+        self._digest.update(data)
+        self._file.write(data)
+        self.written += len(data)
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+    def discard(self) -> None:
+        self._file.truncate(self.offset)
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def write_chunk(target_path: str | Path, offset: int, data: bytes) -> None:
+    """Store *data* at *offset* of the partial file of *target_path*."""
+    writer = ChunkWriter(target_path, offset)
+    try:
+        writer.write(data)
+    finally:
+        writer.close()
+
+
+def finish_transfer(target_path: str | Path, extract: bool = False) -> None:
+    """Move the completed partial file to *target_path*, or extract it there when it is an archive."""
+    target_path = Path(target_path)
+    part = partial_path(target_path)
+    if not extract:
+        os.replace(part, target_path)
+        return
+    try:
+        extract_archive(part, target_path)
+    finally:
+        part.unlink(missing_ok=True)
+
+
+def extract_archive(archive: str | Path, target_dir: str | Path) -> None:
+    """Extract a zip or (optionally compressed) tar archive member by member, without loading it whole."""
+    target_dir = Path(target_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    if zipfile.is_zipfile(archive):
+        with zipfile.ZipFile(archive) as zf:
+            zf.extractall(target_dir)
+    else:
+        with tarfile.open(archive, "r:*") as tf:
+            if hasattr(tarfile, "data_filter"):
+                tf.extractall(target_dir, filter="data")
+            else:
+                # Python < 3.10.12 / 3.11.4 has no extraction filters.
+                for member in tf:
+                    _check_tar_member(member, target_dir)
+                    tf.extract(member, target_dir)
+
+
+def _check_tar_member(member: tarfile.TarInfo, target_dir: Path) -> None:
+    """Refuse members that would land, or link, outside *target_dir*, like tarfile's "data" filter."""
+    root = target_dir.resolve()
+    name = Path(member.name)
+    parent = (root / name).parent.resolve()
+    if name.is_absolute() or ".." in name.parts or not parent.is_relative_to(root):
+        raise tarfile.TarError(f"refusing to extract {member.name!r} outside {target_dir}")
+    if member.isdev() or member.isfifo():
+        raise tarfile.TarError(f"refusing to extract special file {member.name!r}")
+    if member.issym():
+        link_target = (parent / member.linkname).resolve()
+    elif member.islnk():
+        link_target = (root / member.linkname).resolve()
+    else:
+        return
+    if os.path.isabs(member.linkname) or not link_target.is_relative_to(root):
+        raise tarfile.TarError(f"refusing to extract link {member.name!r} -> {member.linkname!r} outside {target_dir}")
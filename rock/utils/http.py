@@ -1,15 +1,180 @@
 import asyncio
+import contextlib
+import importlib.util
 import logging
+import math
 import mimetypes
 import ssl
 import time
-from collections.abc import Callable
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Callable
 from typing import BinaryIO
 
 import certifi
 import httpx
 from httpx import Response
 
+from rock import env_vars
+
+
+class _HostPool:
+    """Connection-pooled clients for a single ``scheme://host:port``.
+
+    httpcore re-scans every pooled connection each time a request is queued or
+    released, so one client with hundreds of connections spends more time
+    scheduling than sending. Connections to a host are therefore striped over
+    several small clients, created lazily once the existing ones are saturated.
+    For the same reason requests beyond ``max_connections`` wait here, on a
+    semaphore, rather than in httpcore's request queue.
+    """
+
+    CONNECTIONS_PER_CLIENT = 8
+
+    def __init__(self, max_connections: int):
+        self._connections_per_client = max(1, min(self.CONNECTIONS_PER_CLIENT, max_connections))
+        self._max_clients = max(1, math.ceil(max_connections / self._connections_per_client))
+        self._clients: list[httpx.AsyncClient] = []
+        self._in_flight: list[int] = []
+        self._slots = asyncio.Semaphore(max_connections)
+
+    def _new_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            verify=HttpUtils._SHARED_SSL_CONTEXT,
+            http2=HttpClientPool.http2_available(),
+            timeout=httpx.Timeout(timeout=300.0, connect=300.0, read=300.0),
+            limits=httpx.Limits(
+                max_connections=self._connections_per_client,
+                max_keepalive_connections=self._connections_per_client,
+                keepalive_expiry=env_vars.ROCK_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
+
+    def _acquire(self) -> int:
+        index = min(range(len(self._clients)), key=self._in_flight.__getitem__, default=-1)
+        if index < 0 or (
+            self._in_flight[index] >= self._connections_per_client and len(self._clients) < self._max_clients
+        ):
+            self._clients.append(self._new_client())
+            self._in_flight.append(0)
+            index = len(self._clients) - 1
+        self._in_flight[index] += 1
+        return index
+
+    async def request(self, method: str, url: str, **kwargs) -> Response:
+        async with self._slots:
+            index = self._acquire()
+            # aclose may swap the lists out while this request is in flight; count against the ones it started on.
+            client, in_flight = self._clients[index], self._in_flight
+            try:
+                return await client.request(method, url, **kwargs)
+            finally:
+                in_flight[index] -= 1
+
+    @contextlib.asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs) -> AsyncIterator[Response]:
+        async with self._slots:
+            index = self._acquire()
+            client, in_flight = self._clients[index], self._in_flight
+            try:
+                async with client.stream(method, url, **kwargs) as response:
+                    yield response
+            finally:
+                in_flight[index] -= 1
+
+    async def aclose(self) -> None:
+        clients, self._clients, self._in_flight = self._clients, [], []
+        await asyncio.gather(*[client.aclose() for client in clients], return_exceptions=True)
+
+
+class HttpClientPool:
+    """Long-lived, keep-alive HTTP transport shared by every caller on an event loop.
+
+    httpx clients are bound to the event loop they first run on, so a single
+    module-level client cannot be shared between SDK callers that use
+    ``asyncio.run`` repeatedly and Ray actors that own their own loops. The pool
+    keeps one set of per-host clients per running loop. The clients hold their
+    loop alive, so a loop's clients are closed by ``aclose``, or when the loop
+    shuts down its async generators as ``asyncio.run`` does; loops closed without
+    that are dropped the next time a new loop is seen.
+
+    Connections are kept alive between requests, HTTP/2 is negotiated over TLS
+    when the optional ``h2`` package is installed, and each host gets at most
+    ``ROCK_HTTP_MAX_CONNECTIONS_PER_HOST`` concurrent connections.
+    """
+
+    _loops: "dict[asyncio.AbstractEventLoop, dict[str, _HostPool]]" = {}
+    _shutdown_hooks: "dict[asyncio.AbstractEventLoop, AsyncGenerator[None, None]]" = {}
+
+    @staticmethod
+    def http2_available() -> bool:
+        return env_vars.ROCK_HTTP2_ENABLE and importlib.util.find_spec("h2") is not None
+
+    @classmethod
+    def get_host_pool(cls, url: str) -> _HostPool:
+        """Return the pool of the url's host on the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        host_pools = cls._loops.get(loop)
+        if host_pools is None:
+            cls._forget_closed_loops()
+            host_pools = cls._loops[loop] = {}
+            cls._close_at_shutdown(loop)
+        parsed = httpx.URL(url)
+        key = f"{parsed.scheme}://{parsed.netloc.decode('ascii')}"
+        host_pool = host_pools.get(key)
+        if host_pool is None:
+            host_pool = host_pools[key] = _HostPool(env_vars.ROCK_HTTP_MAX_CONNECTIONS_PER_HOST)
+        return host_pool
+
+    @classmethod
+    def _forget_closed_loops(cls) -> None:
+        """Drop the clients of loops that were closed without shutting their async generators down."""
+        for loop in [loop for loop in list(cls._loops) if loop.is_closed()]:
+            cls._loops.pop(loop, None)
+            cls._retire_shutdown_hook(loop)
+
+    @classmethod
+    def _close_at_shutdown(cls, loop: asyncio.AbstractEventLoop) -> None:
+        """Close the loop's clients from ``loop.shutdown_asyncgens()``, which ``asyncio.run`` calls before closing it."""
+
+        async def hook() -> AsyncGenerator[None, None]:
+            try:
+                yield
+            finally:
+                if cls._shutdown_hooks.pop(loop, None) is not None:
+                    await cls.aclose()
+
+        # Stepping it once registers the generator with the running loop; nothing is awaited before the yield.
+        cls._shutdown_hooks[loop] = gen = hook()
+        with contextlib.suppress(StopIteration):
+            gen.asend(None).send(None)
+
+    @classmethod
+    def _retire_shutdown_hook(cls, loop: asyncio.AbstractEventLoop) -> None:
+        """Finish the loop's hook without running it, so it is not left for the loop's async generator finalizer."""
+        hook = cls._shutdown_hooks.pop(loop, None)
+        if hook is not None:
+            with contextlib.suppress(StopIteration):
+                hook.aclose().send(None)
+
+    @classmethod
+    async def request(cls, method: str, url: str, **kwargs) -> Response:
+        """Send a request through the pooled connections of the running event loop."""
+        return await cls.get_host_pool(url).request(method, url, **kwargs)
+
+    @classmethod
+    @contextlib.asynccontextmanager
+    async def stream(cls, method: str, url: str, **kwargs) -> AsyncIterator[Response]:
+        """Like :meth:`request`, but the body is read lazily from the yielded response."""
+        async with cls.get_host_pool(url).stream(method, url, **kwargs) as response:
+            yield response
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close every pooled connection of the running event loop."""
+        loop = asyncio.get_running_loop()
+        host_pools = cls._loops.pop(loop, {})
+        cls._retire_shutdown_hook(loop)
+        await asyncio.gather(*[host_pool.aclose() for host_pool in host_pools.values()])
+
 
 class HttpUtils:
     """HTTP client utilities"""
@@ -20,31 +185,70 @@ class HttpUtils:
     @staticmethod
     async def post(url: str, headers: dict, data: dict, read_timeout: float = 300.0) -> dict:
         """Send POST request"""
-        async with httpx.AsyncClient(
-            verify=HttpUtils._SHARED_SSL_CONTEXT,
-            timeout=httpx.Timeout(timeout=300.0, connect=300.0, read=read_timeout if read_timeout else 300.0),
-        ) as client:
-            try:
-                response: Response = await client.post(url, headers=headers, json=data)
-                response.raise_for_status()
-                return response.json()
-            except Exception as e:
-                logging.exception(f"Failed to post to {url}: {e}")
-                raise e
+        try:
+            response: Response = await HttpClientPool.request(
+                "POST",
+                url,
+                headers=headers,
+                json=data,
+                timeout=httpx.Timeout(timeout=300.0, connect=300.0, read=read_timeout if read_timeout else 300.0),
+            )
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            logging.exception(f"Failed to post to {url}: {e}")
+            raise e
 
     @staticmethod
-    async def get(url: str, headers: dict) -> dict:
+    async def get(url: str, headers: dict, params: dict | None = None) -> dict:
         """Send GET request"""
-        async with httpx.AsyncClient(
-            verify=HttpUtils._SHARED_SSL_CONTEXT, timeout=httpx.Timeout(timeout=300.0, connect=300.0, read=300.0)
-        ) as client:
-            try:
-                response: Response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                return response.json()
-            except Exception as e:
+        try:
+            response: Response = await HttpClientPool.request("GET", url, headers=headers, params=params)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            # A 404 is left to the caller: clients probe endpoints that older servers do not have.
+            if e.response.status_code != 404:
                 logging.exception(f"Failed to get from {url}: {e}")
-                raise e
+            raise e
+        except Exception as e:
+            logging.exception(f"Failed to get from {url}: {e}")
+            raise e
+
+    @staticmethod
+    async def post_content(
+        url: str,
+        headers: dict,
+        content: bytes | AsyncIterable[bytes],
+        params: dict | None = None,
+        read_timeout: float = 300.0,
+    ) -> dict:
+        """Send POST request with a raw binary body, streamed when given as an async iterable"""
+        try:
+            response: Response = await HttpClientPool.request(
+                "POST",
+                url,
+                headers={**headers, "Content-Type": "application/octet-stream"},
+                params=params,
+                content=content,
+                timeout=httpx.Timeout(timeout=300.0, connect=300.0, read=read_timeout if read_timeout else 300.0),
+            )
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            logging.exception(f"Failed to post content to {url}: {e}")
+            raise e
+
+    @staticmethod
+    async def get_content(url: str, headers: dict, params: dict | None = None) -> Response:
+        """Send GET request and return the raw response, for binary bodies"""
+        try:
+            response: Response = await HttpClientPool.request("GET", url, headers=headers, params=params)
+            response.raise_for_status()
+            return response
+        except Exception as e:
+            logging.exception(f"Failed to get content from {url}: {e}")
+            raise e
 
     @staticmethod
     async def post_multipart(
@@ -70,36 +274,38 @@ class HttpUtils:
         Returns:
             Response JSON data
         """
-        async with httpx.AsyncClient(
-            verify=HttpUtils._SHARED_SSL_CONTEXT, timeout=httpx.Timeout(timeout=300.0, connect=300.0, read=300.0)
-        ) as client:
-            try:
-                # Build multipart data
-                multipart_data = {}
-                multipart_files = {}
-
-                # Add form fields
-                if data:
-                    for key, value in data.items():
-                        if value is not None:
-                            multipart_data[key] = str(value)
-
-                # Add file fields
-                if files:
-                    for field_name, file_data in files.items():
-                        if file_data is not None:
-                            multipart_files[field_name] = HttpUtils._process_file_data(file_data)
-
-                # Send request
-                response: httpx.Response = await client.post(
-                    url, headers=headers, data=multipart_data, files=multipart_files
-                )
-                response.raise_for_status()
-                return response.json()
-
-            except Exception as e:
-                logging.exception(f"Failed to post multipart to {url}: {e}")
-                raise e
+        try:
+            # Build multipart data
+            multipart_data = {}
+            multipart_files = {}
+
+            # Add form fields
+            if data:
+                for key, value in data.items():
+                    if value is not None:
+                        multipart_data[key] = str(value)
+
+            # Add file fields
+            if files:
+                for field_name, file_data in files.items():
+                    if file_data is not None:
+                        multipart_files[field_name] = HttpUtils._process_file_data(file_data)
+
+            # Send request
+            response: httpx.Response = await HttpClientPool.request(
+                "POST", url, headers=headers, data=multipart_data, files=multipart_files
+            )
+            response.raise_for_status()
+            return response.json()
+
+        except Exception as e:
+            logging.exception(f"Failed to post multipart to {url}: {e}")
+            raise e
+
+    @staticmethod
+    async def aclose() -> None:
+        """Release the pooled connections of the running event loop."""
+        await HttpClientPool.aclose()
 
     @staticmethod
     def _process_file_data(file_data: BinaryIO | bytes | tuple) -> tuple:
@@ -129,13 +335,10 @@ class HttpUtils:
             return ("file", file_data, "application/octet-stream")
 
         elif hasattr(file_data, "read"):
-            # File object
-            content = file_data.read()
+            # File object: httpx streams it in chunks, so it is not read into memory here
             filename = getattr(file_data, "name", "file")
-            if hasattr(file_data, "seek"):
-                file_data.seek(0)  # Reset file pointer
             content_type = HttpUtils._guess_content_type(filename)
-            return (filename, content, content_type)
+            return (filename, file_data, content_type)
 
         else:
             raise ValueError(f"Unsupported file data type: {type(file_data)}")
@@ -1,6 +1,8 @@
+from collections.abc import AsyncIterator
 from typing import Any
 
 import redis
+from redis.asyncio.client import Pipeline
 from redis.commands.json import JSON
 
 from rock.logger import init_logger
@@ -54,6 +56,15 @@ class RedisProvider:
             raise RuntimeError("RedisManager is not initialized. Please call 'init_pool()' first.")
         return self.client
 
+    def pipeline(self, transaction: bool = True) -> Pipeline:
+        """
+        Create a pipeline: queued commands are sent in one round trip on ``await pipe.execute()``.
+
+        :param transaction: Wrap the queued commands in MULTI/EXEC so they apply atomically.
+        Usage: async with provider.pipeline() as pipe: pipe.json().set(...); await pipe.execute()
+        """
+        return self._ensure_client().pipeline(transaction=transaction)
+
     # --- RedisJSON functionality encapsulation ---
 
     @property
@@ -185,3 +196,52 @@ class RedisProvider:
         except Exception as e:
             logger.error(f"Error on JSON MGET for keys '{keys}': {e}", exc_info=True)
             raise
+
+    # --- Hashes ---
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        """
+        Get all fields and values of the hash at *key*; an empty dict if it does not exist.
+        """
+        logger.debug(f"HGETALL on key '{key}'")
+        return await self._ensure_client().hgetall(key)
+
+    # --- Sorted sets ---
+
+    async def zrange_by_score(self, key: str, max_score: float, count: int, exclusive: bool = False) -> list[str]:
+        """
+        Get up to *count* members of the sorted set at *key* with the lowest scores, all at most *max_score*.
+
+        :param exclusive: Only return members scored strictly below *max_score*.
+        """
+        logger.debug(f"ZRANGEBYSCORE on key '{key}' up to {max_score}")
+        upper = f"({max_score}" if exclusive else max_score
+        return await self._ensure_client().zrangebyscore(key, "-inf", upper, start=0, num=count)
+
+    # --- Pub/Sub ---
+
+    async def publish(self, channel: str, message: str) -> int:
+        """
+        Publish a message to a channel.
+
+        :return: Number of subscribers that received the message.
+        """
+        logger.debug(f"PUBLISH on channel '{channel}'")
+        return await self._ensure_client().publish(channel, message)
+
+    async def subscribe(self, channel: str, idle_timeout: float = 1.0) -> AsyncIterator[str | None]:
+        """
+        Yield messages published to *channel* until the consumer stops iterating.
+
+        Yields None whenever nothing arrived within *idle_timeout* seconds, so the consumer can check
+        for shutdown without relying on cancelling a pending pub/sub read.
+        """
+        pubsub = self._ensure_client().pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(channel)
+        try:
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=idle_timeout)
+                yield message["data"] if message is not None and message.get("type") == "message" else None
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
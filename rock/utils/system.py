@@ -6,7 +6,6 @@ import os
 import re
 import socket
 import subprocess
-import time
 import zoneinfo
 from pathlib import Path
 
@@ -203,13 +202,55 @@ async def find_free_port(max_attempts: int = 10, sleep_between_attempts: float =
                 logger.debug(f"Found free port {port}")
                 return port
             logger.debug(
-                f"Port {port} already registered or held by docker, " f"trying again after {sleep_between_attempts}s"
+                f"Port {port} already registered or held by docker, trying again after {sleep_between_attempts}s"
             )
-        time.sleep(sleep_between_attempts)
+        await asyncio.sleep(sleep_between_attempts)
     msg = f"Failed to find a unique free port after {max_attempts} attempts"
     raise RuntimeError(msg)
 
 
+def find_free_ports(count: int, max_attempts: int = 10) -> list[int]:
+    """Find *count* distinct free ports in one pass, with the same guarantees as ``find_free_port``.
+
+    Every candidate socket stays bound until the batch is complete, so the kernel never hands out
+    the same port twice and a rejected port is not offered again; no sleep between retries is needed.
+
+    Args:
+        count: Number of ports to allocate
+        max_attempts: Maximum number of rejected candidates before giving up
+
+    Returns:
+        List of available port numbers
+
+    Raises:
+        RuntimeError: If unable to find enough free ports within max_attempts rejections
+    """
+    cached = set(_DOCKER_USED_PORTS)
+    ports: list[int] = []
+    held: list[socket.socket] = []
+    rejected = 0
+    try:
+        while len(ports) < count:
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            held.append(s)
+            s.bind(("", 0))
+            port = s.getsockname()[1]
+            if port in _REGISTERED_PORTS or port in cached:
+                rejected += 1
+                if rejected >= max_attempts:
+                    msg = f"Failed to find {count} unique free ports after {max_attempts} attempts"
+                    raise RuntimeError(msg)
+                logger.debug(f"Port {port} already registered or held by docker, trying again")
+                continue
+            ports.append(port)
+    finally:
+        for s in held:
+            s.close()
+    _REGISTERED_PORTS.update(ports)
+    logger.debug(f"Found free ports {ports}")
+    return ports
+
+
 def release_port(port: int):
     """Release a previously registered port
 
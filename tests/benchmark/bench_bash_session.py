@@ -0,0 +1,70 @@
+"""Per-command latency of the rocklet BashSession running `echo` in a loop: previous protocol vs. current.
+
+The previous protocol, reproduced below on the same shell, ran a `bash -n` subprocess per command,
+fetched the exit code with a second `echo $?` write/read, and paid pexpect's default 50ms delay before
+each write. The current one validates with bashlex and reads the exit code from the prompt.
+
+Usage:
+    python -m tests.benchmark.bench_bash_session --commands 200
+"""
+
+import argparse
+import asyncio
+import re
+import statistics
+import time
+from copy import deepcopy
+
+from rock.admin.proto.request import SandboxBashAction as BashAction
+from rock.admin.proto.request import SandboxCreateBashSessionRequest as CreateBashSessionRequest
+from rock.rocklet.linux import BashSession, _check_bash_command, _split_bash_command, _strip_control_chars
+
+
+def _legacy_run(session: BashSession, action: BashAction) -> int:
+    """The previous BashSession._run_normal, minus its error handling."""
+    action = deepcopy(action)
+    _check_bash_command(action.command)
+    session.shell.sendline(" ; ".join(_split_bash_command(action.command)))
+    session.shell.expect(session._PROMPT_RE, timeout=action.timeout)
+    session.refresh_shell()
+    session.shell.sendline("\necho EXITCODESTART$?EXITCODEEND")
+    session.shell.expect("EXITCODEEND", timeout=1)
+    exit_code = int(re.findall("EXITCODESTART([0-9]+)", _strip_control_chars(session.shell.before))[0])
+    session.shell.expect(session._PROMPT_RE, timeout=0.1)
+    session.refresh_shell()
+    return exit_code
+
+
+async def _measure(label: str, run, commands: int) -> float:
+    latencies = []
+    for i in range(commands):
+        start = time.perf_counter()
+        await run(BashAction(command=f"echo {i}", session="bench", sandbox_id="bench"))
+        latencies.append(time.perf_counter() - start)
+    p50 = statistics.median(latencies) * 1000
+    p99 = statistics.quantiles(latencies, n=100)[98] * 1000
+    print(f"{label:<18} p50 {p50:8.2f} ms   p99 {p99:8.2f} ms")
+    return p50
+
+
+async def main(commands: int):
+    session = BashSession(CreateBashSessionRequest(session="bench", sandbox_id="bench", startup_timeout=30))
+    await session.start()
+    loop = asyncio.get_running_loop()
+    try:
+        session.shell.delaybeforesend = 0.05
+        before = await _measure(
+            "previous protocol", lambda action: loop.run_in_executor(None, _legacy_run, session, action), commands
+        )
+        session.shell.delaybeforesend = None
+        after = await _measure("single round trip", session.run, commands)
+    finally:
+        await session.close()
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--commands", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.commands))
@@ -0,0 +1,98 @@
+"""Time to cancel a job's sandboxes: one /stop request per sandbox vs. a single bulk /batch_stop request.
+
+The SDK talks to the real sandbox API and SandboxManager in-process (meta store over FakeRedis and
+in-memory SQLite); only the operator is fake, and its stop takes ``--stop-latency`` seconds. The bulk
+path's floor is the per-stop CPU work in this process (state machine, meta store stand-ins), which the
+batch does not parallelise.
+
+Usage:
+    python -m tests.benchmark.bench_batch_stop --sandboxes 1000 --stop-latency 0.05 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+from fastapi import FastAPI
+
+from rock.actions.sandbox.response import State
+from rock.admin.entrypoints import sandbox_api
+from rock.common.constants import StopReason
+from rock.config import RockConfig
+from rock.sandbox.sandbox_manager import SandboxManager
+from rock.sdk.sandbox.client import Sandbox, stop_sandboxes
+from rock.sdk.sandbox.config import SandboxConfig
+from rock.utils import HttpClientPool
+from rock.utils.http import _HostPool
+from tests.benchmark.lifecycle.standins import meta_store
+
+
+class FakeOperator:
+    def __init__(self, stop_latency: float):
+        self.stop_latency = stop_latency
+        self.stopped = 0
+
+    async def stop(self, sandbox_id: str, reason: StopReason = StopReason.MANUAL) -> bool:
+        await asyncio.sleep(self.stop_latency)
+        self.stopped += 1
+        return True
+
+
+async def _cancel_seconds(bulk: bool, sandboxes: int, stop_latency: float, concurrency: int) -> float:
+    rock_config = RockConfig()
+    rock_config.runtime.batch_stop_concurrency = concurrency
+    operator = FakeOperator(stop_latency)
+    async with meta_store(rock_config) as store:
+        with patch("rock.sandbox.base_manager.BaseManager._setup_scheduler"):
+            manager = SandboxManager(
+                rock_config,
+                meta_store=store,
+                ray_namespace="bench",
+                ray_service=MagicMock(),
+                operator=operator,
+            )
+        clients = []
+        for index in range(sandboxes):
+            sandbox_id = f"sbx-{index}"
+            await store.create(sandbox_id, {"sandbox_id": sandbox_id, "state": State.RUNNING, "host_ip": "127.0.0.1"})
+            client = Sandbox(SandboxConfig(base_url="http://admin"))
+            client._sandbox_id = sandbox_id
+            clients.append(client)
+
+        app = FastAPI()
+        app.include_router(sandbox_api.sandbox_router, prefix="/apis/envs/sandbox/v1")
+        sandbox_api.set_sandbox_manager(manager)
+        with patch.object(
+            _HostPool, "_new_client", lambda self: httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+        ):
+            start = time.perf_counter()
+            if bulk:
+                async for _ in stop_sandboxes(clients):
+                    pass
+            else:
+                for client in clients:
+                    await client.stop()
+            elapsed = time.perf_counter() - start
+            await HttpClientPool.aclose()
+        await manager.aclose()
+    assert operator.stopped == sandboxes
+    return elapsed
+
+
+async def main(sandboxes: int, stop_latency: float, concurrency: int):
+    one_by_one = await _cancel_seconds(False, sandboxes, stop_latency, concurrency)
+    bulk = await _cancel_seconds(True, sandboxes, stop_latency, concurrency)
+    print(f"{sandboxes} sandboxes, {stop_latency * 1000:.0f} ms per operator stop")
+    print(f"one /stop per sandbox: {one_by_one:8.2f} s")
+    print(f"bulk /batch_stop:      {bulk:8.2f} s  ({one_by_one / bulk:.1f}x, concurrency {concurrency})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sandboxes", type=int, default=1000)
+    parser.add_argument("--stop-latency", type=float, default=0.05, help="fake operator stop latency, seconds")
+    parser.add_argument("--concurrency", type=int, default=32, help="runtime.batch_stop_concurrency")
+    args = parser.parse_args()
+    asyncio.run(main(args.sandboxes, args.stop_latency, args.concurrency))
@@ -0,0 +1,137 @@
+"""Bytes sent and wall time of re-uploading a large directory after a one-line edit: whole tar.gz vs. delta sync.
+
+The whole-tarball path is the previous upload_dir, reproduced below: pack the directory into one tar.gz,
+upload it, then ``rm -rf`` the target and extract. The delta path is the current LinuxFileSystem.upload_dir.
+Both run against a sandbox stand-in that executes commands on this machine and copies uploads, so the
+times are local packing/extraction cost and the byte counts are what would cross the network.
+
+Usage:
+    python -m tests.benchmark.bench_dir_sync --size-mb 1024 --file-kb 256 --compression gzip
+"""
+
+import argparse
+import asyncio
+import os
+import shlex
+import shutil
+import subprocess
+import tarfile
+import tempfile
+import time
+from pathlib import Path
+
+from rock.actions import Observation
+from rock.actions.sandbox.request import Command
+from rock.actions.sandbox.response import CommandResponse, UploadResponse
+from rock.sdk.sandbox.file_system import LinuxFileSystem
+
+
+class LocalSandbox:
+    """Runs sandbox commands on this machine; uploads are copied into its own /tmp stand-in."""
+
+    def __init__(self, root: Path):
+        self.tmp = root / "sandbox-tmp"
+        self.tmp.mkdir(parents=True)
+        self.bytes_uploaded = 0
+
+    def _local(self, text: str) -> str:
+        return text.replace("/tmp/rock_", f"{self.tmp}/rock_")
+
+    async def execute(self, command: Command) -> CommandResponse:
+        result = await asyncio.to_thread(
+            subprocess.run, command.command, cwd=command.cwd, capture_output=True, stdin=subprocess.DEVNULL
+        )
+        return CommandResponse(
+            stdout=result.stdout.decode(errors="backslashreplace"),
+            stderr=result.stderr.decode(errors="backslashreplace"),
+            exit_code=result.returncode,
+        )
+
+    async def upload_by_path(self, file_path: str, target_path: str) -> UploadResponse:
+        await asyncio.to_thread(shutil.copyfile, file_path, self._local(target_path))
+        self.bytes_uploaded += Path(file_path).stat().st_size
+        return UploadResponse(success=True)
+
+    async def arun(self, cmd: str, mode=None, wait_timeout=None, session=None) -> Observation:
+        result = await asyncio.to_thread(
+            subprocess.run, self._local(cmd), shell=True, capture_output=True, text=True, stdin=subprocess.DEVNULL
+        )
+        return Observation(output=result.stdout + result.stderr, exit_code=result.returncode)
+
+
+async def _legacy_upload(sandbox: LocalSandbox, src: Path, target_dir: str) -> None:
+    local_tar = Path(tempfile.gettempdir()) / f"rock_upload_{time.time_ns()}.tar.gz"
+    remote_tar = f"/tmp/{local_tar.name}"
+    try:
+
+        def pack():
+            with tarfile.open(local_tar, "w:gz") as tf:
+                tf.add(str(src), arcname=".")
+
+        await asyncio.to_thread(pack)
+        await sandbox.upload_by_path(str(local_tar), remote_tar)
+        extract = f"rm -rf {target_dir} && mkdir -p {target_dir} && tar -xzf {remote_tar} -C {target_dir}"
+        res = await sandbox.arun(f"bash -c {shlex.quote(extract)}")
+        assert res.exit_code == 0, res.output
+    finally:
+        local_tar.unlink(missing_ok=True)
+
+
+def _make_tree(root: Path, size_mb: int, file_kb: int) -> Path:
+    """A source-like tree: mostly text in nested packages, with some already compressed blobs."""
+    files = size_mb * 1024 // file_kb
+    for index in range(files):
+        package = root / f"pkg{index // 200}" / f"mod{index // 20 % 10}"
+        package.mkdir(parents=True, exist_ok=True)
+        if index % 10 == 9:
+            (package / f"blob{index}.zip").write_bytes(os.urandom(file_kb * 1024))
+        else:
+            (package / f"file{index}.py").write_text(os.urandom(file_kb * 512).hex())
+    return root / "pkg0" / "mod0" / "file0.py"
+
+
+async def _timed(coro) -> float:
+    start = time.perf_counter()
+    await coro
+    return time.perf_counter() - start
+
+
+async def main(size_mb: int, file_kb: int, compression: str):
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        src = root / "src"
+        edited = _make_tree(src, size_mb, file_kb)
+        fs_sandbox = LocalSandbox(root)
+        fs = LinuxFileSystem(fs_sandbox)
+        target = str(root / "target")
+
+        initial = await _timed(fs.upload_dir(src, target, compression=compression))
+        initial_bytes = fs_sandbox.bytes_uploaded
+
+        with open(edited, "a") as f:
+            f.write("\nprint('one more line')\n")
+
+        legacy_sandbox = LocalSandbox(root / "legacy")
+        legacy = await _timed(_legacy_upload(legacy_sandbox, src, str(root / "legacy-target")))
+        fs_sandbox.bytes_uploaded = 0
+        start = time.perf_counter()
+        observation = await fs.upload_dir(src, target, compression=compression)
+        delta = time.perf_counter() - start
+        assert observation.exit_code == 0, observation.failure_reason
+        assert (Path(target) / edited.relative_to(src)).read_text() == edited.read_text()
+
+    mb = 1024 * 1024
+    print(f"{size_mb} MB tree of {file_kb} KB files, one-line edit, compression={compression}")
+    print(f"first delta sync:           {initial:7.2f} s  {initial_bytes / mb:10.2f} MB sent")
+    print(f"edit, whole tar.gz:         {legacy:7.2f} s  {legacy_sandbox.bytes_uploaded / mb:10.2f} MB sent")
+    print(f"edit, delta sync:           {delta:7.2f} s  {fs_sandbox.bytes_uploaded / mb:10.4f} MB sent")
+    print(f"  ({observation.output})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--file-kb", type=int, default=256)
+    parser.add_argument("--compression", choices=["gzip", "zstd", "none"], default="gzip")
+    args = parser.parse_args()
+    asyncio.run(main(args.size_mb, args.file_kb, args.compression))
@@ -0,0 +1,140 @@
+"""Peak memory and throughput of uploading a large sparse file to a local rocklet: whole-file vs. chunked.
+
+The whole-file path is the previous behaviour, reproduced below: the SDK read the file into memory and
+posted it as multipart, and the rocklet read the whole part into memory again before writing it. The chunked path
+streams sha256-checked chunks to /upload_chunk. Each mode gets a fresh rocklet process; its peak RSS
+(VmHWM) is reported next to the client's peak RSS growth. The chunked mode runs first so that its
+client figure is not masked by the whole-file run.
+
+Usage:
+    python -m tests.benchmark.bench_file_transfer --size-mb 2048
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from rock.utils import HttpUtils
+from rock.utils.file_transfer import TRANSFER_CHUNK_SIZE, aiter_file_range, file_range_sha256
+
+_ROCKLET = """
+import sys, uvicorn
+from fastapi import FastAPI, File, Form, UploadFile
+from rock.rocklet.local_api import local_router
+app = FastAPI()
+app.include_router(local_router)
+
+@app.post("/legacy_upload")
+async def legacy_upload(file: UploadFile = File(...), target_path: str = Form(...)):
+    with open(target_path, "wb") as f:
+        f.write(await file.read())
+    return {"success": True}
+
+uvicorn.run(app, host="127.0.0.1", port=int(sys.argv[1]), log_level="warning")
+"""
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _peak_rss_mb(pid: int) -> float:
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def _client_peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def _start_rocklet() -> tuple[subprocess.Popen, str]:
+    port = _free_port()
+    process = subprocess.Popen([sys.executable, "-c", _ROCKLET, str(port)])
+    url = f"http://127.0.0.1:{port}"
+    async with httpx.AsyncClient() as client:
+        for _ in range(300):
+            try:
+                await client.get(f"{url}/is_alive")
+                return process, url
+            except httpx.HTTPError:
+                await asyncio.sleep(0.1)
+    process.kill()
+    raise TimeoutError("rocklet did not start")
+
+
+async def _whole_file_upload(url: str, source: Path, target: str) -> None:
+    with open(source, "rb") as f:
+        content = f.read()
+    await HttpUtils.post_multipart(
+        f"{url}/legacy_upload", {}, data={"target_path": target}, files={"file": (source.name, content)}
+    )
+
+
+async def _chunked_upload(url: str, source: Path, target: str) -> None:
+    size, offset = source.stat().st_size, 0
+    while True:
+        length = min(TRANSFER_CHUNK_SIZE, size - offset)
+        sha256 = await asyncio.to_thread(file_range_sha256, source, offset, length)
+        final = offset + length >= size
+        params = {"target_path": target, "offset": offset, "sha256": sha256, "final": final}
+        body = aiter_file_range(source, offset, length)
+        result = await HttpUtils.post_content(f"{url}/upload_chunk", {}, body, params)
+        if not result["success"]:
+            raise RuntimeError(result["message"])
+        if final:
+            return
+        offset = result["offset"]
+
+
+async def _measure(label: str, upload, source: Path, workdir: Path) -> None:
+    process, url = await _start_rocklet()
+    client_before = _client_peak_rss_mb()
+    try:
+        start = time.perf_counter()
+        await upload(url, source, str(workdir / f"{label}.bin"))
+        elapsed = time.perf_counter() - start
+        rocklet_peak = _peak_rss_mb(process.pid)
+    finally:
+        await HttpUtils.aclose()
+        process.terminate()
+        process.wait()
+    size_mb = source.stat().st_size / 2**20
+    client_growth = _client_peak_rss_mb() - client_before
+    print(
+        f"{label:<11} {size_mb / elapsed:8.1f} MB/s   client peak +{client_growth:8.1f} MB   "
+        f"rocklet peak {rocklet_peak:8.1f} MB"
+    )
+    os.unlink(workdir / f"{label}.bin")
+
+
+async def main(size_mb: int, skip_whole_file: bool):
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        source = workdir / "source.bin"
+        with open(source, "wb") as f:
+            f.truncate(size_mb * 2**20)
+        print(f"uploading a {size_mb} MB sparse file")
+        await _measure("chunked", _chunked_upload, source, workdir)
+        if not skip_whole_file:
+            await _measure("whole-file", _whole_file_upload, source, workdir)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--skip-whole-file", action="store_true", help="only run the chunked upload")
+    args = parser.parse_args()
+    asyncio.run(main(args.size_mb, args.skip_whole_file))
@@ -0,0 +1,77 @@
+"""Requests/second of HttpUtils against a local stub server, fresh client per call vs. pooled transport.
+
+Usage:
+    python -m tests.benchmark.bench_http_pool --requests 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from rock.utils import HttpUtils
+
+_BODY = json.dumps({"status": "Success", "result": {}}).encode()
+_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n" + f"Content-Length: {len(_BODY)}\r\n\r\n".encode() + _BODY
+)
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            for line in head.decode().split("\r\n"):
+                if line.lower().startswith("content-length:"):
+                    await reader.readexactly(int(line.split(":", 1)[1]))
+            writer.write(_RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError, asyncio.CancelledError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _fresh_client_post(url: str, headers: dict, data: dict) -> dict:
+    """The pre-pool behaviour: one AsyncClient (and TCP handshake) per request."""
+    async with httpx.AsyncClient(verify=HttpUtils._SHARED_SSL_CONTEXT) as client:
+        response = await client.post(url, headers=headers, json=data)
+        response.raise_for_status()
+        return response.json()
+
+
+async def _run(post, url: str, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one():
+        async with semaphore:
+            await post(url, {}, {"command": "echo hello"})
+
+    start = time.perf_counter()
+    await asyncio.gather(*[_one() for _ in range(requests)])
+    return requests / (time.perf_counter() - start)
+
+
+async def main(requests: int, concurrency: int):
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    host, port = server.sockets[0].getsockname()[:2]
+    url = f"http://{host}:{port}/run_in_session"
+    try:
+        before = await _run(_fresh_client_post, url, requests, concurrency)
+        after = await _run(HttpUtils.post, url, requests, concurrency)
+    finally:
+        await HttpUtils.aclose()
+        server.close()
+        await server.wait_closed()
+    print(f"fresh client per request: {before:10.1f} req/s")
+    print(f"pooled transport:         {after:10.1f} req/s  ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
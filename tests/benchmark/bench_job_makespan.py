@@ -0,0 +1,92 @@
+"""Job makespan on a skewed synthetic workload: static partition vs. work queue vs. work queue with speculation.
+
+Task runtimes are log-normal (``--median`` seconds, ``--sigma``), and every task attempt independently
+straggles ``--straggler-factor`` times longer with probability ``--straggler-rate``, as on a slow host.
+
+    static     ScatterOperator-style: the tasks are split up front into one chunk per worker
+    queue      QueueOperator: idle workers pull the next task
+    speculate  QueueOperator with speculate_percentile: stragglers also get a backup copy
+
+Simulated seconds are scaled to wall time by ``--scale``; makespan is reported in simulated seconds.
+
+Usage:
+    python -m tests.benchmark.bench_job_makespan --tasks 400 --workers 40 --straggler-rate 0.02
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from rock.sdk.job.config import BashJobConfig, SandboxPoolConfig, SchedulingConfig
+from rock.sdk.job.executor import JobExecutor
+from rock.sdk.job.operator import Operator, QueueOperator
+from rock.sdk.job.trial.bash import BashTrial
+from tests.benchmark.job.standins import Latencies, fake_sandboxes
+
+
+class _StaticOperator(Operator):
+    def __init__(self, chunks: list[list[float]]):
+        self.chunks = chunks
+
+    def apply(self, config):
+        return [
+            BashTrial(BashJobConfig(script="; ".join(f"sleep {d}" for d in chunk), job_name=f"chunk-{i}"))
+            for i, chunk in enumerate(self.chunks)
+        ]
+
+
+async def _makespan(operator: Operator, config: BashJobConfig, latencies: Latencies, args) -> float:
+    with fake_sandboxes(
+        latencies,
+        script_scale=args.scale,
+        straggler_rate=args.straggler_rate,
+        straggler_factor=args.straggler_factor,
+        seed=args.seed,
+    ):
+        start = time.perf_counter()
+        results = await JobExecutor().run(operator, config)
+        elapsed = time.perf_counter() - start
+    assert all(r.exception_info is None for r in results)
+    return elapsed / args.scale
+
+
+async def main(args):
+    rng = random.Random(args.seed)
+    durations = [round(args.median * rng.lognormvariate(0, args.sigma), 3) for _ in range(args.tasks)]
+    latencies = Latencies(start=args.start * args.scale, call=args.call * args.scale)
+    config = BashJobConfig(
+        script="true",
+        job_name="bench",
+        scheduling=SchedulingConfig(submit_concurrency=args.workers),
+        sandbox_pool=SandboxPoolConfig(max_uses=1_000_000),
+    )
+    tasks = [BashJobConfig(script=f"sleep {d}", job_name=f"task-{i}") for i, d in enumerate(durations)]
+
+    static = _StaticOperator([durations[i :: args.workers] for i in range(args.workers)])
+    queue = QueueOperator(tasks, workers=args.workers)
+    speculate = QueueOperator(tasks, workers=args.workers, speculate_percentile=args.percentile)
+    print(
+        f"{args.tasks} tasks, total work {sum(durations):.0f}s, longest {max(durations):.0f}s, {args.workers} workers"
+    )
+    baseline = None
+    for name, operator in [("static", static), ("queue", queue), ("speculate", speculate)]:
+        makespan = await _makespan(operator, config, latencies, args)
+        baseline = baseline or makespan
+        print(f"{name:10s} makespan {makespan:8.0f}s  ({baseline / makespan:.2f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=40)
+    parser.add_argument("--median", type=float, default=30.0, help="median task runtime, seconds")
+    parser.add_argument("--sigma", type=float, default=1.0, help="log-normal sigma of task runtimes")
+    parser.add_argument("--straggler-rate", type=float, default=0.02)
+    parser.add_argument("--straggler-factor", type=float, default=10.0)
+    parser.add_argument("--percentile", type=float, default=0.9, help="speculation percentile")
+    parser.add_argument("--start", type=float, default=60.0, help="sandbox start latency, seconds")
+    parser.add_argument("--call", type=float, default=0.5, help="latency of other admin calls, seconds")
+    parser.add_argument("--scale", type=float, default=0.001, help="wall-clock seconds per simulated second")
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,178 @@
+"""Latency of the sandbox lifecycle's critical paths, one stage at a time, against local stand-ins.
+
+Stages:
+    start_async    SandboxManager.start_async with a RayOperator on fake Ray actors, FakeRedis and SQLite
+    ray_submit     RayOperator.submit on fake Ray actors
+    docker_start   DockerDeployment.start with a fake docker CLI whose `start` runs a local rocklet
+    proxy_execute  SandboxProxyService.execute forwarding a command to a local rocklet process
+
+Each stage reports p50/p99 of the whole call plus the StageTimer sections entered inside it. Results
+can be written as JSON (--output) and compared with an earlier run (--baseline); the exit status is 1
+if any stage's p50 or p99 regressed by more than --threshold.
+
+Usage:
+    python -m tests.benchmark.bench_lifecycle --output lifecycle.json
+    python -m tests.benchmark.bench_lifecycle --stages docker_start --iterations 5 --baseline lifecycle.json
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import uuid
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from rock.actions.sandbox.response import State
+from rock.admin.proto.request import SandboxCommand
+from rock.config import RockConfig
+from rock.deployments.config import DockerDeploymentConfig, RayDeploymentConfig
+from rock.deployments.constants import Port
+from rock.deployments.docker import DockerDeployment
+from rock.sandbox.operator.ray import RayOperator
+from rock.sandbox.sandbox_manager import SandboxManager
+from rock.sandbox.service.sandbox_proxy_service import SandboxProxyService
+from rock.sandbox.utils.timeout import SandboxTimeoutHelper
+from tests.benchmark.lifecycle.harness import (
+    compare_reports,
+    load_report,
+    print_report,
+    run_stage,
+    to_report,
+    write_report,
+)
+from tests.benchmark.lifecycle.standins import (
+    FakeRayService,
+    fake_docker_cli,
+    fake_ray_actors,
+    local_rocklet,
+    meta_store,
+)
+
+IMAGE = "python:3.11"
+CONFIG_PATH = Path(__file__).parents[2] / "rock-conf" / "rock-test.yml"
+
+
+def _rock_config() -> RockConfig:
+    return RockConfig.from_env(config_path=CONFIG_PATH)
+
+
+@asynccontextmanager
+async def start_async_stage(ray_rtt: float):
+    rock_config = _rock_config()
+    async with meta_store(rock_config) as store:
+        ray_service = FakeRayService()
+        with fake_ray_actors(ray_rtt):
+            manager = SandboxManager(
+                rock_config,
+                meta_store=store,
+                ray_service=ray_service,
+                operator=RayOperator(ray_service, rock_config.runtime),
+            )
+
+            async def once():
+                await manager.start_async(DockerDeploymentConfig(image=IMAGE))
+
+            try:
+                yield once
+            finally:
+                manager._metrics_scheduler.shutdown(wait=False)
+                manager.stop_monitoring()
+
+
+@asynccontextmanager
+async def ray_submit_stage(ray_rtt: float):
+    rock_config = _rock_config()
+    operator = RayOperator(FakeRayService(), rock_config.runtime)
+    with fake_ray_actors(ray_rtt):
+
+        async def once():
+            config = RayDeploymentConfig(
+                image=IMAGE, container_name=uuid.uuid4().hex, runtime_config=rock_config.runtime
+            )
+            await operator.submit(config)
+
+        yield once
+
+
+@asynccontextmanager
+async def docker_start_stage():
+    with fake_docker_cli():
+
+        async def once():
+            deployment = DockerDeployment(image=IMAGE, container_name=uuid.uuid4().hex, startup_timeout=60)
+            await deployment.start()
+            return deployment.stop
+
+        yield once
+
+
+@asynccontextmanager
+async def proxy_execute_stage():
+    rock_config = _rock_config()
+    sandbox_id = uuid.uuid4().hex
+    async with local_rocklet() as port, meta_store(rock_config) as store:
+        sandbox_info = {
+            "sandbox_id": sandbox_id,
+            "state": State.RUNNING,
+            "host_ip": "127.0.0.1",
+            "port_mapping": {str(Port.PROXY): port},
+        }
+        await store.create(sandbox_id, sandbox_info, timeout_info=SandboxTimeoutHelper.make_timeout_info(30))
+        service = SandboxProxyService(rock_config, meta_store=store)
+        command = SandboxCommand(sandbox_id=sandbox_id, command=["true"])
+
+        async def once():
+            response = await service.execute(command)
+            if response.exit_code != 0:
+                raise RuntimeError(f"command failed: {response}")
+
+        try:
+            yield once
+        finally:
+            await service.aclose()
+
+
+def _stages(args) -> dict:
+    return {
+        "start_async": lambda: start_async_stage(args.ray_rtt),
+        "ray_submit": lambda: ray_submit_stage(args.ray_rtt),
+        "docker_start": docker_start_stage,
+        "proxy_execute": proxy_execute_stage,
+    }
+
+
+async def main(args) -> int:
+    stages = _stages(args)
+    results = []
+    for name in args.stages:
+        iterations = args.iterations or (10 if name == "docker_start" else 200)
+        print(f"running {name} x{iterations}", file=sys.stderr)
+        results.append(await run_stage(name, stages[name], iterations, concurrency=args.concurrency))
+
+    report = to_report(results)
+    print_report(report)
+    if args.output:
+        write_report(args.output, report)
+    if args.baseline:
+        regressions = compare_reports(report, load_report(args.baseline), args.threshold)
+        if regressions:
+            print(f"regressed beyond {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    stage_names = ["start_async", "ray_submit", "docker_start", "proxy_execute"]
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stages", nargs="+", choices=stage_names, default=stage_names)
+    parser.add_argument("--iterations", type=int, help="per stage; defaults to 10 for docker_start and 200 otherwise")
+    parser.add_argument("--concurrency", type=int, default=1, help="iterations run concurrently per batch")
+    parser.add_argument("--ray-rtt", type=float, default=0.0, help="simulated latency of each fake Ray actor call")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative p50/p99 increase")
+    args = parser.parse_args()
+    # Per-call INFO records would dominate the timings on a slow terminal.
+    logging.disable(logging.INFO)
+    sys.exit(asyncio.run(main(args)))
@@ -0,0 +1,110 @@
+"""Latency of one list_sandboxes page as the fleet grows: full scan and in-memory paging vs. SQL paging.
+
+Runs against in-memory SQLite (no services needed). Each row carries a status/spec document of
+realistic size so that loading whole rows costs what it does in production.
+
+Usage:
+    python -m tests.benchmark.bench_list_sandboxes --sandboxes 10000 100000 --page-size 500
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from rock.actions.sandbox.response import State
+from rock.admin.core.db_provider import DatabaseProvider
+from rock.admin.core.sandbox_query import SandboxQuery
+from rock.admin.core.sandbox_table import SandboxTable
+from rock.admin.core.schema import SandboxRecord
+from rock.admin.proto.response import SandboxListStatusResponse
+from rock.config import DatabaseConfig
+from rock.sandbox.service.sandbox_proxy_service import _LIST_FIELDS
+
+_ACTIVE = [State.RUNNING, State.PENDING]
+
+
+def _row(i: int) -> dict:
+    sandbox_id = f"bench-{i:07d}"
+    info = {
+        "sandbox_id": sandbox_id,
+        "user_id": f"user-{i % 100}",
+        "image": "python:3.11",
+        "state": State.STOPPED if i % 4 == 0 else State.RUNNING,
+        "host_ip": f"10.0.{i % 250}.{i % 200}",
+        "cpus": 2.0,
+        "memory": "8g",
+    }
+    return {
+        **info,
+        "phases": {"image_pull": {"status": "success"}, "docker_run": {"status": "success"}},
+        "port_mapping": {"8000": 40000 + i % 1000},
+        "status": {**info, "env": {f"VAR_{k}": "x" * 32 for k in range(20)}},
+        "spec": {"image": "python:3.11", "cpus": 2.0, "memory": "8g", "env": {f"VAR_{k}": "x" * 32 for k in range(20)}},
+    }
+
+
+async def _seed(sandboxes: int) -> tuple[DatabaseProvider, SandboxTable]:
+    db_provider = DatabaseProvider(db_config=DatabaseConfig(url="sqlite:///:memory:"))
+    await db_provider.init()
+    await db_provider.create_tables()
+    async with AsyncSession(db_provider.engine) as session:
+        for start in range(0, sandboxes, 5000):
+            await session.execute(insert(SandboxRecord), [_row(i) for i in range(start, min(start + 5000, sandboxes))])
+        await session.commit()
+    return db_provider, SandboxTable(db_provider)
+
+
+async def _legacy_page(table: SandboxTable, filters: dict, page: int, page_size: int):
+    """The previous list_sandboxes: load every active row, filter and slice in memory."""
+    rows = await table.list_by_in("state", _ACTIVE)
+    matched = [
+        SandboxListStatusResponse.from_sandbox_info(row)
+        for row in rows
+        if all(row.get(key) == value for key, value in filters.items())
+    ]
+    return matched[(page - 1) * page_size : page * page_size], len(matched)
+
+
+async def _sql_page(table: SandboxTable, filters: dict, after: str | None, page_size: int, count: bool = True):
+    query = SandboxQuery(filters=filters, states=_ACTIVE, fields=list(_LIST_FIELDS), limit=page_size + 1, after=after)
+    rows = await table.query(query)
+    total = await table.count(query) if count else None
+    return [SandboxListStatusResponse.from_sandbox_info(row) for row in rows[:page_size]], total
+
+
+async def _measure(label: str, call, repeat: int) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await call()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<36} {elapsed * 1000:>10.1f} ms")
+
+
+async def main(fleet_sizes: list[int], page_size: int, repeat: int):
+    for sandboxes in fleet_sizes:
+        db_provider, table = await _seed(sandboxes)
+        try:
+            # Start of the last page of active sandboxes, as reached by following cursors.
+            deep_after = f"bench-{sandboxes - page_size * 4 // 3 - 1:07d}"
+            user = {"user_id": "user-7"}
+            print(f"{sandboxes} sandboxes ({sandboxes * 3 // 4} active), page size {page_size}")
+            await _measure("first page, legacy", lambda: _legacy_page(table, {}, 1, page_size), repeat)
+            await _measure("first page, SQL", lambda: _sql_page(table, {}, None, page_size), repeat)
+            await _measure("first page, SQL, count=false", lambda: _sql_page(table, {}, None, page_size, False), repeat)
+            await _measure("last page, SQL cursor", lambda: _sql_page(table, {}, deep_after, page_size), repeat)
+            await _measure("filtered by user_id, legacy", lambda: _legacy_page(table, user, 1, page_size), repeat)
+            await _measure("filtered by user_id, SQL", lambda: _sql_page(table, user, None, page_size), repeat)
+        finally:
+            await db_provider.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sandboxes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.sandboxes, args.page_size, args.repeat))
@@ -0,0 +1,145 @@
+"""Redis round trips and latency of SandboxMetaStore sweeps over many sandboxes: per-sandbox vs. batched.
+
+Runs against FakeRedis and in-memory SQLite (no services needed). Every Redis round trip (single command or
+pipeline execute) is counted and delayed by --rtt seconds to stand in for the network.
+
+Usage:
+    python -m tests.benchmark.bench_meta_store --sandboxes 1000 --rtt 0.0005
+"""
+
+import argparse
+import asyncio
+import time
+
+from fakeredis import aioredis
+
+from rock.actions.sandbox.response import State
+from rock.admin.core.db_provider import DatabaseProvider
+from rock.admin.core.redis_key import alive_sandbox_key, timeout_sandbox_key
+from rock.admin.core.sandbox_table import SandboxTable
+from rock.config import DatabaseConfig, RockConfig
+from rock.sandbox.sandbox_meta_store import SandboxMetaStore
+from rock.utils.providers.redis_provider import RedisProvider
+
+
+class _RoundTripCounter:
+    def __init__(self, provider: RedisProvider, rtt: float):
+        self.count = 0
+        self._rtt = rtt
+        execute_command = provider.client.execute_command
+        make_pipeline = provider.pipeline
+
+        async def counting_execute_command(*args, **kwargs):
+            await self._round_trip()
+            return await execute_command(*args, **kwargs)
+
+        def counting_pipeline(transaction: bool = True):
+            pipe = make_pipeline(transaction)
+            execute = pipe.execute
+
+            async def counting_execute(raise_on_error: bool = True):
+                await self._round_trip()
+                return await execute(raise_on_error)
+
+            pipe.execute = counting_execute
+            return pipe
+
+        provider.client.execute_command = counting_execute_command
+        provider.pipeline = counting_pipeline
+
+    async def _round_trip(self):
+        self.count += 1
+        if self._rtt:
+            await asyncio.sleep(self._rtt)
+
+
+async def _legacy_update(redis: RedisProvider, db: SandboxTable, sandbox_id: str, info: dict):
+    """The previous SandboxMetaStore.update: read-modify-write of the whole alive document."""
+    current = await redis.json_get(alive_sandbox_key(sandbox_id), "$")
+    await redis.json_set(alive_sandbox_key(sandbox_id), "$", {**(current[0] if current else {}), **info})
+    await db.update(sandbox_id, info)
+
+
+async def _legacy_archive(redis: RedisProvider, db: SandboxTable, sandbox_id: str, info: dict):
+    """The previous SandboxMetaStore.archive: read, DB write, then one delete per key."""
+    current = await redis.json_get(alive_sandbox_key(sandbox_id), "$")
+    await db.update(sandbox_id, {**(current[0] if current else {}), **info})
+    await redis.json_delete(alive_sandbox_key(sandbox_id))
+    await redis.json_delete(timeout_sandbox_key(sandbox_id))
+
+
+async def _setup(sandboxes: int, rtt: float, write_behind: float):
+    redis = RedisProvider(host=None, port=None, password="")
+    redis.client = aioredis.FakeRedis(decode_responses=True)
+    db_provider = DatabaseProvider(db_config=DatabaseConfig(url="sqlite:///:memory:"))
+    await db_provider.init()
+    await db_provider.create_tables()
+    table = SandboxTable(db_provider)
+    rock_config = RockConfig()
+    rock_config.database.write_behind_interval_seconds = write_behind
+    store = SandboxMetaStore(redis_provider=redis, sandbox_table=table, rock_config=rock_config)
+    sandbox_ids = [f"bench-{i:05d}" for i in range(sandboxes)]
+    for sandbox_id in sandbox_ids:
+        info = {"sandbox_id": sandbox_id, "state": State.RUNNING, "host_ip": "10.0.0.1", "user_id": "bench"}
+        await store.create(sandbox_id, info, timeout_info={"auto_clear_time": "30", "expire_time": "0"})
+    counter = _RoundTripCounter(redis, rtt)
+    return redis, table, db_provider, store, sandbox_ids, counter
+
+
+async def _measure(label: str, counter: _RoundTripCounter, sweep) -> None:
+    counter.count = 0
+    start = time.perf_counter()
+    await sweep()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {counter.count:>8} round trips {elapsed * 1000:>10.1f} ms")
+
+
+async def main(sandboxes: int, rtt: float, write_behind: float):
+    redis, table, db_provider, store, ids, counter = await _setup(sandboxes, rtt, write_behind)
+    update = {"state": State.RUNNING, "host_ip": "10.0.0.2"}
+    try:
+
+        async def legacy_update_sweep():
+            for sandbox_id in ids:
+                await _legacy_update(redis, table, sandbox_id, update)
+
+        async def update_sweep():
+            for sandbox_id in ids:
+                await store.update(sandbox_id, update)
+
+        async def get_sweep():
+            for sandbox_id in ids:
+                await store.get(sandbox_id)
+
+        half = len(ids) // 2
+
+        async def legacy_archive_sweep():
+            for sandbox_id in ids[:half]:
+                await _legacy_archive(redis, table, sandbox_id, {"state": State.STOPPED})
+
+        print(f"{sandboxes} sandboxes, {rtt * 1000:.2f} ms per Redis round trip")
+        await _measure("status update, legacy RMW", counter, legacy_update_sweep)
+        await _measure("status update, pipelined", counter, update_sweep)
+        await _measure("status update, update_many", counter, lambda: store.update_many(dict.fromkeys(ids, update)))
+        await _measure("status read, get", counter, get_sweep)
+        await _measure("status read, get_many", counter, lambda: store.get_many(ids))
+        await _measure(f"archive {half}, legacy", counter, legacy_archive_sweep)
+        await _measure(
+            f"archive {len(ids) - half}, archive_many",
+            counter,
+            lambda: store.archive_many(dict.fromkeys(ids[half:], {"state": State.STOPPED})),
+        )
+    finally:
+        await store.aclose()
+        await db_provider.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sandboxes", type=int, default=1000)
+    parser.add_argument("--rtt", type=float, default=0.0005, help="seconds added to every Redis round trip")
+    parser.add_argument(
+        "--write-behind", type=float, default=0.0, help="database.write_behind_interval_seconds (0 = off)"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.sandboxes, args.rtt, args.write_behind))
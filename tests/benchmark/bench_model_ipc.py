@@ -0,0 +1,93 @@
+"""Per-exchange latency of the model service's log-file IPC as the log grows.
+
+Runs lockstep exchanges between a FileHandler (the model service side) and a fresh ModelClient per
+call (as `rock model-service anti-call-llm` does), and reports exchange latency percentiles for the first
+and last thousand exchanges: with offset-indexed reads they should stay flat. For comparison it times
+the previous client's full-file scan for the last request/response at the same log sizes; the previous
+server side also rescanned from the start and slept POLLING_INTERVAL_SECONDS between scans, while
+wakeups now arrive over a unix socket.
+
+Usage:
+    python -m tests.benchmark.bench_model_ipc --exchanges 10000
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from rock.sdk.model.client import ModelClient
+from rock.sdk.model.server.config import REQUEST_START_MARKER, RESPONSE_START_MARKER, SESSION_END_MARKER
+from rock.sdk.model.server.file_handler import FileHandler
+
+WINDOW = 1000
+
+
+def _legacy_read_last_lines(log_file: str) -> tuple[str, str | None]:
+    """The previous ModelClient lookups: read every line, then search backwards."""
+    with open(log_file) as f:
+        lines = f.readlines()
+    request = next(line for line in reversed(lines) if REQUEST_START_MARKER in line or SESSION_END_MARKER in line)
+    response = next((line for line in reversed(lines) if RESPONSE_START_MARKER in line), None)
+    return request, response
+
+
+def _percentiles(samples: list[float]) -> str:
+    samples = sorted(samples)
+    p50 = statistics.median(samples)
+    p99 = samples[int(len(samples) * 0.99) - 1]
+    return f"p50 {p50 * 1000:7.3f} ms   p99 {p99 * 1000:7.3f} ms"
+
+
+async def _run_exchanges(log_file: str, exchanges: int) -> tuple[list[float], dict[int, float]]:
+    handler = FileHandler(log_file)
+    latencies: list[float] = []
+    legacy_scan: dict[int, float] = {}
+    request = {"model": "bench", "messages": [{"role": "user", "content": "x" * 200}]}
+
+    async def server():
+        for index in range(1, exchanges + 1):
+            start = time.perf_counter()
+            handler.write_request(request, index)
+            await handler.poll_for_response(index)
+            latencies.append(time.perf_counter() - start)
+            if index in (WINDOW, exchanges):
+                scan_start = time.perf_counter()
+                _legacy_read_last_lines(log_file)
+                legacy_scan[index] = time.perf_counter() - scan_start
+        handler.write_session_end()
+
+    async def agent():
+        result = await ModelClient(log_file).anti_call_llm(0)
+        index = 1
+        while result != SESSION_END_MARKER:
+            result = await ModelClient(log_file).anti_call_llm(index, '{"content": "ok"}')
+            index += 1
+
+    await asyncio.gather(server(), agent())
+    return latencies, legacy_scan
+
+
+async def main(exchanges: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = str(Path(tmp) / "LLMService.log")
+        latencies, legacy_scan = await _run_exchanges(log_file, exchanges)
+        size_mb = Path(log_file).stat().st_size / 2**20
+
+    print(f"{exchanges} exchanges, final log size {size_mb:.1f} MB")
+    print(f"exchange latency, first {WINDOW}: {_percentiles(latencies[:WINDOW])}")
+    print(f"exchange latency, last {WINDOW}:  {_percentiles(latencies[-WINDOW:])}")
+    for index, seconds in legacy_scan.items():
+        print(f"previous client full-file scan after {index:>6} exchanges: {seconds * 1000:7.3f} ms per lookup")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--exchanges", type=int, default=10000)
+    args = parser.parse_args()
+    # Per-exchange log records would dominate the timings on a slow terminal.
+    logging.disable(logging.INFO)
+    asyncio.run(main(args.exchanges))
@@ -0,0 +1,78 @@
+"""Throughput of concurrent actor calls through RayService, thread-pool ray.get vs. awaiting ObjectRefs natively.
+
+Starts a local Ray instance (no cluster needed). Each actor call sleeps for --latency seconds to stand in for
+the docker/HTTP work SandboxActor methods do.
+
+Usage:
+    python -m tests.benchmark.bench_ray_get --calls 10000
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import ray
+
+from rock.admin.core.ray_service import RayService
+from rock.config import RayConfig
+
+
+@ray.remote
+class EchoActor:
+    async def echo(self, value, latency: float):
+        if latency:
+            await asyncio.sleep(latency)
+        return value
+
+
+async def _executor_ray_get(executor: ThreadPoolExecutor, ref, timeout: int = 60):
+    """The previous RayService.async_ray_get: one blocking ray.get per call on a 10-thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, lambda r: ray.get(r, timeout=timeout), ref)
+
+
+async def _run(get, actors: list, calls: int, latency: float) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*[get(actors[i % len(actors)].echo.remote(i, latency)) for i in range(calls)])
+    return calls / (time.perf_counter() - start)
+
+
+async def _run_batched(service: RayService, actors: list, calls: int, latency: float, batch_size: int = 100) -> float:
+    start = time.perf_counter()
+    batches = [
+        [actors[i % len(actors)].echo.remote(i, latency) for i in range(offset, min(offset + batch_size, calls))]
+        for offset in range(0, calls, batch_size)
+    ]
+    await asyncio.gather(*[service.async_ray_get_many(batch) for batch in batches])
+    return calls / (time.perf_counter() - start)
+
+
+async def main(calls: int, actors: int, latency: float):
+    handles = [EchoActor.options(max_concurrency=1000).remote() for _ in range(actors)]
+    ray.get([actor.echo.remote(0, 0) for actor in handles])
+
+    executor = ThreadPoolExecutor(max_workers=10)
+    service = RayService(RayConfig())
+    try:
+        before = await _run(lambda ref: _executor_ray_get(executor, ref), handles, calls, latency)
+        after = await _run(service.async_ray_get, handles, calls, latency)
+        batched = await _run_batched(service, handles, calls, latency)
+    finally:
+        executor.shutdown()
+    print(f"thread-pool ray.get:   {before:10.1f} calls/s")
+    print(f"awaited ObjectRefs:    {after:10.1f} calls/s  ({after / before:.1f}x)")
+    print(f"async_ray_get_many:    {batched:10.1f} calls/s  ({batched / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=10_000)
+    parser.add_argument("--actors", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds each actor call takes")
+    args = parser.parse_args()
+    ray.init(include_dashboard=False, log_to_driver=False)
+    try:
+        asyncio.run(main(args.calls, args.actors, args.latency))
+    finally:
+        ray.shutdown()
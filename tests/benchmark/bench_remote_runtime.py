@@ -0,0 +1,100 @@
+"""execute() throughput of RemoteSandboxRuntime against slow stub rocklets, executor-bound vs. async pooled.
+
+Each stub answers every request after ``--latency`` seconds, like a rocklet running a short command,
+and requests are spread round-robin over ``--rocklets`` of them. The executor-bound baseline is the
+old runtime: blocking ``requests`` calls on a thread pool.
+
+Usage:
+    python -m tests.benchmark.bench_remote_runtime --requests 4000 --concurrency 500 --rocklets 4 --workers 100
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from rock.admin.proto.request import SandboxCommand as Command
+from rock.sandbox.remote_sandbox import RemoteSandboxRuntime
+from rock.utils import HttpClientPool
+
+_BODY = json.dumps({"exit_code": 0, "stdout": "", "stderr": ""}).encode()
+_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n" + f"Content-Length: {len(_BODY)}\r\n\r\n".encode() + _BODY
+)
+
+
+def _handler(latency: float):
+    async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                for line in head.decode().split("\r\n"):
+                    if line.lower().startswith("content-length:"):
+                        await reader.readexactly(int(line.split(":", 1)[1]))
+                await asyncio.sleep(latency)
+                writer.write(_RESPONSE)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    return _handle
+
+
+async def _run(execute, ports: list[int], requests_: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    command = Command(command="true", sandbox_id="bench")
+
+    async def _one(port: int):
+        async with semaphore:
+            await execute(port, command)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[_one(ports[i % len(ports)]) for i in range(requests_)])
+    return requests_ / (time.perf_counter() - start)
+
+
+async def main(requests_: int, concurrency: int, rocklets: int, workers: int, latency: float):
+    servers = [await asyncio.start_server(_handler(latency), "127.0.0.1", 0) for _ in range(rocklets)]
+    ports = [server.sockets[0].getsockname()[1] for server in servers]
+    executor = ThreadPoolExecutor(max_workers=workers)
+
+    async def executor_bound(port: int, command: Command):
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            executor,
+            lambda: requests.post(f"http://127.0.0.1:{port}/execute", json=command.model_dump(), timeout=60),
+        )
+        response.raise_for_status()
+
+    runtimes = {port: RemoteSandboxRuntime(host="http://127.0.0.1", port=port) for port in ports}
+
+    async def pooled(port: int, command: Command):
+        await runtimes[port].execute(command)
+
+    try:
+        before = await _run(executor_bound, ports, requests_, concurrency)
+        after = await _run(pooled, ports, requests_, concurrency)
+    finally:
+        executor.shutdown()
+        await HttpClientPool.aclose()
+        for server in servers:
+            server.close()
+            await server.wait_closed()
+    print(f"requests on {workers} threads: {before:10.1f} req/s")
+    print(f"async pooled runtime:  {after:10.1f} req/s  ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--rocklets", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.rocklets, args.workers, args.latency))
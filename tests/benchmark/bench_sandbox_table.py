@@ -0,0 +1,122 @@
+"""SandboxTable write throughput and SQL statements per sandbox lifecycle: ORM session per call vs. single statements.
+
+Runs against a SQLite file in a temporary directory (no services needed). Every statement sent to the
+driver is counted; an executemany counts once, transaction control (BEGIN / COMMIT) not at all.
+
+Usage:
+    python -m tests.benchmark.bench_sandbox_table --sandboxes 2000
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from fakeredis import aioredis
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from rock.actions.sandbox.response import State
+from rock.admin.core.db_provider import DatabaseProvider
+from rock.admin.core.sandbox_table import SandboxTable, _pick_columns
+from rock.admin.core.schema import SandboxRecord
+from rock.config import DatabaseConfig
+from rock.sandbox.sandbox_meta_store import SandboxMetaStore
+from rock.utils.providers.redis_provider import RedisProvider
+
+
+class _StatementCounter:
+    def __init__(self, db_provider: DatabaseProvider):
+        self.count = 0
+        event.listen(db_provider.engine.sync_engine, "before_cursor_execute", self._record)
+
+    def _record(self, *args):
+        self.count += 1
+
+
+class _LegacySandboxTable(SandboxTable):
+    """The previous write path: a new ORM session per call, and get + setattr for updates."""
+
+    async def update(self, sandbox_id: str, info: dict) -> None:
+        filtered = _pick_columns(info)
+        filtered["status"] = dict(info)
+        async with AsyncSession(self._db.engine) as session:
+            record = await session.get(SandboxRecord, sandbox_id)
+            if record is None:
+                return
+            for key, value in filtered.items():
+                setattr(record, key, value)
+            await session.commit()
+
+    async def update_many(self, infos: dict[str, dict]) -> None:
+        for sandbox_id, info in infos.items():
+            await self.update(sandbox_id, info)
+
+    async def upsert_many(self, infos: dict[str, dict]) -> None:
+        await self.update_many(infos)
+
+
+async def _lifecycle(store: SandboxMetaStore, sandbox_id: str) -> None:
+    info = {"sandbox_id": sandbox_id, "state": State.PENDING, "user_id": "bench", "image": "python:3.11"}
+    await store.create(sandbox_id, info)
+    await store.update(sandbox_id, {"state": State.RUNNING, "host_ip": "10.0.0.2"})
+    await store.update(sandbox_id, {"phases": {"docker_run": {"status": "success"}}})
+    await store.archive(sandbox_id, {"state": State.STOPPED, "stop_time": "2026-01-01T00:00:00Z"})
+
+
+async def _run(label: str, table_cls: type[SandboxTable], url: str, sandboxes: int) -> None:
+    db_provider = DatabaseProvider(db_config=DatabaseConfig(url=url))
+    await db_provider.init()
+    await db_provider.create_tables()
+    table = table_cls(db_provider)
+    redis = RedisProvider(host=None, port=None, password="")
+    redis.client = aioredis.FakeRedis(decode_responses=True)
+    store = SandboxMetaStore(redis_provider=redis, sandbox_table=table)
+    counter = _StatementCounter(db_provider)
+    try:
+        ids = [f"{label}-{i:05d}" for i in range(sandboxes)]
+        for sandbox_id in ids:
+            await table.create(sandbox_id, {"state": State.RUNNING, "user_id": "bench"})
+
+        counter.count = 0
+        start = time.perf_counter()
+        for sandbox_id in ids:
+            await table.update(sandbox_id, {"state": State.RUNNING, "host_ip": "10.0.0.2"})
+        elapsed = time.perf_counter() - start
+        print(f"  {'update':<28} {sandboxes / elapsed:>10.0f} writes/s {counter.count:>8} statements")
+
+        counter.count = 0
+        start = time.perf_counter()
+        await table.update_many(dict.fromkeys(ids, {"state": State.RUNNING, "host_ip": "10.0.0.3"}))
+        elapsed = time.perf_counter() - start
+        print(f"  {'update_many':<28} {sandboxes / elapsed:>10.0f} writes/s {counter.count:>8} statements")
+
+        lifecycles = max(sandboxes // 10, 1)
+        counter.count = 0
+        start = time.perf_counter()
+        for i in range(lifecycles):
+            await _lifecycle(store, f"{label}-life-{i:05d}")
+        elapsed = time.perf_counter() - start
+        print(
+            f"  {'lifecycle (meta store)':<28} {lifecycles / elapsed:>10.0f} sandboxes/s "
+            f"{counter.count / lifecycles:>6.1f} stmts/sandbox"
+        )
+    finally:
+        await store.aclose()
+        await redis.close_pool()
+        await db_provider.close()
+
+
+async def main(sandboxes: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, table_cls in (("legacy", _LegacySandboxTable), ("current", SandboxTable)):
+            print(f"{label}: {sandboxes} sandboxes, SQLite file")
+            await _run(label, table_cls, f"sqlite:///{Path(tmp) / f'{label}.db'}", sandboxes)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sandboxes", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.sandboxes))
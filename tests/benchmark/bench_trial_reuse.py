@@ -0,0 +1,61 @@
+"""Trials per hour of a job over one image, one sandbox per trial vs. pooled sandboxes reused across trials.
+
+Runs against a fake sandbox backend whose latencies are given in seconds and scaled down by ``--scale``
+(so the default 60 s sandbox start takes 0.06 s of wall time); reported throughput is in unscaled
+trials per hour.
+
+Usage:
+    python -m tests.benchmark.bench_trial_reuse --trials 400 --in-flight 50 --start 60 --trial 30 --reset 2
+"""
+
+import argparse
+import asyncio
+import time
+
+from rock.sdk.job.config import BashJobConfig, SandboxPoolConfig, SchedulingConfig
+from rock.sdk.job.executor import JobExecutor
+from rock.sdk.job.operator import ScatterOperator
+from tests.benchmark.job.standins import Latencies, fake_sandboxes
+
+
+async def _trials_per_hour(config: BashJobConfig, trials: int, latencies: Latencies, scale: float) -> tuple[float, int]:
+    with fake_sandboxes(latencies) as backend:
+        start = time.perf_counter()
+        await JobExecutor().run(ScatterOperator(size=trials), config)
+        elapsed = (time.perf_counter() - start) / scale
+    return trials / elapsed * 3600, backend.starts
+
+
+async def main(
+    trials: int, in_flight: int, start: float, stop: float, call: float, trial: float, reset: float, scale: float
+):
+    latencies = Latencies(
+        start=start * scale, stop=stop * scale, call=call * scale, trial=trial * scale, reset=reset * scale
+    )
+    scheduling = SchedulingConfig(max_in_flight=in_flight, submit_concurrency=in_flight)
+    fresh = BashJobConfig(script="true", job_name="bench", scheduling=scheduling)
+    pooled = BashJobConfig(
+        script="true",
+        job_name="bench",
+        scheduling=scheduling,
+        sandbox_pool=SandboxPoolConfig(enabled=True, max_uses=1_000_000, reset_command="true"),
+    )
+
+    before, before_starts = await _trials_per_hour(fresh, trials, latencies, scale)
+    after, after_starts = await _trials_per_hour(pooled, trials, latencies, scale)
+    print(f"sandbox per trial: {before:10.0f} trials/h  ({before_starts} sandbox starts)")
+    print(f"pooled sandboxes:  {after:10.0f} trials/h  ({after_starts} sandbox starts, {after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trials", type=int, default=400)
+    parser.add_argument("--in-flight", type=int, default=50)
+    parser.add_argument("--start", type=float, default=60.0, help="sandbox start latency, seconds")
+    parser.add_argument("--stop", type=float, default=5.0, help="sandbox stop latency, seconds")
+    parser.add_argument("--call", type=float, default=0.5, help="latency of other admin calls, seconds")
+    parser.add_argument("--trial", type=float, default=30.0, help="trial script runtime, seconds")
+    parser.add_argument("--reset", type=float, default=2.0, help="reset command runtime, seconds")
+    parser.add_argument("--scale", type=float, default=0.001, help="wall-clock seconds per simulated second")
+    args = parser.parse_args()
+    asyncio.run(main(args.trials, args.in_flight, args.start, args.stop, args.call, args.trial, args.reset, args.scale))
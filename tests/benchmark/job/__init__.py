@@ -0,0 +1,4 @@
+"""Job framework benchmarks: a fake sandbox backend with configurable lifecycle and trial latencies.
+
+Entry points: ``python -m tests.benchmark.bench_trial_reuse``, ``python -m tests.benchmark.bench_job_makespan``.
+"""
@@ -0,0 +1,107 @@
+"""A fake sandbox backend for the job framework: every admin call sleeps for a configured latency."""
+
+import asyncio
+import random
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from types import SimpleNamespace
+from unittest.mock import patch
+
+
+@dataclass
+class Latencies:
+    start: float = 0.0
+    stop: float = 0.0
+    call: float = 0.0
+    trial: float = 0.0
+    reset: float = 0.0
+
+
+class FakeBackend:
+    """``sleep X`` commands in a trial script take ``X * script_scale`` seconds; each one independently
+    straggles (runs ``straggler_factor`` times longer) with probability ``straggler_rate``."""
+
+    def __init__(
+        self,
+        latencies: Latencies,
+        script_scale: float = 0.0,
+        straggler_rate: float = 0.0,
+        straggler_factor: float = 1.0,
+        seed: int = 0,
+    ):
+        self.latencies = latencies
+        self.script_scale = script_scale
+        self.straggler_rate = straggler_rate
+        self.straggler_factor = straggler_factor
+        self.rng = random.Random(seed)
+        self.starts = 0
+        self.stops = 0
+
+    def script_seconds(self, script: str) -> float:
+        tokens = script.replace(";", " ").split()
+        seconds = 0.0
+        for command, arg in zip(tokens, tokens[1:]):
+            if command == "sleep":
+                factor = self.straggler_factor if self.rng.random() < self.straggler_rate else 1.0
+                seconds += float(arg) * self.script_scale * factor
+        return seconds
+
+    def sandbox(self, *args, **kwargs) -> "FakeSandbox":
+        return FakeSandbox(self)
+
+
+class FakeSandbox:
+    def __init__(self, backend: FakeBackend):
+        self._backend = backend
+        self._latencies = backend.latencies
+        self._namespace = None
+        self._experiment_id = None
+        self.sandbox_id = None
+        self._script = ""
+
+    async def start(self):
+        await asyncio.sleep(self._latencies.start)
+        self._backend.starts += 1
+        self.sandbox_id = f"sb-{self._backend.starts}"
+
+    async def close(self):
+        await asyncio.sleep(self._latencies.stop)
+        self._backend.stops += 1
+
+    async def create_session(self, request):
+        await asyncio.sleep(self._latencies.call)
+
+    async def close_session(self, request):
+        await asyncio.sleep(self._latencies.call)
+
+    async def write_file_by_path(self, content, path):
+        await asyncio.sleep(self._latencies.call)
+        self._script = content
+
+    async def start_nohup_process(self, cmd, tmp_file, session):
+        await asyncio.sleep(self._latencies.call)
+        return 1, None
+
+    async def wait_for_process_completion(self, pid, session, wait_timeout, wait_interval):
+        await asyncio.sleep(self._latencies.trial + self._backend.script_seconds(self._script))
+        return True, "done"
+
+    async def handle_nohup_output(self, tmp_file, session, success, message, ignore_output, **kwargs):
+        await asyncio.sleep(self._latencies.call)
+        return SimpleNamespace(output="", exit_code=0)
+
+    async def arun(self, cmd, session=None, **kwargs):
+        await asyncio.sleep(self._latencies.reset)
+        return SimpleNamespace(output="", exit_code=0)
+
+
+@contextmanager
+def fake_sandboxes(latencies: Latencies, **backend_options) -> Iterator[FakeBackend]:
+    """Route every Sandbox the job framework creates to a FakeBackend."""
+    backend = FakeBackend(latencies, **backend_options)
+    with (
+        patch("rock.sdk.job.executor.Sandbox", side_effect=backend.sandbox),
+        patch("rock.sdk.job.sandbox_pool.Sandbox", side_effect=backend.sandbox),
+    ):
+        yield backend
@@ -0,0 +1,4 @@
+"""Sandbox lifecycle latency benchmarks: the harness and the local stand-ins the stages run against.
+
+Entry point: ``python -m tests.benchmark.bench_lifecycle``.
+"""
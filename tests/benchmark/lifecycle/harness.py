@@ -0,0 +1,148 @@
+"""Runs benchmark stages, aggregates their StageTimer sub-stages, and reads/writes JSON results."""
+
+import asyncio
+import json
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from rock.utils import StageTimer
+
+# One timed iteration. It may return a cleanup coroutine function, which runs after timing stops.
+Iteration = Callable[[], Awaitable[Callable[[], Awaitable[None]] | None]]
+# A stage yields its iteration function, with setup and teardown shared by all iterations around it.
+Stage = Callable[[], AbstractAsyncContextManager[Iteration]]
+
+# StageTimer descriptions start with "[sandbox-id] [image] ..." tags that differ per iteration.
+_TAGS = re.compile(r"^(\[[^\]]*\]\s*)+")
+
+
+def stage_name(description: str) -> str:
+    return _TAGS.sub("", description)
+
+
+def summarize(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p99_ms": round(ordered[max(0, int(len(ordered) * 0.99 + 0.5) - 1)] * 1000, 3),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+    }
+
+
+@dataclass
+class StageResult:
+    name: str
+    samples: list[float] = field(default_factory=list)
+    substages: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    concurrency: int = 1
+
+    def to_dict(self) -> dict:
+        return {
+            **summarize(self.samples),
+            "concurrency": self.concurrency,
+            "substages": {name: summarize(samples) for name, samples in sorted(self.substages.items())},
+        }
+
+
+async def run_stage(name: str, stage: Stage, iterations: int, warmup: int = 1, concurrency: int = 1) -> StageResult:
+    """Time ``iterations`` runs of *stage*, ``concurrency`` at a time, after ``warmup`` untimed runs.
+
+    StageTimer sections entered during the timed runs are collected as sub-stages.
+    """
+    result = StageResult(name, concurrency=concurrency)
+    recording = False
+
+    def on_stage(phase: str, description: str, seconds: float) -> None:
+        if recording:
+            result.substages[stage_name(description)].append(seconds)
+
+    async def timed(once: Iteration) -> None:
+        start = time.perf_counter()
+        cleanup = await once()
+        result.samples.append(time.perf_counter() - start)
+        if cleanup is not None:
+            await cleanup()
+
+    StageTimer.add_listener(on_stage)
+    try:
+        async with stage() as once:
+            for _ in range(warmup):
+                cleanup = await once()
+                if cleanup is not None:
+                    await cleanup()
+            recording = True
+            remaining = iterations
+            while remaining > 0:
+                batch = min(concurrency, remaining)
+                await asyncio.gather(*(timed(once) for _ in range(batch)))
+                remaining -= batch
+    finally:
+        StageTimer.remove_listener(on_stage)
+    return result
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def to_report(results: list[StageResult]) -> dict:
+    return {
+        "commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "stages": {result.name: result.to_dict() for result in results},
+    }
+
+
+def write_report(path: str, report: dict) -> None:
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+
+
+def load_report(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def print_report(report: dict) -> None:
+    for name, stage in report["stages"].items():
+        print(
+            f"{name:<16} n={stage['count']:<5} p50 {stage['p50_ms']:9.3f} ms   p99 {stage['p99_ms']:9.3f} ms"
+            + (f"   (concurrency {stage['concurrency']})" if stage["concurrency"] > 1 else "")
+        )
+        for sub_name, sub in stage["substages"].items():
+            print(f"  {sub_name:<30} p50 {sub['p50_ms']:9.3f} ms   p99 {sub['p99_ms']:9.3f} ms")
+
+
+def compare_reports(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Print p50/p99 changes against *baseline*; return the stages that regressed by more than *threshold*."""
+    print(f"\ncompared with {baseline.get('commit', 'unknown')[:12]}:")
+    regressions = []
+    for name, stage in current["stages"].items():
+        base = baseline["stages"].get(name)
+        if base is None:
+            print(f"{name:<16} (not in baseline)")
+            continue
+        changes = []
+        for metric in ("p50_ms", "p99_ms"):
+            ratio = stage[metric] / base[metric] if base[metric] else float("inf")
+            changes.append(f"{metric[:3]} {base[metric]:9.3f} -> {stage[metric]:9.3f} ms ({ratio - 1:+7.1%})")
+            if ratio > 1 + threshold and name not in regressions:
+                regressions.append(name)
+        print(f"{name:<16} " + "   ".join(changes))
+    return regressions
@@ -0,0 +1,187 @@
+"""Local stand-ins for the services a sandbox lifecycle touches: Redis, the database, Ray, docker and the rocklet."""
+
+import asyncio
+import os
+import shlex
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+from fakeredis import aioredis
+
+from rock import env_vars
+from rock.admin.core.db_provider import DatabaseProvider
+from rock.admin.core.sandbox_table import SandboxTable
+from rock.config import DatabaseConfig, RockConfig
+from rock.deployments.constants import Port
+from rock.sandbox.sandbox_meta_store import SandboxMetaStore
+from rock.utils.providers.redis_provider import RedisProvider
+from rock.utils.rwlock import AsyncRWLock
+
+
+def rocklet_command(port: int | str) -> list[str]:
+    return [sys.executable, "-m", "rock.rocklet", "--host", "127.0.0.1", "--port", str(port)]
+
+
+@asynccontextmanager
+async def meta_store(rock_config: RockConfig) -> AsyncIterator[SandboxMetaStore]:
+    """SandboxMetaStore over FakeRedis and in-memory SQLite."""
+    redis = RedisProvider(host=None, port=None, password="")
+    redis.client = aioredis.FakeRedis(decode_responses=True)
+    db_provider = DatabaseProvider(db_config=DatabaseConfig(url="sqlite:///:memory:"))
+    await db_provider.init()
+    await db_provider.create_tables()
+    try:
+        yield SandboxMetaStore(
+            redis_provider=redis,
+            sandbox_table=SandboxTable(db_provider, rock_config=rock_config),
+            rock_config=rock_config,
+        )
+    finally:
+        await db_provider.close()
+        await redis.close_pool()
+
+
+class _ActorMethod:
+    def __init__(self, actor: "FakeSandboxActor", name: str):
+        self._actor = actor
+        self._name = name
+
+    def remote(self, *args, **kwargs):
+        return self._actor.call(self._name, *args, **kwargs)
+
+
+class FakeSandboxActor:
+    """Handle to an in-process SandboxActor stand-in; each ``.remote()`` call resolves after ``rtt`` seconds."""
+
+    def __init__(self, config, deployment, rtt: float):
+        self._config = config
+        self._deployment = deployment
+        self._rtt = rtt
+
+    def __getattr__(self, name: str) -> _ActorMethod:
+        return _ActorMethod(self, name)
+
+    def call(self, name: str, *args, **kwargs) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        result = None
+        if name == "sandbox_info":
+            result = {
+                "sandbox_id": self._config.container_name,
+                "host_ip": "127.0.0.1",
+                "host_name": socket.gethostname(),
+                "image": self._config.image,
+                "cpus": self._config.cpus,
+                "memory": self._config.memory,
+            }
+        asyncio.get_running_loop().call_later(self._rtt, future.set_result, result)
+        return future
+
+
+class FakeSandboxActorClass:
+    """Replaces the ``SandboxActor`` Ray actor class: ``SandboxActor.options(...).remote(config, deployment)``."""
+
+    def __init__(self, rtt: float):
+        self._rtt = rtt
+
+    def options(self, **actor_options) -> "FakeSandboxActorClass":
+        return self
+
+    def remote(self, config, deployment) -> FakeSandboxActor:
+        return FakeSandboxActor(config, deployment, self._rtt)
+
+
+class FakeRayService:
+    """The parts of RayService the operator uses, resolving fake actor calls instead of ObjectRefs."""
+
+    def __init__(self):
+        self._rwlock = AsyncRWLock()
+
+    def get_ray_rwlock(self) -> AsyncRWLock:
+        return self._rwlock
+
+    async def async_ray_get(self, ref, timeout: int = 60):
+        return await ref
+
+
+@contextmanager
+def fake_ray_actors(rtt: float) -> Iterator[None]:
+    with patch("rock.sandbox.operator.ray.SandboxActor", FakeSandboxActorClass(rtt)):
+        yield
+
+
+_FAKE_DOCKER = """#!/bin/sh
+# docker CLI stand-in: `start -a` runs a local rocklet on the host port published for the proxy port.
+state_dir={state_dir}
+case "$1" in
+  --version) echo "Docker version 0.0.0-bench" ;;
+  info) echo '{{"Driver": "vfs", "DockerRootDir": "{state_dir}"}}' ;;
+  create)
+    shift
+    while [ $# -gt 0 ]; do
+      case "$1" in
+        -p) case "$2" in *:{proxy_port}) port="${{2%%:*}}" ;; esac; shift ;;
+        --name) name="$2"; shift ;;
+      esac
+      shift
+    done
+    echo "$port" > "$state_dir/$name" ;;
+  start)
+    for name; do :; done
+    exec {rocklet} --port "$(cat "$state_dir/$name")" >/dev/null 2>&1 ;;
+esac
+exit 0
+"""
+
+
+@contextmanager
+def fake_docker_cli() -> Iterator[str]:
+    """Put a fake ``docker`` first on PATH and keep service status files in a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmp:
+        docker = Path(tmp) / "docker"
+        docker.write_text(
+            _FAKE_DOCKER.format(
+                state_dir=tmp, proxy_port=int(Port.PROXY), rocklet=shlex.join(rocklet_command("0")[:-2])
+            )
+        )
+        docker.chmod(docker.stat().st_mode | stat.S_IEXEC)
+        with (
+            patch.dict(os.environ, {"PATH": f"{tmp}{os.pathsep}{os.environ['PATH']}"}),
+            patch.object(env_vars, "ROCK_SERVICE_STATUS_DIR", tmp),
+            patch.object(env_vars, "ROCK_LOGGING_PATH", ""),
+        ):
+            yield tmp
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@asynccontextmanager
+async def local_rocklet() -> AsyncIterator[int]:
+    """Run a rocklet in a subprocess and yield its port once it answers /is_alive."""
+    port = free_port()
+    process = subprocess.Popen(rocklet_command(port), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        async with httpx.AsyncClient() as client:
+            for _ in range(300):
+                try:
+                    await client.get(f"http://127.0.0.1:{port}/is_alive")
+                    break
+                except httpx.HTTPError:
+                    await asyncio.sleep(0.1)
+            else:
+                raise TimeoutError("rocklet did not start")
+        yield port
+    finally:
+        process.terminate()
+        process.wait()
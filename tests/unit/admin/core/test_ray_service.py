@@ -1,6 +1,10 @@
+import asyncio
+import concurrent.futures
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import ray
 
 from rock import InternalServerRockError
 from rock.admin.core.ray_service import RayService
@@ -229,3 +233,87 @@ async def test_ray_get(ray_service):
             ray.kill(leaked)
         except Exception:
             pass
+
+
+class _FakeRef:
+    """Stands in for an ObjectRef: resolved from another thread like Ray's completion callback."""
+
+    def __init__(self, value=None, error: Exception | None = None, delay: float | None = 0.0):
+        self.fut = concurrent.futures.Future()
+        self.awaited = False
+        if delay is not None:
+            threading.Timer(delay, self._resolve, args=(value, error)).start()
+
+    def _resolve(self, value, error):
+        if error is not None:
+            self.fut.set_exception(error)
+        else:
+            self.fut.set_result(value)
+
+    def future(self):
+        self.awaited = True
+        return self.fut
+
+
+@pytest.mark.asyncio
+async def test_async_ray_get_awaits_ref_without_executor():
+    service = _make_service()
+    service._executor = MagicMock()
+
+    with patch("rock.admin.core.ray_service.ray.is_initialized", return_value=True):
+        result = await service.async_ray_get(_FakeRef("ok", delay=0.01), timeout=1)
+
+    assert result == "ok"
+    service._executor.submit.assert_not_called()
+    assert service._ray_request_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_ray_get_timeout_raises():
+    service = _make_service()
+
+    with patch("rock.admin.core.ray_service.ray.is_initialized", return_value=True):
+        with pytest.raises(Exception, match="timed out after 0.05s"):
+            await service.async_ray_get(_FakeRef(delay=None), timeout=0.05)
+
+
+@pytest.mark.asyncio
+async def test_async_ray_get_propagates_remote_error_message():
+    service = _make_service()
+
+    with patch("rock.admin.core.ray_service.ray.is_initialized", return_value=True):
+        with pytest.raises(Exception, match="actor died"):
+            await service.async_ray_get(_FakeRef(error=RuntimeError("actor died")), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_async_ray_get_bounds_in_flight_calls():
+    service = _make_service(max_in_flight_calls=2)
+    refs = [_FakeRef(delay=None) for _ in range(5)]
+
+    with patch("rock.admin.core.ray_service.ray.is_initialized", return_value=True):
+        tasks = [asyncio.create_task(service.async_ray_get(ref, timeout=5)) for ref in refs]
+        await asyncio.sleep(0.05)
+        assert sum(ref.awaited for ref in refs) == 2
+        for i, ref in enumerate(refs):
+            ref.fut.set_result(i)
+        assert await asyncio.gather(*tasks) == [0, 1, 2, 3, 4]
+    assert not service._in_flight.locked()
+
+
+@pytest.mark.asyncio
+async def test_async_ray_get_many_awaits_refs_without_executor():
+    service = _make_service()
+    service._executor = MagicMock()
+    refs = [_FakeRef("a"), _FakeRef("b"), _FakeRef(delay=None)]
+
+    with patch("rock.admin.core.ray_service.ray.is_initialized", return_value=True):
+        results = await service.async_ray_get_many(refs, timeout=0.1, return_exceptions=True)
+        with pytest.raises(Exception, match="timed out"):
+            await service.async_ray_get_many([_FakeRef("c"), _FakeRef(delay=None)], timeout=0.1)
+
+    service._executor.submit.assert_not_called()
+    assert results[:2] == ["a", "b"]
+    assert isinstance(results[2], ray.exceptions.GetTimeoutError)
+    assert service._ray_request_count == 5
+    assert not service._in_flight.locked()
@@ -0,0 +1,99 @@
+"""Tests for SandboxQuery and SandboxTable.query / count (SQLite in-memory)."""
+
+import pytest
+
+from rock.admin.core.db_provider import DatabaseProvider
+from rock.admin.core.sandbox_query import SandboxQuery, decode_cursor, encode_cursor, is_filterable
+from rock.admin.core.sandbox_table import SandboxTable
+from rock.config import DatabaseConfig
+
+
+@pytest.fixture
+async def db():
+    provider = DatabaseProvider(db_config=DatabaseConfig(url="sqlite:///:memory:"))
+    await provider.init()
+    await provider.create_tables()
+    table = SandboxTable(provider)
+    for i in range(10):
+        await table.create(
+            f"sbx-{i:02d}",
+            {
+                "sandbox_id": f"sbx-{i:02d}",
+                "user_id": "alice" if i % 2 == 0 else "bob",
+                "state": "stopped" if i == 9 else "running",
+                "cpus": 2.0 if i < 5 else 4.0,
+                "create_user_gray_flag": i == 0,
+                "cluster_name": f"zone-{i % 3}",
+            },
+        )
+    yield table
+    await provider.close()
+
+
+def ids(rows: list[dict]) -> list[str]:
+    return [row["sandbox_id"] for row in rows]
+
+
+class TestSandboxTableQuery:
+    async def test_filters_and_states_are_combined(self, db):
+        query = SandboxQuery(filters={"user_id": "bob"}, states=["running", "pending"])
+
+        assert ids(await db.query(query)) == ["sbx-01", "sbx-03", "sbx-05", "sbx-07"]
+        assert await db.count(query) == 4
+
+    async def test_filter_values_are_coerced_to_column_type(self, db):
+        assert ids(await db.query(SandboxQuery(filters={"create_user_gray_flag": "true"}))) == ["sbx-00"]
+
+    async def test_json_filter(self, db):
+        rows = await db.query(SandboxQuery(filters={"status.cluster_name": "zone-2"}))
+
+        assert ids(rows) == ["sbx-02", "sbx-05", "sbx-08"]
+
+    async def test_cursor_pages_cover_every_row_once(self, db):
+        seen, after = [], None
+        while True:
+            page = await db.query(SandboxQuery(states=["running"], limit=4, after=after))
+            seen.extend(ids(page))
+            if len(page) < 4:
+                break
+            after = page[-1]["sandbox_id"]
+
+        assert seen == [f"sbx-{i:02d}" for i in range(9)]
+
+    async def test_offset_page(self, db):
+        rows = await db.query(SandboxQuery(limit=3, offset=3))
+
+        assert ids(rows) == ["sbx-03", "sbx-04", "sbx-05"]
+
+    async def test_count_ignores_the_page(self, db):
+        assert await db.count(SandboxQuery(states=["running"], limit=2, after="sbx-05", offset=1)) == 9
+
+    async def test_projection_loads_only_requested_columns(self, db):
+        [row] = await db.query(SandboxQuery(filters={"sandbox_id": "sbx-00"}, fields=["user_id", "status"]))
+
+        assert set(row) == {"sandbox_id", "user_id", "status"}
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            SandboxQuery(filters={"auth_token": "x"}),
+            SandboxQuery(filters={"create_user_gray_flag": "yes"}),
+            SandboxQuery(fields=["no_such_column"]),
+        ],
+    )
+    async def test_invalid_query_raises(self, db, query):
+        with pytest.raises(ValueError):
+            await db.query(query)
+
+
+def test_cursor_round_trip_and_validation():
+    assert decode_cursor(encode_cursor("sbx-42")) == "sbx-42"
+    with pytest.raises(ValueError):
+        decode_cursor("not base64!")
+
+
+def test_is_filterable():
+    assert is_filterable("user_id")
+    assert is_filterable("spec.image")
+    assert not is_filterable("auth_token")
+    assert not is_filterable("spec.")
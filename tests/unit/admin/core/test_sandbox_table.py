@@ -1,6 +1,9 @@
 """Tests for SandboxTable — SQLite in-memory (fast) and PostgreSQL (Docker)."""
 
+from contextlib import contextmanager
+
 import pytest
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
 
 from rock.admin.core.db_provider import DatabaseProvider
@@ -8,6 +11,21 @@ from rock.admin.core.sandbox_table import SandboxTable
 from rock.config import DatabaseConfig
 
 
+@contextmanager
+def count_statements(table: SandboxTable):
+    statements: list[str] = []
+    engine = table._db.engine.sync_engine
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(" ".join(statement.split()))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
 class TestSandboxTableWithSQLite:
     """Unit tests for SandboxTable using an in-memory SQLite database.
 
@@ -97,6 +115,54 @@ class TestSandboxTableWithSQLite:
         assert record["user_id"] == "default"
         assert record["state"] == "pending"
 
+    async def test_update_is_a_single_statement(self, db):
+        await db.create("stmt-1", {"state": "pending"})
+
+        with count_statements(db) as statements:
+            assert await db.update("stmt-1", {"state": "running"}) is True
+            assert await db.update("does-not-exist", {"state": "running"}) is False
+
+        assert len(statements) == 2
+        assert all(s.startswith("UPDATE sandbox_record SET state=?, status=?") and "RETURNING" in s for s in statements)
+
+    async def test_create_many_and_update_many(self, db):
+        await db.create_many({f"many-{i}": {"user_id": "alice", "state": "pending"} for i in range(4)})
+
+        with count_statements(db) as statements:
+            await db.update_many(
+                {
+                    "many-0": {"state": "running"},
+                    "many-1": {"state": "running"},
+                    "many-2": {"state": "running", "host_ip": "10.0.0.2"},
+                    "does-not-exist": {"state": "running"},
+                }
+            )
+
+        # One statement per column set.
+        assert len(statements) == 2
+        records = {r["sandbox_id"]: r for r in await db.list_by("user_id", "alice")}
+        assert [records[f"many-{i}"]["state"] for i in range(4)] == ["running", "running", "running", "pending"]
+        assert records["many-2"]["host_ip"] == "10.0.0.2"
+        assert await db.get("does-not-exist") is None
+
+    async def test_create_many_is_all_or_nothing(self, db):
+        await db.create("dup", {})
+
+        with pytest.raises(IntegrityError):
+            await db.create_many({"new": {}, "dup": {}})
+
+        assert await db.get("new") is None
+
+    async def test_upsert_many_inserts_missing_and_updates_existing(self, db):
+        await db.create("up-1", {"user_id": "alice", "state": "running", "host_ip": "10.0.0.1"})
+
+        await db.upsert_many({"up-1": {"state": "stopped"}, "up-2": {"state": "stopped", "user_id": "bob"}})
+
+        existing = await db.get("up-1")
+        assert (existing["state"], existing["user_id"], existing["host_ip"]) == ("stopped", "alice", "10.0.0.1")
+        inserted = await db.get("up-2")
+        assert (inserted["state"], inserted["user_id"], inserted["host_ip"]) == ("stopped", "bob", "default")
+
 
 @pytest.mark.need_docker
 class TestSandboxTableWithPostgres:
@@ -170,6 +170,7 @@ async def test_decorator_retrieves_user_info_from_meta_store(redis_provider, _me
 
     service = Mock()
     service._meta_store = meta_store
+    service.route_cache = None
     service.metrics_monitor = Mock(spec=MetricsMonitor)
 
     @monitor_sandbox_operation()
@@ -296,6 +296,21 @@ def deployment_config():
     )
 
 
+class FakeClock:
+    """A settable stand-in for ``time.time``/``time.monotonic``: advance it with ``clock.now += seconds``."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
 # ---------------------------------------------------------------------------
 # Docker container fixtures - shared across all unit test subdirectories
 # (lazy-import docker so non-Docker tests don't require the package)
@@ -82,6 +82,7 @@ def _make_start_mocks(deployment):
     deployment.sandbox_validator.check_resource.return_value = True
     deployment._pull_image = MagicMock()
     deployment.do_port_mapping = AsyncMock()
+    deployment._docker_create = AsyncMock()
     deployment._prepare_volume_mounts = MagicMock(return_value=[])
     deployment._start_container = AsyncMock()
     deployment._wait_until_alive = AsyncMock()
@@ -97,14 +98,17 @@ async def _run_start(deployment):
         patch("rock.deployments.docker.wait_until_alive", new_callable=AsyncMock),
         patch("rock.deployments.docker.env_vars") as mock_env,
         patch("rock.deployments.docker.subprocess"),
+        patch("rock.deployments.docker.random.uniform", return_value=0),
     ):
         mock_env.ROCK_LOGGING_PATH = ""
         mock_env.ROCK_TIME_ZONE = "UTC"
-        mock_loop.return_value.run_in_executor = AsyncMock()
+        mock_loop.return_value.run_in_executor = AsyncMock(side_effect=lambda _executor, fn, *args: fn(*args))
         try:
             await deployment.start()
         except Exception:
             pass
+    # No rocklet was started; keep __del__ from closing the runtime while another test patches the loop.
+    deployment._runtime = None
 
 
 class TestDockerDeploymentStartDiskLimit:
@@ -0,0 +1,170 @@
+"""
+Unit tests for the non-blocking DockerDeployment.start() pipeline.
+
+Tests cover:
+- find_free_ports() batch allocation
+- DockerDeployment.start() running independent stages concurrently
+- DockerDeployment.start() undoing completed stages when one fails
+- DockerDeployment._docker_create() surfacing docker failures
+"""
+
+import asyncio
+import subprocess
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from rock.deployments.config import DockerDeploymentConfig
+from rock.deployments.constants import Port
+from rock.deployments.docker import DockerDeployment
+from rock.utils import system
+from rock.utils.system import find_free_ports, release_port
+
+STAGE_SECONDS = 0.3
+
+
+# ---- find_free_ports tests ----
+
+
+class TestFindFreePorts:
+    def test_returns_distinct_registered_ports(self):
+        ports = find_free_ports(3)
+        try:
+            assert len(set(ports)) == 3
+            assert set(ports) <= system._REGISTERED_PORTS
+        finally:
+            for port in ports:
+                release_port(port)
+
+    def test_skips_ports_held_by_docker(self):
+        blocked = find_free_ports(1)[0]
+        release_port(blocked)
+        system._DOCKER_USED_PORTS.add(blocked)
+        try:
+            with patch("rock.utils.system.socket.socket") as mock_socket:
+                mock_socket.return_value.getsockname.side_effect = [("", blocked), ("", blocked + 1)]
+                ports = find_free_ports(1)
+            assert ports == [blocked + 1]
+            # Both candidates were held open until the batch completed.
+            assert mock_socket.return_value.close.call_count == 2
+        finally:
+            system._DOCKER_USED_PORTS.discard(blocked)
+            release_port(blocked + 1)
+
+    def test_raises_after_max_attempts(self):
+        blocked = find_free_ports(1)[0]
+        try:
+            with patch("rock.utils.system.socket.socket") as mock_socket:
+                mock_socket.return_value.getsockname.return_value = ("", blocked)
+                with pytest.raises(RuntimeError):
+                    find_free_ports(2, max_attempts=3)
+        finally:
+            release_port(blocked)
+
+
+# ---- DockerDeployment.start() pipeline tests ----
+
+
+def _slow(result=None):
+    def stage(*args):
+        time.sleep(STAGE_SECONDS)
+        return result
+
+    return stage
+
+
+@pytest.fixture
+def deployment():
+    with patch("rock.deployments.docker.DockerSandboxValidator"):
+        deployment = DockerDeployment.from_config(DockerDeploymentConfig(image="python:3.11"))
+    deployment.sandbox_validator = MagicMock()
+    deployment.sandbox_validator.check_availability.return_value = True
+    deployment.sandbox_validator.check_resource.side_effect = _slow(True)
+    deployment._pull_image = MagicMock(side_effect=_slow())
+    deployment._docker_create = AsyncMock()
+    deployment._docker_start = MagicMock()
+    deployment._wait_until_alive = AsyncMock()
+    deployment._cleanup_kata_disk = MagicMock()
+    with (
+        patch("rock.deployments.docker.DockerUtil.detect_storage_opt_support", side_effect=_slow(False)),
+        patch("rock.deployments.docker.refresh_docker_used_ports", side_effect=_slow()),
+        patch("rock.deployments.docker.random.uniform", return_value=STAGE_SECONDS),
+        patch("rock.deployments.docker.env_vars") as mock_env,
+    ):
+        mock_env.ROCK_LOGGING_PATH = ""
+        mock_env.ROCK_TIME_ZONE = "UTC"
+        yield deployment
+    for port in deployment.get_status().get_port_mapping().values():
+        release_port(port)
+
+
+class TestDockerDeploymentStartPipeline:
+    @pytest.mark.asyncio
+    async def test_independent_stages_overlap(self, deployment):
+        started = time.perf_counter()
+        await deployment.start()
+        elapsed = time.perf_counter() - started
+
+        # Sequentially: availability, pull, resource check, port scan and jitter would take 5 stages.
+        assert elapsed < 4 * STAGE_SECONDS
+        deployment._docker_create.assert_awaited_once()
+        cmd = deployment._docker_create.await_args.args[0]
+        status = deployment.get_status()
+        assert f"{status.get_mapped_port(Port.SSH)}:22" in cmd
+        assert f"{status.get_mapped_port(Port.SERVER)}:8080" in cmd
+        assert deployment.config.port == status.get_mapped_port(Port.PROXY)
+
+    @pytest.mark.asyncio
+    async def test_does_not_block_event_loop(self, deployment):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        try:
+            await deployment.start()
+        finally:
+            task.cancel()
+
+        assert ticks > STAGE_SECONDS / 0.01
+
+    @pytest.mark.asyncio
+    async def test_failed_stage_releases_ports(self, deployment):
+        deployment._pull_image.side_effect = RuntimeError("pull failed")
+
+        with pytest.raises(RuntimeError, match="pull failed"):
+            await deployment.start()
+
+        assert deployment.get_status().get_port_mapping()
+        for port in deployment.get_status().get_port_mapping().values():
+            assert port not in system._REGISTERED_PORTS
+        deployment._cleanup_kata_disk.assert_called_once()
+        deployment._docker_create.assert_not_awaited()
+
+
+# ---- DockerDeployment._docker_create() tests ----
+
+
+class TestDockerCreate:
+    @pytest.mark.asyncio
+    async def test_nonzero_exit_raises_called_process_error(self):
+        with patch("rock.deployments.docker.DockerSandboxValidator"):
+            deployment = DockerDeployment.from_config(DockerDeploymentConfig())
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            await deployment._docker_create(["/bin/sh", "-c", "echo no such image >&2; exit 3"])
+
+        assert exc_info.value.returncode == 3
+        assert b"no such image" in exc_info.value.stderr
+
+    @pytest.mark.asyncio
+    async def test_success(self):
+        with patch("rock.deployments.docker.DockerSandboxValidator"):
+            deployment = DockerDeployment.from_config(DockerDeploymentConfig())
+
+        await deployment._docker_create(["/bin/sh", "-c", "exit 0"])
@@ -0,0 +1,312 @@
+"""
+Unit tests for the per-node warm container pool.
+
+Tests cover:
+- WarmContainerPool claims, hit/miss counting and demand-driven refills (fake backend, simulated clock)
+- WarmContainerPool recycling and destroying handed-back containers
+- DockerDeployment.adopt() taking over a warm container
+- Host port reservations of claimed containers
+"""
+
+import asyncio
+import subprocess
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from rock.actions import IsAliveResponse
+from rock.config import WarmPoolConfig
+from rock.deployments.config import DockerDeploymentConfig
+from rock.deployments.constants import Port
+from rock.deployments.docker import DockerDeployment
+from rock.deployments.warm_pool import (
+    DockerWarmPoolBackend,
+    WarmContainer,
+    WarmContainerPool,
+    WarmPoolBackend,
+    spec_key,
+)
+from rock.utils import system
+
+
+class FakeBackend(WarmPoolBackend):
+    def __init__(self, start_seconds: float = 0.0):
+        self.start_seconds = start_seconds
+        self.fail = False
+        self.created: list[WarmContainer] = []
+        self.destroyed: list[str] = []
+        self.detached: list[str] = []
+        self.dead: set[str] = set()
+
+    async def create(self, config: DockerDeploymentConfig) -> WarmContainer:
+        await asyncio.sleep(self.start_seconds)
+        if self.fail:
+            raise RuntimeError("docker create failed")
+        container = WarmContainer(
+            container_name=f"rock-warm-{len(self.created)}",
+            spec=spec_key(config),
+            image=config.image,
+            port_mapping={Port.PROXY: 40000 + len(self.created)},
+        )
+        self.created.append(container)
+        return container
+
+    async def destroy(self, container: WarmContainer) -> None:
+        self.destroyed.append(container.container_name)
+
+    async def is_alive(self, container: WarmContainer) -> bool:
+        return container.container_name not in self.dead
+
+    def detach(self, container: WarmContainer) -> None:
+        self.detached.append(container.container_name)
+
+
+PYTHON = DockerDeploymentConfig(image="python:3.11")
+UBUNTU = DockerDeploymentConfig(image="ubuntu:22.04")
+
+
+@pytest.fixture
+def backend():
+    return FakeBackend()
+
+
+def make_pool(backend, clock, **overrides) -> WarmContainerPool:
+    config = WarmPoolConfig(enabled=True, demand_window_seconds=300, refill_lead_seconds=30, **overrides)
+    return WarmContainerPool(config, backend, clock=clock)
+
+
+async def refill(pool: WarmContainerPool):
+    await asyncio.gather(*pool.refill())
+
+
+async def test_miss_then_refill_then_hit(backend, clock):
+    pool = make_pool(backend, clock)
+
+    assert pool.claim(PYTHON) is None
+    await refill(pool)
+    container = pool.claim(PYTHON)
+
+    assert container is not None and container.image == "python:3.11"
+    assert backend.detached == [container.container_name]
+    [metrics] = pool.metrics()
+    assert (metrics["hits"], metrics["misses"], metrics["idle"]) == (1, 1, 0)
+
+
+async def test_specs_do_not_share_containers(backend, clock):
+    pool = make_pool(backend, clock)
+    pool.claim(PYTHON)
+    await refill(pool)
+
+    assert pool.claim(UBUNTU) is None
+    assert pool.claim(DockerDeploymentConfig(image="python:3.11", memory="16g")) is None
+    assert pool.claim(PYTHON) is not None
+
+
+async def test_concurrent_claims_never_share_a_container(backend, clock):
+    pool = make_pool(backend, clock)
+    pool.claim(PYTHON)
+    await refill(pool)
+
+    async def claim():
+        return pool.claim(PYTHON)
+
+    results = await asyncio.gather(*(claim() for _ in range(5)))
+
+    assert len([r for r in results if r is not None]) == 1
+
+
+async def test_target_follows_recent_demand(backend, clock):
+    pool = make_pool(backend, clock, max_per_spec=4)
+    # 30 claims in the 300 s window, 30 s to start a replacement -> 3 expected while refilling.
+    for _ in range(30):
+        pool.claim(PYTHON)
+        clock.now += 1
+    await refill(pool)
+    assert pool.metrics()[0]["idle"] == 3
+
+    for _ in range(300):
+        pool.claim(PYTHON)
+    await refill(pool)
+    assert pool.metrics()[0]["idle"] == 4
+
+    # No claims for a whole window: the spec is drained.
+    clock.now += 301
+    await refill(pool)
+    assert pool.metrics()[0]["idle"] == 0
+    assert len(backend.destroyed) == 4
+
+
+async def test_node_cap_is_shared_between_specs(backend, clock):
+    pool = make_pool(backend, clock, max_per_spec=4, max_per_node=3)
+    for _ in range(300):
+        pool.claim(PYTHON)
+        pool.claim(UBUNTU)
+
+    tasks = pool.refill()
+    assert len(tasks) == 3
+    assert pool.refill() == []
+    await asyncio.gather(*tasks)
+
+    assert sorted(m["idle"] for m in pool.metrics()) == [1, 2]
+
+
+async def test_failed_fill_is_retried_after_interval(backend, clock):
+    pool = make_pool(backend, clock, refill_interval_seconds=5)
+    pool.claim(PYTHON)
+    backend.fail = True
+    await refill(pool)
+    backend.fail = False
+
+    assert pool.refill() == []
+    clock.now += 5
+    await refill(pool)
+    assert pool.metrics()[0]["idle"] == 1
+
+
+async def test_unpoolable_configs_always_miss(backend, clock):
+    pool = make_pool(backend, clock)
+
+    assert pool.claim(DockerDeploymentConfig(image="private/img", registry_username="u")) is None
+    assert pool.claim(DockerDeploymentConfig(num_gpus=1)) is None
+    assert pool.metrics() == []
+
+
+async def test_release_recycles_untouched_live_container(backend, clock):
+    pool = make_pool(backend, clock)
+    pool.claim(PYTHON)
+    await refill(pool)
+    container = pool.claim(PYTHON)
+
+    await pool.release(container, reusable=True)
+
+    assert pool.claim(PYTHON) is container
+    assert backend.destroyed == []
+
+
+@pytest.mark.parametrize("reusable,dead,recycle", [(False, False, True), (True, True, True), (True, False, False)])
+async def test_release_destroys_used_dead_or_unrecyclable_container(backend, clock, reusable, dead, recycle):
+    pool = make_pool(backend, clock, recycle=recycle)
+    pool.claim(PYTHON)
+    await refill(pool)
+    container = pool.claim(PYTHON)
+    if dead:
+        backend.dead.add(container.container_name)
+
+    await pool.release(container, reusable=reusable)
+
+    assert backend.destroyed == [container.container_name]
+    assert pool.metrics()[0]["idle"] == 0
+
+
+async def test_hit_is_served_without_waiting_for_a_start(clock):
+    backend = FakeBackend(start_seconds=0.5)
+    pool = make_pool(backend, clock)
+    pool.claim(PYTHON)
+    await refill(pool)
+
+    started = time.perf_counter()
+    container = pool.claim(PYTHON)
+    elapsed = time.perf_counter() - started
+
+    assert container is not None
+    assert elapsed < 0.01
+
+
+async def test_background_refill_and_close(clock):
+    backend = FakeBackend(start_seconds=0.05)
+    pool = make_pool(backend, clock, refill_interval_seconds=60)
+    pool.start()
+
+    pool.claim(PYTHON)
+    for _ in range(50):
+        await asyncio.sleep(0.01)
+        if pool.metrics()[0]["idle"]:
+            break
+    assert pool.metrics()[0]["idle"] == 1
+
+    pool.claim(UBUNTU)
+    await asyncio.sleep(0.01)
+    await pool.close()
+
+    # The container still starting for ubuntu is destroyed too, not left behind.
+    assert len(backend.created) == 2
+    assert sorted(backend.destroyed) == sorted(c.container_name for c in backend.created)
+
+
+# ---- DockerDeployment.adopt() tests ----
+
+
+@pytest.fixture
+def warm_container():
+    return WarmContainer(
+        container_name="rock-warm-abc",
+        spec=spec_key(PYTHON),
+        image="python:3.11",
+        port_mapping={Port.PROXY: 41000, Port.SERVER: 41001, Port.SSH: 41002},
+        effective_disk_limit_rootfs="20g",
+    )
+
+
+@pytest.fixture
+def deployment(tmp_path, monkeypatch):
+    monkeypatch.setenv("ROCK_SERVICE_STATUS_DIR", str(tmp_path))
+    with patch("rock.deployments.docker.DockerSandboxValidator"):
+        deployment = DockerDeployment.from_config(DockerDeploymentConfig(container_name="sandbox-1"))
+    deployment._docker_rename = MagicMock()
+    deployment._docker_wait = MagicMock(return_value=MagicMock())
+    deployment._wait_until_alive = AsyncMock()
+    with patch(
+        "rock.deployments.docker.RemoteSandboxRuntime.is_alive",
+        new_callable=AsyncMock,
+        return_value=IsAliveResponse(is_alive=True),
+    ) as is_alive:
+        deployment.rocklet_is_alive = is_alive
+        yield deployment
+
+
+class TestDockerDeploymentAdopt:
+    async def test_takes_over_ports_and_name(self, deployment, warm_container):
+        await deployment.adopt(warm_container)
+
+        deployment._docker_rename.assert_called_once_with("rock-warm-abc", "sandbox-1")
+        assert deployment.config.port == 41000
+        assert deployment.get_status().get_mapped_port(Port.SSH) == 41002
+        assert deployment.effective_disk_limit_rootfs == "20g"
+        assert deployment.runtime is not None
+        deployment._wait_until_alive.assert_awaited_once()
+
+    async def test_dead_container_is_left_untouched(self, deployment, warm_container):
+        deployment.rocklet_is_alive.return_value = IsAliveResponse(is_alive=False)
+
+        with pytest.raises(RuntimeError):
+            await deployment.adopt(warm_container)
+
+        deployment._docker_rename.assert_not_called()
+
+    async def test_failure_after_rename_removes_container(self, deployment, warm_container):
+        deployment._docker_wait.side_effect = subprocess.SubprocessError("docker wait failed")
+
+        with (
+            patch("rock.deployments.docker.DockerUtil.remove_container_force") as remove,
+            pytest.raises(subprocess.SubprocessError),
+        ):
+            await deployment.adopt(warm_container)
+
+        remove.assert_called_once_with("sandbox-1")
+
+
+class TestPortReservations:
+    async def test_claimed_container_keeps_its_ports_until_destroyed(self, deployment, warm_container, monkeypatch):
+        ports = set(warm_container.port_mapping.values())
+        monkeypatch.setattr(system, "_REGISTERED_PORTS", set(ports))
+        await deployment.adopt(warm_container)
+        backend = DockerWarmPoolBackend()
+        backend._deployments[warm_container.container_name] = deployment
+
+        backend.detach(warm_container)
+
+        assert system._REGISTERED_PORTS == ports
+        with patch("rock.deployments.warm_pool.DockerUtil.remove_container_force"):
+            await backend.destroy(warm_container)
+        assert system._REGISTERED_PORTS == set()
@@ -0,0 +1,196 @@
+"""Tests for the rocklet's chunked upload and download endpoints."""
+
+import io
+import tarfile
+import threading
+import zipfile
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from rock.rocklet import local_api
+from rock.rocklet.local_api import local_router
+from rock.utils.file_transfer import CHUNK_SHA256_HEADER, FILE_SIZE_HEADER, extract_archive, partial_path, sha256_hex
+
+
+@pytest.fixture
+async def client():
+    app = FastAPI()
+    app.include_router(local_router)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://rocklet") as client:
+        yield client
+
+
+async def _put_chunk(client, target, data: bytes, offset: int, final: bool = False, **params) -> dict:
+    params = {"target_path": str(target), "offset": offset, "sha256": sha256_hex(data), "final": final, **params}
+    response = await client.post("/upload_chunk", params=params, content=data)
+    return response.json()
+
+
+async def test_chunks_are_assembled_and_moved_into_place(client, tmp_path):
+    target = tmp_path / "out" / "file.bin"
+
+    first = await _put_chunk(client, target, b"a" * 10, offset=0)
+    second = await _put_chunk(client, target, b"b" * 5, offset=10, final=True)
+
+    assert first == {"success": True, "message": "", "offset": 10}
+    assert second["success"] and second["offset"] == 15
+    assert target.read_bytes() == b"a" * 10 + b"b" * 5
+    assert not partial_path(target).exists()
+
+
+async def test_status_reports_offset_to_resume_from(client, tmp_path):
+    target = tmp_path / "file.bin"
+    await _put_chunk(client, target, b"x" * 7, offset=0)
+
+    status = (await client.get("/upload_status", params={"target_path": str(target)})).json()
+
+    assert status["offset"] == 7
+
+
+async def test_chunk_with_bad_checksum_is_discarded(client, tmp_path):
+    target = tmp_path / "file.bin"
+    await _put_chunk(client, target, b"x" * 7, offset=0)
+
+    params = {"target_path": str(target), "offset": 7, "sha256": sha256_hex(b"other")}
+    result = (await client.post("/upload_chunk", params=params, content=b"corrupt")).json()
+
+    assert result["success"] is False
+    assert result["offset"] == 7
+    assert partial_path(target).read_bytes() == b"x" * 7
+
+
+async def test_chunk_at_wrong_offset_is_rejected(client, tmp_path):
+    target = tmp_path / "file.bin"
+    await _put_chunk(client, target, b"x" * 7, offset=0)
+
+    result = await _put_chunk(client, target, b"y", offset=3)
+
+    assert result["success"] is False
+    assert result["offset"] == 7
+
+
+async def test_offset_zero_restarts_transfer(client, tmp_path):
+    target = tmp_path / "file.bin"
+    await _put_chunk(client, target, b"x" * 7, offset=0)
+
+    await _put_chunk(client, target, b"new", offset=0, final=True)
+
+    assert target.read_bytes() == b"new"
+
+
+async def test_final_chunk_can_extract_tar_archive(client, tmp_path):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tf:
+        info = tarfile.TarInfo("pkg/hello.txt")
+        info.size = 5
+        tf.addfile(info, io.BytesIO(b"hello"))
+    target = tmp_path / "extracted"
+
+    result = await _put_chunk(client, target, buffer.getvalue(), offset=0, final=True, extract=True)
+
+    assert result["success"]
+    assert (target / "pkg" / "hello.txt").read_bytes() == b"hello"
+    assert not partial_path(target).exists()
+
+
+def _tar(path, *members: tarfile.TarInfo) -> None:
+    with tarfile.open(path, "w") as tf:
+        for member in members:
+            tf.addfile(member, io.BytesIO(b"x" * member.size))
+
+
+def _member(name: str, type=tarfile.REGTYPE, linkname: str = "", size: int = 0) -> tarfile.TarInfo:
+    info = tarfile.TarInfo(name)
+    info.type, info.linkname, info.size = type, linkname, size
+    return info
+
+
+@pytest.mark.parametrize("has_data_filter", [True, False])
+@pytest.mark.parametrize(
+    "member",
+    [
+        _member("../escape.txt", size=1),
+        _member("link", tarfile.SYMTYPE, "../../outside"),
+        _member("hard", tarfile.LNKTYPE, "../outside"),
+    ],
+    ids=["dotdot", "symlink", "hardlink"],
+)
+def test_extract_archive_refuses_members_outside_target(tmp_path, monkeypatch, has_data_filter, member):
+    if not has_data_filter:
+        monkeypatch.delattr(tarfile, "data_filter", raising=False)
+    archive = tmp_path / "evil.tar"
+    _tar(archive, member)
+
+    with pytest.raises(tarfile.TarError):
+        extract_archive(archive, tmp_path / "target")
+
+    assert not (tmp_path / "escape.txt").exists()
+
+
+def test_extract_archive_without_data_filter_refuses_absolute_names(tmp_path, monkeypatch):
+    monkeypatch.delattr(tarfile, "data_filter", raising=False)
+    archive = tmp_path / "evil.tar"
+    _tar(archive, _member(f"{tmp_path}/abs.txt", size=1))
+
+    with pytest.raises(tarfile.TarError):
+        extract_archive(archive, tmp_path / "target")
+
+    assert not (tmp_path / "abs.txt").exists()
+
+
+def test_extract_archive_without_data_filter_keeps_links_inside(tmp_path, monkeypatch):
+    monkeypatch.delattr(tarfile, "data_filter", raising=False)
+    archive = tmp_path / "ok.tar"
+    _tar(archive, _member("pkg/a.txt", size=3), _member("pkg/link", tarfile.SYMTYPE, "a.txt"))
+
+    extract_archive(archive, tmp_path / "target")
+
+    assert (tmp_path / "target" / "pkg" / "link").read_bytes() == b"xxx"
+
+
+async def test_download_returns_range_with_checksum(client, tmp_path):
+    source = tmp_path / "file.bin"
+    source.write_bytes(bytes(range(256)) * 4)
+
+    response = await client.get("/download", params={"path": str(source), "offset": 100, "length": 50})
+
+    assert response.content == (bytes(range(256)) * 4)[100:150]
+    assert response.headers[CHUNK_SHA256_HEADER] == sha256_hex(response.content)
+    assert response.headers[FILE_SIZE_HEADER] == "1024"
+
+
+async def test_multipart_upload_still_works(client, tmp_path):
+    target = tmp_path / "file.txt"
+
+    response = await client.post(
+        "/upload", data={"target_path": str(target)}, files={"file": ("file.txt", b"payload", "text/plain")}
+    )
+
+    assert response.json()["success"] is True
+    assert target.read_bytes() == b"payload"
+
+
+async def test_multipart_upload_unzips_off_the_event_loop(client, tmp_path, monkeypatch):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("pkg/a.txt", "a")
+    threads = []
+    save_upload = local_api._save_upload
+
+    def recording_save_upload(*args):
+        threads.append(threading.get_ident())
+        save_upload(*args)
+
+    monkeypatch.setattr(local_api, "_save_upload", recording_save_upload)
+
+    response = await client.post(
+        "/upload",
+        data={"target_path": str(tmp_path / "target"), "unzip": "true"},
+        files={"file": ("pkg.zip", buffer.getvalue(), "application/zip")},
+    )
+
+    assert response.json()["success"] is True
+    assert (tmp_path / "target" / "pkg" / "a.txt").read_text() == "a"
+    assert threads and threads[0] != threading.get_ident()
@@ -1,7 +1,11 @@
+from unittest.mock import patch
+
 import pytest
 
+from rock.admin.proto.request import SandboxBashAction as BashAction
+from rock.admin.proto.request import SandboxCreateBashSessionRequest as CreateBashSessionRequest
 from rock.rocklet.exceptions import BashIncorrectSyntaxError
-from rock.rocklet.linux import _check_bash_command, _split_bash_command
+from rock.rocklet.linux import BashSession, _check_bash_command, _split_bash_command
 
 
 def test_split_bash_command_normal():
@@ -76,3 +80,46 @@ def test_check_bash_command_invalid():
 def test_check_bash_command_valid():
     _check_bash_command("(a)")
     _check_bash_command("a=''")
+
+
+def test_split_bash_command_result_is_not_shared():
+    _split_bash_command("cmd1\ncmd2").append("cmd3")
+    assert _split_bash_command("cmd1\ncmd2") == ["cmd1", "cmd2"]
+
+
+@pytest.fixture
+async def bash_session():
+    session = BashSession(CreateBashSessionRequest(session="test", sandbox_id="test", startup_timeout=30))
+    await session.start()
+    yield session
+    await session.close()
+
+
+def _action(command: str, **kwargs) -> BashAction:
+    return BashAction(command=command, session="test", sandbox_id="test", **kwargs)
+
+
+async def test_bash_session_returns_exit_code_with_one_write(bash_session):
+    with (
+        patch.object(bash_session.shell, "sendline", wraps=bash_session.shell.sendline) as sendline,
+        patch("rock.rocklet.linux.subprocess.run") as run,
+    ):
+        ok = await bash_session.run(_action("echo hello"))
+        failed = await bash_session.run(_action("echo oops; (exit 3)", check="silent"))
+
+    assert (ok.output, ok.exit_code) == ("hello", 0)
+    assert (failed.output, failed.exit_code) == ("oops", 3)
+    assert sendline.call_count == 2
+    run.assert_not_called()
+
+
+async def test_bash_session_exit_code_when_bashlex_fails(bash_session):
+    observation = await bash_session.run(_action("for ((i=0;i<2;i++)); do echo $i; done\nfalse", check="silent"))
+
+    assert observation.output.split() == ["0", "1"]
+    assert observation.exit_code == 1
+
+
+async def test_bash_session_rejects_invalid_syntax(bash_session):
+    with pytest.raises(BashIncorrectSyntaxError):
+        await bash_session.run(_action("for"))
@@ -0,0 +1,73 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from rock.actions import WaitProcessRequest
+from rock.rocklet.process_watcher import ProcessWatcher
+from rock.rocklet.rocklet import Rocklet
+
+
+async def _spawn_sleep(seconds: float) -> asyncio.subprocess.Process:
+    return await asyncio.create_subprocess_exec("sleep", str(seconds))
+
+
+@pytest.fixture(params=["pidfd", "poll"])
+def watcher(request, monkeypatch):
+    if request.param == "poll":
+        monkeypatch.delattr(os, "pidfd_open", raising=False)
+    elif not hasattr(os, "pidfd_open"):
+        pytest.skip("pidfd_open is not available on this platform")
+    return ProcessWatcher(poll_interval=0.02)
+
+
+async def test_wait_returns_when_process_exits(watcher):
+    proc = await _spawn_sleep(0.2)
+    start = time.perf_counter()
+
+    assert await watcher.wait(proc.pid, timeout=5) is True
+
+    assert time.perf_counter() - start < 2
+    assert watcher.watched_pids == []
+    await proc.wait()
+
+
+async def test_wait_times_out_while_process_running(watcher):
+    proc = await _spawn_sleep(5)
+    try:
+        assert await watcher.wait(proc.pid, timeout=0.1) is False
+        assert watcher.watched_pids == []
+    finally:
+        proc.kill()
+        await proc.wait()
+
+
+async def test_wait_on_missing_pid_returns_immediately(watcher):
+    proc = await _spawn_sleep(0)
+    await proc.wait()
+
+    assert await watcher.wait(proc.pid, timeout=5) is True
+
+
+async def test_concurrent_waiters_share_one_watch(watcher):
+    proc = await _spawn_sleep(0.3)
+    waiters = [asyncio.create_task(watcher.wait(proc.pid, timeout=5)) for _ in range(5)]
+    await asyncio.sleep(0.05)
+
+    assert watcher.watched_pids == [proc.pid]
+    assert await asyncio.gather(*waiters) == [True] * 5
+    assert watcher.watched_pids == []
+    await proc.wait()
+
+
+async def test_rocklet_wait_process():
+    rocklet = Rocklet.create()
+    proc = await _spawn_sleep(0.1)
+
+    response = await rocklet.wait_process(WaitProcessRequest(pid=proc.pid, timeout=5))
+
+    assert response.pid == proc.pid
+    assert response.exited is True
+    assert response.elapsed < 5
+    await proc.wait()
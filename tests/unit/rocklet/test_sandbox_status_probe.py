@@ -0,0 +1,36 @@
+"""Tests for Rocklet.probe_sandbox_status, the worker side of the admin's one-hop get_status."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from rock import env_vars
+from rock.admin.proto.request import SandboxStatusProbeRequest
+from rock.rocklet.linux import LinuxRocklet
+
+
+@pytest.fixture
+def status_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(env_vars, "ROCK_SERVICE_STATUS_DIR", str(tmp_path))
+    return tmp_path
+
+
+async def test_missing_status_file(status_dir):
+    response = await LinuxRocklet().probe_sandbox_status(SandboxStatusProbeRequest(sandbox_id="sbx"))
+
+    assert (response.status, response.is_alive) == (None, False)
+
+
+async def test_status_and_liveness_in_one_response(status_dir):
+    status = {"phases": {"docker_run": {"status": "success", "message": "ok"}}, "port_mapping": {"22555": 40001}}
+    (status_dir / "sbx.json").write_text(json.dumps(status))
+
+    with patch("rock.rocklet.rocklet.HttpUtils.get", new=AsyncMock(return_value={"is_alive": True})) as mock_get:
+        response = await LinuxRocklet().probe_sandbox_status(
+            SandboxStatusProbeRequest(sandbox_id="sbx", host_ip="10.0.0.1")
+        )
+
+    assert mock_get.call_args.kwargs["url"] == "http://10.0.0.1:40001/is_alive"
+    assert response.is_alive
+    assert response.status["phases"]["docker_run"]["status"] == "success"
@@ -0,0 +1,54 @@
+"""Local stand-ins for the Ray env actors GemManager drives, shared by the gem manager and VectorRockEnv tests."""
+
+import asyncio
+
+from rock.actions import EnvResetRequest, EnvResetResponse, EnvStepRequest, EnvStepResponse
+
+STEP_SECONDS = 0.1
+
+
+class _Remote:
+    def __init__(self, fn):
+        self._fn = fn
+
+    def remote(self, *args):
+        return self._fn(*args)
+
+
+class FakeEnvActor:
+    """Mimics SandboxActor's env methods; ``.remote()`` returns a coroutine standing in for an ObjectRef."""
+
+    def __init__(self, sandbox_id: str, fail: bool = False):
+        self.sandbox_id = sandbox_id
+        self.fail = fail
+        self.env_step = _Remote(self._step)
+        self.env_reset = _Remote(self._reset)
+
+    async def _step(self, request: EnvStepRequest) -> EnvStepResponse:
+        await asyncio.sleep(STEP_SECONDS)
+        if self.fail:
+            raise RuntimeError(f"env in {self.sandbox_id} crashed")
+        return EnvStepResponse(
+            observation=f"{self.sandbox_id}:{request.action}", reward=1.0, terminated=False, truncated=False
+        )
+
+    async def _reset(self, request: EnvResetRequest) -> EnvResetResponse:
+        if self.fail:
+            raise RuntimeError(f"env in {self.sandbox_id} crashed")
+        return EnvResetResponse(observation=f"{self.sandbox_id}:seed={request.seed}")
+
+
+class FakeRayService:
+    def __init__(self, actors: dict[str, FakeEnvActor]):
+        self.actors = actors
+        self.lookups = 0
+
+    async def async_ray_get_actor(self, actor_name: str, namespace: str = None):
+        self.lookups += 1
+        sandbox_id = actor_name.removeprefix("sandbox-")
+        if sandbox_id not in self.actors:
+            raise ValueError(f"actor {actor_name} not exist")
+        return self.actors[sandbox_id]
+
+    async def async_ray_get(self, ref, timeout: int = 60):
+        return await ref
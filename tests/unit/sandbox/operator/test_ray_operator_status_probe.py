@@ -0,0 +1,107 @@
+"""Tests for RayOperator.get_status probing: one hop per path, with fallbacks for older rocklets and actors."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from rock.actions.sandbox.response import IsAliveResponse, State
+from rock.deployments.status import ServiceStatus
+from rock.sandbox.operator.ray import RayOperator
+
+_STATUS = {"phases": {"docker_run": {"status": "success", "message": "ok"}}, "port_mapping": {"22555": 40001}}
+
+
+@pytest.fixture
+def operator() -> RayOperator:
+    operator = RayOperator(ray_service=MagicMock(), runtime_config=MagicMock(status_cache_ttl_seconds=1.0))
+    operator.set_nacos_provider(None)
+    operator.set_redis_provider(None)
+    return operator
+
+
+@pytest.fixture
+def rocklet_operator(operator: RayOperator) -> RayOperator:
+    nacos = MagicMock()
+    nacos.get_switch_status.return_value = True
+    operator.set_nacos_provider(nacos)
+    return operator
+
+
+def _not_found() -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://10.0.0.1/sandbox_status")
+    return httpx.HTTPStatusError("404", request=request, response=httpx.Response(404, request=request))
+
+
+async def test_rocklet_path_uses_one_sandbox_status_request(rocklet_operator: RayOperator):
+    redis_info = {"sandbox_id": "sbx", "host_ip": "10.0.0.1", "state": State.PENDING}
+    with (
+        patch("rock.sandbox.operator.ray.build_sandbox_from_redis", new=AsyncMock(return_value=redis_info)),
+        patch(
+            "rock.sandbox.operator.ray.HttpUtils.post",
+            new=AsyncMock(return_value={"status": _STATUS, "is_alive": True}),
+        ) as mock_post,
+    ):
+        info = await rocklet_operator.get_status("sbx")
+        await rocklet_operator.get_status("sbx")
+
+    assert mock_post.call_count == 1
+    assert mock_post.call_args.kwargs["url"].endswith("/sandbox_status")
+    assert mock_post.call_args.kwargs["data"] == {"sandbox_id": "sbx", "host_ip": "10.0.0.1"}
+    assert info["state"] == State.RUNNING
+    assert info["port_mapping"] == {22555: 40001}
+
+
+async def test_rocklet_path_falls_back_for_older_rocklets(rocklet_operator: RayOperator):
+    redis_info = {"sandbox_id": "sbx", "host_ip": "10.0.0.1", "state": State.PENDING}
+    rocklet_operator.get_remote_status = AsyncMock(return_value=ServiceStatus.from_dict(_STATUS))
+    rocklet_operator._check_alive_status = AsyncMock(return_value=False)
+    with (
+        patch("rock.sandbox.operator.ray.build_sandbox_from_redis", new=AsyncMock(return_value=redis_info)),
+        patch("rock.sandbox.operator.ray.HttpUtils.post", new=AsyncMock(side_effect=_not_found())),
+    ):
+        info = await rocklet_operator.get_status("sbx")
+
+    rocklet_operator.get_remote_status.assert_awaited_once_with("sbx", "10.0.0.1")
+    assert info["state"] == State.PENDING
+    assert info["phases"]["docker_run"]["status"] == "success"
+
+
+async def test_ray_path_makes_one_actor_call(operator: RayOperator):
+    actor = MagicMock()
+    operator._ray_service.async_ray_get_actor = AsyncMock(return_value=actor)
+    operator._ray_service.async_ray_get = AsyncMock(return_value=({"sandbox_id": "sbx", "phases": {}}, True))
+    operator._ray_service.async_ray_get_many = AsyncMock()
+
+    info = await operator.get_status("sbx")
+
+    actor.status_snapshot.remote.assert_called_once_with()
+    operator._ray_service.async_ray_get_many.assert_not_called()
+    assert info["state"] == State.RUNNING
+
+
+async def test_ray_path_falls_back_for_older_actors(operator: RayOperator):
+    actor = MagicMock(spec=["sandbox_info", "get_status", "is_alive"])
+    operator._ray_service.async_ray_get_actor = AsyncMock(return_value=actor)
+    operator._ray_service.async_ray_get_many = AsyncMock(
+        return_value=[{"sandbox_id": "sbx"}, ServiceStatus.from_dict(_STATUS), IsAliveResponse(is_alive=False)]
+    )
+
+    info = await operator.get_status("sbx")
+
+    assert info["phases"]["docker_run"]["status"] == "success"
+    assert info["port_mapping"] == {22555: 40001}
+    assert "state" not in info
+
+
+async def test_stop_invalidates_cached_status(operator: RayOperator):
+    actor = MagicMock()
+    operator._ray_service.async_ray_get_actor = AsyncMock(return_value=actor)
+    operator._ray_service.async_ray_get = AsyncMock(return_value=({"sandbox_id": "sbx"}, True))
+
+    await operator.get_status("sbx")
+    with patch("rock.sandbox.operator.ray.ray.kill"):
+        await operator.stop("sbx")
+    await operator.get_status("sbx")
+
+    assert actor.status_snapshot.remote.call_count == 2
@@ -0,0 +1,75 @@
+"""Tests for SandboxStatusCache: probe coalescing, TTL and invalidation."""
+
+import asyncio
+
+import pytest
+
+from rock.sandbox.operator.status_cache import SandboxStatusCache
+
+
+class CountingLoader:
+    def __init__(self, delay: float = 0.0, error: Exception | None = None):
+        self.calls = 0
+        self.delay = delay
+        self.error = error
+
+    async def __call__(self, sandbox_id: str) -> dict:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return {"sandbox_id": sandbox_id, "call": self.calls}
+
+
+async def test_concurrent_lookups_share_one_probe():
+    cache, load = SandboxStatusCache(ttl_seconds=0), CountingLoader(delay=0.01)
+
+    results = await asyncio.gather(*(cache.get("sbx", load) for _ in range(20)))
+
+    assert load.calls == 1
+    assert all(result == {"sandbox_id": "sbx", "call": 1} for result in results)
+    results[0]["state"] = "mutated"
+    assert "state" not in results[1]
+
+
+async def test_result_is_served_until_ttl_expires(clock):
+    cache, load = SandboxStatusCache(ttl_seconds=1.0, clock=clock), CountingLoader()
+
+    await cache.get("sbx", load)
+    clock.now += 0.9
+    assert (await cache.get("sbx", load))["call"] == 1
+    clock.now += 0.2
+    assert (await cache.get("sbx", load))["call"] == 2
+
+
+async def test_invalidate_forces_a_new_probe():
+    cache, load = SandboxStatusCache(ttl_seconds=60), CountingLoader()
+
+    await cache.get("sbx", load)
+    cache.invalidate("sbx")
+
+    assert (await cache.get("sbx", load))["call"] == 2
+
+
+async def test_errors_are_shared_but_not_cached():
+    cache, load = SandboxStatusCache(ttl_seconds=60), CountingLoader(delay=0.01, error=RuntimeError("down"))
+
+    results = await asyncio.gather(cache.get("sbx", load), cache.get("sbx", load), return_exceptions=True)
+    assert load.calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    with pytest.raises(RuntimeError):
+        await cache.get("sbx", load)
+    assert load.calls == 2
+
+
+async def test_cancelled_caller_does_not_cancel_shared_probe():
+    cache, load = SandboxStatusCache(ttl_seconds=60), CountingLoader(delay=0.05)
+
+    first = asyncio.create_task(cache.get("sbx", load))
+    second = asyncio.create_task(cache.get("sbx", load))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert (await second)["call"] == 1
+    assert load.calls == 1
@@ -0,0 +1,123 @@
+"""Unit tests for GemManager batch step/reset against local fake env actors."""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from rock.actions import (
+    EnvBatchResetRequest,
+    EnvBatchStepRequest,
+    EnvResetRequest,
+    EnvStepRequest,
+)
+from rock.config import RockConfig, SandboxConfig
+from rock.sandbox.gem_manager import GemManager
+from tests.unit.sandbox.gem_standins import STEP_SECONDS, FakeEnvActor, FakeRayService
+
+
+@pytest.fixture
+def actors():
+    return {f"sb-{i}": FakeEnvActor(f"sb-{i}") for i in range(20)}
+
+
+@pytest.fixture
+def gem_manager(actors):
+    config = RockConfig()
+    config.sandbox_config = SandboxConfig()
+    with patch("rock.sandbox.base_manager.BaseManager._setup_scheduler"):
+        manager = GemManager(
+            config,
+            meta_store=AsyncMock(),
+            ray_namespace="test",
+            ray_service=FakeRayService(actors),
+            operator=AsyncMock(),
+        )
+    manager.deployment_manager = MagicMock()
+    manager.deployment_manager.get_actor_name = lambda sandbox_id: f"sandbox-{sandbox_id}"
+    return manager
+
+
+def _steps(sandbox_ids) -> EnvBatchStepRequest:
+    return EnvBatchStepRequest(steps=[EnvStepRequest(sandbox_id=s, action="up") for s in sandbox_ids])
+
+
+async def test_batch_step_fans_out_in_parallel(gem_manager, actors):
+    start = time.monotonic()
+    response = await gem_manager.env_step_batch(_steps(actors))
+    elapsed = time.monotonic() - start
+
+    assert [r.sandbox_id for r in response.results] == list(actors)
+    assert [r.response.observation for r in response.results] == [f"{s}:up" for s in actors]
+    assert elapsed < STEP_SECONDS * 5
+
+
+async def test_batch_step_reports_failures_per_env(gem_manager, actors):
+    actors["sb-3"].fail = True
+
+    response = await gem_manager.env_step_batch(_steps(["sb-2", "sb-3", "missing", "sb-4"]))
+
+    ok, crashed, missing, ok_again = response.results
+    assert ok.response.observation == "sb-2:up" and ok.error is None
+    assert crashed.response is None and "crashed" in crashed.error
+    assert missing.response is None and "not exist" in missing.error
+    assert ok_again.response.observation == "sb-4:up"
+
+
+async def test_batch_reset(gem_manager):
+    request = EnvBatchResetRequest(
+        resets=[EnvResetRequest(sandbox_id="sb-0", seed=1), EnvResetRequest(sandbox_id="sb-1")]
+    )
+
+    response = await gem_manager.env_reset_batch(request)
+
+    assert [r.response.observation for r in response.results] == ["sb-0:seed=1", "sb-1:seed=None"]
+
+
+async def test_actor_handles_are_cached(gem_manager, actors):
+    for _ in range(3):
+        await gem_manager.env_step_batch(_steps(actors))
+
+    assert gem_manager._ray_service.lookups == len(actors)
+
+
+async def test_failed_call_drops_cached_handle(gem_manager, actors):
+    await gem_manager.env_step(EnvStepRequest(sandbox_id="sb-0", action="up"))
+    actors["sb-0"].fail = True
+    await gem_manager.env_step_batch(_steps(["sb-0"]))
+    actors["sb-0"] = FakeEnvActor("sb-0")
+
+    response = await gem_manager.env_step(EnvStepRequest(sandbox_id="sb-0", action="up"))
+
+    assert response.observation == "sb-0:up"
+    assert gem_manager._ray_service.lookups == 2
+
+
+async def test_stop_drops_cached_handle(gem_manager):
+    await gem_manager.env_step(EnvStepRequest(sandbox_id="sb-0", action="up"))
+    gem_manager._meta_store.get = AsyncMock(return_value=None)
+
+    await gem_manager.stop("sb-0")
+
+    assert "sb-0" not in gem_manager._env_actors
+
+
+async def test_expiry_and_batch_stop_drop_cached_handles(gem_manager):
+    await gem_manager.env_step_batch(_steps(["sb-0", "sb-1"]))
+    gem_manager._meta_store.get = AsyncMock(return_value=None)
+
+    await gem_manager._expiry_scheduler._on_expired("sb-0")
+    results = [result async for result in await gem_manager.batch_stop(["sb-1"])]
+
+    assert [result.error for result in results] == [None]
+    assert gem_manager._env_actors == {}
+
+
+async def test_cached_handles_are_bounded_least_recently_used_first(gem_manager, actors):
+    gem_manager._env_actor_cache_size = 3
+    await gem_manager.env_step_batch(_steps(["sb-0", "sb-1", "sb-2"]))
+    await gem_manager.env_step(EnvStepRequest(sandbox_id="sb-0", action="up"))
+
+    await gem_manager.env_step(EnvStepRequest(sandbox_id="sb-3", action="up"))
+
+    assert sorted(gem_manager._env_actors) == ["sb-0", "sb-2", "sb-3"]
@@ -0,0 +1,121 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from rock.actions import DownloadChunkRequest, UploadRequest
+from rock.admin.proto.request import SandboxCommand as Command
+from rock.sandbox.remote_sandbox import RemoteSandboxRuntime
+from rock.utils import HttpClientPool
+from rock.utils.http import _HostPool
+
+
+@pytest.fixture
+async def rocklet(monkeypatch):
+    """Routes the pooled clients to an in-process handler; ``rocklet.routes`` maps paths to handlers."""
+
+    class FakeRocklet:
+        def __init__(self):
+            self.routes = {}
+            self.requests: list[httpx.Request] = []
+            self.clients = 0
+
+        async def handle(self, request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return await self.routes[request.url.path](request)
+
+    fake = FakeRocklet()
+
+    def _new_client(self):
+        fake.clients += 1
+        return httpx.AsyncClient(transport=httpx.MockTransport(fake.handle))
+
+    monkeypatch.setattr(_HostPool, "_new_client", _new_client)
+    yield fake
+    await HttpClientPool.aclose()
+
+
+@pytest.fixture
+def runtime():
+    return RemoteSandboxRuntime(host="http://127.0.0.1", port=22555)
+
+
+async def test_execute_round_trip(rocklet, runtime):
+    async def execute(request):
+        command = json.loads(request.content)
+        return httpx.Response(200, json={"exit_code": 0, "stdout": command["command"], "stderr": ""})
+
+    rocklet.routes["/execute"] = execute
+
+    response = await runtime.execute(Command(command="echo hi", sandbox_id="sb"))
+
+    assert response.stdout == "echo hi"
+    assert str(rocklet.requests[0].url) == "http://127.0.0.1:22555/execute"
+
+
+async def test_concurrent_executes_share_pooled_clients(rocklet, runtime):
+    async def execute(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"exit_code": 0, "stdout": "", "stderr": ""})
+
+    rocklet.routes["/execute"] = execute
+    other = RemoteSandboxRuntime(host="http://127.0.0.1", port=22555)
+
+    await asyncio.gather(
+        *[rt.execute(Command(command="true", sandbox_id="sb")) for rt in (runtime, other) for _ in range(100)]
+    )
+
+    assert len(rocklet.requests) == 200
+    assert rocklet.clients == len(HttpClientPool.get_host_pool(runtime._api_url)._clients)
+    assert rocklet.clients <= 8
+
+
+async def test_transferred_exception_is_reraised(rocklet, runtime):
+    async def execute(request):
+        transfer = {"message": "bad path", "class_path": "builtins.FileNotFoundError", "traceback": ""}
+        return httpx.Response(511, json={"rockletexception": transfer})
+
+    rocklet.routes["/execute"] = execute
+
+    with pytest.raises(FileNotFoundError, match="bad path"):
+        await runtime.execute(Command(command="cat nope", sandbox_id="sb"))
+
+
+async def test_is_alive_reports_connection_errors(rocklet, runtime):
+    async def is_alive(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    rocklet.routes["/is_alive"] = is_alive
+
+    response = await runtime.is_alive(timeout=1)
+
+    assert response.is_alive is False
+    assert "Failed to connect" in response.message
+
+
+async def test_download_streams_body(rocklet, runtime):
+    async def download(request):
+        assert request.url.params["offset"] == "4"
+        return httpx.Response(200, stream=httpx.ByteStream(b"chunked body"))
+
+    rocklet.routes["/download"] = download
+
+    data = b"".join([chunk async for chunk in runtime.download(DownloadChunkRequest(path="/f", offset=4))])
+
+    assert data == b"chunked body"
+
+
+async def test_upload_file(rocklet, runtime, tmp_path):
+    async def upload(request):
+        body = request.read()
+        assert b"file contents" in body and b"/remote/f.txt" in body
+        return httpx.Response(200, json={"success": True, "file_name": "f.txt"})
+
+    rocklet.routes["/upload"] = upload
+    source = tmp_path / "f.txt"
+    source.write_text("file contents")
+
+    response = await runtime.upload(UploadRequest(source_path=str(source), target_path="/remote/f.txt"))
+
+    assert response.success
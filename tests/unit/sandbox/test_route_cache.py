@@ -0,0 +1,258 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fakeredis import aioredis
+
+from rock import env_vars
+from rock.actions.sandbox.response import State
+from rock.admin.core.db_provider import DatabaseProvider
+from rock.admin.core.sandbox_table import SandboxTable
+from rock.admin.proto.request import SandboxCommand
+from rock.config import DatabaseConfig
+from rock.sandbox.sandbox_meta_store import SandboxMetaStore
+from rock.sandbox.service.route_cache import SandboxRouteCache
+from rock.sandbox.service.sandbox_proxy_service import SandboxProxyService
+from rock.sandbox.utils.timeout import SandboxTimeoutHelper
+from rock.utils.providers.redis_provider import RedisProvider
+
+SANDBOX_ID = "sbx-route-001"
+
+
+def _sandbox_info(host_ip: str = "10.0.0.1") -> dict:
+    return {
+        "sandbox_id": SANDBOX_ID,
+        "state": State.RUNNING,
+        "host_ip": host_ip,
+        "port_mapping": {"8000": 32000},
+    }
+
+
+class _CountingFakeRedis(aioredis.FakeRedis):
+    commands: list[str]
+
+    async def execute_command(self, *args, **kwargs):
+        self.commands.append(str(args[0]))
+        return await super().execute_command(*args, **kwargs)
+
+    def pipeline(self, transaction: bool = True, shard_hint=None):
+        pipe = super().pipeline(transaction, shard_hint)
+        execute = pipe.execute
+
+        async def counting_execute(raise_on_error: bool = True):
+            self.commands.append("PIPELINE")
+            return await execute(raise_on_error)
+
+        pipe.execute = counting_execute
+        return pipe
+
+
+@pytest.fixture
+async def redis():
+    provider = RedisProvider(host=None, port=None, password="")
+    provider.client = _CountingFakeRedis(decode_responses=True)
+    provider.client.commands = []
+    yield provider
+    await provider.close_pool()
+
+
+@pytest.fixture
+async def db():
+    provider = DatabaseProvider(db_config=DatabaseConfig(url="sqlite:///:memory:"))
+    await provider.init()
+    await provider.create_tables()
+    yield SandboxTable(provider)
+    await provider.close()
+
+
+@pytest.fixture
+async def meta_store(redis, db):
+    store = SandboxMetaStore(redis_provider=redis, sandbox_table=db)
+    await store.create(SANDBOX_ID, _sandbox_info(), timeout_info=SandboxTimeoutHelper.make_timeout_info(30))
+    return store
+
+
+@pytest.fixture
+async def proxy_service(rock_config, meta_store):
+    service = SandboxProxyService(rock_config, meta_store=meta_store)
+    service._send_request = AsyncMock(return_value={"stdout": "ok", "stderr": "", "exit_code": 0})
+    yield service
+    await service.aclose()
+
+
+async def test_cache_hit_makes_no_redis_calls(proxy_service, redis):
+    command = SandboxCommand(command="echo hi", sandbox_id=SANDBOX_ID)
+    await proxy_service.execute(command)
+    await asyncio.sleep(0)
+
+    redis.client.commands.clear()
+    for _ in range(10):
+        response = await proxy_service.execute(command)
+
+    assert response.stdout == "ok"
+    assert redis.client.commands == []
+    assert proxy_service._send_request.await_count == 11
+
+
+async def test_local_update_invalidates_route(proxy_service, meta_store):
+    command = SandboxCommand(command="echo hi", sandbox_id=SANDBOX_ID)
+    await proxy_service.execute(command)
+
+    await meta_store.update(SANDBOX_ID, {"host_ip": "10.0.0.2"})
+    await proxy_service.execute(command)
+
+    status_dict = proxy_service._send_request.await_args.args[1]
+    assert status_dict["host_ip"] == "10.0.0.2"
+
+
+async def test_archive_stops_routing(proxy_service, meta_store):
+    command = SandboxCommand(command="echo hi", sandbox_id=SANDBOX_ID)
+    await proxy_service.execute(command)
+
+    await meta_store.archive(SANDBOX_ID, {"state": State.STOPPED})
+
+    with pytest.raises(Exception, match="not started"):
+        await proxy_service.execute(command)
+
+
+async def test_change_on_other_replica_invalidates_via_pubsub(proxy_service, redis, db):
+    other_replica = SandboxMetaStore(redis_provider=redis, sandbox_table=db)
+    command = SandboxCommand(command="echo hi", sandbox_id=SANDBOX_ID)
+    await proxy_service.execute(command)
+    await asyncio.sleep(0.05)  # let the subscriber attach
+
+    await other_replica.update(SANDBOX_ID, {"host_ip": "10.0.0.3"})
+    await asyncio.sleep(0.05)
+    await proxy_service.execute(command)
+
+    status_dict = proxy_service._send_request.await_args.args[1]
+    assert status_dict["host_ip"] == "10.0.0.3"
+
+
+async def test_entries_expire_after_ttl(meta_store):
+    now = [0.0]
+    cache = SandboxRouteCache(meta_store, ttl_seconds=5, refresh_interval_seconds=1, clock=lambda: now[0])
+    with patch.object(meta_store, "get", wraps=meta_store.get) as get:
+        await cache.get(SANDBOX_ID)
+        now[0] = 4.9
+        await cache.get(SANDBOX_ID)
+        assert get.await_count == 1
+        now[0] = 5.1
+        await cache.get(SANDBOX_ID)
+        assert get.await_count == 2
+    await cache.aclose()
+
+
+async def test_concurrent_misses_share_one_read(meta_store):
+    cache = SandboxRouteCache(meta_store, ttl_seconds=5, refresh_interval_seconds=1)
+    with patch.object(meta_store, "get", wraps=meta_store.get) as get:
+        results = await asyncio.gather(*[cache.get(SANDBOX_ID) for _ in range(20)])
+    assert get.await_count == 1
+    assert all(result["host_ip"] == "10.0.0.1" for result in results)
+    await cache.aclose()
+
+
+async def test_invalidating_another_sandbox_does_not_stop_caching(meta_store):
+    cache = SandboxRouteCache(meta_store, ttl_seconds=5, refresh_interval_seconds=1)
+    read = meta_store.get
+
+    async def get_while_others_change(sandbox_id):
+        cache.invalidate("sbx-other")
+        cache.invalidate(sandbox_id if sandbox_id == "raced" else "sbx-other-2")
+        return await read(sandbox_id)
+
+    with patch.object(meta_store, "get", side_effect=get_while_others_change):
+        await cache.get(SANDBOX_ID)
+
+    assert SANDBOX_ID in cache._entries
+    assert cache._watched == {}
+    await cache.aclose()
+
+
+async def test_invalidation_during_load_is_not_cached(meta_store):
+    cache = SandboxRouteCache(meta_store, ttl_seconds=5, refresh_interval_seconds=1)
+    read = meta_store.get
+
+    async def get_then_invalidate(sandbox_id):
+        info = await read(sandbox_id)
+        cache.invalidate(sandbox_id)
+        return info
+
+    with patch.object(meta_store, "get", side_effect=get_then_invalidate):
+        assert (await cache.get(SANDBOX_ID))["host_ip"] == "10.0.0.1"
+
+    assert SANDBOX_ID not in cache._entries
+    await cache.aclose()
+
+
+async def test_callers_cannot_mutate_cached_info(meta_store):
+    cache = SandboxRouteCache(meta_store, ttl_seconds=5, refresh_interval_seconds=1)
+    (await cache.get(SANDBOX_ID))["host_ip"] = "changed"
+    (await cache.get(SANDBOX_ID))["host_ip"] = "changed"
+    (await cache.get_many([SANDBOX_ID]))[SANDBOX_ID]["host_ip"] = "changed"
+
+    assert (await cache.get(SANDBOX_ID))["host_ip"] == "10.0.0.1"
+    await cache.aclose()
+
+
+async def test_get_many_reads_misses_in_one_round_trip(meta_store, redis):
+    other_id = "sbx-route-002"
+    await meta_store.create(other_id, {**_sandbox_info("10.0.0.2"), "sandbox_id": other_id})
+    cache = SandboxRouteCache(meta_store, ttl_seconds=5, refresh_interval_seconds=1)
+    await cache.get(SANDBOX_ID)
+    await asyncio.sleep(0)
+
+    redis.client.commands.clear()
+    routes = await cache.get_many([SANDBOX_ID, other_id, "missing"])
+
+    assert {sandbox_id: route["host_ip"] for sandbox_id, route in routes.items()} == {
+        SANDBOX_ID: "10.0.0.1",
+        other_id: "10.0.0.2",
+    }
+    assert redis.client.commands == ["JSON.MGET"]
+    assert set(cache._entries) == {SANDBOX_ID, other_id}
+    await cache.aclose()
+
+
+async def test_unroutable_sandbox_is_not_cached(meta_store):
+    cache = SandboxRouteCache(meta_store, ttl_seconds=5, refresh_interval_seconds=1)
+    assert await cache.get("missing") is None
+    assert "missing" not in cache._entries
+    await cache.aclose()
+
+
+async def test_expire_refresh_is_coalesced_and_written_behind(meta_store):
+    cache = SandboxRouteCache(meta_store, ttl_seconds=5, refresh_interval_seconds=0.05)
+    await meta_store.update_timeout(SANDBOX_ID, {env_vars.ROCK_SANDBOX_AUTO_CLEAR_TIME_KEY: "30", "expire_time": "0"})
+
+    with patch.object(meta_store, "update_timeout", wraps=meta_store.update_timeout) as update_timeout:
+        for _ in range(50):
+            cache.touch(SANDBOX_ID)
+        assert update_timeout.await_count == 0
+        await asyncio.sleep(0.2)
+        assert update_timeout.await_count == 1
+
+    timeout_info = await meta_store.get_timeout(SANDBOX_ID)
+    assert int(timeout_info[env_vars.ROCK_SANDBOX_EXPIRE_TIME_KEY]) > 0
+    await cache.aclose()
+
+
+async def test_aclose_flushes_pending_refresh(meta_store):
+    cache = SandboxRouteCache(meta_store, ttl_seconds=5, refresh_interval_seconds=60)
+    with patch.object(meta_store, "update_timeout", wraps=meta_store.update_timeout) as update_timeout:
+        cache.touch(SANDBOX_ID)
+        await cache.aclose()
+    assert update_timeout.await_count == 1
+
+
+async def test_disabled_cache_reads_through(rock_config, meta_store, redis):
+    rock_config.proxy_service.route_cache_ttl_seconds = 0
+    service = SandboxProxyService(rock_config, meta_store=meta_store)
+    service._send_request = AsyncMock(return_value={"stdout": "", "stderr": "", "exit_code": 0})
+    command = SandboxCommand(command="echo hi", sandbox_id=SANDBOX_ID)
+    await service.execute(command)
+
+    redis.client.commands.clear()
+    await service.execute(command)
+
+    assert len(redis.client.commands) == 4
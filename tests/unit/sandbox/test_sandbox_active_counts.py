@@ -0,0 +1,170 @@
+"""Tests for the incrementally maintained active sandbox counts and BaseManager's metrics collection.
+
+Tests cover:
+- SandboxMetaStore keeping per-image counts on create / update / archive / delete
+- SandboxMetaStore paginated iteration over active sandboxes
+- BaseManager reporting counts without scanning the DB, reconciling rarely, and caching cluster resources
+"""
+
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+
+from rock.actions.sandbox.response import State
+from rock.admin.core.redis_key import SANDBOX_ACTIVE_COUNT_KEY
+from rock.admin.core.sandbox_table import SandboxTable
+from rock.admin.metrics.constants import MetricsConstants
+from rock.sandbox.base_manager import BaseManager
+from rock.sandbox.sandbox_meta_store import SandboxMetaStore
+from rock.utils import get_executor
+from rock.utils.providers.redis_provider import RedisProvider
+
+
+@pytest.fixture
+def meta_store(redis_provider: RedisProvider, _memory_sandbox_table: SandboxTable):
+    return SandboxMetaStore(redis_provider=redis_provider, sandbox_table=_memory_sandbox_table)
+
+
+@pytest.fixture
+def base_manager(meta_store):
+    mgr = BaseManager.__new__(BaseManager)
+    mgr._meta_store = meta_store
+    mgr._executor = get_executor()
+    mgr.metrics_monitor = MagicMock()
+    return mgr
+
+
+def _info(sandbox_id: str, image: str = "python:3.11", state: str = State.PENDING) -> dict:
+    return {"sandbox_id": sandbox_id, "image": image, "state": state, "host_ip": "10.0.0.1"}
+
+
+class TestActiveCounts:
+    async def test_counts_follow_state_transitions(self, meta_store):
+        await meta_store.create("sbx-1", _info("sbx-1"))
+        await meta_store.create("sbx-2", _info("sbx-2", image="ubuntu:22.04"))
+        assert await meta_store.count_active_by_image() == {"python:3.11": 1, "ubuntu:22.04": 1}
+
+        # pending -> running keeps the sandbox active; repeating the write does not count it twice.
+        await meta_store.update("sbx-1", _info("sbx-1", state=State.RUNNING))
+        await meta_store.update("sbx-1", _info("sbx-1", state=State.RUNNING))
+        assert await meta_store.count_active_by_image() == {"python:3.11": 1, "ubuntu:22.04": 1}
+
+        await meta_store.archive("sbx-1", {"state": State.STOPPED})
+        await meta_store.archive("sbx-1", {"state": State.STOPPED})
+        assert await meta_store.count_active_by_image() == {"python:3.11": 0, "ubuntu:22.04": 1}
+
+        # restart re-seeds the sandbox as pending
+        await meta_store.update("sbx-1", _info("sbx-1"))
+        assert await meta_store.count_active_by_image() == {"python:3.11": 1, "ubuntu:22.04": 1}
+
+        await meta_store.delete("sbx-2")
+        assert await meta_store.count_active_by_image() == {"python:3.11": 1, "ubuntu:22.04": 0}
+
+    async def test_writes_without_state_leave_counts_alone(self, meta_store):
+        await meta_store.create("sbx-1", _info("sbx-1"))
+
+        await meta_store.update("sbx-1", {"host_ip": "10.0.0.2"})
+
+        assert await meta_store.count_active_by_image() == {"python:3.11": 1}
+
+    async def test_missing_image_counts_as_default(self, meta_store):
+        await meta_store.create("sbx-1", {"sandbox_id": "sbx-1", "state": State.RUNNING})
+
+        assert await meta_store.count_active_by_image() == {"default": 1}
+
+    async def test_reset_replaces_drifted_counts(self, meta_store, redis_provider):
+        await meta_store.create("sbx-1", _info("sbx-1"))
+        await redis_provider.client.hset(SANDBOX_ACTIVE_COUNT_KEY, mapping={"python:3.11": 7, "gone:1": 3})
+
+        await meta_store.reset_active_sandboxes({"sbx-1": "python:3.11"})
+
+        assert await meta_store.count_active_by_image() == {"python:3.11": 1}
+        await meta_store.archive("sbx-1", {"state": State.STOPPED})
+        assert await meta_store.count_active_by_image() == {"python:3.11": 0}
+
+    async def test_paginated_iteration_reads_pages(self, meta_store, _memory_sandbox_table):
+        for i in range(5):
+            await meta_store.create(f"sbx-{i}", _info(f"sbx-{i}"))
+        await meta_store.create("sbx-stopped", _info("sbx-stopped", state=State.STOPPED))
+
+        with patch.object(_memory_sandbox_table, "list_by_in", wraps=_memory_sandbox_table.list_by_in) as list_by_in:
+            ids = [info["sandbox_id"] async for info in meta_store.iter_alive_sandbox_info(page_size=2)]
+
+        assert ids == [f"sbx-{i}" for i in range(5)]
+        assert list_by_in.await_count == 3
+
+
+class TestBaseManagerMetrics:
+    async def test_reports_counts_and_reconciles_only_on_interval(self, base_manager, meta_store):
+        await meta_store.create("sbx-1", _info("sbx-1"))
+        await meta_store.create("sbx-2", _info("sbx-2"))
+
+        with (
+            patch("rock.sandbox.base_manager._read_cluster_resources", return_value=(8, 16, 4, 8)),
+            patch.object(meta_store, "iter_alive_sandbox_info", wraps=meta_store.iter_alive_sandbox_info) as iter_alive,
+        ):
+            await base_manager._collect_and_report_metrics_internal()
+            await meta_store.archive("sbx-2", {"state": State.STOPPED})
+            await base_manager._collect_and_report_metrics_internal()
+
+        # Only the first round scanned the DB.
+        assert iter_alive.call_count == 1
+        record = base_manager.metrics_monitor.record_gauge_by_name
+        assert record.call_args_list[-2:] == [
+            call(MetricsConstants.SANDBOX_COUNT_IMAGE, 1, {"image": "python:3.11"}),
+            call(MetricsConstants.SANDBOX_TOTAL_COUNT, 1),
+        ]
+
+    async def test_reconcile_corrects_drift(self, base_manager, meta_store, redis_provider):
+        await meta_store.create("sbx-1", _info("sbx-1"))
+        await redis_provider.client.hset(SANDBOX_ACTIVE_COUNT_KEY, "python:3.11", 5)
+        base_manager._last_reconcile_time = 0.0
+
+        with patch("rock.sandbox.base_manager.time.monotonic", return_value=base_manager._reconcile_interval):
+            await base_manager._reconcile_sandbox_counts()
+
+        assert await meta_store.count_active_by_image() == {"python:3.11": 1}
+
+    async def test_image_dropped_by_reconcile_is_reported_as_zero_once(self, base_manager, meta_store):
+        await meta_store.create("sbx-1", _info("sbx-1"))
+        await meta_store.create("sbx-2", _info("sbx-2", image="ubuntu:22.04"))
+        record = base_manager.metrics_monitor.record_gauge_by_name
+        dropped = call(MetricsConstants.SANDBOX_COUNT_IMAGE, 0, {"image": "ubuntu:22.04"})
+
+        with patch("rock.sandbox.base_manager._read_cluster_resources", return_value=(8, 16, 4, 8)):
+            await base_manager._collect_and_report_metrics_internal()
+            await meta_store.archive("sbx-2", {"state": State.STOPPED})
+            base_manager._last_reconcile_time = None
+            record.reset_mock()
+            await base_manager._collect_and_report_metrics_internal()
+            assert await meta_store.count_active_by_image() == {"python:3.11": 1}
+            assert dropped in record.call_args_list
+
+            record.reset_mock()
+            await base_manager._collect_and_report_metrics_internal()
+            assert dropped not in record.call_args_list
+
+    async def test_last_image_dropped_by_reconcile_is_reported_as_zero(self, base_manager, meta_store):
+        await meta_store.create("sbx-1", _info("sbx-1"))
+
+        with patch("rock.sandbox.base_manager._read_cluster_resources", return_value=(8, 16, 4, 8)):
+            await base_manager._collect_and_report_metrics_internal()
+            await meta_store.archive("sbx-1", {"state": State.STOPPED})
+            base_manager._last_reconcile_time = None
+            await base_manager._collect_and_report_metrics_internal()
+
+        record = base_manager.metrics_monitor.record_gauge_by_name
+        assert record.call_args_list[-2:] == [
+            call(MetricsConstants.SANDBOX_COUNT_IMAGE, 0, {"image": "python:3.11"}),
+            call(MetricsConstants.SANDBOX_TOTAL_COUNT, 0),
+        ]
+
+    async def test_cluster_resources_are_cached(self, base_manager):
+        with patch("rock.sandbox.base_manager.ray") as mock_ray:
+            mock_ray.cluster_resources.return_value = {"CPU": 8, "memory": 16 * 1024**3}
+            mock_ray.available_resources.return_value = {"CPU": 2, "memory": 4 * 1024**3}
+            first = await base_manager._collect_system_resource_metrics()
+            second = await base_manager._collect_system_resource_metrics()
+
+        assert first == second == (8, 16, 2, 4)
+        assert mock_ray.cluster_resources.call_count == 1
@@ -0,0 +1,187 @@
+import asyncio
+import json
+import subprocess
+import sys
+import time
+
+import httpx
+import pytest
+from fakeredis import aioredis
+from fastapi import FastAPI
+
+from rock.actions import Command
+from rock.actions.sandbox.response import State
+from rock.admin.core.db_provider import DatabaseProvider
+from rock.admin.core.sandbox_table import SandboxTable
+from rock.admin.entrypoints import sandbox_proxy_api
+from rock.admin.proto.request import SandboxBatchCommand
+from rock.config import DatabaseConfig
+from rock.deployments.constants import Port
+from rock.sandbox.sandbox_meta_store import SandboxMetaStore
+from rock.sandbox.service.sandbox_proxy_service import SandboxProxyService
+from rock.sdk.sandbox.client import SandboxGroup
+from rock.sdk.sandbox.config import SandboxGroupConfig
+from rock.utils import HttpClientPool, find_free_port
+from rock.utils.http import _HostPool
+from rock.utils.providers.redis_provider import RedisProvider
+
+ROCKLETS = 3
+SANDBOXES_PER_ROCKLET = 2
+
+
+@pytest.fixture(scope="module")
+def rocklet_ports():
+    """Several real rocklet processes, as a batch spans sandboxes on different hosts."""
+    ports = [asyncio.run(find_free_port()) for _ in range(ROCKLETS)]
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "-m", "rock.rocklet", "--host", "127.0.0.1", "--port", str(port)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        for port in ports
+    ]
+    try:
+        deadline = time.monotonic() + 30
+        for port in ports:
+            while True:
+                try:
+                    if httpx.get(f"http://127.0.0.1:{port}/is_alive", timeout=1).status_code == 200:
+                        break
+                except httpx.HTTPError:
+                    pass
+                assert time.monotonic() < deadline, f"rocklet on port {port} did not start"
+                time.sleep(0.1)
+        yield ports
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+@pytest.fixture
+async def meta_store(rocklet_ports):
+    redis = RedisProvider(host=None, port=None, password="")
+    redis.client = aioredis.FakeRedis(decode_responses=True)
+    db_provider = DatabaseProvider(db_config=DatabaseConfig(url="sqlite:///:memory:"))
+    await db_provider.init()
+    await db_provider.create_tables()
+    store = SandboxMetaStore(redis_provider=redis, sandbox_table=SandboxTable(db_provider))
+    for port in rocklet_ports:
+        for index in range(SANDBOXES_PER_ROCKLET):
+            sandbox_id = f"sbx-{port}-{index}"
+            await store.create(
+                sandbox_id,
+                {
+                    "sandbox_id": sandbox_id,
+                    "state": State.RUNNING,
+                    "host_ip": "127.0.0.1",
+                    "port_mapping": {str(Port.PROXY): port},
+                },
+            )
+    yield store
+    await db_provider.close()
+    await redis.close_pool()
+
+
+@pytest.fixture
+async def proxy_service(rock_config, meta_store):
+    service = SandboxProxyService(rock_config, meta_store=meta_store)
+    yield service
+    await service.aclose()
+    await service._httpx_client.aclose()
+
+
+def _sandbox_ids(ports: list[int]) -> list[str]:
+    return [f"sbx-{port}-{index}" for port in ports for index in range(SANDBOXES_PER_ROCKLET)]
+
+
+async def test_batch_execute_runs_command_on_every_rocklet(proxy_service, rocklet_ports):
+    sandbox_ids = _sandbox_ids(rocklet_ports)
+    request = SandboxBatchCommand(command="echo $GREETING", shell=True, env={"GREETING": "hi"}, sandbox_ids=sandbox_ids)
+
+    results = [result async for result in await proxy_service.batch_execute(request)]
+
+    assert sorted(result.sandbox_id for result in results) == sorted(sandbox_ids)
+    assert all(result.error is None and result.result.stdout == "hi\n" for result in results)
+
+
+async def test_batch_execute_forwards_check(proxy_service, rocklet_ports):
+    request = SandboxBatchCommand(
+        command="exit 3", shell=True, check=True, error_msg="boom", sandbox_ids=_sandbox_ids(rocklet_ports)[:1]
+    )
+
+    [result] = [result async for result in await proxy_service.batch_execute(request)]
+
+    # As with a single execute, a failed check comes back as a rocklet exception rather than exit code 3.
+    assert result.error is None
+    assert result.result.exit_code == -1
+
+
+async def test_batch_execute_streams_results_in_completion_order(proxy_service, rocklet_ports):
+    request = SandboxBatchCommand(command="sleep 0.5", shell=True, sandbox_ids=[*_sandbox_ids(rocklet_ports), "gone"])
+
+    results = [result async for result in await proxy_service.batch_execute(request)]
+
+    assert results[0].sandbox_id == "gone"
+    assert results[0].error == "sandbox gone not started"
+    assert all(result.result.exit_code == 0 for result in results[1:])
+
+
+async def test_batch_execute_bounds_concurrency(proxy_service, rocklet_ports, monkeypatch):
+    monkeypatch.setattr(proxy_service.proxy_config, "batch_execute_concurrency", 2)
+    request = SandboxBatchCommand(command="sleep 0.3", shell=True, sandbox_ids=_sandbox_ids(rocklet_ports))
+
+    start = time.monotonic()
+    results = [result async for result in await proxy_service.batch_execute(request)]
+
+    assert len(results) == ROCKLETS * SANDBOXES_PER_ROCKLET
+    assert time.monotonic() - start >= 0.3 * ROCKLETS * SANDBOXES_PER_ROCKLET / 2
+
+
+async def test_sandbox_group_execute_over_one_request(proxy_service, rocklet_ports, monkeypatch):
+    app = FastAPI()
+    app.include_router(sandbox_proxy_api.sandbox_proxy_router, prefix="/apis/envs/sandbox/v1")
+    sandbox_proxy_api.set_sandbox_proxy_service(proxy_service)
+    requests: list[httpx.Request] = []
+
+    def _new_client(self):
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), event_hooks={"request": [_record]})
+
+    async def _record(request: httpx.Request):
+        requests.append(request)
+
+    monkeypatch.setattr(_HostPool, "_new_client", _new_client)
+    group = SandboxGroup(SandboxGroupConfig(base_url="http://admin", size=ROCKLETS * SANDBOXES_PER_ROCKLET))
+    for sandbox, sandbox_id in zip(group.sandbox_list, _sandbox_ids(rocklet_ports)):
+        sandbox._sandbox_id = sandbox_id
+
+    try:
+        results = [result async for result in group.execute(Command(command=["echo", "hi"]))]
+    finally:
+        await HttpClientPool.aclose()
+
+    assert sorted(result.sandbox_id for result in results) == sorted(_sandbox_ids(rocklet_ports))
+    assert all(result.result.stdout == "hi\n" for result in results)
+    assert [request.url.path for request in requests] == ["/apis/envs/sandbox/v1/batch_execute"]
+
+
+async def test_sandbox_group_execute_falls_back_to_one_request_per_sandbox(monkeypatch):
+    async def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/batch_execute"):
+            return httpx.Response(404)
+        sandbox_id = json.loads(request.content)["sandbox_id"]
+        return httpx.Response(200, json={"status": "Success", "result": {"stdout": sandbox_id}})
+
+    monkeypatch.setattr(_HostPool, "_new_client", lambda self: httpx.AsyncClient(transport=httpx.MockTransport(handle)))
+    group = SandboxGroup(SandboxGroupConfig(base_url="http://admin", size=2))
+    for index, sandbox in enumerate(group.sandbox_list):
+        sandbox._sandbox_id = f"sbx-{index}"
+
+    try:
+        results = [result async for result in group.execute(Command(command="true"))]
+    finally:
+        await HttpClientPool.aclose()
+
+    assert sorted(result.sandbox_id for result in results) == ["sbx-0", "sbx-1"]
+    assert all(result.result.stdout == result.sandbox_id for result in results)
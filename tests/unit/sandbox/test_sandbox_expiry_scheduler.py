@@ -0,0 +1,180 @@
+"""Tests for SandboxExpiryScheduler and the expiry index kept by SandboxMetaStore (FakeRedis, simulated clock)."""
+
+import asyncio
+
+import pytest
+
+from rock.actions.sandbox.response import State
+from rock.admin.core.redis_key import SANDBOX_EXPIRY_KEY, expiry_lease_key
+from rock.config import ExpiryConfig
+from rock.sandbox.sandbox_expiry_scheduler import SandboxExpiryScheduler
+from rock.sandbox.sandbox_meta_store import SandboxMetaStore
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def store(redis_provider, _memory_sandbox_table):
+    return SandboxMetaStore(redis_provider=redis_provider, sandbox_table=_memory_sandbox_table)
+
+
+class Stopper:
+    """Stands in for SandboxManager.stop: archives the sandbox like a real stop does."""
+
+    def __init__(self, store: SandboxMetaStore, delay: float = 0.0):
+        self.store = store
+        self.delay = delay
+        self.calls: list[str] = []
+        self.fail: set[str] = set()
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, sandbox_id: str) -> None:
+        self.calls.append(sandbox_id)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if sandbox_id in self.fail:
+                raise RuntimeError("stop failed")
+            await self.store.archive(sandbox_id, {"state": State.STOPPED})
+        finally:
+            self.running -= 1
+
+
+def make_scheduler(store, stopper, clock, **overrides) -> SandboxExpiryScheduler:
+    config = ExpiryConfig(**{"batch_size": 100, "concurrency": 16, "lease_seconds": 60, **overrides})
+    return SandboxExpiryScheduler(store, stopper, config, clock=clock)
+
+
+async def create(store, sandbox_id: str, expire_time: float) -> None:
+    info = {"sandbox_id": sandbox_id, "state": State.RUNNING, "image": "python:3.11"}
+    await store.create(sandbox_id, info, timeout_info={"auto_clear_time": "30", "expire_time": str(int(expire_time))})
+
+
+async def index(redis_provider) -> dict[str, float]:
+    return dict(await redis_provider.client.zrange(SANDBOX_EXPIRY_KEY, 0, -1, withscores=True))
+
+
+# ---------------------------------------------------------------------------
+# Expiry index
+# ---------------------------------------------------------------------------
+
+
+class TestExpiryIndex:
+    async def test_create_refresh_and_archive_maintain_index(self, store, redis_provider):
+        await create(store, "sbx-1", 2000)
+        assert await index(redis_provider) == {"sbx-1": 2000}
+
+        await store.update_timeout("sbx-1", {"auto_clear_time": "30", "expire_time": "5000"})
+        assert await index(redis_provider) == {"sbx-1": 5000}
+
+        await store.archive("sbx-1", {"state": State.STOPPED})
+        assert await index(redis_provider) == {}
+
+    async def test_claim_returns_only_due_entries_once(self, store, redis_provider):
+        await create(store, "due", 900)
+        await create(store, "later", 1100)
+
+        assert await store.claim_expired(1000, 10, 60, "replica-a") == ["due"]
+        assert await store.claim_expired(1000, 10, 60, "replica-b") == []
+        # The lease moved the claimed entry ahead so it no longer takes up a batch slot.
+        assert (await index(redis_provider))["due"] == 1060
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+
+class TestSandboxExpiryScheduler:
+    async def test_stops_only_due_sandboxes(self, store, clock):
+        stopper = Stopper(store)
+        scheduler = make_scheduler(store, stopper, clock)
+        await create(store, "expired", clock.now - 10)
+        await create(store, "alive", clock.now + 600)
+
+        assert await scheduler.run_once() == ["expired"]
+        assert stopper.calls == ["expired"]
+
+        clock.now += 601
+        assert await scheduler.run_once() == ["alive"]
+        assert await scheduler.run_once() == []
+
+    async def test_refreshed_timeout_is_rescheduled_not_stopped(self, store, redis_provider, clock):
+        stopper = Stopper(store)
+        scheduler = make_scheduler(store, stopper, clock)
+        await create(store, "sbx-1", clock.now - 10)
+        # The timeout key was refreshed, but the index entry still holds the old expire time.
+        await redis_provider.json_set(
+            "timeout:sbx-1", "$", {"auto_clear_time": "30", "expire_time": str(int(clock.now) + 900)}
+        )
+
+        assert await scheduler.run_once() == []
+        assert stopper.calls == []
+        assert await index(redis_provider) == {"sbx-1": int(clock.now) + 900}
+
+    async def test_replicas_never_stop_the_same_sandbox_twice(self, store, clock):
+        stopper = Stopper(store, delay=0.01)
+        replicas = [make_scheduler(store, stopper, clock, batch_size=3) for _ in range(3)]
+        for i in range(20):
+            await create(store, f"sbx-{i}", clock.now - 1 - i)
+
+        results = await asyncio.gather(*(replica.run_once() for replica in replicas))
+
+        assert sorted(stopper.calls) == sorted(f"sbx-{i}" for i in range(20))
+        assert sum(len(r) for r in results) == 20
+
+    async def test_failed_stop_is_retried_after_lease(self, store, redis_provider, clock):
+        stopper = Stopper(store)
+        stopper.fail.add("sbx-1")
+        scheduler = make_scheduler(store, stopper, clock, lease_seconds=60)
+        await create(store, "sbx-1", clock.now - 1)
+
+        assert await scheduler.run_once() == []
+        clock.now += 30
+        assert await scheduler.run_once() == []
+        assert stopper.calls == ["sbx-1"]
+
+        stopper.fail.clear()
+        clock.now += 31
+        # Redis expires the lease key on its own clock; stand in for that here.
+        await redis_provider.client.delete(expiry_lease_key("sbx-1"))
+        assert await scheduler.run_once() == ["sbx-1"]
+
+    async def test_parallelism_is_bounded(self, store, clock):
+        stopper = Stopper(store, delay=0.01)
+        scheduler = make_scheduler(store, stopper, clock, concurrency=3)
+        for i in range(10):
+            await create(store, f"sbx-{i}", clock.now - 1)
+
+        assert len(await scheduler.run_once()) == 10
+        assert stopper.max_running == 3
+
+    async def test_drains_all_due_entries_across_batches(self, store, clock):
+        stopper = Stopper(store)
+        scheduler = make_scheduler(store, stopper, clock, batch_size=2)
+        for i in range(5):
+            await create(store, f"sbx-{i}", clock.now - 1)
+
+        assert len(await scheduler.run_once()) == 5
+
+    async def test_first_round_indexes_sandboxes_created_before_the_index(self, store, redis_provider, clock):
+        stopper = Stopper(store)
+        scheduler = make_scheduler(store, stopper, clock)
+        await create(store, "old", clock.now - 1)
+        await redis_provider.client.delete(SANDBOX_EXPIRY_KEY)
+
+        assert await scheduler.run_once() == ["old"]
+
+    async def test_entry_without_timeout_key_is_dropped(self, store, redis_provider, clock):
+        stopper = Stopper(store)
+        scheduler = make_scheduler(store, stopper, clock)
+        await create(store, "sbx-1", clock.now - 1)
+        await redis_provider.json_delete("timeout:sbx-1")
+
+        assert await scheduler.run_once() == []
+        assert stopper.calls == []
+        assert await index(redis_provider) == {}
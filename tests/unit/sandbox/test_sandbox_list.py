@@ -0,0 +1,77 @@
+"""Tests for SandboxProxyService.list_sandboxes paging, filtering and projection (FakeRedis, in-memory SQLite)."""
+
+import pytest
+
+from rock.actions.sandbox.response import State
+from rock.admin.core.sandbox_table import SandboxTable
+from rock.sandbox.sandbox_meta_store import SandboxMetaStore
+from rock.sandbox.service.sandbox_proxy_service import SandboxProxyService
+from rock.sdk.common.exceptions import BadRequestRockError
+from rock.utils.providers.redis_provider import RedisProvider
+
+
+@pytest.fixture
+async def service(redis_provider: RedisProvider, _memory_sandbox_table: SandboxTable):
+    meta_store = SandboxMetaStore(redis_provider=redis_provider, sandbox_table=_memory_sandbox_table)
+    service = SandboxProxyService.__new__(SandboxProxyService)
+    service._meta_store = meta_store
+    service._batch_get_status_max_count = 1000
+    for i in range(7):
+        info = {
+            "sandbox_id": f"sbx-{i}",
+            "user_id": "alice" if i < 4 else "bob",
+            "state": State.STOPPED if i == 6 else State.RUNNING,
+            "image": "python:3.11",
+            "rock_authorization_encrypted": "secret",
+        }
+        await meta_store.create(f"sbx-{i}", info)
+    return service
+
+
+def ids(response) -> list[str]:
+    return [item.sandbox_id for item in response.items]
+
+
+async def test_cursor_pages_through_active_sandboxes(service):
+    first = await service.list_sandboxes({"page_size": "4"})
+    assert ids(first) == ["sbx-0", "sbx-1", "sbx-2", "sbx-3"]
+    assert (first.total, first.has_more) == (6, True)
+
+    second = await service.list_sandboxes({"page_size": "4", "cursor": first.next_cursor})
+    assert ids(second) == ["sbx-4", "sbx-5"]
+    assert (second.has_more, second.next_cursor) == (False, None)
+
+
+async def test_legacy_page_parameter(service):
+    response = await service.list_sandboxes({"page": "2", "page_size": "4"})
+
+    assert ids(response) == ["sbx-4", "sbx-5"]
+    assert response.total == 6
+
+
+async def test_filters_projection_and_count_opt_out(service):
+    response = await service.list_sandboxes({"user_id": "bob", "fields": "state", "count": "false"})
+
+    assert ids(response) == ["sbx-4", "sbx-5"]
+    assert response.total is None
+    assert response.items[0].state == State.RUNNING
+    assert response.items[0].user_id is None
+
+
+async def test_default_projection_keeps_list_response_fields(service):
+    response = await service.list_sandboxes({"sandbox_id": "sbx-0"})
+
+    [item] = response.items
+    assert (item.user_id, item.image, item.rock_authorization_encrypted) == ("alice", "python:3.11", "secret")
+
+
+async def test_unknown_filter_matches_nothing(service):
+    response = await service.list_sandboxes({"no_such_key": "x"})
+
+    assert (response.items, response.total, response.has_more) == ([], 0, False)
+
+
+@pytest.mark.parametrize("params", [{"fields": "auth_token"}, {"cursor": "!!"}, {"cursor": "c2J4", "page": "2"}])
+async def test_invalid_params_are_rejected(service, params):
+    with pytest.raises(BadRequestRockError):
+        await service.list_sandboxes(params)
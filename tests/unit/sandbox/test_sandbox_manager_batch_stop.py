@@ -0,0 +1,204 @@
+"""Unit tests for SandboxManager.batch_stop and the SDK's stop_sandboxes, against a stubbed meta_store / operator."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from rock.admin.entrypoints import sandbox_api
+from rock.common.constants import StopReason
+from rock.config import RockConfig, SandboxConfig
+from rock.sandbox.sandbox_manager import SandboxManager
+from rock.sdk.sandbox.client import Sandbox, SandboxGroup, stop_sandboxes
+from rock.sdk.sandbox.config import SandboxConfig as SdkSandboxConfig
+from rock.sdk.sandbox.config import SandboxGroupConfig
+from rock.utils import HttpClientPool
+from rock.utils.http import _HostPool
+
+
+class SlowOperator:
+    """Operator whose stop takes a while and tracks how many stops overlap."""
+
+    def __init__(self, seconds: float = 0.01, fail: set[str] | None = None):
+        self.seconds = seconds
+        self.fail = fail or set()
+        self.stopped: list[tuple[str, StopReason]] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def stop(self, sandbox_id: str, reason: StopReason = StopReason.MANUAL) -> None:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.seconds)
+            if sandbox_id in self.fail:
+                raise RuntimeError(f"cannot stop {sandbox_id}")
+            self.stopped.append((sandbox_id, reason))
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def operator():
+    return SlowOperator()
+
+
+@pytest.fixture
+def manager(operator):
+    cfg = RockConfig()
+    cfg.sandbox_config = SandboxConfig()
+    cfg.runtime.batch_stop_concurrency = 4
+    meta_store = AsyncMock()
+    # Unknown sandboxes are stopped as dangling, straight through the operator.
+    meta_store.get = AsyncMock(return_value=None)
+    with patch("rock.sandbox.base_manager.BaseManager._setup_scheduler"):
+        return SandboxManager(
+            rock_config=cfg,
+            meta_store=meta_store,
+            ray_namespace="test",
+            ray_service=MagicMock(),
+            enable_runtime_auto_clear=False,
+            operator=operator,
+        )
+
+
+async def test_batch_stop_stops_every_sandbox_once(manager, operator):
+    results = [result async for result in await manager.batch_stop(["sb-1", "sb-2", "sb-1", "sb-3"])]
+
+    assert sorted(result.sandbox_id for result in results) == ["sb-1", "sb-2", "sb-3"]
+    assert all(result.error is None for result in results)
+    assert sorted(operator.stopped) == [(f"sb-{i}", StopReason.MANUAL) for i in (1, 2, 3)]
+
+
+async def test_batch_stop_bounds_concurrency(manager, operator):
+    results = [result async for result in await manager.batch_stop([f"sb-{i}" for i in range(20)])]
+
+    assert len(results) == 20
+    assert operator.max_active == 4
+
+
+async def test_batch_stop_reports_failures_per_sandbox(manager, operator):
+    operator.fail = {"sb-2"}
+
+    results = {result.sandbox_id: result for result in await _collect(manager, ["sb-1", "sb-2"])}
+
+    assert results["sb-1"].error is None
+    assert results["sb-2"].error == "cannot stop sb-2"
+
+
+async def test_batch_stop_finishes_after_the_caller_goes_away(manager, operator):
+    results = await manager.batch_stop([f"sb-{i}" for i in range(8)])
+    await anext(results)
+    await results.aclose()
+
+    await manager.aclose()
+
+    assert len(operator.stopped) == 8
+
+
+async def test_stop_sandboxes_over_one_request(manager, operator, monkeypatch):
+    app = FastAPI()
+    app.include_router(sandbox_api.sandbox_router, prefix="/apis/envs/sandbox/v1")
+    monkeypatch.setattr(sandbox_api, "sandbox_manager", manager, raising=False)
+    requests: list[httpx.Request] = []
+
+    async def _record(request: httpx.Request):
+        requests.append(request)
+
+    def _new_client(self):
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), event_hooks={"request": [_record]})
+
+    monkeypatch.setattr(_HostPool, "_new_client", _new_client)
+    operator.fail = {"sb-3"}
+
+    try:
+        results = [result async for result in stop_sandboxes(_sandboxes(5))]
+    finally:
+        await HttpClientPool.aclose()
+
+    assert sorted(result.sandbox_id for result in results) == [f"sb-{i}" for i in range(5)]
+    assert [result.sandbox_id for result in results if result.error] == ["sb-3"]
+    assert [request.url.path for request in requests] == ["/apis/envs/sandbox/v1/batch_stop"]
+
+
+async def test_stop_sandboxes_falls_back_to_one_request_per_sandbox(monkeypatch):
+    async def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/batch_stop"):
+            return httpx.Response(404)
+        sandbox_id = json.loads(request.content)["sandbox_id"]
+        if sandbox_id == "sb-1":
+            return httpx.Response(200, json={"status": "Failed", "message": "stop sandbox failed"})
+        return httpx.Response(200, json={"status": "Success", "result": f"{sandbox_id} stopped"})
+
+    monkeypatch.setattr(_HostPool, "_new_client", lambda self: httpx.AsyncClient(transport=httpx.MockTransport(handle)))
+
+    try:
+        results = {result.sandbox_id: result async for result in stop_sandboxes(_sandboxes(3))}
+    finally:
+        await HttpClientPool.aclose()
+
+    assert sorted(results) == ["sb-0", "sb-1", "sb-2"]
+    assert results["sb-0"].error is None
+    assert "stop sandbox failed" in results["sb-1"].error
+
+
+async def test_stop_sandboxes_reports_the_rest_when_the_stream_breaks(monkeypatch):
+    async def body():
+        yield b'{"sandbox_id": "sb-0", "error": null}\n'
+        raise httpx.ReadError("connection reset")
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "application/x-ndjson"}, content=body())
+
+    monkeypatch.setattr(_HostPool, "_new_client", lambda self: httpx.AsyncClient(transport=httpx.MockTransport(handle)))
+
+    try:
+        results = {result.sandbox_id: result async for result in stop_sandboxes(_sandboxes(3))}
+    finally:
+        await HttpClientPool.aclose()
+
+    assert sorted(results) == ["sb-0", "sb-1", "sb-2"]
+    assert results["sb-0"].error is None
+    assert "connection reset" in results["sb-1"].error
+    assert "connection reset" in results["sb-2"].error
+
+
+async def test_unreachable_admin_does_not_abort_the_others(monkeypatch):
+    async def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "down":
+            raise httpx.ConnectError("connection refused")
+        sandbox_ids = json.loads(request.content)["sandbox_ids"]
+        lines = "".join(json.dumps({"sandbox_id": sandbox_id}) + "\n" for sandbox_id in sandbox_ids)
+        return httpx.Response(200, headers={"content-type": "application/x-ndjson"}, content=lines)
+
+    monkeypatch.setattr(_HostPool, "_new_client", lambda self: httpx.AsyncClient(transport=httpx.MockTransport(handle)))
+    up = _sandboxes(2)
+    down = _sandboxes(2, base_url="http://down", first=2)
+    group = SandboxGroup(SandboxGroupConfig(base_url="http://admin", size=0))
+    group.sandbox_list = [*up, *down]
+
+    try:
+        results = {result.sandbox_id: result async for result in stop_sandboxes(group.sandbox_list)}
+        await group.stop()
+    finally:
+        await HttpClientPool.aclose()
+
+    assert [sandbox_id for sandbox_id, result in sorted(results.items()) if result.error is None] == ["sb-0", "sb-1"]
+    assert "connection refused" in results["sb-2"].error
+    assert "connection refused" in results["sb-3"].error
+
+
+def _sandboxes(count: int, base_url: str = "http://admin", first: int = 0) -> list[Sandbox]:
+    sandboxes = [Sandbox(SdkSandboxConfig(base_url=base_url)) for _ in range(count)]
+    for index, sandbox in enumerate(sandboxes, start=first):
+        sandbox._sandbox_id = f"sb-{index}"
+    return sandboxes
+
+
+async def _collect(manager, sandbox_ids):
+    return [result async for result in await manager.batch_stop(sandbox_ids)]
@@ -3,6 +3,7 @@
 import asyncio
 import time
 import uuid
+from unittest.mock import patch
 
 import pytest
 from fakeredis import aioredis
@@ -43,6 +44,41 @@ def repo(redis, db):
     return SandboxMetaStore(redis_provider=redis, sandbox_table=db)
 
 
+@pytest.fixture
+def round_trips(redis, monkeypatch):
+    """Record one entry per Redis round trip: the command name, or ``PIPELINE`` for a pipeline execute."""
+    calls: list[str] = []
+    execute_command = redis.client.execute_command
+    make_pipeline = redis.pipeline
+
+    async def counting_execute_command(*args, **kwargs):
+        calls.append(str(args[0]))
+        return await execute_command(*args, **kwargs)
+
+    def counting_pipeline(transaction: bool = True):
+        pipe = make_pipeline(transaction)
+        execute = pipe.execute
+
+        async def counting_execute(raise_on_error: bool = True):
+            calls.append("PIPELINE")
+            return await execute(raise_on_error)
+
+        pipe.execute = counting_execute
+        return pipe
+
+    monkeypatch.setattr(redis.client, "execute_command", counting_execute_command)
+    monkeypatch.setattr(redis, "pipeline", counting_pipeline)
+    return calls
+
+
+@pytest.fixture
+async def write_behind_repo(redis, db, rock_config):
+    rock_config.database.write_behind_interval_seconds = 0.05
+    store = SandboxMetaStore(redis_provider=redis, sandbox_table=db, rock_config=rock_config)
+    yield store
+    await store.aclose()
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -335,6 +371,150 @@ class TestUpdateTimeout:
         assert result[0]["expire_time"] == "9999999999"
 
 
+class TestPipelinedWrites:
+    async def test_update_is_one_round_trip(self, repo, redis, round_trips):
+        """update() sets only the given fields in one pipelined transaction, without reading first."""
+        await repo.create(SANDBOX_ID, SANDBOX_INFO)
+        round_trips.clear()
+
+        await repo.update(SANDBOX_ID, {"state": "stopped"})
+
+        # The second round trip moves the active sandbox counts, since the state left pending/running.
+        assert round_trips == ["PIPELINE", "PIPELINE"]
+        info = (await redis.json_get(alive_sandbox_key(SANDBOX_ID), "$"))[0]
+        assert info["state"] == "stopped"
+        assert info["user_id"] == "user-1"
+
+    async def test_update_creates_missing_alive_key(self, repo, redis):
+        """update() on a sandbox without an alive key creates it, like the old read-merge-write did."""
+        await repo.update("sbx-new", {"state": State.PENDING})
+
+        assert (await redis.json_get(alive_sandbox_key("sbx-new"), "$"))[0] == {"state": State.PENDING}
+
+    async def test_update_ignores_db_only_fields_in_redis(self, repo, redis):
+        await repo.create(SANDBOX_ID, SANDBOX_INFO)
+
+        await repo.update(SANDBOX_ID, {"state": "stopped", "spec": {"image": "x"}})
+
+        assert "spec" not in (await redis.json_get(alive_sandbox_key(SANDBOX_ID), "$"))[0]
+
+    async def test_create_and_delete_round_trips(self, repo, round_trips):
+        # Plus one each for the active sandbox counts, since the sandbox enters and leaves the running state.
+        await repo.create(SANDBOX_ID, SANDBOX_INFO, timeout_info={"auto_clear_time": "30", "expire_time": "1"})
+        assert round_trips == ["PIPELINE", "PIPELINE"]
+
+        round_trips.clear()
+        await repo.delete(SANDBOX_ID)
+        assert round_trips == ["PIPELINE", "PIPELINE"]
+
+    async def test_write_that_keeps_the_sandbox_active_is_one_round_trip(self, repo, round_trips):
+        await repo.create(SANDBOX_ID, SANDBOX_INFO)
+        round_trips.clear()
+
+        await repo.update(SANDBOX_ID, {"state": State.RUNNING, "host_ip": "10.0.0.2"})
+
+        assert round_trips == ["PIPELINE"]
+
+
+class TestGetMany:
+    async def test_get_many_reads_redis_in_one_round_trip(self, repo, round_trips):
+        await repo.create("sbx-a", {**SANDBOX_INFO, "sandbox_id": "sbx-a"})
+        await repo.create("sbx-b", {**SANDBOX_INFO, "sandbox_id": "sbx-b"})
+        round_trips.clear()
+
+        results = await repo.get_many(["sbx-a", "sbx-b", "sbx-missing"])
+
+        assert round_trips == ["JSON.MGET"]
+        assert set(results) == {"sbx-a", "sbx-b"}
+        assert results["sbx-a"]["sandbox_id"] == "sbx-a"
+
+    async def test_get_many_empty_list(self, repo, round_trips):
+        assert await repo.get_many([]) == {}
+        assert round_trips == []
+
+
+class TestUpdateMany:
+    async def test_update_many_writes_redis_once_and_db_for_each(self, repo, redis, db, round_trips):
+        sandbox_ids = [f"sbx-{i}" for i in range(5)]
+        for sandbox_id in sandbox_ids:
+            await repo.create(sandbox_id, {**SANDBOX_INFO, "sandbox_id": sandbox_id})
+        round_trips.clear()
+
+        await repo.update_many({sandbox_id: {"state": "stopped"} for sandbox_id in sandbox_ids})
+
+        # One write for all sandboxes, and one active count update for all of them.
+        assert round_trips == ["PIPELINE", "PIPELINE"]
+        for sandbox_id in sandbox_ids:
+            assert (await redis.json_get(alive_sandbox_key(sandbox_id), "$"))[0]["state"] == "stopped"
+            assert (await db.get(sandbox_id))["state"] == "stopped"
+
+    async def test_update_many_notifies_each_sandbox(self, repo):
+        changed: list[str] = []
+        repo.add_change_listener(changed.append)
+
+        await repo.update_many({"sbx-a": {"state": "stopped"}, "sbx-b": {"state": "stopped"}})
+
+        assert changed == ["sbx-a", "sbx-b"]
+
+
+class TestArchiveMany:
+    async def test_archive_many_snapshots_and_evicts(self, repo, redis, db, round_trips):
+        sandbox_ids = [f"sbx-{i}" for i in range(3)]
+        for sandbox_id in sandbox_ids:
+            await repo.create(sandbox_id, {**SANDBOX_INFO, "sandbox_id": sandbox_id})
+        round_trips.clear()
+
+        await repo.archive_many({sandbox_id: {"state": "stopped"} for sandbox_id in sandbox_ids})
+
+        assert round_trips == ["JSON.MGET", "PIPELINE", "PIPELINE"]
+        for sandbox_id in sandbox_ids:
+            assert await redis.json_get(alive_sandbox_key(sandbox_id), "$") is None
+            db_record = await db.get(sandbox_id)
+            assert db_record["state"] == "stopped"
+            assert db_record["user_id"] == "user-1"
+
+
+class TestWriteBehind:
+    async def test_updates_are_coalesced_per_sandbox(self, write_behind_repo, db):
+        await write_behind_repo.create(SANDBOX_ID, SANDBOX_INFO)
+
+        with patch.object(db, "update_many", wraps=db.update_many) as db_update:
+            await write_behind_repo.update(SANDBOX_ID, {"state": State.PENDING})
+            await write_behind_repo.update(SANDBOX_ID, {"state": State.RUNNING, "host_ip": "10.0.0.2"})
+            assert db_update.await_count == 0
+
+            for _ in range(100):
+                await asyncio.sleep(0.05)
+                if db_update.await_count:
+                    break
+            await asyncio.sleep(0.2)
+
+        assert db_update.await_count == 1
+        db_record = await db.get(SANDBOX_ID)
+        assert db_record["state"] == State.RUNNING
+        assert db_record["host_ip"] == "10.0.0.2"
+
+    async def test_archive_is_not_overwritten_by_queued_update(self, write_behind_repo, db):
+        await write_behind_repo.create(SANDBOX_ID, SANDBOX_INFO)
+        await write_behind_repo.update(SANDBOX_ID, {"state": State.RUNNING})
+
+        await write_behind_repo.archive(SANDBOX_ID, {"state": "stopped"})
+        await asyncio.sleep(0.2)
+
+        assert (await db.get(SANDBOX_ID))["state"] == "stopped"
+
+    async def test_aclose_flushes_queued_updates(self, redis, db, rock_config):
+        rock_config.database.write_behind_interval_seconds = 60
+        store = SandboxMetaStore(redis_provider=redis, sandbox_table=db, rock_config=rock_config)
+        await store.create(SANDBOX_ID, SANDBOX_INFO)
+        await store.update(SANDBOX_ID, {"state": "stopped"})
+        assert (await db.get(SANDBOX_ID))["state"] == State.RUNNING
+
+        await store.aclose()
+
+        assert (await db.get(SANDBOX_ID))["state"] == "stopped"
+
+
 # ---------------------------------------------------------------------------
 # Docker-backed fixtures (real Redis Stack + real PostgreSQL)
 # ---------------------------------------------------------------------------
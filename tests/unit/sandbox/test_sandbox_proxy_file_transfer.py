@@ -0,0 +1,106 @@
+import httpx
+import pytest
+from fakeredis import aioredis
+from fastapi import FastAPI
+
+from rock.actions.sandbox.response import State
+from rock.admin.core.db_provider import DatabaseProvider
+from rock.admin.core.sandbox_table import SandboxTable
+from rock.admin.proto.request import (
+    SandboxDownloadChunkRequest,
+    SandboxUploadChunkRequest,
+    SandboxUploadStatusRequest,
+)
+from rock.config import DatabaseConfig
+from rock.deployments.constants import Port
+from rock.rocklet.local_api import local_router
+from rock.sandbox.sandbox_meta_store import SandboxMetaStore
+from rock.sandbox.service.sandbox_proxy_service import SandboxProxyService
+from rock.sandbox.utils.timeout import SandboxTimeoutHelper
+from rock.utils.file_transfer import CHUNK_SHA256_HEADER, FILE_SIZE_HEADER, sha256_hex
+from rock.utils.providers.redis_provider import RedisProvider
+
+SANDBOX_ID = "sbx-transfer-001"
+
+
+@pytest.fixture
+async def meta_store():
+    redis = RedisProvider(host=None, port=None, password="")
+    redis.client = aioredis.FakeRedis(decode_responses=True)
+    db_provider = DatabaseProvider(db_config=DatabaseConfig(url="sqlite:///:memory:"))
+    await db_provider.init()
+    await db_provider.create_tables()
+    store = SandboxMetaStore(redis_provider=redis, sandbox_table=SandboxTable(db_provider))
+    sandbox_info = {
+        "sandbox_id": SANDBOX_ID,
+        "state": State.RUNNING,
+        "host_ip": "10.0.0.1",
+        "port_mapping": {str(Port.PROXY): 32000},
+    }
+    await store.create(SANDBOX_ID, sandbox_info, timeout_info=SandboxTimeoutHelper.make_timeout_info(30))
+    yield store
+    await db_provider.close()
+    await redis.close_pool()
+
+
+@pytest.fixture
+async def proxy_service(rock_config, meta_store):
+    rocklet = FastAPI()
+    rocklet.include_router(local_router)
+    service = SandboxProxyService(rock_config, meta_store=meta_store)
+    await service._httpx_client.aclose()
+    service._httpx_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=rocklet))
+    yield service
+    await service.aclose()
+    await service._httpx_client.aclose()
+
+
+async def test_upload_chunk_body_is_relayed_as_a_stream(proxy_service, tmp_path):
+    target = tmp_path / "file.bin"
+    pieces = [b"a" * 1000, b"b" * 1000, b"c" * 10]
+    pulled = []
+
+    async def body():
+        for piece in pieces:
+            pulled.append(piece)
+            yield piece
+
+    request = SandboxUploadChunkRequest(
+        sandbox_id=SANDBOX_ID, target_path=str(target), sha256=sha256_hex(b"".join(pieces)), final=True
+    )
+    response = await proxy_service.upload_chunk(request, body())
+
+    assert response.success
+    assert response.offset == 2010
+    assert pulled == pieces
+    assert target.read_bytes() == b"".join(pieces)
+
+
+async def test_upload_status(proxy_service, tmp_path):
+    target = tmp_path / "file.bin"
+    request = SandboxUploadChunkRequest(sandbox_id=SANDBOX_ID, target_path=str(target), sha256=sha256_hex(b"abc"))
+    await proxy_service.upload_chunk(request, _once(b"abc"))
+
+    status = await proxy_service.upload_status(
+        SandboxUploadStatusRequest(sandbox_id=SANDBOX_ID, target_path=str(target))
+    )
+
+    assert status.offset == 3
+
+
+async def test_download_relays_range_and_headers(proxy_service, tmp_path):
+    source = tmp_path / "file.bin"
+    source.write_bytes(b"0123456789")
+
+    response = await proxy_service.download(
+        SandboxDownloadChunkRequest(sandbox_id=SANDBOX_ID, path=str(source), offset=2, length=5)
+    )
+    body = b"".join([chunk async for chunk in response.body_iterator])
+
+    assert body == b"23456"
+    assert response.headers[CHUNK_SHA256_HEADER] == sha256_hex(b"23456")
+    assert response.headers[FILE_SIZE_HEADER] == "10"
+
+
+async def _once(data: bytes):
+    yield data
@@ -0,0 +1,164 @@
+"""Tests for push-based sandbox readiness: SandboxReadinessRegistry and SandboxManager.wait_ready.
+
+Uses a fake operator, FakeRedis and in-memory SQLite; two meta stores on one Redis stand in for two
+admin replicas.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from rock.actions.sandbox.response import State
+from rock.admin.core.sandbox_table import SandboxTable
+from rock.sandbox.operator.abstract import AbstractOperator
+from rock.sandbox.sandbox_manager import SandboxManager
+from rock.sandbox.sandbox_meta_store import SandboxMetaStore
+from rock.sandbox.sandbox_readiness import SandboxReadinessRegistry
+from rock.utils.providers.redis_provider import RedisProvider
+
+SANDBOX_ID = "sbx-ready"
+
+
+class FakeOperator(AbstractOperator):
+    """Starts sandboxes when told to; ``backing`` shares the sandbox state of another replica's operator."""
+
+    def __init__(self, backing: "FakeOperator | None" = None):
+        self._backing = backing
+        self.started = asyncio.Event()
+        self.phases: dict = {"docker_run": {"status": "running", "message": ""}}
+        self.status_calls = 0
+
+    def finish_start(self, phase_status: str = "success") -> None:
+        self.phases = {"docker_run": {"status": phase_status, "message": "done"}}
+        self.started.set()
+
+    async def wait_started(self, sandbox_id: str, timeout: float) -> bool:
+        if self._backing is not None:
+            return False
+        await self.started.wait()
+        return True
+
+    async def get_status(self, sandbox_id: str):
+        self.status_calls += 1
+        source = self._backing or self
+        alive = source.started.is_set() and source.phases["docker_run"]["status"] == "success"
+        return {
+            "sandbox_id": sandbox_id,
+            "state": State.RUNNING if alive else State.PENDING,
+            "phases": dict(source.phases),
+            "host_ip": "10.0.0.1",
+            "port_mapping": {},
+        }
+
+    async def submit(self, config, user_info: dict = {}):
+        raise NotImplementedError
+
+    async def restart(self, config, host_ip: str | None = None):
+        raise NotImplementedError
+
+    async def stop(self, sandbox_id: str, reason=None) -> bool:
+        raise NotImplementedError
+
+    async def delete(self, config, host_ip: str | None = None) -> bool:
+        raise NotImplementedError
+
+
+@pytest.fixture
+async def make_manager(rock_config):
+    managers: list[SandboxManager] = []
+
+    def make(meta_store: SandboxMetaStore, operator: AbstractOperator) -> SandboxManager:
+        manager = SandboxManager.__new__(SandboxManager)
+        manager.rock_config = rock_config
+        manager._meta_store = meta_store
+        manager._operator = operator
+        manager._refresh_timeout = AsyncMock()
+        manager._readiness = SandboxReadinessRegistry(meta_store, poll_interval_seconds=60)
+        manager._start_watchers = set()
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        for task in manager._start_watchers:
+            task.cancel()
+        await manager._readiness.aclose()
+
+
+@pytest.fixture
+async def meta_store(redis_provider: RedisProvider, _memory_sandbox_table: SandboxTable):
+    store = SandboxMetaStore(redis_provider=redis_provider, sandbox_table=_memory_sandbox_table)
+    await store.create(SANDBOX_ID, {"sandbox_id": SANDBOX_ID, "state": State.PENDING, "image": "python:3.11"})
+    return store
+
+
+async def test_waiter_is_woken_by_start_completion(make_manager, meta_store):
+    operator = FakeOperator()
+    manager = make_manager(meta_store, operator)
+    manager._watch_start(SANDBOX_ID, timeout=10)
+
+    waiter = asyncio.create_task(manager.wait_ready(SANDBOX_ID, timeout=30))
+    await asyncio.sleep(0.05)
+    operator.finish_start()
+    status = await asyncio.wait_for(waiter, 1)
+
+    assert status.is_alive
+    assert (await meta_store.get(SANDBOX_ID))["state"] == State.RUNNING
+    # One check on entry, one by the watcher, one after the wake-up: no polling in between.
+    assert operator.status_calls <= 3
+    assert manager._readiness.waiting == 0
+
+
+async def test_waiter_on_another_replica_is_woken_via_pubsub(
+    make_manager, meta_store, redis_provider, _memory_sandbox_table
+):
+    owner = FakeOperator()
+    replica_a = make_manager(meta_store, owner)
+    other_store = SandboxMetaStore(redis_provider=redis_provider, sandbox_table=_memory_sandbox_table)
+    replica_b = make_manager(other_store, FakeOperator(backing=owner))
+    replica_a._watch_start(SANDBOX_ID, timeout=10)
+
+    waiter = asyncio.create_task(replica_b.wait_ready(SANDBOX_ID, timeout=30))
+    await asyncio.sleep(0.05)  # let the subscriber attach
+    owner.finish_start()
+    status = await asyncio.wait_for(waiter, 2)
+
+    assert status.is_alive
+
+
+async def test_failed_start_returns_without_waiting_for_timeout(make_manager, meta_store):
+    operator = FakeOperator()
+    manager = make_manager(meta_store, operator)
+    manager._watch_start(SANDBOX_ID, timeout=10)
+
+    waiter = asyncio.create_task(manager.wait_ready(SANDBOX_ID, timeout=30))
+    await asyncio.sleep(0.05)
+    operator.finish_start(phase_status="failed")
+    status = await asyncio.wait_for(waiter, 1)
+
+    assert not status.is_alive
+    assert status.status["docker_run"]["status"] == "failed"
+
+
+async def test_timeout_returns_last_status(make_manager, meta_store):
+    manager = make_manager(meta_store, FakeOperator())
+
+    status = await manager.wait_ready(SANDBOX_ID, timeout=0.05)
+
+    assert not status.is_alive
+    assert status.state == State.PENDING
+
+
+async def test_registry_falls_back_to_polling(meta_store):
+    registry = SandboxReadinessRegistry(meta_store, poll_interval_seconds=0.01)
+    calls = 0
+
+    async def check():
+        nonlocal calls
+        calls += 1
+        return "ready" if calls == 3 else None
+
+    assert await registry.wait(SANDBOX_ID, check, timeout=1) == "ready"
+    assert registry.waiting == 0
+    await registry.aclose()
@@ -12,6 +12,7 @@ from rock.actions.sandbox.response import State
 from rock.admin.proto.response import SandboxStartResponse
 from rock.common.constants import StopReason
 from rock.sandbox.sandbox_manager import SandboxManager
+from rock.sandbox.sandbox_readiness import SandboxReadinessRegistry
 from rock.sdk.common.exceptions import BadRequestRockError
 
 
@@ -310,7 +311,7 @@ class TestManagerRestart:
 
 
 @pytest.fixture
-def mgr_start(mgr, mock_meta_store, mock_operator, mock_docker_config):
+async def mgr_start(mgr, mock_meta_store, mock_operator, mock_docker_config):
     mgr.deployment_manager = MagicMock()
     mgr.deployment_manager.init_config = AsyncMock(return_value=mock_docker_config)
     mgr._check_sandbox_exists_in_redis = AsyncMock()
@@ -321,8 +322,11 @@ def mgr_start(mgr, mock_meta_store, mock_operator, mock_docker_config):
     mgr.start_async = SandboxManager.start_async.__wrapped__.__get__(mgr)
     mgr._build_sandbox_info_metadata = AsyncMock()
     mgr.start = SandboxManager.start.__wrapped__.__get__(mgr)
+    mgr.wait_ready = SandboxManager.wait_ready.__get__(mgr)
+    mgr._readiness = SandboxReadinessRegistry(MagicMock(), poll_interval_seconds=0)
     mgr.get_status = AsyncMock(return_value=MagicMock(is_alive=True, state=State.RUNNING))
-    return mgr
+    yield mgr
+    await mgr._readiness.aclose()
 
 
 class TestManagerStart:
@@ -0,0 +1,100 @@
+"""VectorRockEnv against the gem router and a GemManager backed by local fake env actors."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from rock import env_vars
+from rock.actions import EnvCloseResponse, EnvMakeResponse
+from rock.admin.gem import api as gem_api
+from rock.config import RockConfig, SandboxConfig
+from rock.sdk.envs import VectorRockEnv
+from tests.unit.sandbox.gem_standins import FakeEnvActor, FakeRayService
+
+
+def _rock_config() -> RockConfig:
+    config = RockConfig()
+    config.sandbox_config = SandboxConfig()
+    return config
+
+
+@pytest.fixture
+def admin(monkeypatch):
+    with patch("rock.sandbox.base_manager.BaseManager._setup_scheduler"):
+        manager = gem_api.GemManager(_rock_config(), meta_store=AsyncMock(), ray_service=FakeRayService({}))
+    manager.deployment_manager = MagicMock()
+    manager.deployment_manager.get_actor_name = lambda sandbox_id: f"sandbox-{sandbox_id}"
+
+    async def env_make(env_id):
+        sandbox_id = f"sb-{len(manager._ray_service.actors)}"
+        manager._ray_service.actors[sandbox_id] = FakeEnvActor(sandbox_id)
+        return EnvMakeResponse(sandbox_id=sandbox_id)
+
+    async def env_close(request):
+        manager._ray_service.actors.pop(request.sandbox_id)
+        return EnvCloseResponse(sandbox_id=request.sandbox_id)
+
+    manager.env_make = env_make
+    manager.env_close = env_close
+    monkeypatch.setattr(gem_api, "sandbox_manager", manager, raising=False)
+
+    app = FastAPI()
+    app.include_router(gem_api.gem_router, prefix="/apis/v1/envs/gem")
+    client = TestClient(app, base_url="http://admin")
+    monkeypatch.setattr(env_vars, "ROCK_BASE_URL", "http://admin")
+    with patch("rock.sdk.envs.vector_rock_env.httpx.Client", return_value=client):
+        yield manager
+
+
+def test_step_and_reset_all_envs_in_one_request(admin):
+    env = VectorRockEnv("game:Sokoban-v0-easy", num_envs=3)
+
+    ids = env.sandbox_ids
+    assert sorted(ids) == ["sb-0", "sb-1", "sb-2"]
+
+    observations, infos = env.reset(seed=10)
+    assert observations == [f"{ids[0]}:seed=10", f"{ids[1]}:seed=11", f"{ids[2]}:seed=12"]
+
+    observations, rewards, terminated, truncated, infos = env.step(["up", "down", "left"])
+    assert observations == [f"{ids[0]}:up", f"{ids[1]}:down", f"{ids[2]}:left"]
+    assert rewards == [1.0, 1.0, 1.0]
+    assert truncated == [False, False, False]
+
+    env.close()
+    assert admin._ray_service.actors == {}
+
+
+def test_failed_env_is_reported_as_truncated(admin):
+    env = VectorRockEnv("game:Sokoban-v0-easy", num_envs=2)
+    healthy, failing = env.sandbox_ids
+    admin._ray_service.actors[failing].fail = True
+
+    observations, rewards, terminated, truncated, infos = env.step(["up", "up"])
+
+    assert observations == [f"{healthy}:up", None]
+    assert truncated == [False, True]
+    assert "crashed" in infos[1]["error"]
+    env.close()
+
+
+def test_action_count_must_match(admin):
+    env = VectorRockEnv("game:Sokoban-v0-easy", num_envs=2)
+
+    with pytest.raises(ValueError):
+        env.step(["up"])
+    env.close()
+
+
+def test_make_and_close_threads_are_capped(admin, monkeypatch):
+    monkeypatch.setattr(env_vars, "ROCK_GEM_VECTOR_ENV_CONCURRENCY", 2)
+
+    with patch("rock.sdk.envs.vector_rock_env.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+        env = VectorRockEnv("game:Sokoban-v0-easy", num_envs=5)
+        assert len(env.sandbox_ids) == 5
+        env.close()
+
+    assert admin._ray_service.actors == {}
+    assert [call.kwargs["max_workers"] for call in pool.call_args_list] == [2, 2]
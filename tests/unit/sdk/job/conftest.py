@@ -0,0 +1,17 @@
+"""Shared fixtures for the JobExecutor scheduling and sandbox pool tests."""
+
+from unittest.mock import patch
+
+import pytest
+
+from tests.unit.sdk.job.standins import FakeBackend
+
+
+@pytest.fixture
+def backend():
+    backend = FakeBackend()
+    with (
+        patch("rock.sdk.job.executor.Sandbox", side_effect=backend.sandbox),
+        patch("rock.sdk.job.sandbox_pool.Sandbox", side_effect=backend.sandbox),
+    ):
+        yield backend
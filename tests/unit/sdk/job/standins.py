@@ -0,0 +1,109 @@
+"""A fake sandbox backend and trial helpers for the JobExecutor scheduling and sandbox pool tests."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from rock.sdk.job.config import BashJobConfig
+from rock.sdk.job.operator import Operator
+from rock.sdk.job.trial.bash import BashTrial
+
+
+class FakeBackend:
+    """Stands in for the admin server: counts concurrency, fails configured sandbox starts."""
+
+    def __init__(self, run_seconds: float = 0.0, start_seconds: float = 0.0, fail_starts: int = 0):
+        self.run_seconds = run_seconds
+        self.start_seconds = start_seconds
+        self.fail_starts = fail_starts
+        self.created = 0
+        self.starts = 0
+        self.starting = 0
+        self.max_starting = 0
+        self.running = 0
+        self.max_running = 0
+        self.started_scripts: list[str] = []
+        self.launches: list[tuple[str, str]] = []
+        self.resets: list[str] = []
+        self.reset_exit_code = 0
+        self.closed: list[str] = []
+        # Scripts whose first attempt hangs, as on a slow host.
+        self.stragglers: set[str] = set()
+
+    def sandbox(self, *args, **kwargs) -> FakeSandbox:
+        self.created += 1
+        return FakeSandbox(self, f"sb-{self.created}")
+
+
+class FakeSandbox:
+    def __init__(self, backend: FakeBackend, sandbox_id: str):
+        self._backend = backend
+        self._namespace = None
+        self._experiment_id = None
+        self.sandbox_id = sandbox_id
+        self._script = ""
+
+    async def start(self):
+        backend = self._backend
+        backend.starts += 1
+        backend.starting += 1
+        backend.max_starting = max(backend.max_starting, backend.starting)
+        try:
+            await asyncio.sleep(backend.start_seconds)
+            if backend.fail_starts > 0:
+                backend.fail_starts -= 1
+                raise RuntimeError("admin unavailable")
+        finally:
+            backend.starting -= 1
+
+    async def create_session(self, request):
+        pass
+
+    async def write_file_by_path(self, content, path):
+        self._script = content
+
+    async def start_nohup_process(self, cmd, tmp_file, session):
+        backend = self._backend
+        backend.started_scripts.append(self._script)
+        backend.launches.append((self.sandbox_id, self._script))
+        backend.running += 1
+        backend.max_running = max(backend.max_running, backend.running)
+        return 1, None
+
+    async def wait_for_process_completion(self, pid, session, wait_timeout, wait_interval):
+        if self._script in self._backend.stragglers:
+            self._backend.stragglers.discard(self._script)
+            await asyncio.sleep(30)
+        await asyncio.sleep(float(self._script.split()[1]) if self._script.startswith("sleep") else 0)
+        await asyncio.sleep(self._backend.run_seconds)
+        self._backend.running -= 1
+        return True, "done"
+
+    async def handle_nohup_output(self, tmp_file, session, success, message, ignore_output, **kwargs):
+        exit_code = int(self._script.split()[-1]) if self._script.startswith("exit") else 0
+        return SimpleNamespace(output=self._script, exit_code=exit_code)
+
+    async def close_session(self, request):
+        pass
+
+    async def arun(self, cmd, session=None, **kwargs):
+        self._backend.resets.append(cmd)
+        return SimpleNamespace(output="", exit_code=self._backend.reset_exit_code)
+
+    async def close(self):
+        self._backend.closed.append(self.sandbox_id)
+
+
+class ListOperator(Operator):
+    def __init__(self, trials):
+        self.trials = trials
+
+    def apply(self, config):
+        return self.trials
+
+
+def make_trial(script: str, priority: int = 0) -> BashTrial:
+    trial = BashTrial(BashJobConfig(script=script, job_name=script))
+    trial.priority = priority
+    return trial
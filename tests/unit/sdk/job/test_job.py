@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from rock.actions import BatchStopResult
 from rock.sdk.job import Job
 from rock.sdk.job.config import BashJobConfig
 from rock.sdk.job.operator import ScatterOperator
@@ -95,18 +96,29 @@ class TestJobSubmitWait:
 
 
 class TestJobCancel:
-    async def test_cancel_kills_all_trial_sandboxes(self):
-        mock_sandbox = _make_mock_sandbox()
-        with patch("rock.sdk.job.executor.Sandbox", return_value=mock_sandbox):
-            job = Job(BashJobConfig(script="echo hi", job_name="test"))
+    async def test_cancel_stops_all_trial_sandboxes_in_bulk(self):
+        mocks = [_make_mock_sandbox() for _ in range(3)]
+        for index, sandbox in enumerate(mocks):
+            sandbox.sandbox_id = f"sb-{index}"
+        stopped: list[list[str]] = []
+
+        async def fake_stop_sandboxes(sandboxes):
+            sandboxes = list(sandboxes)
+            stopped.append([s.sandbox_id for s in sandboxes])
+            for sandbox in sandboxes:
+                yield BatchStopResult(sandbox_id=sandbox.sandbox_id)
+
+        progress: list[tuple[int, int]] = []
+        with (
+            patch("rock.sdk.job.executor.Sandbox", side_effect=mocks),
+            patch("rock.sdk.job.executor.stop_sandboxes", fake_stop_sandboxes),
+        ):
+            job = Job(BashJobConfig(script="echo hi", job_name="test"), operator=ScatterOperator(size=3))
             await job.submit()
-            await job.cancel()
+            await job.cancel(progress=lambda done, total: progress.append((done, total)))
 
-        assert mock_sandbox.arun.called
-        # Extract the cmd kwarg from the last arun call
-        call = mock_sandbox.arun.call_args
-        cmd = call.kwargs.get("cmd", "")
-        assert "kill" in cmd
+        assert stopped == [["sb-0", "sb-1", "sb-2"]]
+        assert progress == [(1, 3), (2, 3), (3, 3)]
 
     async def test_cancel_without_submit_is_noop(self):
         job = Job(BashJobConfig(script="echo hi", job_name="test"))
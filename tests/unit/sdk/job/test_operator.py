@@ -7,7 +7,8 @@ import pytest
 # Import bench first to avoid circular-import pitfall in rock.sdk.job.config
 import rock.sdk.bench  # noqa: F401
 from rock.sdk.job.config import BashJobConfig, JobConfig
-from rock.sdk.job.operator import Operator, ScatterOperator
+from rock.sdk.job.operator import Operator, QueueOperator, ScatterOperator, ScoreReducer
+from rock.sdk.job.result import ExceptionInfo, TrialResult
 from rock.sdk.job.trial.abstract import AbstractTrial
 from rock.sdk.job.trial.bash import BashTrial
 
@@ -64,3 +65,37 @@ class TestCustomOperator:
         result = op.apply(BashJobConfig(script="ignored"))
         assert result == fixed_trials
         assert len(result) == 2
+
+
+class TestQueueOperator:
+    def test_apply_creates_one_trial_per_task(self):
+        tasks = [BashJobConfig(script=f"echo {i}") for i in range(3)]
+        trials = QueueOperator(tasks, workers=2).apply(BashJobConfig(script="unused"))
+        assert [t._config.script for t in trials] == ["echo 0", "echo 1", "echo 2"]
+
+    def test_configure_caps_in_flight_at_workers_and_pools_sandboxes(self):
+        config = BashJobConfig(script="echo hi")
+        configured = QueueOperator([], workers=4, speculate_percentile=0.9).configure(config)
+        assert configured.scheduling.max_in_flight == 4
+        assert configured.scheduling.speculation_percentile == 0.9
+        assert configured.sandbox_pool.enabled is True
+        assert config.scheduling.max_in_flight is None
+        assert config.sandbox_pool.enabled is False
+
+    def test_workers_must_be_positive(self):
+        with pytest.raises(ValueError):
+            QueueOperator([], workers=0)
+
+    def test_default_configure_returns_config_unchanged(self):
+        config = BashJobConfig(script="echo hi")
+        assert ScatterOperator().configure(config) is config
+
+
+class TestScoreReducer:
+    def test_step_counts_completed_and_failed(self):
+        reducer = ScoreReducer()
+        summary = reducer.initial()
+        summary = reducer.step(summary, TrialResult())
+        summary = reducer.step(summary, TrialResult(exception_info=ExceptionInfo(exception_type="Boom")))
+        assert (summary.n_completed, summary.n_failed, summary.n_finished) == (1, 1, 2)
+        assert summary.score == 0.0
@@ -0,0 +1,124 @@
+"""Tests for SandboxPool and sandbox reuse in JobExecutor.stream, against the fake sandbox backend."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+
+from rock.sdk.envhub import EnvironmentConfig
+from rock.sdk.job.config import BashJobConfig, SandboxPoolConfig, SchedulingConfig
+from rock.sdk.job.executor import JobExecutor
+from rock.sdk.job.operator import ScatterOperator
+from rock.sdk.job.sandbox_pool import SandboxPool
+from tests.unit.sdk.job.standins import ListOperator, make_trial
+
+
+def _config(max_in_flight: int = 1, **pool) -> BashJobConfig:
+    return BashJobConfig(
+        script="echo hi",
+        job_name="pool",
+        scheduling=SchedulingConfig(max_in_flight=max_in_flight),
+        sandbox_pool=SandboxPoolConfig(enabled=True, **pool),
+    )
+
+
+async def test_trials_reuse_pooled_sandboxes(backend):
+    results = await JobExecutor().run(ScatterOperator(size=6), _config(max_in_flight=2))
+
+    assert all(r.exception_info is None for r in results)
+    assert backend.starts == 2
+    assert Counter(sandbox_id for sandbox_id, _ in backend.launches) == {"sb-1": 3, "sb-2": 3}
+
+
+async def test_pool_disabled_starts_one_sandbox_per_trial(backend):
+    config = _config()
+    config.sandbox_pool.enabled = False
+
+    await JobExecutor().run(ScatterOperator(size=3), config)
+
+    assert backend.starts == 3
+    assert backend.closed == []
+
+
+async def test_sandbox_is_recycled_after_max_uses(backend):
+    await JobExecutor().run(ScatterOperator(size=5), _config(max_uses=2))
+
+    assert [sandbox_id for sandbox_id, _ in backend.launches] == ["sb-1", "sb-1", "sb-2", "sb-2", "sb-3"]
+    assert backend.closed == ["sb-1", "sb-2", "sb-3"]
+
+
+async def test_failed_trial_recycles_its_sandbox(backend):
+    operator = ListOperator([make_trial("exit 3"), make_trial("echo ok"), make_trial("echo ok")])
+
+    results = await JobExecutor().run(operator, _config())
+
+    assert results[0].exception_info is not None
+    assert [sandbox_id for sandbox_id, _ in backend.launches] == ["sb-1", "sb-2", "sb-2"]
+    assert backend.closed[0] == "sb-1"
+
+
+async def test_reset_command_runs_between_trials(backend):
+    await JobExecutor().run(ScatterOperator(size=3), _config(reset_command="rm -rf /workdir/*"))
+
+    assert backend.starts == 1
+    assert backend.resets == ["rm -rf /workdir/*"] * 3
+
+
+async def test_failed_reset_recycles_sandbox(backend):
+    backend.reset_exit_code = 1
+
+    await JobExecutor().run(ScatterOperator(size=2), _config(reset_command="restore-snapshot"))
+
+    assert backend.starts == 2
+    assert backend.closed == ["sb-1", "sb-2"]
+
+
+async def test_sandboxes_are_only_shared_within_a_spec(backend):
+    pool = SandboxPool(SandboxPoolConfig(enabled=True))
+    small = EnvironmentConfig(image="python:3.11", memory="8g")
+    large = EnvironmentConfig(image="python:3.11", memory="32g")
+
+    first = await pool.lease(small)
+    await pool.release(first)
+    assert await pool.lease(large) is not first
+    assert await pool.lease(small) is first
+
+    await pool.close()
+    assert sorted(backend.closed) == ["sb-1", "sb-2"]
+
+
+async def test_shared_pool_outlives_the_job(backend):
+    pool = SandboxPool(SandboxPoolConfig(enabled=True))
+    executor = JobExecutor(sandbox_pool=pool)
+
+    await executor.run(ScatterOperator(size=2), _config())
+    await executor.run(ScatterOperator(size=2), _config())
+
+    assert backend.starts == 1
+    assert backend.closed == []
+    await pool.close()
+    assert backend.closed == ["sb-1"]
+
+
+async def test_cancelled_launch_returns_the_lease(backend):
+    pool = SandboxPool(SandboxPoolConfig(enabled=True))
+    trial = make_trial("echo hi")
+    launched = asyncio.Event()
+
+    async def hang(trial, sandbox):
+        launched.set()
+        await asyncio.sleep(30)
+
+    executor = JobExecutor(sandbox_pool=pool)
+    with patch.object(executor, "_launch", hang):
+        submit = asyncio.create_task(executor._do_submit(trial, pool))
+        await launched.wait()
+        submit.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await submit
+
+    assert pool._leased == set()
+    assert backend.closed == ["sb-1"]
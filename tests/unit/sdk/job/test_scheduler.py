@@ -0,0 +1,234 @@
+"""Tests for JobExecutor.stream admission control, priorities and checkpointing against a fake sandbox backend."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+import rock.sdk.job.trial.bash  # register BashJobConfig -> BashTrial  # noqa: F401
+from rock.sdk.job import Job
+from rock.sdk.job.config import BashJobConfig, SchedulingConfig
+from rock.sdk.job.executor import JobExecutor
+from rock.sdk.job.operator import QueueOperator, ScatterOperator, ScoreReducer
+from rock.sdk.job.result import TrialResult
+from rock.sdk.job.scheduler import AdmissionController, TrialCheckpoint
+from tests.unit.sdk.job.standins import ListOperator, make_trial
+
+
+def _config(**scheduling) -> BashJobConfig:
+    return BashJobConfig(script="echo hi", job_name="sched", scheduling=SchedulingConfig(**scheduling))
+
+
+async def test_in_flight_window_caps_running_trials(backend):
+    backend.run_seconds = 0.02
+
+    results = await JobExecutor().run(ScatterOperator(size=20), _config(max_in_flight=4))
+
+    assert len(results) == 20
+    assert backend.max_running == 4
+
+
+async def test_submit_concurrency_caps_sandbox_starts(backend):
+    backend.start_seconds = 0.02
+
+    await JobExecutor().run(ScatterOperator(size=20), _config(submit_concurrency=3))
+
+    assert backend.max_starting == 3
+
+
+async def test_submit_path_is_admission_controlled(backend):
+    backend.start_seconds = 0.02
+
+    job_client = await JobExecutor().submit(ScatterOperator(size=10), _config(submit_concurrency=2))
+
+    assert len(job_client.trials) == 10
+    assert backend.max_starting == 2
+
+
+async def test_results_stream_as_trials_finish(backend):
+    operator = ListOperator([make_trial("sleep 0.3"), make_trial("sleep 0"), make_trial("sleep 0.1")])
+
+    indexes = [index async for index, _ in JobExecutor().stream(operator, _config())]
+
+    assert indexes == [1, 2, 0]
+
+
+async def test_higher_priority_trials_are_admitted_first(backend):
+    operator = ListOperator([make_trial(f"echo {i}", priority=i % 3) for i in range(6)])
+
+    await JobExecutor().run(operator, _config(max_in_flight=1))
+
+    assert backend.started_scripts == ["echo 2", "echo 5", "echo 1", "echo 4", "echo 0", "echo 3"]
+
+
+async def test_start_failure_fails_only_that_trial(backend):
+    backend.fail_starts = 1
+
+    results = await JobExecutor().run(ScatterOperator(size=3), _config(backoff_seconds=0))
+
+    failed = [r for r in results if r.exception_info is not None]
+    assert len(failed) == 1
+    assert failed[0].exception_info.exception_message == "admin unavailable"
+
+
+async def test_job_stream_yields_trial_results(backend):
+    results = [r async for r in Job(_config(), operator=ScatterOperator(size=3)).stream()]
+
+    assert len(results) == 3
+    assert all(r.exception_info is None for r in results)
+
+
+async def test_checkpointed_trials_are_skipped_on_restart(backend, tmp_path):
+    checkpoint_path = str(tmp_path / "checkpoint.jsonl")
+    backend.fail_starts = 2
+    config = _config(checkpoint_path=checkpoint_path, submit_concurrency=1, backoff_seconds=0)
+
+    first = await JobExecutor().run(ScatterOperator(size=5), config)
+    assert sum(r.exception_info is not None for r in first) == 2
+    starts = backend.starts
+
+    second = await JobExecutor().run(ScatterOperator(size=5), config)
+
+    assert backend.starts - starts == 2
+    assert all(r.exception_info is None for r in second)
+    assert len(TrialCheckpoint(checkpoint_path).load()) == 5
+
+
+def test_checkpoint_only_loads_known_trial_result_types(tmp_path):
+    checkpoint = tmp_path / "checkpoint.jsonl"
+    records = [
+        {"index": 0, "many": False, "results": [{"type": "subprocess.Popen", "data": {"task_name": "a"}}]},
+        {"index": 1, "many": False, "results": [{"type": "rock.sdk.job.result.TrialResult", "data": {}}]},
+    ]
+    checkpoint.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+    completed = TrialCheckpoint(checkpoint).load()
+
+    assert type(completed[0]) is TrialResult
+    assert completed[0].task_name == "a"
+    assert type(completed[1]) is TrialResult
+
+
+async def test_queue_operator_workers_pull_tasks_as_they_go_idle(backend):
+    tasks = [BashJobConfig(script="sleep 0.3", job_name="long")]
+    tasks += [BashJobConfig(script="sleep 0.05", job_name=f"short-{i}") for i in range(6)]
+
+    start = time.monotonic()
+    results = await JobExecutor().run(QueueOperator(tasks, workers=2), _config())
+
+    # A static split would put 3-4 tasks on each worker; here one worker runs the long task while the
+    # other drains the short ones.
+    assert time.monotonic() - start < 0.45
+    assert len(results) == 7
+    assert backend.starts == 2
+
+
+async def test_straggler_is_speculatively_re_executed(backend):
+    tasks = [BashJobConfig(script=f"sleep 0.05 task-{i}", job_name=f"task-{i}") for i in range(6)]
+    backend.stragglers.add("sleep 0.05 task-5")
+
+    start = time.monotonic()
+    finished = [
+        index
+        async for index, _ in JobExecutor().stream(QueueOperator(tasks, workers=6, speculate_percentile=0.5), _config())
+    ]
+
+    assert time.monotonic() - start < 5
+    assert sorted(finished) == list(range(6))
+    assert [script for _, script in backend.launches].count("sleep 0.05 task-5") == 2
+    assert backend.resets == ["kill 1"]
+
+
+async def test_losing_copy_of_a_straggler_is_stopped_with_its_sandbox(backend):
+    operator = ListOperator([make_trial(f"sleep 0.05 {i}") for i in range(6)])
+    backend.stragglers.add("sleep 0.05 5")
+
+    results = await JobExecutor().run(operator, _config(speculation_percentile=0.5))
+
+    assert all(r.exception_info is None for r in results)
+    straggler, _ = [sandbox_id for sandbox_id, script in backend.launches if script == "sleep 0.05 5"]
+    assert backend.closed == [straggler]
+
+
+async def test_cancelled_launch_stops_the_sandbox(backend):
+    launched = asyncio.Event()
+
+    async def hang(trial, sandbox):
+        launched.set()
+        await asyncio.sleep(30)
+
+    executor = JobExecutor()
+    with patch.object(executor, "_launch", hang):
+        submit = asyncio.create_task(executor._do_submit(make_trial("echo hi")))
+        await launched.wait()
+        submit.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await submit
+
+    assert backend.closed == ["sb-1"]
+
+
+async def test_cancelled_start_stops_the_sandbox(backend):
+    backend.start_seconds = 30
+
+    submit = asyncio.create_task(JobExecutor()._do_submit(make_trial("echo hi")))
+    while not backend.starting:
+        await asyncio.sleep(0)
+    submit.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await submit
+
+    assert backend.closed == ["sb-1"]
+
+
+async def test_job_reduce_streams_partial_aggregates(backend):
+    operator = ListOperator([make_trial("echo ok"), make_trial("exit 1"), make_trial("echo ok")])
+
+    summaries = [summary async for summary in Job(_config(), operator=operator).reduce(ScoreReducer())]
+
+    assert [summary.n_finished for summary in summaries] == [1, 2, 3]
+    assert (summaries[-1].n_completed, summaries[-1].n_failed) == (2, 1)
+
+
+class TestAdmissionController:
+    async def test_errors_halve_the_window_and_pause(self):
+        admission = AdmissionController(SchedulingConfig(submit_concurrency=8, backoff_seconds=5))
+
+        with pytest.raises(RuntimeError):
+            async with admission.admit():
+                raise RuntimeError("boom")
+
+        assert admission.limit == 4
+        acquire = asyncio.ensure_future(admission._acquire())
+        await asyncio.sleep(0.01)
+        assert not acquire.done()
+        acquire.cancel()
+
+    async def test_successes_grow_the_window_back(self):
+        admission = AdmissionController(SchedulingConfig(submit_concurrency=8, backoff_seconds=0, error_window=4))
+        with pytest.raises(RuntimeError):
+            async with admission.admit():
+                raise RuntimeError("boom")
+        assert admission.limit == 4
+
+        for _ in range(40):
+            async with admission.admit():
+                pass
+
+        assert admission.limit == 8
+
+    async def test_back_off_doubles_while_errors_continue(self):
+        admission = AdmissionController(
+            SchedulingConfig(submit_concurrency=8, backoff_seconds=0.01, max_backoff_seconds=0.03)
+        )
+        for _ in range(4):
+            with pytest.raises(RuntimeError):
+                async with admission.admit():
+                    raise RuntimeError("boom")
+
+        assert admission.limit == 1
+        assert admission._backoff == 0.03
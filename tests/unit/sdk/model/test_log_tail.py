@@ -0,0 +1,121 @@
+import asyncio
+import os
+import time
+
+from rock.sdk.model.server.file_handler import FileHandler
+from rock.sdk.model.server.log_tail import LogTail, append_line, notify_readers
+
+
+def test_read_lines_returns_only_new_complete_lines(tmp_path):
+    log_file = str(tmp_path / "LLMService.log")
+    tail = LogTail(log_file, reader="test")
+    assert tail.read_lines() == []
+
+    append_line(log_file, "first\n")
+    with open(log_file, "a") as f:
+        f.write("second\nthi")
+
+    assert tail.read_lines() == ["first", "second"]
+    assert tail.read_lines() == []
+
+    append_line(log_file, "rd\n")
+    assert tail.read_lines() == ["third"]
+
+
+def test_line_separators_inside_payload_do_not_split_lines(tmp_path):
+    log_file = str(tmp_path / "LLMService.log")
+    append_line(log_file, 'LLM_RESPONSE_START{"content": "a b\rc"}LLM_RESPONSE_END{}\n')
+
+    assert LogTail(log_file, reader="test").read_lines() == [
+        'LLM_RESPONSE_START{"content": "a b\rc"}LLM_RESPONSE_END{}'
+    ]
+
+
+def test_restored_tail_continues_from_saved_offset(tmp_path):
+    log_file = str(tmp_path / "LLMService.log")
+    append_line(log_file, "old\n")
+    first = LogTail(log_file, reader="test")
+    first.read_lines()
+
+    append_line(log_file, "new\n")
+    second = LogTail(log_file, reader="test")
+    second.restore(first.state())
+
+    assert second.read_lines() == ["new"]
+
+
+def test_replaced_log_is_read_from_the_start(tmp_path):
+    log_file = str(tmp_path / "LLMService.log")
+    rewinds = []
+    tail = LogTail(log_file, reader="test", on_rewind=lambda: rewinds.append(True))
+    append_line(log_file, "old session\n")
+    tail.read_lines()
+
+    os.unlink(log_file)
+    append_line(log_file, "new session\n")
+
+    assert tail.read_lines() == ["new session"]
+    assert rewinds == [True]
+
+
+async def test_append_wakes_waiting_reader(tmp_path):
+    log_file = str(tmp_path / "LLMService.log")
+    tail = LogTail(log_file, reader="test")
+    await tail.wait(10)  # binds the wakeup socket
+
+    async def append_later():
+        await asyncio.sleep(0.05)
+        append_line(log_file, "line\n")
+
+    start = time.monotonic()
+    await asyncio.gather(tail.wait(10), append_later())
+    tail.close()
+
+    assert time.monotonic() - start < 5
+    assert tail.read_lines() == ["line"]
+    assert not any(name.endswith(".sock") for name in os.listdir(tmp_path))
+
+
+async def test_wakeup_before_wait_is_not_lost(tmp_path):
+    log_file = str(tmp_path / "LLMService.log")
+    tail = LogTail(log_file, reader="test")
+    await tail.wait(10)
+
+    notify_readers(log_file)
+    await asyncio.sleep(0)  # let the event loop deliver the datagram
+
+    start = time.monotonic()
+    await tail.wait(10)
+    tail.close()
+    assert time.monotonic() - start < 5
+
+
+async def test_concurrent_pollers_get_their_own_responses(tmp_path):
+    log_file = str(tmp_path / "LLMService.log")
+    handler = FileHandler(log_file)
+    for index in (1, 2, 3):
+        handler.write_request({"index": index}, index)
+
+    async def respond():
+        for index in (3, 1, 2):
+            await asyncio.sleep(0.01)
+            append_line(log_file, f'LLM_RESPONSE_START{{"answer": {index}}}LLM_RESPONSE_END{{"index": {index}}}\n')
+
+    *responses, _ = await asyncio.wait_for(
+        asyncio.gather(*(handler.poll_for_response(index) for index in (1, 2, 3)), respond()), timeout=10
+    )
+
+    assert responses == [{"answer": 1}, {"answer": 2}, {"answer": 3}]
+
+
+async def test_session_end_releases_pollers(tmp_path):
+    handler = FileHandler(str(tmp_path / "LLMService.log"))
+    handler.write_request({}, 1)
+
+    async def end_session():
+        await asyncio.sleep(0.01)
+        handler.write_session_end()
+
+    response, _ = await asyncio.wait_for(asyncio.gather(handler.poll_for_response(1), end_session()), timeout=10)
+
+    assert response is None
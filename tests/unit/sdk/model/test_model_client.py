@@ -1,6 +1,12 @@
+import asyncio
+import json
+import os
+
 import pytest
 
 from rock.sdk.model.client import ModelClient
+from rock.sdk.model.server.config import RESPONSE_START_MARKER, SESSION_END_MARKER
+from rock.sdk.model.server.file_handler import FileHandler
 
 
 @pytest.mark.asyncio
@@ -23,3 +29,52 @@ async def test_parse_response_line():
     response_json, meta = await client.parse_response_line(content)
     assert 1 == meta.get("index")
     assert "mock content" in response_json
+
+
+async def test_exchange_with_a_fresh_client_per_call(tmp_path):
+    log_file = str(tmp_path / "LLMService.log")
+    handler = FileHandler(log_file)
+
+    async def server():
+        for index in (1, 2, 3):
+            handler.write_request({"turn": index}, index)
+            response = await handler.poll_for_response(index)
+            assert response == {"reply": index}
+        handler.write_session_end()
+
+    async def agent():
+        requests = [await ModelClient(log_file).anti_call_llm(0)]
+        for index in (1, 2, 3):
+            requests.append(await ModelClient(log_file).anti_call_llm(index, f'{{"reply": {index}}}'))
+        return requests
+
+    _, requests = await asyncio.wait_for(asyncio.gather(server(), agent()), timeout=10)
+
+    assert [json.loads(r) for r in requests[:3]] == [{"turn": 1}, {"turn": 2}, {"turn": 3}]
+    assert requests[3] == SESSION_END_MARKER
+
+
+async def test_client_resumes_from_persisted_offset(tmp_path):
+    log_file = str(tmp_path / "LLMService.log")
+    handler = FileHandler(log_file)
+    handler.write_request({"turn": 1}, 1)
+    await ModelClient(log_file).read_last_request_line()
+    offset = os.path.getsize(log_file)
+
+    handler.write_request({"turn": 2}, 2)
+    client = ModelClient(log_file)
+
+    assert client._tail.offset == offset
+    request_json, meta = await client.parse_request_line(await client.read_last_request_line())
+    assert meta["index"] == 2
+
+
+async def test_push_response_skips_duplicate_index(tmp_path):
+    log_file = str(tmp_path / "LLMService.log")
+    FileHandler(log_file).write_request({}, 1)
+
+    await ModelClient(log_file).push_response(1, '{"reply": 1}')
+    await ModelClient(log_file).push_response(1, '{"reply": 1}')
+
+    with open(log_file) as f:
+        assert sum(RESPONSE_START_MARKER in line for line in f) == 1
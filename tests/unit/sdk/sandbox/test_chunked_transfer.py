@@ -0,0 +1,190 @@
+"""Test Sandbox chunked uploads and downloads against an in-process rocklet."""
+
+import tracemalloc
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from rock.rocklet.local_api import local_router
+from rock.sdk.sandbox.client import Sandbox
+from rock.sdk.sandbox.config import SandboxConfig
+from rock.utils.file_transfer import TRANSFER_CHUNK_SIZE, partial_path, write_chunk
+
+FILE_SIZE = 3 * TRANSFER_CHUNK_SIZE + 123
+
+
+class _Rocklet:
+    """Stands in for admin + rocklet: serves the SDK's HttpUtils calls from the rocklet router."""
+
+    def __init__(self, client: httpx.AsyncClient):
+        self._client = client
+        self.chunk_posts = 0
+        self.fail_next_post = False
+
+    async def get(self, url, headers, params=None):
+        response = await self._client.get(_path(url), params=params)
+        response.raise_for_status()
+        return {"status": "Success", "result": response.json()}
+
+    async def post_content(self, url, headers, content, params=None, read_timeout=300.0):
+        self.chunk_posts += 1
+        if self.fail_next_post:
+            self.fail_next_post = False
+            raise httpx.ConnectError("connection reset")
+        response = await self._client.post(_path(url), params=params, content=content)
+        return {"status": "Success", "result": response.json()}
+
+    async def get_content(self, url, headers, params=None):
+        response = await self._client.get(_path(url), params=params)
+        response.raise_for_status()
+        return response
+
+
+def _path(url: str) -> str:
+    return "/" + url.rsplit("/", 1)[1]
+
+
+@pytest.fixture
+async def rocklet():
+    app = FastAPI()
+    app.include_router(local_router)
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app, raise_app_exceptions=False), base_url="http://rocklet"
+    ) as client:
+        fake = _Rocklet(client)
+        with (
+            patch("rock.sdk.sandbox.client.HttpUtils.get", fake.get),
+            patch("rock.sdk.sandbox.client.HttpUtils.post_content", fake.post_content),
+            patch("rock.sdk.sandbox.client.HttpUtils.get_content", fake.get_content),
+        ):
+            yield fake
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr("rock.sdk.sandbox.client.TRANSFER_RETRY_DELAY_SECONDS", 0)
+
+
+@pytest.fixture
+def sandbox():
+    sandbox = Sandbox(SandboxConfig(base_url="http://x"))
+    sandbox._oss = MagicMock()
+    sandbox._oss.ensure_setup = AsyncMock(return_value=False)
+    sandbox._oss.is_available = False
+    return sandbox
+
+
+def _sparse_file(path, size: int):
+    with open(path, "wb") as f:
+        f.truncate(size)
+        f.seek(TRANSFER_CHUNK_SIZE + 1)
+        f.write(b"marker")
+    return path
+
+
+@pytest.fixture
+def large_file(tmp_path):
+    return _sparse_file(tmp_path / "large.bin", FILE_SIZE)
+
+
+async def _upload_peak_memory(sandbox, source, target) -> int:
+    tracemalloc.start()
+    try:
+        response = await sandbox.upload_by_path(source, str(target), upload_mode="direct")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert response.success, response.message
+    return peak
+
+
+async def test_large_file_is_uploaded_in_chunks(rocklet, sandbox, large_file, tmp_path):
+    target = tmp_path / "remote" / "large.bin"
+
+    response = await sandbox.upload_by_path(large_file, str(target), upload_mode="direct")
+
+    assert response.success, response.message
+    assert rocklet.chunk_posts == 4
+    assert target.read_bytes() == large_file.read_bytes()
+
+
+async def test_upload_memory_does_not_grow_with_file_size(rocklet, sandbox, large_file, tmp_path):
+    larger_file = _sparse_file(tmp_path / "larger.bin", 4 * FILE_SIZE)
+
+    peak = await _upload_peak_memory(sandbox, large_file, tmp_path / "a.bin")
+    larger_peak = await _upload_peak_memory(sandbox, larger_file, tmp_path / "b.bin")
+
+    # Not even one whole chunk is held at a time, on either side.
+    assert peak < TRANSFER_CHUNK_SIZE
+    assert larger_peak < TRANSFER_CHUNK_SIZE
+    assert (tmp_path / "b.bin").stat().st_size == 4 * FILE_SIZE
+
+
+async def test_upload_resumes_from_partial_file(rocklet, sandbox, large_file, tmp_path):
+    target = tmp_path / "large.bin"
+    with open(large_file, "rb") as f:
+        write_chunk(target, 0, f.read(2 * TRANSFER_CHUNK_SIZE))
+
+    response = await sandbox.upload_by_path(large_file, str(target), upload_mode="direct")
+
+    assert response.success, response.message
+    assert rocklet.chunk_posts == 2
+    assert target.read_bytes() == large_file.read_bytes()
+
+
+async def test_lost_chunk_is_retried(rocklet, sandbox, large_file, tmp_path):
+    target = tmp_path / "large.bin"
+    rocklet.fail_next_post = True
+
+    response = await sandbox.upload_by_path(large_file, str(target), upload_mode="direct")
+
+    assert response.success, response.message
+    assert rocklet.chunk_posts == 5
+    assert target.read_bytes() == large_file.read_bytes()
+
+
+async def test_falls_back_to_multipart_without_chunked_endpoint(sandbox, large_file):
+    not_found = httpx.HTTPStatusError(
+        "not found", request=httpx.Request("GET", "http://x"), response=httpx.Response(404)
+    )
+    with (
+        patch("rock.sdk.sandbox.client.HttpUtils.get", AsyncMock(side_effect=not_found)),
+        patch(
+            "rock.sdk.sandbox.client.HttpUtils.post_multipart", AsyncMock(return_value={"status": "Success"})
+        ) as post_multipart,
+    ):
+        response = await sandbox.upload_by_path(large_file, "/remote/large.bin", upload_mode="direct")
+
+    assert response.success
+    post_multipart.assert_awaited_once()
+
+
+async def test_download_round_trip_and_resume(rocklet, sandbox, large_file, tmp_path):
+    local = tmp_path / "downloaded.bin"
+    with open(large_file, "rb") as f:
+        write_chunk(local, 0, f.read(TRANSFER_CHUNK_SIZE))
+
+    response = await sandbox.download_by_path(str(large_file), local)
+
+    assert response.success, response.message
+    assert local.read_bytes() == large_file.read_bytes()
+    assert not partial_path(local).exists()
+
+
+async def test_download_of_missing_file_fails(rocklet, sandbox, tmp_path):
+    response = await sandbox.download_by_path(str(tmp_path / "missing"), tmp_path / "local")
+
+    assert response.success is False
+
+
+async def test_download_retries_back_off_exponentially(rocklet, sandbox, tmp_path, monkeypatch):
+    monkeypatch.setattr("rock.sdk.sandbox.client.TRANSFER_RETRY_DELAY_SECONDS", 0.5)
+    sleep = AsyncMock()
+
+    with patch("rock.sdk.sandbox.client.asyncio.sleep", sleep):
+        response = await sandbox.download_by_path(str(tmp_path / "missing"), tmp_path / "local")
+
+    assert response.success is False
+    assert [call.args[0] for call in sleep.await_args_list] == [0.5, 1.0, 2.0]
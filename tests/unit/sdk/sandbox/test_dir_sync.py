@@ -0,0 +1,274 @@
+"""Tests for the incremental LinuxFileSystem.upload_dir, against a sandbox stand-in that runs commands locally."""
+
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from rock.actions import Observation
+from rock.actions.sandbox.request import Command
+from rock.actions.sandbox.response import CommandResponse, UploadResponse
+from rock.sdk.sandbox.dir_sync import ManifestEntry, local_manifest, plan_sync, split_archives
+from rock.sdk.sandbox.file_system import LinuxFileSystem
+
+
+class LocalSandbox:
+    """Runs sandbox commands on this machine and copies uploads, counting the bytes sent."""
+
+    def __init__(self, path: str = os.environ["PATH"]):
+        self.path = path
+        self.uploaded: list[int] = []
+        self.upload_targets: list[str] = []
+
+    async def execute(self, command: Command) -> CommandResponse:
+        result = subprocess.run(
+            command.command, cwd=command.cwd, capture_output=True, env={"PATH": self.path}, stdin=subprocess.DEVNULL
+        )
+        return CommandResponse(
+            stdout=result.stdout.decode(errors="backslashreplace"),
+            stderr=result.stderr.decode(errors="backslashreplace"),
+            exit_code=result.returncode,
+        )
+
+    async def upload_by_path(self, file_path: str, target_path: str) -> UploadResponse:
+        shutil.copyfile(file_path, target_path)
+        self.uploaded.append(Path(file_path).stat().st_size)
+        self.upload_targets.append(target_path)
+        return UploadResponse(success=True)
+
+    async def arun(self, cmd: str, mode=None, wait_timeout=None, session=None) -> Observation:
+        result = subprocess.run(
+            cmd, shell=True, capture_output=True, text=True, env={"PATH": self.path}, stdin=subprocess.DEVNULL
+        )
+        return Observation(output=result.stdout + result.stderr, exit_code=result.returncode)
+
+
+def _tree(root: Path) -> dict[str, bytes | str]:
+    tree: dict[str, bytes | str] = {}
+    for path in sorted(root.rglob("*")):
+        rel = path.relative_to(root).as_posix()
+        if path.is_symlink():
+            tree[rel] = f"-> {os.readlink(path)}"
+        elif path.is_dir():
+            tree[rel] = "dir"
+        else:
+            tree[rel] = path.read_bytes()
+    return tree
+
+
+@pytest.fixture(autouse=True)
+def local_tmp(tmp_path, monkeypatch):
+    """Keep local archives apart from the sandbox's /tmp, which here is the same directory."""
+    local = tmp_path / "local-tmp"
+    local.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(local))
+
+
+@pytest.fixture
+def source(tmp_path) -> Path:
+    src = tmp_path / "src"
+    (src / "pkg" / "sub").mkdir(parents=True)
+    (src / "empty").mkdir()
+    (src / "README.md").write_text("readme\n")
+    (src / "pkg" / "a.py").write_text("a = 1\n" * 1000)
+    (src / "pkg" / "sub" / "b.py").write_text("b = 2\n")
+    (src / "pkg" / "data.zip").write_bytes(os.urandom(4096))
+    (src / "link").symlink_to("pkg/a.py")
+    return src
+
+
+async def _upload(sandbox: LocalSandbox, src: Path, target: Path, **kwargs) -> Observation:
+    observation = await LinuxFileSystem(sandbox).upload_dir(src, str(target), **kwargs)
+    assert observation.exit_code == 0, observation.failure_reason
+    return observation
+
+
+async def test_first_upload_copies_the_whole_tree(source, tmp_path):
+    target = tmp_path / "target"
+
+    await _upload(LocalSandbox(), source, target)
+
+    assert _tree(target) == _tree(source)
+
+
+async def test_resync_sends_only_changed_files(source, tmp_path):
+    target = tmp_path / "target"
+    sandbox = LocalSandbox()
+    await _upload(sandbox, source, target)
+    sandbox.uploaded.clear()
+
+    (source / "pkg" / "sub" / "b.py").write_text("b = 3\n")
+    observation = await _upload(sandbox, source, target)
+
+    assert _tree(target) == _tree(source)
+    assert len(sandbox.uploaded) == 1
+    assert "1 entries sent" in observation.output
+
+
+async def test_unchanged_tree_sends_nothing(source, tmp_path):
+    target = tmp_path / "target"
+    sandbox = LocalSandbox()
+    await _upload(sandbox, source, target)
+    sandbox.uploaded.clear()
+
+    await _upload(sandbox, source, target)
+
+    assert sandbox.uploaded == []
+
+
+async def test_touched_but_identical_file_is_not_resent(source, tmp_path):
+    target = tmp_path / "target"
+    sandbox = LocalSandbox()
+    await _upload(sandbox, source, target)
+    sandbox.uploaded.clear()
+
+    os.utime(source / "pkg" / "a.py", (1, 1))
+    await _upload(sandbox, source, target)
+
+    assert sandbox.uploaded == []
+
+
+async def test_permission_changes_propagate_without_resending(source, tmp_path):
+    target = tmp_path / "target"
+    sandbox = LocalSandbox()
+    await _upload(sandbox, source, target)
+    sandbox.uploaded.clear()
+
+    script = source / "pkg" / "a.py"
+    mtime = script.stat().st_mtime_ns
+    script.chmod(0o755)
+    (source / "pkg" / "sub").chmod(0o700)
+    os.utime(script, ns=(mtime, mtime))
+    observation = await _upload(sandbox, source, target)
+
+    assert sandbox.uploaded == []
+    assert "2 chmodded" in observation.output
+    assert stat.S_IMODE((target / "pkg" / "a.py").stat().st_mode) == 0o755
+    assert stat.S_IMODE((target / "pkg" / "sub").stat().st_mode) == 0o700
+
+
+async def test_deletions_and_type_changes_propagate(source, tmp_path):
+    target = tmp_path / "target"
+    sandbox = LocalSandbox()
+    await _upload(sandbox, source, target)
+
+    shutil.rmtree(source / "pkg" / "sub")
+    (source / "README.md").unlink()
+    (source / "README.md").mkdir()
+    (source / "link").unlink()
+    (source / "link").symlink_to("README.md")
+    (source / "empty").rmdir()
+    (source / "empty").write_text("now a file\n")
+    await _upload(sandbox, source, target)
+
+    assert _tree(target) == _tree(source)
+
+
+async def test_already_compressed_files_are_sent_uncompressed(source, tmp_path):
+    target = tmp_path / "target"
+    sandbox = LocalSandbox()
+
+    await _upload(sandbox, source, target)
+
+    assert sorted("".join(Path(target).suffixes[-2:]) for target in sandbox.upload_targets) == [".tar", ".tar.gz"]
+    assert (target / "pkg" / "data.zip").read_bytes() == (source / "pkg" / "data.zip").read_bytes()
+
+
+async def test_uncompressed_mode(source, tmp_path):
+    target = tmp_path / "target"
+
+    await _upload(LocalSandbox(), source, target, compression="none")
+
+    assert _tree(target) == _tree(source)
+
+
+async def test_sandbox_without_gnu_find_gets_the_whole_tree(source, tmp_path):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    for tool in ("sh", "bash", "tar", "gzip", "mkdir", "rm", "cp"):
+        (bin_dir / tool).symlink_to(shutil.which(tool))
+    # A find that cannot print a manifest, as on busybox.
+    (bin_dir / "find").write_text("#!/bin/sh\nexit 1\n")
+    (bin_dir / "find").chmod(0o755)
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "stale.txt").write_text("stale\n")
+
+    observation = await _upload(LocalSandbox(path=str(bin_dir)), source, target)
+
+    assert _tree(target) == _tree(source)
+    assert "0 deleted" in observation.output
+
+
+async def test_missing_tar_fails_the_upload(source, tmp_path):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "sh").symlink_to(shutil.which("sh"))
+
+    observation = await LinuxFileSystem(LocalSandbox(path=str(bin_dir))).upload_dir(source, str(tmp_path / "t"))
+
+    assert observation.exit_code == 1
+    assert "no tar command" in observation.failure_reason
+
+
+async def test_zstd_requires_zstandard(source, tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+
+    observation = await LinuxFileSystem(LocalSandbox()).upload_dir(source, str(tmp_path / "t"), compression="zstd")
+
+    assert observation.exit_code == 1
+    assert "pip install zstandard" in observation.failure_reason
+
+
+class TestPlan:
+    def test_nested_deletions_collapse_into_their_top_directory(self):
+        remote = {
+            "gone": ManifestEntry("d"),
+            "gone/a": ManifestEntry("f", 1, 1),
+            "gone/b": ManifestEntry("d"),
+            "gone-too": ManifestEntry("f", 1, 1),
+        }
+
+        assert plan_sync({}, remote).delete == ["gone", "gone-too"]
+
+    def test_size_change_is_sent_and_mtime_change_is_verified(self):
+        local = {"a": ManifestEntry("f", 2, 5), "b": ManifestEntry("f", 1, 6), "c": ManifestEntry("f", 1, 1)}
+        remote = {"a": ManifestEntry("f", 1, 5), "b": ManifestEntry("f", 1, 5), "c": ManifestEntry("f", 1, 1)}
+
+        plan = plan_sync(local, remote)
+
+        assert (plan.send, plan.verify, plan.unchanged) == (["a"], ["b"], 1)
+
+    def test_mode_change_is_chmodded_unless_the_file_is_sent(self):
+        local = {
+            "a": ManifestEntry("f", 1, 1, mode=0o755),
+            "b": ManifestEntry("f", 1, 2, mode=0o755),
+            "c": ManifestEntry("f", 2, 1, mode=0o755),
+            "d": ManifestEntry("d", mode=0o700),
+        }
+        remote = {
+            "a": ManifestEntry("f", 1, 1, mode=0o644),
+            "b": ManifestEntry("f", 1, 1, mode=0o644),
+            "c": ManifestEntry("f", 1, 1, mode=0o644),
+            "d": ManifestEntry("d", mode=0o755),
+        }
+
+        plan = plan_sync(local, remote)
+
+        assert (plan.send, plan.verify, plan.chmod, plan.unchanged) == (["c"], ["b"], ["a", "b", "d"], 0)
+
+    def test_archives_are_capped_by_size(self, tmp_path):
+        root = tmp_path / "root"
+        root.mkdir()
+        for name in ("a", "b", "c"):
+            (root / name).write_bytes(b"x" * 10)
+        local = local_manifest(root)
+
+        archives = split_archives(sorted(local), local, archive_bytes=25)
+
+        assert archives == [(["a", "b"], True), (["c"], True)]
@@ -0,0 +1,69 @@
+"""Unit tests for Sandbox.start waiting on the admin's /wait_ready long-poll."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from rock.actions.sandbox.response import SandboxStatusResponse
+from rock.sdk.common.exceptions import InternalServerRockError
+from rock.sdk.sandbox.client import Sandbox
+from rock.sdk.sandbox.config import SandboxConfig
+
+SANDBOX_ID = "sbx-wait"
+START_RESPONSE = {"status": "Success", "result": {"sandbox_id": SANDBOX_ID, "host_name": "h", "host_ip": "10.0.0.1"}}
+
+
+def _status(is_alive: bool, phase: str = "running") -> dict:
+    return {
+        "status": "Success",
+        "result": {"sandbox_id": SANDBOX_ID, "is_alive": is_alive, "status": {"docker_run": {"status": phase}}},
+    }
+
+
+def _not_found() -> httpx.Response:
+    return httpx.Response(404, request=httpx.Request("GET", "http://admin/wait_ready"))
+
+
+async def test_start_blocks_on_wait_ready():
+    sandbox = Sandbox(SandboxConfig(startup_timeout=600))
+    with (
+        patch("rock.sdk.sandbox.client.HttpUtils.post", new=AsyncMock(return_value=START_RESPONSE)),
+        patch(
+            "rock.sdk.sandbox.client.HttpUtils.get", new=AsyncMock(side_effect=[_status(False), _status(True)])
+        ) as mock_get,
+        patch("rock.sdk.sandbox.client.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+    ):
+        await sandbox.start()
+
+    assert mock_get.await_count == 2
+    assert "/wait_ready?sandbox_id=sbx-wait&timeout=60.0" in mock_get.await_args.args[0]
+    mock_sleep.assert_not_awaited()
+
+
+async def test_start_reports_failed_phase():
+    sandbox = Sandbox(SandboxConfig())
+    with (
+        patch("rock.sdk.sandbox.client.HttpUtils.post", new=AsyncMock(return_value=START_RESPONSE)),
+        patch("rock.sdk.sandbox.client.HttpUtils.get", new=AsyncMock(return_value=_status(False, "failed"))),
+        pytest.raises(InternalServerRockError, match="docker_run"),
+    ):
+        await sandbox.start()
+
+
+async def test_older_admin_falls_back_to_polling_get_status():
+    sandbox = Sandbox(SandboxConfig())
+    statuses = [SandboxStatusResponse(sandbox_id=SANDBOX_ID, is_alive=alive, status={}) for alive in (False, True)]
+    with (
+        patch("rock.sdk.sandbox.client.HttpUtils.post", new=AsyncMock(return_value=START_RESPONSE)),
+        patch("rock.utils.http.HttpClientPool.request", new=AsyncMock(return_value=_not_found())) as mock_request,
+        patch.object(sandbox, "get_status", new=AsyncMock(side_effect=statuses)),
+        patch("rock.sdk.sandbox.client.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+        patch("rock.utils.http.logging.exception") as mock_log_exception,
+    ):
+        await sandbox.start()
+
+    assert mock_request.await_count == 1
+    mock_sleep.assert_awaited_once_with(3)
+    # The expected 404 of an older admin is not logged as a failure.
+    mock_log_exception.assert_not_called()
@@ -0,0 +1,90 @@
+import types
+
+import pytest
+
+from rock.sdk.sandbox.client import Sandbox
+from rock.sdk.sandbox.config import SandboxConfig
+
+
+@pytest.mark.asyncio
+async def test_wait_for_process_completion_long_polls_until_exit(monkeypatch):
+    sandbox = Sandbox(SandboxConfig(image="mock-image"))
+    posted: list[dict] = []
+
+    async def fake_post(url, headers, data, read_timeout=300.0):
+        posted.append(data)
+        exited = len(posted) == 3
+        return {"status": "Success", "result": {"pid": data["pid"], "exited": exited, "elapsed": 0.0}}
+
+    async def fail_run_in_session(self, action):
+        raise AssertionError(f"Unexpected polling command: {action.command}")
+
+    monkeypatch.setattr("rock.sdk.sandbox.client.HttpUtils.post", fake_post)
+    sandbox._run_in_session = types.MethodType(fail_run_in_session, sandbox)  # type: ignore
+
+    success, message = await sandbox.wait_for_process_completion(
+        pid=42, session="bash-1", wait_timeout=600, wait_interval=30
+    )
+
+    assert success is True
+    assert "completed" in message
+    assert len(posted) == 3
+    assert all(data["pid"] == 42 and data["timeout"] <= 60 for data in posted)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_process_completion_reports_timeout(monkeypatch):
+    sandbox = Sandbox(SandboxConfig(image="mock-image"))
+    timeouts: list[float] = []
+
+    async def fake_post(url, headers, data, read_timeout=300.0):
+        timeouts.append(data["timeout"])
+        return {"status": "Success", "result": {"pid": data["pid"], "exited": False, "elapsed": data["timeout"]}}
+
+    clock = iter(range(0, 1000, 1))
+    monkeypatch.setattr("rock.sdk.sandbox.client.time.perf_counter", lambda: next(clock))
+    monkeypatch.setattr("rock.sdk.sandbox.client.HttpUtils.post", fake_post)
+
+    success, message = await sandbox.wait_for_process_completion(
+        pid=42, session="bash-1", wait_timeout=3, wait_interval=30
+    )
+
+    assert success is False
+    assert "did not complete" in message
+    assert timeouts
+
+
+@pytest.mark.asyncio
+async def test_wait_for_process_completion_falls_back_to_polling(monkeypatch):
+    sandbox = Sandbox(SandboxConfig(image="mock-image"))
+    commands: list[str] = []
+
+    async def fake_post(url, headers, data, read_timeout=300.0):
+        return {"status": "Failed", "message": "Not Found"}
+
+    async def fake_run_in_session(self, action):
+        commands.append(action.command)
+        raise Exception("process gone")
+
+    monkeypatch.setattr("rock.sdk.sandbox.client.HttpUtils.post", fake_post)
+    sandbox._run_in_session = types.MethodType(fake_run_in_session, sandbox)  # type: ignore
+
+    success, _ = await sandbox.wait_for_process_completion(pid=7, session="bash-1", wait_timeout=60, wait_interval=5)
+
+    assert success is True
+    assert commands == ["kill -0 7"]
+
+
+@pytest.mark.asyncio
+async def test_wait_process_raises_on_failed_status(monkeypatch):
+    sandbox = Sandbox(SandboxConfig(image="mock-image"))
+
+    async def fake_post(url, headers, data, read_timeout=300.0):
+        assert url.endswith("/wait_process")
+        assert read_timeout > data["timeout"]
+        return {"status": "Failed", "message": "boom"}
+
+    monkeypatch.setattr("rock.sdk.sandbox.client.HttpUtils.post", fake_post)
+
+    with pytest.raises(Exception, match="Failed to wait process"):
+        await sandbox.wait_process(1, timeout=10)
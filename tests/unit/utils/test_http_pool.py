@@ -0,0 +1,174 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from rock.utils import HttpClientPool, HttpUtils
+
+
+class StubServer:
+    """Minimal keep-alive HTTP/1.1 server that counts accepted TCP connections."""
+
+    def __init__(self, delay: float = 0.0):
+        self.connections = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._delay = delay
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode().split("\r\n"):
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                await asyncio.sleep(self._delay)
+                self.in_flight -= 1
+                body = json.dumps({"ok": True}).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def stub_server():
+    server = StubServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+async def test_requests_reuse_pooled_connection(stub_server):
+    for _ in range(5):
+        assert await HttpUtils.get(f"{stub_server.url}/get", headers={}) == {"ok": True}
+        assert await HttpUtils.post(f"{stub_server.url}/post", headers={}, data={"a": 1}) == {"ok": True}
+    await HttpUtils.aclose()
+
+    assert stub_server.connections == 1
+
+
+async def test_aclose_drops_pool_of_current_loop(stub_server):
+    await HttpUtils.get(f"{stub_server.url}/get", headers={})
+    host_pool = HttpClientPool.get_host_pool(stub_server.url)
+    assert HttpClientPool.get_host_pool(f"{stub_server.url}/other") is host_pool
+
+    await HttpUtils.aclose()
+
+    assert HttpClientPool.get_host_pool(stub_server.url) is not host_pool
+    await HttpUtils.aclose()
+
+
+def test_pool_is_per_event_loop():
+    async def _get_host_pool():
+        return HttpClientPool.get_host_pool("http://127.0.0.1:1")
+
+    first = asyncio.run(_get_host_pool())
+    second = asyncio.run(_get_host_pool())
+
+    assert first is not second
+
+
+@pytest.fixture
+def threaded_server():
+    """A StubServer on its own loop in a background thread, reachable from ``asyncio.run`` in the test."""
+    server = StubServer()
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+    yield server
+    asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def test_asyncio_run_does_not_retain_loops(threaded_server):
+    loops = len(HttpClientPool._loops)
+
+    for _ in range(5):
+        assert asyncio.run(HttpUtils.get(f"{threaded_server.url}/get", headers={})) == {"ok": True}
+        assert len(HttpClientPool._loops) == loops
+
+
+def test_closed_loop_is_dropped_by_the_next_loop(threaded_server):
+    loops = len(HttpClientPool._loops)
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(HttpUtils.get(f"{threaded_server.url}/get", headers={}))
+    loop.close()
+    assert len(HttpClientPool._loops) == loops + 1
+
+    asyncio.run(HttpUtils.get(f"{threaded_server.url}/get", headers={}))
+
+    assert loop not in HttpClientPool._loops
+    assert len(HttpClientPool._loops) == loops
+
+
+async def test_connections_are_striped_across_clients():
+    server = StubServer(delay=0.05)
+    await server.start()
+    try:
+        await asyncio.gather(*[HttpUtils.get(f"{server.url}/get", headers={}) for _ in range(20)])
+        host_pool = HttpClientPool.get_host_pool(server.url)
+        assert len(host_pool._clients) == 3
+    finally:
+        await HttpUtils.aclose()
+        await server.stop()
+
+    assert server.max_in_flight == 20
+
+
+async def test_max_connections_per_host(monkeypatch):
+    monkeypatch.setenv("ROCK_HTTP_MAX_CONNECTIONS_PER_HOST", "2")
+    server = StubServer(delay=0.05)
+    await server.start()
+    try:
+        await asyncio.gather(*[HttpUtils.get(f"{server.url}/get", headers={}) for _ in range(8)])
+    finally:
+        await HttpUtils.aclose()
+        await server.stop()
+
+    assert server.max_in_flight == 2
+
+
+async def test_aclose_with_requests_in_flight():
+    server = StubServer(delay=0.05)
+    await server.start()
+    try:
+        requests = [asyncio.create_task(HttpUtils.get(f"{server.url}/get", headers={})) for _ in range(4)]
+        while server.in_flight < 4:
+            await asyncio.sleep(0.005)
+        await HttpUtils.aclose()
+        results = await asyncio.gather(*requests, return_exceptions=True)
+    finally:
+        await HttpUtils.aclose()
+        await server.stop()
+
+    assert not any(isinstance(result, IndexError) for result in results)
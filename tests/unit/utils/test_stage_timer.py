@@ -49,3 +49,19 @@ class TestStageTimer:
         record = caplog.records[0]
         assert record.message.startswith("[my_phase] my description took ")
         assert record.message.endswith(" s")
+
+    @patch("rock.utils.concurrent_helper.time.perf_counter", side_effect=[100.0, 100.25, 101.0, 101.5])
+    def test_listener_receives_stage_timing(self, mock_perf_counter):
+        received = []
+        listener = lambda *timing: received.append(timing)  # noqa: E731
+        StageTimer.add_listener(listener)
+        try:
+            with StageTimer("startup_timing", "[sandbox-abc] Docker start", logging.getLogger("test_stage_timer")):
+                pass
+        finally:
+            StageTimer.remove_listener(listener)
+
+        with StageTimer("startup_timing", "after removal", logging.getLogger("test_stage_timer")):
+            pass
+
+        assert received == [("startup_timing", "[sandbox-abc] Docker start", 0.25)]